@@ -0,0 +1,82 @@
+import numpy as np
+from typing import Tuple
+
+# Fractional fills are split with floating point arithmetic, so an order counts as
+# filled once no more than this quantity is left.
+FILL_EPSILON = 1e-9
+
+
+def fifo(quantities: np.ndarray, total: float) -> np.ndarray:
+    """ Allocate total across quantities in time priority.
+
+    Each order receives whatever is left once every order ahead of it
+    has been filled, capped at its own quantity.
+    """
+    ahead = np.cumsum(quantities) - quantities
+    return np.clip(total - ahead, 0, quantities)
+
+
+def pro_rata(quantities: np.ndarray, total: float) -> np.ndarray:
+    """ Allocate total across quantities in proportion to their size.
+
+    Allocations are rounded down to whole units, and the units left over go one each
+    to the orders with the largest remainders, earliest first on ties, so the
+    allocation always sums to total. Integer quantities are allocated in integer
+    arithmetic and keep their dtype. Any fraction of a unit left by fractional
+    quantities is handed out in time priority.
+    """
+    level_total = quantities.sum()
+    if total >= level_total:
+        return quantities.copy()
+    if quantities.dtype.kind in "iu":
+        allocation = quantities * total // level_total
+        remainders = quantities * total % level_total
+    else:
+        exact = quantities * (total / level_total)
+        allocation = np.floor(exact)
+        remainders = exact - allocation
+    units = int(total - allocation.sum())
+    if units > 0:
+        largest = np.argsort(-remainders, kind="stable")[:units]
+        allocation[largest] += np.minimum(quantities[largest] - allocation[largest], 1)
+    return allocation + fifo(quantities - allocation, total - allocation.sum())
+
+
+def fifo_pro_rata(quantities: np.ndarray, total: float, fifo_fraction: float) -> np.ndarray:
+    """ Allocate fifo_fraction of total, rounded down to whole units, in time priority and the rest pro-rata."""
+
+    allocation = fifo(quantities, quantities.dtype.type(np.floor(total * fifo_fraction)))
+    return allocation + pro_rata(quantities - allocation, total - allocation.sum())
+
+
+def filled(fills: np.ndarray, quantities: np.ndarray) -> np.ndarray:
+    """ Which orders of quantities are filled by fills.
+
+    Integer quantities must be filled exactly. Fractional ones may leave a
+    rounding residue of at most FILL_EPSILON, however large the order.
+    """
+    if quantities.dtype.kind in "iu" and fills.dtype.kind in "iu":
+        return fills == quantities
+    return quantities - fills <= FILL_EPSILON
+
+
+def pair_fills(bid_fills: np.ndarray, ask_fills: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ Pair per-order bid and ask allocations into individual trades.
+
+    Both sides are laid end to end on the same cumulative quantity axis.
+    Every boundary on either side ends a trade, between the bid and the ask
+    whose allocations cover it.
+
+    Returns the bid index, ask index and quantity of each trade.
+    """
+    bid_filled = np.cumsum(bid_fills)
+    ask_filled = np.cumsum(ask_fills)
+    boundaries = np.union1d(bid_filled, ask_filled)
+    boundaries = boundaries[boundaries <= min(bid_filled[-1], ask_filled[-1])]
+    quantities = np.diff(boundaries, prepend=0)
+    traded = quantities > 0
+    boundaries = boundaries[traded]
+
+    bid_index = np.searchsorted(bid_filled, boundaries, side="left")
+    ask_index = np.searchsorted(ask_filled, boundaries, side="left")
+    return bid_index, ask_index, quantities[traded]
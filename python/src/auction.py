@@ -0,0 +1,44 @@
+import numpy as np
+from typing import Optional, Tuple
+
+
+def clearing_price(bid_prices: np.ndarray,
+                   bid_quantities: np.ndarray,
+                   ask_prices: np.ndarray,
+                   ask_quantities: np.ndarray,
+                   reference_price: Optional[float] = None) -> Tuple[float, float]:
+    """ Find the single price which maximises executed volume in a call auction.
+
+    Bids must be in priority order (descending price) and asks in priority order
+    (ascending price). Market orders carry prices of inf and 0 and so count
+    towards depth at every price, but are never candidate prices themselves.
+
+    Every limit price is a candidate. Cumulative depth on each side is looked up
+    for all candidates at once with searchsorted, and executable volume is the
+    smaller of the two. Ties are broken by the smallest imbalance, then by the
+    distance to the reference price (the midpoint of the tied range if None).
+
+    Returns the clearing price and volume, (nan, 0) if the book does not cross.
+    """
+    candidates = np.unique(np.concatenate([bid_prices[np.isfinite(bid_prices)],
+                                           ask_prices[ask_prices > 0]]))
+    if not candidates.size:
+        return float("nan"), 0.
+
+    bid_depth = np.concatenate([[0.], np.cumsum(bid_quantities)])
+    ask_depth = np.concatenate([[0.], np.cumsum(ask_quantities)])
+    demand = bid_depth[np.searchsorted(-bid_prices, -candidates, side="right")]
+    supply = ask_depth[np.searchsorted(ask_prices, candidates, side="right")]
+    volume = np.minimum(demand, supply)
+
+    max_volume = volume.max()
+    if max_volume <= 0:
+        return float("nan"), 0.
+
+    tied = np.flatnonzero(volume == max_volume)
+    imbalance = np.abs(demand[tied] - supply[tied])
+    tied = tied[imbalance == imbalance.min()]
+    if reference_price is None:
+        reference_price = (candidates[tied[0]] + candidates[tied[-1]]) / 2
+    best = tied[np.argmin(np.abs(candidates[tied] - reference_price))]
+    return float(candidates[best]), float(max_volume)
@@ -0,0 +1,3 @@
+from .scenario import Scenario
+from .scenario_statistics import ScenarioStatistics, RESULT
+from .backtest_runner import BacktestRunner, run_scenario
@@ -0,0 +1,32 @@
+from python.src.enums import MatchingAlgorithm
+from python.src.enums import ExecutionPriceRule
+from python.src.risk import RiskLimits
+from typing import Optional
+
+
+class Scenario:
+    """ One engine configuration to backtest.
+
+    Scenarios are sent to worker processes, so they hold only plain settings
+    and each worker builds its own MatchingEngine from them.
+
+    Attributes:
+    -- name -> A label for the scenario's row in the results, at most 32 characters.
+    -- matching_algorithm -> The matching algorithm of every instrument.
+    -- tick_size -> The tick size of every instrument, None for no tick grid.
+    -- risk_limits -> Limits applied to every account, None for no pre-trade checks.
+    -- execution_price_rule -> The execution price rule of every instrument.
+    """
+
+    def __init__(self,
+                 name: str,
+                 matching_algorithm: MatchingAlgorithm = MatchingAlgorithm.price_time,
+                 tick_size: Optional[float] = None,
+                 risk_limits: Optional[RiskLimits] = None,
+                 execution_price_rule: ExecutionPriceRule = ExecutionPriceRule.resting):
+
+        self.name = name
+        self.matching_algorithm = matching_algorithm
+        self.tick_size = tick_size
+        self.risk_limits = risk_limits
+        self.execution_price_rule = execution_price_rule
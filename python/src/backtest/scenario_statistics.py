@@ -0,0 +1,85 @@
+from python.src.events import EventSink
+from python.src.orders import BaseOrder
+from python.src.orders import AnyCancel
+from python.src.orders import AnyOrder
+import numpy as np
+
+# One row of the backtest results table.
+# -- name -> The scenario's name.
+# -- orders -> The number of orders replayed.
+# -- accepted, rejected, filled, cancelled -> The number of orders reaching each state.
+# -- trades -> The number of trades.
+# -- volume -> The total quantity traded.
+# -- vwap -> The volume weighted average trade price, nan without trades.
+# -- low, high -> The lowest and highest trade prices, nan without trades.
+# -- elapsed -> The wall time of the scenario, in seconds.
+RESULT = np.dtype([("name", "U32"),
+                   ("orders", np.int64),
+                   ("accepted", np.int64),
+                   ("rejected", np.int64),
+                   ("filled", np.int64),
+                   ("cancelled", np.int64),
+                   ("trades", np.int64),
+                   ("volume", np.float64),
+                   ("vwap", np.float64),
+                   ("low", np.float64),
+                   ("high", np.float64),
+                   ("elapsed", np.float64)])
+
+
+class ScenarioStatistics(EventSink):
+    """ Running totals of one scenario's order events and trades.
+
+    Used as both the engine's trade sink and an event sink, so a scenario of any
+    length is summarised in constant memory.
+
+    Attributes:
+    -- accepted, rejected, filled, cancelled -> The number of orders reaching each state.
+    -- trades -> The number of trades.
+    -- volume -> The total quantity traded.
+    -- notional -> The total price * quantity traded.
+    -- low, high -> The lowest and highest trade prices.
+    """
+
+    def __init__(self):
+        self.accepted = 0
+        self.rejected = 0
+        self.filled = 0
+        self.cancelled = 0
+        self.trades = 0
+        self.volume = 0.
+        self.notional = 0.
+        self.low = float("inf")
+        self.high = float("-inf")
+
+    def __call__(self, timestamp: int, price: float, quantity: float, bid: BaseOrder, ask: BaseOrder) -> None:
+        self.trades += 1
+        self.volume += quantity
+        self.notional += price * quantity
+        if price < self.low:
+            self.low = price
+        if price > self.high:
+            self.high = price
+
+    def on_accepted(self, order: BaseOrder) -> None:
+        self.accepted += 1
+
+    def on_rejected(self, order: AnyOrder, reason: str) -> None:
+        self.rejected += 1
+
+    def on_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        self.filled += 1
+
+    def on_cancelled(self, order: BaseOrder, cancel_order: AnyCancel) -> None:
+        self.cancelled += 1
+
+    def row(self, name: str, orders: int, elapsed: float) -> tuple:
+        """ The scenario's row of the results table."""
+
+        traded = self.trades > 0
+        return (name, orders, self.accepted, self.rejected, self.filled, self.cancelled,
+                self.trades, self.volume,
+                self.notional / self.volume if traded else np.nan,
+                self.low if traded else np.nan,
+                self.high if traded else np.nan,
+                elapsed)
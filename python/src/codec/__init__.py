@@ -0,0 +1,8 @@
+from .messages import HEADER, SCHEMA_VERSION, ORDER, LIMIT_ORDER, MARKET_ORDER, CANCEL_ORDER, TRADE
+from .messages import EXECUTION_REPORT
+from .messages import MESSAGE_DTYPES
+from .frames import encode_frame, decode_frame, iter_frames, complete_frames_length
+from .orders import orders_to_records, records_to_orders, restore_order_ids, encode_orders, decode_orders
+from .orders import decode_order_records
+from .trades import trades_to_records, trade_buffer_to_records, records_to_trades
+from .trades import encode_trades, decode_trades
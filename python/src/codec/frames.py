@@ -0,0 +1,60 @@
+from python.src.codec.messages import HEADER, SCHEMA_VERSION, MESSAGE_DTYPES
+from python.src.enums import MessageType
+from typing import Iterator, Tuple
+import numpy as np
+
+
+def encode_frame(message_type: MessageType, records: np.ndarray) -> bytes:
+    """ A frame holding records, which must be an array of message_type's dtype."""
+
+    if records.dtype != MESSAGE_DTYPES[message_type]:
+        raise ValueError("Records do not have the layout of {}".format(message_type.name))
+    return HEADER.pack(message_type, SCHEMA_VERSION, len(records)) + records.tobytes()
+
+
+def decode_frame(buffer, offset: int = 0) -> Tuple[MessageType, np.ndarray, int]:
+    """ Read the frame starting at offset in buffer.
+
+    buffer may be bytes, a memoryview or anything else exposing the buffer protocol.
+    The records are a read-only view onto buffer, not a copy.
+
+    Returns the message type, the records and the offset of the next frame.
+    """
+    message_type, schema_version, count = HEADER.unpack_from(buffer, offset)
+    if schema_version != SCHEMA_VERSION:
+        raise ValueError("Unsupported schema version: {}".format(schema_version))
+    message_type = MessageType(message_type)
+    dtype = MESSAGE_DTYPES[message_type]
+    offset += HEADER.size
+    records = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    return message_type, records, offset + count * dtype.itemsize
+
+
+def complete_frames_length(buffer) -> int:
+    """ The length of the complete frames at the start of buffer.
+
+    A stream may end part way through a frame. Everything up to the returned
+    length can be decoded, and the rest must wait for more data.
+    """
+    offset = 0
+    end = len(memoryview(buffer).cast("B"))
+    while end - offset >= HEADER.size:
+        message_type, schema_version, count = HEADER.unpack_from(buffer, offset)
+        dtype = MESSAGE_DTYPES.get(message_type)
+        if dtype is None:
+            raise ValueError("Unknown message type: {}".format(message_type))
+        frame_end = offset + HEADER.size + count * dtype.itemsize
+        if frame_end > end:
+            break
+        offset = frame_end
+    return offset
+
+
+def iter_frames(buffer) -> Iterator[Tuple[MessageType, np.ndarray]]:
+    """ Read every frame in buffer, in order, as views onto buffer."""
+
+    offset = 0
+    end = len(memoryview(buffer).cast("B"))
+    while offset < end:
+        message_type, records, offset = decode_frame(buffer, offset)
+        yield message_type, records
@@ -0,0 +1,97 @@
+from python.src.enums import MessageType
+from struct import Struct
+import numpy as np
+
+# The layouts of the binary wire protocol.
+#
+# Every message is a packed, little-endian NumPy structured dtype, so a batch of
+# messages is an array which can be written out with tobytes() and read back as a
+# view with np.frombuffer(). Strings are fixed-width ASCII bytes, padded with zeros,
+# and enums are stored as their values.
+#
+# Messages travel in frames: an 8 byte HEADER holding the message type, the schema
+# version and the number of messages, then the messages themselves.
+SCHEMA_VERSION = 1
+HEADER = Struct("<HHI")
+
+# Any order type. Fields an order type does not use are zero.
+# -- order_type -> OrderType value.
+# -- order_direction -> OrderDirection value. 0 for a mass cancel of both sides.
+# -- instrument_id -> Instrument id, at most 14 bytes. Empty for a mass cancel of every instrument.
+# -- order_id -> The order to cancel, for cancels. Other orders are given their id by the engine,
+#    except in replays, where an order recorded with its id keeps it. 0 if not recorded.
+# -- quantity -> Order quantity.
+# -- price -> Limit price, for limit and stop-limit orders.
+# -- stop_price -> Stop price, for stop and stop-limit orders.
+# -- sent_ns -> When the sender wrote the message, in nanoseconds. Live senders use
+#    time.perf_counter_ns(), and replay files the historical time since the epoch.
+# -- account_id -> Account id, at most 16 bytes. Empty if untagged, or for a mass cancel of every account.
+# -- client_order_id -> Client order id, at most 16 bytes. Empty if not given.
+ORDER = np.dtype([("order_type", "u1"),
+                  ("order_direction", "u1"),
+                  ("instrument_id", "S14"),
+                  ("order_id", "<i8"),
+                  ("quantity", "<f8"),
+                  ("price", "<f8"),
+                  ("stop_price", "<f8"),
+                  ("sent_ns", "<i8"),
+                  ("account_id", "S16"),
+                  ("client_order_id", "S16")])
+
+# The compact messages carry only the ORDER fields their order type uses, under the same names.
+LIMIT_ORDER = np.dtype([("order_direction", "u1"),
+                        ("instrument_id", "S14"),
+                        ("quantity", "<f8"),
+                        ("price", "<f8"),
+                        ("sent_ns", "<i8"),
+                        ("account_id", "S16"),
+                        ("client_order_id", "S16")])
+
+MARKET_ORDER = np.dtype([("order_direction", "u1"),
+                         ("instrument_id", "S14"),
+                         ("quantity", "<f8"),
+                         ("sent_ns", "<i8"),
+                         ("account_id", "S16"),
+                         ("client_order_id", "S16")])
+
+CANCEL_ORDER = np.dtype([("order_direction", "u1"),
+                         ("instrument_id", "S14"),
+                         ("order_id", "<i8"),
+                         ("sent_ns", "<i8"),
+                         ("client_order_id", "S16")])
+
+# An execution between two orders.
+# -- timestamp -> Nanoseconds since the epoch.
+# -- instrument_id -> Instrument id, at most 14 bytes.
+# -- price -> Execution price.
+# -- quantity -> Executed quantity.
+# -- bid_order_id -> The order_id of the bid, 0 if unknown.
+# -- ask_order_id -> The order_id of the ask, 0 if unknown.
+TRADE = np.dtype([("timestamp", "<i8"),
+                  ("instrument_id", "S14"),
+                  ("price", "<f8"),
+                  ("quantity", "<f8"),
+                  ("bid_order_id", "<i8"),
+                  ("ask_order_id", "<i8")])
+
+# An order lifecycle event, sent back to the order's sender.
+# -- event_type -> EventType value.
+# -- order_id -> The engine order_id of the order concerned. For cancel events, the order being cancelled.
+# -1 for a rejected quote, which has no order of its own.
+# -- client_order_id -> The client_order_id of the message which caused the event, empty if not given.
+# -- instrument_id -> Instrument id, at most 14 bytes.
+# -- price -> Fill price or the new price of a replaced order, nan for other events.
+# -- quantity -> Fill quantity, or the unfilled quantity for other events.
+EXECUTION_REPORT = np.dtype([("event_type", "u1"),
+                             ("order_id", "<i8"),
+                             ("client_order_id", "S16"),
+                             ("instrument_id", "S14"),
+                             ("price", "<f8"),
+                             ("quantity", "<f8")])
+
+MESSAGE_DTYPES = {MessageType.order: ORDER,
+                  MessageType.limit_order: LIMIT_ORDER,
+                  MessageType.market_order: MARKET_ORDER,
+                  MessageType.cancel_order: CANCEL_ORDER,
+                  MessageType.trade: TRADE,
+                  MessageType.execution_report: EXECUTION_REPORT}
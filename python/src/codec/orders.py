@@ -0,0 +1,252 @@
+from python.src.codec.messages import ORDER, MESSAGE_DTYPES
+from python.src.codec.frames import encode_frame, iter_frames
+from python.src.orders import AnyOrder
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.orders import CancelOrder
+from python.src.orders import MassCancelOrder
+from python.src.orders import StopOrder
+from python.src.orders import StopLimitOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from python.src.enums import MessageType
+from python.src.pools import OrderPool
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+ORDER_TYPES = {order_type.value: order_type for order_type in OrderType}
+ORDER_DIRECTIONS = {order_direction.value: order_direction for order_direction in OrderDirection}
+# Decoded directions, with 0 for a mass cancel on both sides.
+DECODED_DIRECTIONS: Dict[int, Optional[OrderDirection]] = {0: None, **ORDER_DIRECTIONS}
+ORDER_TYPE_VALUES = {order_type: order_type.value for order_type in OrderType}
+ORDER_DIRECTION_VALUES = {order_direction: order_direction.value for order_direction in OrderDirection}
+LIMIT = OrderType.limit
+MARKET = OrderType.market
+CANCEL = OrderType.cancel
+STOP = OrderType.stop
+STOP_LIMIT = OrderType.stop_limit
+MASS_CANCEL = OrderType.mass_cancel
+INSTRUMENT_ID_SIZE = ORDER["instrument_id"].itemsize
+ACCOUNT_ID_SIZE = ORDER["account_id"].itemsize
+CLIENT_ORDER_ID_SIZE = ORDER["client_order_id"].itemsize
+
+# Order types with a compact message. Other order types are sent as ORDER.
+COMPACT_MESSAGES = {LIMIT: MessageType.limit_order,
+                    MARKET: MessageType.market_order,
+                    CANCEL: MessageType.cancel_order}
+COMPACT_ORDER_TYPES = {message_type: order_type for order_type, message_type in COMPACT_MESSAGES.items()}
+MESSAGE_TYPE_OF_ORDER_TYPE = np.full(max(ORDER_TYPES) + 1, MessageType.order.value, dtype=np.uint16)
+for order_type, message_type in COMPACT_MESSAGES.items():
+    MESSAGE_TYPE_OF_ORDER_TYPE[order_type.value] = message_type.value
+
+
+def encode_field(value: str, size: int, name: str) -> bytes:
+    """ Encode a string field, which must fit in size bytes."""
+
+    encoded = value.encode()
+    if len(encoded) > size:
+        raise ValueError("{} is longer than {} bytes: {!r}".format(name, size, value))
+    return encoded
+
+
+def orders_to_records(orders: Iterable[AnyOrder], sent_ns: int = 0) -> np.ndarray:
+    """ Encode orders as an array of ORDER.
+
+    Enum values and encoded strings are looked up in dicts, as reading Enum.value
+    and encoding each string again would cost more than the rest of the row.
+    Raises ValueError for ids longer than their field, which would otherwise be truncated.
+    """
+    type_values = ORDER_TYPE_VALUES
+    direction_values = ORDER_DIRECTION_VALUES
+    instruments: Dict[Optional[str], bytes] = {None: b""}
+    accounts: Dict[Optional[str], bytes] = {None: b""}
+    rows: List[Tuple] = []
+    append = rows.append
+    # Fields are read according to order_type, so each order is used untyped.
+    order: Any
+    for order in orders:
+        order_type = order.order_type
+        instrument_id = order.instrument_id
+        if instrument_id not in instruments:
+            instruments[instrument_id] = encode_field(instrument_id, INSTRUMENT_ID_SIZE, "instrument_id")
+        account_id = order.account_id
+        if account_id not in accounts:
+            accounts[account_id] = encode_field(account_id, ACCOUNT_ID_SIZE, "account_id")
+        client_order_id = order.client_order_id
+        client_order_id = encode_field(client_order_id, CLIENT_ORDER_ID_SIZE, "client_order_id") \
+            if client_order_id else b""
+
+        if order_type is CANCEL:
+            append((type_values[order_type], direction_values[order.order_direction], instruments[instrument_id],
+                    order.order_id, 0., 0., 0., sent_ns, accounts[account_id], client_order_id))
+            continue
+
+        if order_type is MASS_CANCEL:
+            order_direction = order.order_direction
+            append((type_values[order_type], direction_values[order_direction] if order_direction else 0,
+                    instruments[instrument_id], 0, 0., 0., 0., sent_ns, accounts[account_id], client_order_id))
+            continue
+        append((type_values[order_type], direction_values[order.order_direction], instruments[instrument_id],
+                0, order.quantity,
+                order.price if order_type is LIMIT or order_type is STOP_LIMIT else 0.,
+                order.stop_price if order_type is STOP or order_type is STOP_LIMIT else 0.,
+                sent_ns, accounts[account_id], client_order_id))
+    return np.array(rows, dtype=ORDER)
+
+
+def records_to_orders(records: np.ndarray, order_pool: Optional[OrderPool] = None) -> List[AnyOrder]:
+    """ Build the orders described by an array of ORDER, recycling released orders from order_pool if given.
+
+    Records are converted to Python tuples in one call, then each is dispatched on its order type.
+    Enum members are compared by identity against module constants, and decoded strings are
+    cached, as these dominate the cost of decoding otherwise.
+    """
+    limit_order: Callable[..., LimitOrder] = LimitOrder
+    market_order: Callable[..., MarketOrder] = MarketOrder
+    stop_order: Callable[..., StopOrder] = StopOrder
+    stop_limit_order: Callable[..., StopLimitOrder] = StopLimitOrder
+    if order_pool is not None:
+        limit_order = order_pool.limit_order
+        market_order = order_pool.market_order
+        stop_order = order_pool.stop_order
+        stop_limit_order = order_pool.stop_limit_order
+    orders: List[AnyOrder] = []
+    append = orders.append
+    # Directions and strings are only None for empty fields, which only the order types allowing them have.
+    directions: Dict[int, Any] = DECODED_DIRECTIONS
+    strings: Dict[bytes, Any] = {b"": None}
+    for (order_type, order_direction, instrument_id, order_id, quantity, price, stop_price,
+         sent_ns, account_id, client_order_id) in records.tolist():
+
+        order_type = ORDER_TYPES[order_type]
+        order_direction = directions[order_direction]
+        if instrument_id not in strings:
+            strings[instrument_id] = instrument_id.decode()
+        if account_id not in strings:
+            strings[account_id] = account_id.decode()
+        instrument_id = strings[instrument_id]
+        account_id = strings[account_id]
+        client_order_id = client_order_id.decode() if client_order_id else None
+
+        if order_type is LIMIT:
+            append(limit_order(instrument_id, order_direction, quantity, price,
+                               account_id, client_order_id))
+        elif order_type is MARKET:
+            append(market_order(instrument_id, order_direction, quantity,
+                                account_id, client_order_id))
+        elif order_type is CANCEL:
+            append(CancelOrder(instrument_id, order_id, order_direction, client_order_id, account_id))
+        elif order_type is STOP:
+            append(stop_order(instrument_id, order_direction, quantity, stop_price,
+                              account_id, client_order_id))
+        elif order_type is STOP_LIMIT:
+            append(stop_limit_order(instrument_id, order_direction, quantity, stop_price, price,
+                                    account_id, client_order_id))
+        elif order_type is MASS_CANCEL:
+            append(MassCancelOrder(instrument_id, account_id, order_direction, client_order_id))
+        else:
+            raise ValueError("Cannot decode order type: {}".format(order_type))
+    return orders
+
+
+def restore_order_ids(orders: List[AnyOrder], records: np.ndarray,
+                      id_generator: Callable[[], int]) -> Optional[bool]:
+    """ Give orders decoded from records the order_id recorded with each, so recorded cancels find them.
+
+    Orders recorded without an id, as 0, take the next id of id_generator instead. Generated ids could
+    collide with recorded ones, so records must give an id to every order or to none, otherwise
+    ValueError is raised. Cancels already reference their recorded order, and mass cancels have no id.
+    Returns whether the orders were recorded with ids, or None when the records hold only cancels.
+    """
+    order_types = records["order_type"]
+    order_ids = records["order_id"][(order_types != CANCEL.value) & (order_types != MASS_CANCEL.value)]
+    if not len(order_ids):
+        return None
+    recorded = bool(order_ids.all())
+    if not recorded and order_ids.any():
+        raise ValueError("Records must give an order_id to every order or to none")
+    order: Any
+    for order, order_id in zip(orders, records["order_id"].tolist()):
+        order_type = order.order_type
+        if order_type is not CANCEL and order_type is not MASS_CANCEL:
+            order.order_id = order_id or id_generator()
+    return recorded
+
+
+def compact(records: np.ndarray, message_type: MessageType) -> np.ndarray:
+    """ Copy ORDER records into a compact message, one field at a time."""
+
+    dtype = MESSAGE_DTYPES[message_type]
+    result = np.empty(len(records), dtype=dtype)
+    for name in dtype.names or ():
+        result[name] = records[name]
+    return result
+
+
+def expand(records: np.ndarray, message_type: MessageType, out: np.ndarray) -> None:
+    """ Copy compact messages into out, an array of ORDER of the same length, one field at a time."""
+
+    out["order_type"] = COMPACT_ORDER_TYPES[message_type].value
+    for name in records.dtype.names or ():
+        out[name] = records[name]
+
+
+def encode_orders(orders: Iterable[AnyOrder], sent_ns: int = 0, min_run: int = 16) -> bytes:
+    """ Encode a sequence of orders as frames, keeping their order.
+
+    Runs of at least min_run consecutive orders with a compact message become a frame
+    of that message. Everything in between is sent as ORDER frames, as short frames
+    save fewer bytes than their headers and per-frame work cost.
+    Orders are encoded as ORDER in one pass and the runs are found on the array.
+    """
+    records = orders_to_records(orders, sent_ns)
+    n = len(records)
+    if not n:
+        return b""
+    message_types = MESSAGE_TYPE_OF_ORDER_TYPE[records["order_type"]]
+    # The compact cancel has no account, so cancels tagged with one are sent as ORDER.
+    message_types[(records["order_type"] == CANCEL.value) & (records["account_id"] != b"")] = MessageType.order.value
+    starts = np.flatnonzero(np.diff(message_types)) + 1
+    bounds = zip([0] + starts.tolist(), starts.tolist() + [n])
+
+    frames = []
+    pending = 0
+    for start, end in bounds:
+        if end - start < min_run or message_types[start] == MessageType.order:
+            continue
+        message_type = MessageType(int(message_types[start]))
+        if pending < start:
+            frames.append(encode_frame(MessageType.order, records[pending:start]))
+        frames.append(encode_frame(message_type, compact(records[start:end], message_type)))
+        pending = end
+    if pending < n:
+        frames.append(encode_frame(MessageType.order, records[pending:]))
+    return b"".join(frames)
+
+
+def decode_orders(buffer) -> List[AnyOrder]:
+    """ Build the orders in every frame of buffer, in order.
+
+    Every frame is copied into one array of ORDER, which is then decoded in a single pass.
+    """
+    return records_to_orders(decode_order_records(buffer))
+
+
+def decode_order_records(buffer) -> np.ndarray:
+    """ The orders in every frame of buffer, in order, copied into one array of ORDER."""
+
+    frames = list(iter_frames(buffer))
+    for message_type, _ in frames:
+        if message_type != MessageType.order and message_type not in COMPACT_ORDER_TYPES:
+            raise ValueError("Not an order message: {}".format(message_type.name))
+
+    records = np.zeros(sum(len(r) for _, r in frames), dtype=ORDER)
+    start = 0
+    for message_type, frame in frames:
+        end = start + len(frame)
+        if message_type == MessageType.order:
+            records[start:end] = frame
+        else:
+            expand(frame, message_type, records[start:end])
+        start = end
+    return records
@@ -0,0 +1,65 @@
+from python.src.codec.messages import TRADE
+from python.src.codec.frames import encode_frame, iter_frames
+from python.src.trades import Trade
+from python.src.trades import TradeBuffer
+from python.src.enums import MessageType
+from typing import Iterable, List
+import numpy as np
+
+
+def trades_to_records(trades: Iterable[Trade], instrument_id: str = "") -> np.ndarray:
+    """ Encode Trade objects as an array of TRADE.
+
+    Trade objects do not record the orders which traded, so their order ids are 0.
+    """
+    trades = list(trades)
+    records = np.zeros(len(trades), dtype=TRADE)
+    if trades:
+        records["timestamp"] = np.array([t.datetime for t in trades]).astype("datetime64[ns]").astype(np.int64)
+        records["price"] = [t.price for t in trades]
+        records["quantity"] = [t.quantity for t in trades]
+    records["instrument_id"] = instrument_id.encode()
+    return records
+
+
+def trade_buffer_to_records(trade_buffer: TradeBuffer, instrument_id: str = "") -> np.ndarray:
+    """ Encode the trades recorded in a TradeBuffer as an array of TRADE, a column at a time."""
+
+    size = trade_buffer.size
+    records = np.empty(size, dtype=TRADE)
+    records["timestamp"] = trade_buffer.times[:size]
+    records["instrument_id"] = instrument_id.encode()
+    records["price"] = trade_buffer.prices[:size]
+    records["quantity"] = trade_buffer.quantities[:size]
+    records["bid_order_id"] = trade_buffer.bid_order_ids[:size]
+    records["ask_order_id"] = trade_buffer.ask_order_ids[:size]
+    return records
+
+
+def records_to_trades(records: np.ndarray) -> List[Trade]:
+    """ Build Trade objects from an array of TRADE."""
+
+    times = records["timestamp"].astype("datetime64[ns]")
+    return [Trade(datetime=t, price=p, quantity=q)
+            for t, p, q in zip(times, records["price"].tolist(), records["quantity"].tolist())]
+
+
+def encode_trades(records: np.ndarray) -> bytes:
+    """ Encode an array of TRADE as a frame."""
+
+    return encode_frame(MessageType.trade, records)
+
+
+def decode_trades(buffer) -> np.ndarray:
+    """ The trades in every frame of buffer.
+
+    A buffer holding a single frame is decoded as a view, without copying.
+    """
+    frames = []
+    for message_type, records in iter_frames(buffer):
+        if message_type != MessageType.trade:
+            raise ValueError("Not a trade message: {}".format(message_type.name))
+        frames.append(records)
+    if len(frames) == 1:
+        return frames[0]
+    return np.concatenate(frames) if frames else np.zeros(0, dtype=TRADE)
@@ -1,3 +1,8 @@
 from .order_direction import OrderDirection
 from .order_type import OrderType
-from .order_status import OrderStatus
\ No newline at end of file
+from .order_status import OrderStatus
+from .matching_algorithm import MatchingAlgorithm
+from .execution_price_rule import ExecutionPriceRule
+from .event_type import EventType
+from .scheduling_policy import SchedulingPolicy
+from .message_type import MessageType
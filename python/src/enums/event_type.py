@@ -0,0 +1,25 @@
+from enum import IntEnum
+
+
+class EventType(IntEnum):
+    """ Implements the order lifecycle events reported to event sinks
+
+    Values are small integers so batched events can be stored in integer arrays.
+
+    -- accepted - an order was added to an order book.
+    -- rejected - an order was refused before reaching an order book.
+    -- filled - an order traded its last unfilled quantity.
+    -- partially_filled - an order traded but has quantity left.
+    -- cancelled - an order was cancelled.
+    -- cancel_rejected - a cancel found no live order to cancel.
+    -- replaced - a resting quote was given a new price or quantity in place.
+    -- test - an value used exclusively for error checking.
+    """
+    accepted = 1
+    rejected = 2
+    filled = 3
+    partially_filled = 4
+    cancelled = 5
+    cancel_rejected = 6
+    replaced = 7
+    test = 8
@@ -0,0 +1,13 @@
+from enum import Enum, auto
+
+
+class ExecutionPriceRule(Enum):
+    """ Implements the price at which two crossing orders trade
+
+    -- resting - the price of the order which was in the book first.
+    -- midpoint - halfway between the bid and ask prices.
+    -- test - an value used exclusively for error checking.
+    """
+    resting = auto()
+    midpoint = auto()
+    test = auto()
@@ -0,0 +1,15 @@
+from enum import Enum, auto
+
+
+class MatchingAlgorithm(Enum):
+    """ Implements how a crossing quantity is allocated between orders at the best price
+
+    -- price_time - orders fill in full in the order they arrived (FIFO).
+    -- pro_rata - orders fill in proportion to their size.
+    -- fifo_pro_rata - a fixed fraction is allocated FIFO and the remainder pro-rata.
+    -- test - an value used exclusively for error checking.
+    """
+    price_time = auto()
+    pro_rata = auto()
+    fifo_pro_rata = auto()
+    test = auto()
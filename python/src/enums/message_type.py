@@ -0,0 +1,23 @@
+from enum import IntEnum
+
+
+class MessageType(IntEnum):
+    """ Implements the messages of the binary wire protocol
+
+    Values other than test are written into frame headers, so they must never be renumbered.
+
+    -- order - any order type, in one fixed-width layout. Used where every record must be the same size.
+    -- limit_order - a compact limit order.
+    -- market_order - a compact market order.
+    -- cancel_order - a compact cancel.
+    -- trade - an execution.
+    -- execution_report - an order lifecycle event, sent back to the order's sender.
+    -- test - an value used exclusively for error checking.
+    """
+    order = 1
+    limit_order = 2
+    market_order = 3
+    cancel_order = 4
+    trade = 5
+    execution_report = 6
+    test = 7
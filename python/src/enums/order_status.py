@@ -7,9 +7,11 @@ class OrderStatus(Enum):
     -- live - an order presently in the book
     -- filled - an order that has completed filling.
     -- canceled - an order that was cancelled before complete fill.
+    -- rejected - an order that was refused and never reached the book.
     -- test - an value used exclusively for error checking.
     """
     live = auto()
     filled = auto()
     cancelled = auto()
+    rejected = auto()
     test = auto()
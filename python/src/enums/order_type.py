@@ -8,10 +8,18 @@ class OrderType(Enum):
     -- market - an order in the book to trade the security at the realised market price.
     -- cancel - an order to the engine to cancel a previous order if possible.
     -- amend - an order that can update an existing order.
+    -- stop - a market order held off the book until the market trades through its stop price.
+    -- stop_limit - a limit order held off the book until the market trades through its stop price.
+    -- mass_cancel - an order to the engine to cancel every live order of an account, instrument or side.
+    -- quote - a market maker's two-sided quote in one instrument, replacing its previous quote there.
     -- test - an value used exclusively for error checking.
     """
     limit = auto()
     market = auto()
     cancel = auto()
     amend = auto()
+    stop = auto()
+    stop_limit = auto()
+    mass_cancel = auto()
+    quote = auto()
     test = auto()
@@ -0,0 +1,15 @@
+from enum import Enum, auto
+
+
+class SchedulingPolicy(Enum):
+    """ Implements which instrument's queue the matching engine drains next
+
+    -- round_robin - instruments with queued orders take turns, a batch at a time.
+    -- weighted - as round_robin, but each instrument's batch is scaled by its weight.
+    -- deadline - the instrument whose oldest queued order is due soonest goes first.
+    -- test - an value used exclusively for error checking.
+    """
+    round_robin = auto()
+    weighted = auto()
+    deadline = auto()
+    test = auto()
@@ -0,0 +1,3 @@
+from .event_sink import EventSink
+from .event_fanout import EventFanout
+from .event_batch import EventBatch, NO_ORDER
@@ -0,0 +1,95 @@
+from .event_sink import EventSink
+from python.src.enums import EventType
+from python.src.orders import BaseOrder
+from python.src.orders import CancelOrder
+from python.src.orders import AnyCancel
+from python.src.orders import AnyOrder
+from array import array
+from typing import Callable
+import numpy as np
+
+# The order_id reported for a rejected mass cancel or quote, which have no order of their own.
+NO_ORDER = -1
+
+
+class EventBatch(EventSink):
+    """ Buffers events in preallocated columns and delivers them as one batch.
+
+    Events are written into the next row of fixed columns, in the same way as a
+    TradeBuffer. On flush() the filled rows are passed to the callback as NumPy
+    views, which are only valid during the call, and the columns are reused.
+    If the columns fill up between flushes the batch is delivered early, so
+    recording never allocates.
+
+    Attributes:
+    -- callback -> called as callback(event_types, order_ids, prices, quantities) on each flush.
+    -- size -> the number of buffered events.
+    -- event_types -> the EventType of each event.
+    -- order_ids -> the order_id of the order the event concerns. For cancel
+    events this is the order being cancelled, and NO_ORDER for a rejected mass cancel or quote.
+    -- prices -> the fill price or the new price of a replaced order, nan for other events.
+    -- quantities -> the fill quantity, or the unfilled quantity for other events.
+    """
+
+    def __init__(self,
+                 callback: Callable[[np.ndarray, np.ndarray, np.ndarray, np.ndarray], None],
+                 capacity: int = 4096):
+
+        self.callback = callback
+        self.size = 0
+        self.capacity = capacity
+        self._event_types = array("q", bytes(8 * capacity))
+        self._order_ids = array("q", bytes(8 * capacity))
+        self._prices = array("d", bytes(8 * capacity))
+        self._quantities = array("d", bytes(8 * capacity))
+        self.event_types = np.frombuffer(self._event_types, dtype=np.int64)
+        self.order_ids = np.frombuffer(self._order_ids, dtype=np.int64)
+        self.prices = np.frombuffer(self._prices, dtype=np.float64)
+        self.quantities = np.frombuffer(self._quantities, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def record(self, event_type: EventType, order_id: int, price: float, quantity: float) -> None:
+        size = self.size
+        if size == self.capacity:
+            self.flush()
+            size = 0
+        self._event_types[size] = event_type
+        self._order_ids[size] = order_id
+        self._prices[size] = price
+        self._quantities[size] = quantity
+        self.size = size + 1
+
+    def on_accepted(self, order: BaseOrder) -> None:
+        self.record(EventType.accepted, order.order_id, float("nan"), order.unfilled_quantity)
+
+    def on_rejected(self, order: AnyOrder, reason: str) -> None:
+        if not isinstance(order, BaseOrder):
+            self.record(EventType.rejected, NO_ORDER, float("nan"), 0.)
+            return None
+        self.record(EventType.rejected, order.order_id, float("nan"), order.unfilled_quantity)
+
+    def on_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        self.record(EventType.filled, order.order_id, price, quantity)
+
+    def on_partially_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        self.record(EventType.partially_filled, order.order_id, price, quantity)
+
+    def on_cancelled(self, order: BaseOrder, cancel_order: AnyCancel) -> None:
+        self.record(EventType.cancelled, order.order_id, float("nan"), order.unfilled_quantity)
+
+    def on_replaced(self, order: BaseOrder, previous_price: float, previous_quantity: float) -> None:
+        self.record(EventType.replaced, order.order_id, order.price, order.unfilled_quantity)
+
+    def on_cancel_rejected(self, cancel_order: CancelOrder) -> None:
+        self.record(EventType.cancel_rejected, cancel_order.order_id, float("nan"), 0.)
+
+    def flush(self) -> None:
+        """ Deliver the buffered events to the callback and reuse the columns."""
+
+        size = self.size
+        if size:
+            self.callback(self.event_types[:size], self.order_ids[:size],
+                          self.prices[:size], self.quantities[:size])
+            self.size = 0
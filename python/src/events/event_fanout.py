@@ -0,0 +1,57 @@
+from .event_sink import EventSink
+from python.src.orders import BaseOrder
+from python.src.orders import CancelOrder
+from python.src.orders import AnyOrder
+from python.src.orders import AnyCancel
+from python.src.orders import MassCancelOrder
+from typing import List
+
+
+class EventFanout(EventSink):
+    """ Reports every event to each of several sinks, in registration order.
+
+    Attributes:
+    -- sinks -> the sinks to report to.
+    -- fill_sinks -> the sinks which want fills, and the only ones fills are reported to.
+    """
+
+    def __init__(self, sinks: List[EventSink]):
+        self.sinks = sinks
+        self.fill_sinks = [sink for sink in sinks if sink.wants_fills]
+        self.wants_fills = bool(self.fill_sinks)
+
+    def on_accepted(self, order: BaseOrder) -> None:
+        for sink in self.sinks:
+            sink.on_accepted(order)
+
+    def on_rejected(self, order: AnyOrder, reason: str) -> None:
+        for sink in self.sinks:
+            sink.on_rejected(order, reason)
+
+    def on_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        for sink in self.fill_sinks:
+            sink.on_filled(order, price, quantity)
+
+    def on_partially_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        for sink in self.fill_sinks:
+            sink.on_partially_filled(order, price, quantity)
+
+    def on_cancelled(self, order: BaseOrder, cancel_order: AnyCancel) -> None:
+        for sink in self.sinks:
+            sink.on_cancelled(order, cancel_order)
+
+    def on_mass_cancelled(self, orders: List[BaseOrder], mass_cancel: MassCancelOrder) -> None:
+        for sink in self.sinks:
+            sink.on_mass_cancelled(orders, mass_cancel)
+
+    def on_replaced(self, order: BaseOrder, previous_price: float, previous_quantity: float) -> None:
+        for sink in self.sinks:
+            sink.on_replaced(order, previous_price, previous_quantity)
+
+    def on_cancel_rejected(self, cancel_order: CancelOrder) -> None:
+        for sink in self.sinks:
+            sink.on_cancel_rejected(cancel_order)
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            sink.flush()
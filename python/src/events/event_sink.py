@@ -0,0 +1,66 @@
+from python.src.orders import BaseOrder
+from python.src.orders import CancelOrder
+from python.src.orders import AnyOrder
+from python.src.orders import AnyCancel
+from python.src.orders import MassCancelOrder
+from typing import List
+
+
+class EventSink:
+    """ A consumer of order lifecycle events, registered with a MatchingEngine or an OrderBook.
+
+    Each event is a method call carrying the objects involved, so reporting
+    an event allocates nothing. Every method does nothing by default;
+    subclasses override the events they need.
+
+    Fills are the most frequent events, two per trade. A sink which does not need them
+    sets wants_fills to False, and books then skip reporting fills to it altogether.
+    """
+
+    wants_fills: bool = True
+
+    def on_accepted(self, order: BaseOrder) -> None:
+        """ An order was added to its order book."""
+        pass
+
+    def on_rejected(self, order: AnyOrder, reason: str) -> None:
+        """ An order was refused before reaching its order book.
+
+        Refused cancels are reported to on_cancel_rejected instead. Mass cancels and quotes
+        are reported here, and have no order_id or unfilled_quantity of their own.
+        """
+        pass
+
+    def on_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        """ An order traded its last unfilled quantity."""
+        pass
+
+    def on_partially_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        """ An order traded and has quantity left."""
+        pass
+
+    def on_cancelled(self, order: BaseOrder, cancel_order: AnyCancel) -> None:
+        """ An order was cancelled by cancel_order."""
+        pass
+
+    def on_mass_cancelled(self, orders: List[BaseOrder], mass_cancel: MassCancelOrder) -> None:
+        """ Orders of one book were cancelled together by mass_cancel.
+
+        Unlike the other events, this one reports each order to on_cancelled by default,
+        so sinks which only handle single cancels still see every cancelled order.
+        Sinks which can handle the whole batch at once override it.
+        """
+        for order in orders:
+            self.on_cancelled(order, mass_cancel)
+
+    def on_replaced(self, order: BaseOrder, previous_price: float, previous_quantity: float) -> None:
+        """ A resting quote order was given a new price or unfilled quantity in place."""
+        pass
+
+    def on_cancel_rejected(self, cancel_order: CancelOrder) -> None:
+        """ A cancel found no live order to cancel, or was refused before reaching its order book."""
+        pass
+
+    def flush(self) -> None:
+        """ Deliver any buffered events. Called by the MatchingEngine after each batch."""
+        pass
@@ -1 +1,5 @@
 from .invalid_order_direction_exception import InvalidOrderDirectionException
+from .use_after_release_exception import UseAfterReleaseException
+from .off_tick_price_exception import OffTickPriceException
+from .quote_without_account_exception import QuoteWithoutAccountException
+from .unpriced_market_order_exception import UnpricedMarketOrderException
@@ -0,0 +1,6 @@
+class OffTickPriceException(Exception):
+    """Raised when a limit price is not a multiple of the order book's tick size"""
+
+    def __init__(self, price: float, tick_size: float):
+        message = "Price {} is not a multiple of the tick size {}".format(price, tick_size)
+        super().__init__(message)
@@ -0,0 +1,6 @@
+class QuoteWithoutAccountException(Exception):
+    """Raised when a quote has no account_id, as the quote it replaces is found by account"""
+
+    def __init__(self):
+        message = "Quotes must have an account_id"
+        super().__init__(message)
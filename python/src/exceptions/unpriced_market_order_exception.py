@@ -0,0 +1,6 @@
+class UnpricedMarketOrderException(Exception):
+    """Raised when a market order would trade against a resting market order before the book has traded"""
+
+    def __init__(self):
+        message = "Market orders cannot trade with each other before there is a last trade price"
+        super().__init__(message)
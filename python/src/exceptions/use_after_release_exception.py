@@ -0,0 +1,6 @@
+class UseAfterReleaseException(Exception):
+    """Raised when a pooled object is used, or released again, after being released to its pool"""
+
+    def __init__(self, name: str):
+        message = "{} was used after being released to its pool".format(name)
+        super().__init__(message)
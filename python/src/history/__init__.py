@@ -0,0 +1,2 @@
+from .book_checkpoint import BookCheckpoint, CHECKPOINT_ORDER, BOOK_STATE, capture
+from .order_history import OrderHistory, InstrumentHistory, LOGGED_ORDER, load_history
@@ -0,0 +1,199 @@
+from python.src.order_book import OrderBook
+from python.src.orders import BaseOrder
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.orders import StopOrder
+from python.src.orders import StopLimitOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from python.src.enums import OrderStatus
+from python.src.enums import MatchingAlgorithm
+from python.src.enums import ExecutionPriceRule
+from typing import Callable, List, Optional, Set, cast
+import numpy as np
+
+# One live order of a checkpointed book, in the book's priority order.
+# -- kind -> The OrderType value the order was created as. Triggered stops keep kind stop or stop_limit.
+# -- order_type -> The current OrderType value, market or limit for a triggered stop.
+# -- order_direction -> OrderDirection value.
+# -- order_id -> The order's engine order_id.
+# -- quantity, unfilled_quantity -> The order's quantity and the part not yet traded.
+# -- price -> The order's current limit price, after any rounding to the tick.
+# -- stop_price -> The stop price of stop and stop-limit orders, 0 otherwise.
+# -- account_id, client_order_id -> Empty if not given.
+# -- quote -> Whether the order is its account's resting quote on its side.
+CHECKPOINT_ORDER = np.dtype([("kind", "u1"),
+                             ("order_type", "u1"),
+                             ("order_direction", "u1"),
+                             ("order_id", "<i8"),
+                             ("quantity", "<f8"),
+                             ("unfilled_quantity", "<f8"),
+                             ("price", "<f8"),
+                             ("stop_price", "<f8"),
+                             ("account_id", "S16"),
+                             ("client_order_id", "S16"),
+                             ("quote", "?")])
+
+# Everything else about a checkpointed book.
+# -- sequence -> The number of orders logged before the checkpoint. The book reflects exactly those.
+# -- timestamp -> The time of the checkpoint, nanoseconds since the epoch.
+# -- instrument_id -> Instrument id, at most 14 bytes.
+# -- bids, asks -> The number of live orders on each side, which come first in the orders, bids then asks.
+# The remaining orders are pending stops, buy stops then sell stops.
+# -- last_price -> The price of the book's last trade, nan before the first.
+# -- aggressor_id -> The order_id of the book's aggressor, -1 if none.
+# -- in_auction -> Whether the book was collecting orders for an auction.
+# -- matching_algorithm, fifo_fraction, execution_price_rule, tick_size -> The book's configuration.
+# The tick size is nan if prices are not rounded.
+BOOK_STATE = np.dtype([("sequence", "<i8"),
+                       ("timestamp", "<i8"),
+                       ("instrument_id", "S14"),
+                       ("bids", "<i8"),
+                       ("asks", "<i8"),
+                       ("last_price", "<f8"),
+                       ("aggressor_id", "<i8"),
+                       ("in_auction", "?"),
+                       ("matching_algorithm", "u1"),
+                       ("fifo_fraction", "<f8"),
+                       ("execution_price_rule", "u1"),
+                       ("tick_size", "<f8")])
+
+KINDS = {LimitOrder: OrderType.limit.value,
+         MarketOrder: OrderType.market.value,
+         StopOrder: OrderType.stop.value,
+         StopLimitOrder: OrderType.stop_limit.value}
+ORDER_TYPES = {order_type.value: order_type for order_type in OrderType}
+ORDER_DIRECTIONS = {order_direction.value: order_direction for order_direction in OrderDirection}
+MATCHING_ALGORITHMS = {algorithm.value: algorithm for algorithm in MatchingAlgorithm}
+EXECUTION_PRICE_RULES = {rule.value: rule for rule in ExecutionPriceRule}
+
+
+class BookCheckpoint:
+    """ The live state of an OrderBook at a point in its order log, in two compact arrays.
+
+    A checkpoint holds what the book needs to carry on matching exactly as it would have:
+    every live order and pending stop in priority order, which of them are resting quotes,
+    the last trade price, the aggressor and the book's configuration. Trade and completed order history is not kept.
+    Being plain NumPy arrays, checkpoints are cheap to store, save and send between processes.
+
+    Attributes:
+    -- state -> A single BOOK_STATE record.
+    -- orders -> The book's live orders as CHECKPOINT_ORDER records, bids then asks then stops,
+    each in priority order.
+    """
+
+    __slots__ = ("state", "orders")
+
+    def __init__(self, state: np.ndarray, orders: np.ndarray):
+        self.state = state
+        self.orders = orders
+
+    @property
+    def sequence(self) -> int:
+        return int(self.state["sequence"])
+
+    @property
+    def timestamp(self) -> int:
+        return int(self.state["timestamp"])
+
+    def restore(self, clock: Optional[Callable[[], int]] = None) -> OrderBook:
+        """ Build a new OrderBook in the checkpointed state, stamping trades with clock if given.
+
+        Each side is added in one sorted update. The update sort is stable, so orders at
+        the same price keep the time priority of the checkpoint.
+        """
+        state = self.state
+        tick_size = float(state["tick_size"])
+        order_book = OrderBook(matching_algorithm=MATCHING_ALGORITHMS[int(state["matching_algorithm"])],
+                               fifo_fraction=float(state["fifo_fraction"]),
+                               execution_price_rule=EXECUTION_PRICE_RULES[int(state["execution_price_rule"])],
+                               clock=clock,
+                               tick_size=None if np.isnan(tick_size) else tick_size)
+        instrument_id = state["instrument_id"].item().decode()
+        orders = [restore_order(instrument_id, row) for row in self.orders.tolist()]
+        bids = orders[:int(state["bids"])]
+        asks = orders[len(bids):len(bids) + int(state["asks"])]
+        stops = orders[len(bids) + len(asks):]
+        if bids:
+            order_book.best_bid = bids[0]
+            order_book.bids.update(bids[1:])
+        if asks:
+            order_book.best_ask = asks[0]
+            order_book.asks.update(asks[1:])
+        trigger_book = order_book.trigger_book
+        trigger_book.buy_stops.update(o for o in stops if o.order_direction == OrderDirection.buy)
+        trigger_book.sell_stops.update(o for o in stops if o.order_direction == OrderDirection.sell)
+        for order in orders:
+            order_book.index(order)
+        for order, quote in zip(orders, self.orders["quote"].tolist()):
+            if quote:
+                quote_ids = order_book.quotes.setdefault(cast(str, order.account_id), [None, None])
+                quote_ids[0 if order.order_direction == OrderDirection.buy else 1] = order.order_id
+
+        last_price = float(state["last_price"])
+        order_book.last_price = None if np.isnan(last_price) else last_price
+        order_book.aggressor = order_book.order_index.get(int(state["aggressor_id"]))
+        order_book.in_auction = bool(state["in_auction"])
+        return order_book
+
+
+def restore_order(instrument_id: str, row: tuple) -> BaseOrder:
+    """ Rebuild a live order from a CHECKPOINT_ORDER row."""
+
+    (kind, order_type, order_direction, order_id, quantity, unfilled_quantity, price, stop_price,
+     account_id, client_order_id, quote) = row
+    direction = ORDER_DIRECTIONS[order_direction]
+    account = account_id.decode() if account_id else None
+    client = client_order_id.decode() if client_order_id else None
+    order: BaseOrder
+    if kind == OrderType.limit.value:
+        order = LimitOrder(instrument_id, direction, quantity, price, account, client)
+    elif kind == OrderType.market.value:
+        order = MarketOrder(instrument_id, direction, quantity, account, client)
+    elif kind == OrderType.stop.value:
+        order = StopOrder(instrument_id, direction, quantity, stop_price, account, client)
+    else:
+        order = StopLimitOrder(instrument_id, direction, quantity, stop_price, price, account, client)
+    order.order_type = ORDER_TYPES[order_type]
+    order.order_id = order_id
+    order.unfilled_quantity = unfilled_quantity
+    order.price = price
+    return order
+
+
+def checkpoint_rows(orders: List[BaseOrder], quote_ids: Set[Optional[int]]) -> List[tuple]:
+    """ The CHECKPOINT_ORDER rows of live orders, of which those in quote_ids are resting quotes."""
+
+    return [(KINDS[type(order)], order.order_type.value, order.order_direction.value, order.order_id,
+             order.quantity, order.unfilled_quantity, order.price, getattr(order, "stop_price", 0.),
+             (order.account_id or "").encode(), (order.client_order_id or "").encode(),
+             order.order_id in quote_ids)
+            for order in orders]
+
+
+def capture(order_book: OrderBook, instrument_id: str, sequence: int, timestamp: int) -> BookCheckpoint:
+    """ Checkpoint a book which reflects the first sequence orders of the log, at timestamp."""
+
+    bids: List[BaseOrder] = []
+    if order_book.best_bid is not None:
+        bids.append(order_book.best_bid)
+        bids.extend(order_book.bids)
+    asks: List[BaseOrder] = []
+    if order_book.best_ask is not None:
+        asks.append(order_book.best_ask)
+        asks.extend(order_book.asks)
+    trigger_book = order_book.trigger_book
+    quote_ids = {order_id for quote_ids in order_book.quotes.values() for order_id in quote_ids}
+    orders = np.array(checkpoint_rows(bids + asks + list(trigger_book.buy_stops) + list(trigger_book.sell_stops),
+                                      quote_ids),
+                      dtype=CHECKPOINT_ORDER)
+
+    aggressor = order_book.aggressor
+    tick_size = order_book.tick_size
+    state = np.array((sequence, timestamp, instrument_id.encode(), len(bids), len(asks),
+                      order_book.last_price if order_book.last_price is not None else np.nan,
+                      aggressor.order_id if aggressor is not None and aggressor.status == OrderStatus.live else -1,
+                      order_book.in_auction, order_book.matching_algorithm.value, order_book.fifo_fraction,
+                      order_book.execution_price_rule.value, tick_size if tick_size is not None else np.nan),
+                     dtype=BOOK_STATE)
+    return BookCheckpoint(state, orders)
@@ -0,0 +1,358 @@
+from python.src.history.book_checkpoint import BookCheckpoint, BOOK_STATE, CHECKPOINT_ORDER, capture
+from python.src.order_book import OrderBook
+from python.src.orders import AnyOrder
+from python.src.orders import BaseOrder
+from python.src.orders import Quote
+from python.src.codec import ORDER
+from python.src.codec import records_to_orders
+from python.src.codec.orders import ORDER_TYPE_VALUES, ORDER_DIRECTION_VALUES
+from python.src.codec.orders import LIMIT, CANCEL, MASS_CANCEL, STOP, STOP_LIMIT
+from python.src.enums import OrderType
+from python.src.exceptions import InvalidOrderDirectionException
+from python.src.exceptions import OffTickPriceException
+from python.src.exceptions import QuoteWithoutAccountException
+from python.src.exceptions import UnpricedMarketOrderException
+from python.src.replay import SimulatedClock
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+import os
+import time
+
+# An order as logged by OrderHistory: the ORDER record it would be sent as, with its place in the log.
+# -- sequence -> The position of the order in the log of every instrument, from 0.
+# -- order_id -> For cancels the order to cancel, and for every other order but mass cancels
+#    the order_id it was given, so a replay gives it the same id.
+# -- sent_ns -> When the engine processed the order, by the order book's clock.
+# -- ask_order_id, ask_quantity, ask_price -> The ask of a quote, 0 for other orders. A quote's
+#    bid is in order_id, quantity and price. Its order ids are those of the orders it creates,
+#    0 for a side which creates none.
+# The other fields are those of ORDER. The engine's start_auction() and uncross() are logged
+# for each book as rows of order_type START_AUCTION and UNCROSS, with only sequence,
+# instrument_id and sent_ns set.
+LOGGED_ORDER = np.dtype([("sequence", "<i8")] + ORDER.descr +
+                        [("ask_order_id", "<i8"), ("ask_quantity", "<f8"), ("ask_price", "<f8")])
+
+ORDER_FIELDS = list(ORDER.names or ())
+QUOTE = OrderType.quote
+QUOTE_VALUE = QUOTE.value
+# The order_type values of logged book events, which no OrderType has.
+START_AUCTION = 254
+UNCROSS = 255
+NOT_DECODED = [QUOTE_VALUE, START_AUCTION, UNCROSS]
+
+
+class InstrumentHistory:
+    """ The order log and checkpoints of one instrument.
+
+    Logged orders are kept as rows until chunk_size of them have built up, then
+    packed into a LOGGED_ORDER array, so logging costs a tuple per order.
+
+    Attributes:
+    -- instrument_id -> The instrument.
+    -- chunks -> The packed log, oldest first.
+    -- pending -> Logged rows not yet packed.
+    -- checkpoints -> The instrument's checkpoints, oldest first.
+    -- checkpoint_sequences -> The sequence of each checkpoint, for bisecting.
+    -- since_checkpoint -> The number of orders logged since the last checkpoint.
+    """
+
+    def __init__(self, instrument_id: str, chunk_size: int = 4096):
+        self.instrument_id = instrument_id
+        self.chunk_size = chunk_size
+        self.chunks: List[np.ndarray] = []
+        self.pending: List[tuple] = []
+        self.checkpoints: List[BookCheckpoint] = []
+        self.checkpoint_sequences: List[int] = []
+        self.since_checkpoint = 0
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks) + len(self.pending)
+
+    def add_checkpoint(self, checkpoint: BookCheckpoint) -> None:
+        self.checkpoints.append(checkpoint)
+        self.checkpoint_sequences.append(checkpoint.sequence)
+        self.since_checkpoint = 0
+
+    def append(self, row: tuple) -> None:
+        pending = self.pending
+        pending.append(row)
+        self.since_checkpoint += 1
+        if len(pending) >= self.chunk_size:
+            self.pack()
+
+    def pack(self) -> None:
+        """ Pack the pending rows into a chunk."""
+
+        if self.pending:
+            self.chunks.append(np.array(self.pending, dtype=LOGGED_ORDER))
+            self.pending = []
+
+    def log(self) -> np.ndarray:
+        """ The whole log as one LOGGED_ORDER array."""
+
+        self.pack()
+        if not self.chunks:
+            return np.zeros(0, dtype=LOGGED_ORDER)
+        if len(self.chunks) > 1:
+            self.chunks = [np.concatenate(self.chunks)]
+        return self.chunks[0]
+
+    def sequence_at(self, timestamp: int) -> int:
+        """ The sequence of the instrument's last order processed at or before timestamp, -1 if none."""
+
+        log = self.log()
+        index = int(np.searchsorted(log["sent_ns"], timestamp, side="right"))
+        return int(log["sequence"][index - 1]) if index else -1
+
+    def checkpoint_before(self, sequence: int) -> Optional[BookCheckpoint]:
+        """ The latest checkpoint reflecting no orders after sequence."""
+
+        index = bisect_right(self.checkpoint_sequences, sequence + 1)
+        return self.checkpoints[index - 1] if index else None
+
+    def between(self, start: int, end: int) -> np.ndarray:
+        """ The logged orders with start <= sequence <= end, as a LOGGED_ORDER array."""
+
+        log = self.log()
+        sequences = log["sequence"]
+        return log[np.searchsorted(sequences, start):np.searchsorted(sequences, end, side="right")]
+
+
+def replay(order_book: OrderBook, records: np.ndarray, clock: SimulatedClock) -> None:
+    """ Process logged orders through a book exactly as the engine did, one add and match per order.
+
+    Quotes create their orders with the ids logged for them, and logged auction starts
+    and uncrosses are applied to the book in their place.
+    """
+    decoded = ~np.isin(records["order_type"], NOT_DECODED)
+    orders = iter(records_to_orders(records[decoded][ORDER_FIELDS]))
+    for (_, order_type, _, instrument_id, order_id, quantity, price, _, now, account_id, client_order_id,
+         ask_order_id, ask_quantity, ask_price) in records.tolist():
+        clock.now = now
+        if order_type == START_AUCTION:
+            order_book.start_auction()
+            continue
+        if order_type == UNCROSS:
+            order_book.uncross()
+            continue
+        order: AnyOrder
+        if order_type == QUOTE_VALUE:
+            quote = Quote(instrument_id.decode(), price, quantity, ask_price, ask_quantity,
+                          account_id.decode() or None, client_order_id.decode() or None)
+            quote.bid_order_id = order_id
+            quote.ask_order_id = ask_order_id
+            order = quote
+        else:
+            order = next(orders)
+            if isinstance(order, BaseOrder):
+                order.order_id = order_id
+        try:
+            order_book.add_order(order)
+            order_book.match()
+        except (InvalidOrderDirectionException, OffTickPriceException, QuoteWithoutAccountException,
+                UnpricedMarketOrderException):
+            pass
+
+
+def reconstruct_checkpoint(history: InstrumentHistory, sequence: int) -> Optional[BookCheckpoint]:
+    """ The state of an instrument's book after every order up to sequence, as a checkpoint.
+
+    The nearest checkpoint is restored and only the orders logged after it are replayed.
+    Returns None if the instrument had no orders by then.
+    """
+    checkpoint = history.checkpoint_before(sequence)
+    if checkpoint is None:
+        return None
+    clock = SimulatedClock(checkpoint.timestamp)
+    order_book = checkpoint.restore(clock)
+    records = history.between(checkpoint.sequence, sequence)
+    replay(order_book, records, clock)
+    end = int(records["sequence"][-1]) + 1 if len(records) else checkpoint.sequence
+    return capture(order_book, history.instrument_id, end, clock.now)
+
+
+class OrderHistory:
+    """ An order log with periodic checkpoints, from which any book can be rebuilt as it was at any point.
+
+    Registered with a MatchingEngine, it logs every order which reaches a book, with a
+    sequence number across all instruments, the order_id it was given and the time it
+    was processed. Every checkpoint_interval orders of an instrument, before logging
+    the next, it checkpoints the instrument's book (see BookCheckpoint). The engine's
+    processing is deterministic, so restoring the latest checkpoint at or before a point
+    and replaying the orders logged between the two rebuilds the book exactly, at a cost
+    of at most checkpoint_interval orders rather than a replay from the start of the day.
+
+    The log records orders, not their effects, so it must see every order which reaches
+    the book, and the engine's start_auction() and uncross(), which it logs for each book.
+    Quotes are logged with the ids of the orders they create, which it gives them, so
+    replayed quotes create the same orders. Rebuilt books hold no trade or completed order history.
+
+    Attributes:
+    -- checkpoint_interval -> The number of an instrument's orders between its checkpoints.
+    -- chunk_size -> The number of logged orders packed into each array of an instrument's log.
+    -- sequence -> The sequence of the next order logged.
+    -- instruments -> The InstrumentHistory of each instrument, by instrument id.
+    """
+
+    def __init__(self, checkpoint_interval: int = 10_000, chunk_size: int = 4096):
+        self.checkpoint_interval = checkpoint_interval
+        self.chunk_size = chunk_size
+        self.sequence = 0
+        self.instruments: Dict[str, InstrumentHistory] = {}
+        self._strings: Dict[Optional[str], bytes] = {None: b""}
+
+    def record(self, instrument_id: str, order: AnyOrder, order_book: OrderBook) -> None:
+        """ Log an order about to be added to order_book, checkpointing the book first if one is due."""
+
+        now = order_book.clock() if order_book.clock is not None else time.time_ns()
+        self.append(instrument_id, self.row(instrument_id, order, order_book, now), order_book, now)
+
+    def record_start_auction(self, instrument_id: str, order_book: OrderBook) -> None:
+        """ Log the engine putting order_book into a call auction."""
+
+        now = self.now(order_book)
+        self.append(instrument_id, self.event_row(START_AUCTION, instrument_id, now), order_book, now)
+
+    def record_uncross(self, instrument_id: str, order_book: OrderBook) -> None:
+        """ Log the engine uncrossing order_book."""
+
+        now = self.now(order_book)
+        self.append(instrument_id, self.event_row(UNCROSS, instrument_id, now), order_book, now)
+
+    def now(self, order_book: OrderBook) -> int:
+        return order_book.clock() if order_book.clock is not None else time.time_ns()
+
+    def append(self, instrument_id: str, row: tuple, order_book: OrderBook, now: int) -> None:
+        """ Log a row, checkpointing the book first if one is due."""
+
+        history = self.instruments.get(instrument_id)
+        if history is None:
+            history = self.instruments[instrument_id] = InstrumentHistory(instrument_id, self.chunk_size)
+            history.since_checkpoint = self.checkpoint_interval
+        if history.since_checkpoint >= self.checkpoint_interval:
+            history.add_checkpoint(capture(order_book, instrument_id, self.sequence, now))
+        history.append(row)
+        self.sequence += 1
+
+    def event_row(self, order_type: int, instrument_id: str, now: int) -> tuple:
+        return (self.sequence, order_type, 0, instrument_id.encode(), 0, 0., 0., 0., now, b"", b"", 0, 0., 0.)
+
+    def row(self, instrument_id: str, order: AnyOrder, order_book: OrderBook, now: int) -> tuple:
+        """ The LOGGED_ORDER row of an order, taken before the book can change it."""
+
+        order_type = order.order_type
+        # Each order type has only the fields its order_type picks out below.
+        logged: Any = order
+        strings = self._strings
+        if instrument_id not in strings:
+            strings[instrument_id] = instrument_id.encode()
+        client_order_id = logged.client_order_id.encode() if logged.client_order_id else b""
+        if order_type is CANCEL:
+            return (self.sequence, ORDER_TYPE_VALUES[order_type], ORDER_DIRECTION_VALUES[logged.order_direction],
+                    strings[instrument_id], logged.order_id, 0., 0., 0., now, b"", client_order_id, 0, 0., 0.)
+
+        account_id = logged.account_id
+        if account_id not in strings:
+            strings[account_id] = account_id.encode()
+        if order_type is QUOTE:
+            self.number_quote(logged, order_book)
+            return (self.sequence, QUOTE_VALUE, 0, strings[instrument_id],
+                    logged.bid_order_id, logged.bid_quantity, logged.bid_price, 0., now,
+                    strings[account_id], client_order_id, logged.ask_order_id, logged.ask_quantity, logged.ask_price)
+        order_direction = ORDER_DIRECTION_VALUES.get(logged.order_direction, 0)
+        if order_type is MASS_CANCEL:
+            return (self.sequence, ORDER_TYPE_VALUES[order_type], order_direction, strings[instrument_id],
+                    0, 0., 0., 0., now, strings[account_id], client_order_id, 0, 0., 0.)
+        return (self.sequence, ORDER_TYPE_VALUES[order_type], order_direction, strings[instrument_id],
+                logged.order_id, logged.quantity,
+                logged.price if order_type is LIMIT or order_type is STOP_LIMIT else 0.,
+                logged.stop_price if order_type is STOP or order_type is STOP_LIMIT else 0.,
+                now, strings[account_id], client_order_id, 0, 0., 0.)
+
+    def number_quote(self, quote: Quote, order_book: OrderBook) -> None:
+        """ Give a quote the order_id of each order it will create, for sides quoted without a live order."""
+
+        quote.bid_order_id = 0
+        quote.ask_order_id = 0
+        if quote.account_id is None:
+            return None
+        bid_id, ask_id = order_book.quotes.get(quote.account_id, (None, None))
+        order_index = order_book.order_index
+        if quote.bid_quantity > 0 and bid_id not in order_index:
+            quote.bid_order_id = BaseOrder.id_generator()
+        if quote.ask_quantity > 0 and ask_id not in order_index:
+            quote.ask_order_id = BaseOrder.id_generator()
+
+    def target(self, history: InstrumentHistory, sequence: Optional[int], timestamp: Optional[int]) -> int:
+        """ The last sequence to replay for a point given by sequence, timestamp, both or neither (now)."""
+
+        last = self.sequence - 1
+        if sequence is not None:
+            last = min(last, sequence)
+        if timestamp is not None:
+            last = min(last, history.sequence_at(timestamp))
+        return last
+
+    def reconstruct(self, instrument_id: str, sequence: Optional[int] = None,
+                    timestamp: Optional[int] = None) -> Optional[OrderBook]:
+        """ Rebuild an instrument's book as it was after the order at sequence, or the last order at or before timestamp.
+
+        Returns None if the instrument had no orders by then.
+        """
+        history = self.instruments.get(instrument_id)
+        if history is None:
+            return None
+        checkpoint = reconstruct_checkpoint(history, self.target(history, sequence, timestamp))
+        return checkpoint.restore() if checkpoint is not None else None
+
+    def reconstruct_many(self, instrument_ids: Iterable[str], sequence: Optional[int] = None,
+                         timestamp: Optional[int] = None, max_workers: Optional[int] = None) -> Dict[str, OrderBook]:
+        """ Rebuild the books of many instruments at one point, one worker process per instrument at a time.
+
+        Each worker is sent only its instrument's history, and sends back a checkpoint of the
+        rebuilt book rather than the book itself. The book is restored from it in this process.
+        Instruments without orders by then are left out.
+        """
+        histories = [self.instruments[i] for i in instrument_ids if i in self.instruments]
+        targets = [self.target(history, sequence, timestamp) for history in histories]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            checkpoints = list(executor.map(reconstruct_checkpoint, histories, targets))
+        return {history.instrument_id: checkpoint.restore()
+                for history, checkpoint in zip(histories, checkpoints) if checkpoint is not None}
+
+    def save(self, directory: str) -> None:
+        """ Write every instrument's log and checkpoints to directory, one .npz file per instrument."""
+
+        os.makedirs(directory, exist_ok=True)
+        for instrument_id, history in self.instruments.items():
+            checkpoints = history.checkpoints
+            np.savez(os.path.join(directory, instrument_id + ".npz"),
+                     log=history.log(),
+                     states=np.array([c.state for c in checkpoints], dtype=BOOK_STATE),
+                     orders=np.concatenate([c.orders for c in checkpoints]) if checkpoints
+                     else np.zeros(0, dtype=CHECKPOINT_ORDER),
+                     lengths=np.array([len(c.orders) for c in checkpoints], dtype=np.int64))
+
+
+def load_history(directory: str, checkpoint_interval: int = 10_000, chunk_size: int = 4096) -> OrderHistory:
+    """ Read an OrderHistory written by OrderHistory.save()."""
+
+    order_history = OrderHistory(checkpoint_interval, chunk_size)
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".npz"):
+            continue
+        with np.load(os.path.join(directory, name)) as data:
+            history = InstrumentHistory(name[:-len(".npz")], chunk_size)
+            log = data["log"]
+            if len(log):
+                history.chunks.append(log)
+                order_history.sequence = max(order_history.sequence, int(log["sequence"][-1]) + 1)
+            offsets = np.r_[0, np.cumsum(data["lengths"])]
+            for state, start, end in zip(data["states"], offsets[:-1], offsets[1:]):
+                history.add_checkpoint(BookCheckpoint(state, data["orders"][start:end]))
+            history.since_checkpoint = len(log) - int(np.searchsorted(log["sequence"], history.checkpoint_sequences[-1])) \
+                if history.checkpoints else checkpoint_interval
+        order_history.instruments[history.instrument_id] = history
+    return order_history
@@ -0,0 +1,3 @@
+from .id_generator import IdGenerator
+from .id_sequence import IdSequence
+from .block_id_generator import BlockIdGenerator
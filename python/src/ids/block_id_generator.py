@@ -0,0 +1,30 @@
+from typing import Iterator
+from .id_sequence import IdSequence
+
+
+class BlockIdGenerator:
+    """ Hands out ids from blocks reserved on a shared IdSequence.
+
+    Each shard or worker owns one generator. Ids within a block are handed out
+    without touching shared state, so workers only contend when a block runs out.
+    Ids are unique across every generator on the same sequence, and increase
+    monotonically within each generator.
+
+    A generator belongs to one shard and should not itself be shared between threads.
+
+    Attributes:
+    -- sequence -> The shared sequence blocks are reserved from.
+    -- block_size -> The number of ids reserved at a time.
+    """
+
+    def __init__(self, sequence: IdSequence, block_size: int = 4096):
+        self.sequence = sequence
+        self.block_size = block_size
+        self._ids: Iterator[int] = iter(())
+
+    def __call__(self) -> int:
+        try:
+            return next(self._ids)
+        except StopIteration:
+            self._ids = iter(self.sequence.reserve(self.block_size))
+            return next(self._ids)
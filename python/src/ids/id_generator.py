@@ -0,0 +1,20 @@
+from itertools import count
+
+
+class IdGenerator:
+    """ Hands out monotonically increasing ids within a single process.
+
+    Calling the generator returns the next id. itertools.count advances in a single
+    C call, so under the GIL two threads can never be handed the same id and no
+    lock is taken on the hot path.
+
+    Attributes:
+    -- start -> The first id handed out.
+    """
+
+    def __init__(self, start: int = 1):
+        self.start = start
+        self._ids = count(start)
+
+    def __call__(self) -> int:
+        return next(self._ids)
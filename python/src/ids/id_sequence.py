@@ -0,0 +1,32 @@
+from multiprocessing import Value
+
+
+class IdSequence:
+    """ A sequence of ids shared between processes, handed out in blocks.
+
+    The next free id lives in shared memory behind a lock. Workers reserve whole
+    blocks at once, so the lock is taken once per block rather than once per id.
+    Pass the sequence to worker processes when they are created.
+
+    Attributes:
+    -- start -> The first id in the sequence.
+    """
+
+    def __init__(self, start: int = 1):
+        self.start = start
+        self._next_id = Value("q", start)
+
+    def reserve(self, block_size: int) -> range:
+        """ Reserve the next block_size ids for the caller's exclusive use."""
+
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        with self._next_id.get_lock():
+            first = self._next_id.value
+            self._next_id.value = first + block_size
+        return range(first, first + block_size)
+
+    def peek(self) -> int:
+        """ The first id not yet reserved."""
+
+        return self._next_id.value
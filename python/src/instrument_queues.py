@@ -0,0 +1,194 @@
+from python.src.orders import AnyOrder
+from python.src.enums import SchedulingPolicy
+from collections import deque
+from heapq import heappush, heappop
+from itertools import count
+from typing import Callable, Dict, List, Optional, Tuple
+import threading
+import time
+
+
+class InstrumentQueues:
+    """ Orders waiting for the matching engine, queued per instrument.
+
+    A single queue makes every instrument wait behind a burst on any one of them.
+    Here each instrument has its own queue and a scheduler decides which queue is
+    drained next, a batch at a time, so a quiet instrument waits for at most one
+    batch of each busy instrument rather than for the whole burst.
+
+    Only instruments with queued orders are scheduled: a deque of instruments in
+    turn for round_robin and weighted, and a heap keyed on the deadline of each
+    queue's oldest order for deadline. Appending and scheduling are both O(1),
+    O(log k) for deadline with k busy instruments.
+
+    Orders are appended on the caller's thread while the engine thread takes batches,
+    so append and next_batch hold a lock while they update the queues and the schedule.
+
+    A mass cancel without an instrument_id belongs to every queue, so it is queued as a
+    barrier instead: it is handed out once every order queued before it has been taken,
+    and no order queued after it is taken before it.
+
+    Attributes:
+    -- policy -> The SchedulingPolicy choosing the next instrument.
+    -- batch_size -> The most orders taken from one instrument at a time.
+    -- weights -> Under weighted, the multiple of batch_size each instrument takes. Default 1.
+    -- deadlines -> Under deadline, how long each instrument's orders may wait, in seconds.
+    Instruments not listed use default_deadline.
+    -- default_deadline -> The deadline of instruments not in deadlines.
+    -- clock -> The time source for deadlines, in seconds.
+    -- queues -> The queued orders of each instrument.
+    -- enqueued -> The number of orders ever queued for each instrument.
+    -- dequeued -> The number of orders ever taken from each instrument's queue.
+    -- max_backlog -> The longest each instrument's queue has been.
+    """
+
+    def __init__(self,
+                 policy: SchedulingPolicy = SchedulingPolicy.round_robin,
+                 batch_size: int = 64,
+                 weights: Optional[Dict[str, int]] = None,
+                 deadlines: Optional[Dict[str, float]] = None,
+                 default_deadline: float = 1e-3,
+                 clock: Callable[[], float] = time.monotonic):
+
+        if policy not in (SchedulingPolicy.round_robin,
+                          SchedulingPolicy.weighted,
+                          SchedulingPolicy.deadline):
+            raise ValueError("Unknown scheduling policy: {}".format(policy))
+        self.policy = policy
+        self.batch_size = batch_size
+        self.weights: Dict[str, int] = weights or {}
+        self.deadlines: Dict[str, float] = deadlines or {}
+        self.default_deadline = default_deadline
+        self.clock = clock
+        self.queues: Dict[str, deque] = {}
+        self.enqueued: Dict[str, int] = {}
+        self.dequeued: Dict[str, int] = {}
+        self.max_backlog: Dict[str, int] = {}
+        self._size = 0
+        self._ready: deque = deque()
+        self._due: List[Tuple[float, int, str]] = []
+        self._arrivals: Dict[str, deque] = {}
+        self._sequence = count()
+        self._barriers: deque = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def append(self, order: AnyOrder) -> None:
+        """ Queue an order behind the other orders for its instrument.
+
+        An order without an instrument_id, a mass cancel of every instrument, is queued
+        behind every order already queued, with the number of each instrument's orders it waits for.
+        """
+        instrument_id = order.instrument_id
+        if instrument_id is None:
+            with self._lock:
+                enqueued = self.enqueued
+                self._barriers.append((order, {i: enqueued[i] for i, queue in self.queues.items() if queue}))
+                self._size += 1
+            return None
+        with self._lock:
+            queue = self.queues.get(instrument_id)
+            if queue is None:
+                queue = self.queues[instrument_id] = deque()
+                self._arrivals[instrument_id] = deque()
+                self.enqueued[instrument_id] = 0
+                self.dequeued[instrument_id] = 0
+                self.max_backlog[instrument_id] = 0
+
+            if self.policy is SchedulingPolicy.deadline:
+                now = self.clock()
+                self._arrivals[instrument_id].append(now)
+                if not queue:
+                    self.schedule_deadline(instrument_id, now)
+            elif not queue:
+                self._ready.append(instrument_id)
+
+            queue.append(order)
+            self._size += 1
+            self.enqueued[instrument_id] += 1
+            if len(queue) > self.max_backlog[instrument_id]:
+                self.max_backlog[instrument_id] = len(queue)
+
+    def schedule_deadline(self, instrument_id: str, arrival: float) -> None:
+        """ Schedule an instrument by the deadline of its oldest queued order."""
+
+        due = arrival + self.deadlines.get(instrument_id, self.default_deadline)
+        heappush(self._due, (due, next(self._sequence), instrument_id))
+
+    def next_batch(self) -> Tuple[Optional[str], List[AnyOrder]]:
+        """ Take the next batch of orders, all for one instrument, in arrival order.
+
+        The instrument goes back into the schedule if it still has orders queued.
+        While a mass cancel of every instrument is queued, only the orders queued before it
+        are taken, and once they all have been it is returned alone, with instrument None.
+        """
+        with self._lock:
+            limits: Optional[Dict[str, int]] = None
+            if self._barriers:
+                order, until = self._barriers[0]
+                dequeued = self.dequeued
+                limits = {i: n - dequeued[i] for i, n in until.items() if dequeued[i] < n}
+                if not limits:
+                    self._barriers.popleft()
+                    self._size -= 1
+                    return None, [order]
+
+            if self.policy is SchedulingPolicy.deadline:
+                due = self._due
+                entry = heappop(due)
+                if limits is not None:
+                    skipped = []
+                    while entry[2] not in limits:
+                        skipped.append(entry)
+                        entry = heappop(due)
+                    for skipped_entry in skipped:
+                        heappush(due, skipped_entry)
+                instrument_id = entry[2]
+                batch_size = self.batch_size
+            else:
+                ready = self._ready
+                if limits is not None:
+                    while ready[0] not in limits:
+                        ready.rotate(-1)
+                instrument_id = ready.popleft()
+                batch_size = self.batch_size
+                if self.policy is SchedulingPolicy.weighted:
+                    batch_size *= self.weights.get(instrument_id, 1)
+
+            queue = self.queues[instrument_id]
+            n = min(batch_size, len(queue))
+            if limits is not None:
+                n = min(n, limits[instrument_id])
+            popleft = queue.popleft
+            batch = [popleft() for _ in range(n)]
+            self._size -= n
+            self.dequeued[instrument_id] += n
+
+            if self.policy is SchedulingPolicy.deadline:
+                arrivals = self._arrivals[instrument_id]
+                for _ in range(n):
+                    arrivals.popleft()
+                if queue:
+                    self.schedule_deadline(instrument_id, arrivals[0])
+            elif queue:
+                self._ready.append(instrument_id)
+            return instrument_id, batch
+
+    def backlog(self) -> Dict[str, int]:
+        """ The number of orders queued for each instrument."""
+
+        with self._lock:
+            return {instrument_id: len(queue) for instrument_id, queue in self.queues.items()}
+
+    def oldest_wait(self, instrument_id: str) -> float:
+        """ Under deadline, how long the instrument's oldest queued order has waited, in seconds."""
+
+        arrivals = self._arrivals.get(instrument_id)
+        if not arrivals:
+            return 0.
+        return self.clock() - arrivals[0]
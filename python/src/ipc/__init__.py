@@ -0,0 +1,2 @@
+from .ring_buffer import RingBuffer
+from .order_ingress import OrderIngress
@@ -0,0 +1,32 @@
+from python.src.codec import records_to_orders
+from python.src.ipc.ring_buffer import RingBuffer
+
+
+class OrderIngress:
+    """ Feeds orders from a shared memory RingBuffer of codec ORDER records into a MatchingEngine.
+
+    Records are taken and decoded a batch at a time, so the cost of reading shared
+    memory and converting records is paid once per batch rather than once per order.
+
+    Attributes:
+    -- ring_buffer -> The ring the gateway writes order records into.
+    -- batch_size -> The most records taken per poll.
+    -- received -> The number of orders received so far.
+    """
+
+    def __init__(self, ring_buffer: RingBuffer, batch_size: int = 1024):
+        self.ring_buffer = ring_buffer
+        self.batch_size = batch_size
+        self.received = 0
+
+    def poll(self, matching_engine) -> int:
+        """ Queue the next batch of orders on the engine. Returns the number of orders queued."""
+
+        records = self.ring_buffer.get(self.batch_size)
+        n = len(records)
+        if n:
+            add_order = matching_engine.add_order
+            for order in records_to_orders(records):
+                add_order(order)
+            self.received += n
+        return n
@@ -0,0 +1,119 @@
+from multiprocessing import parent_process, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+import numpy as np
+
+
+class RingBuffer:
+    """ A single-producer, single-consumer ring of fixed-width records in shared memory.
+
+    The segment starts with a header holding the capacity and two counters, then the
+    records. The producer only writes tail and the consumer only writes head, each on
+    its own cache line, so neither side takes a lock: the producer copies records in,
+    then publishes them by advancing tail, and the consumer copies records out, then
+    frees their slots by advancing head. Counters only ever increase, and a counter
+    maps to the slot counter & (capacity - 1).
+
+    This relies on aligned 8-byte stores being atomic and on stores being seen in
+    program order, which holds on x86-64. It is only safe with one producer and one consumer.
+
+    Attributes:
+    -- name -> The name of the shared memory segment, used to attach from another process.
+    -- capacity -> The number of records the ring holds, a power of two.
+    -- dtype -> The record dtype.
+    -- records -> The record slots, a view onto shared memory.
+    """
+
+    header_size = 192
+
+    def __init__(self,
+                 dtype: np.dtype,
+                 capacity: int = 65536,
+                 name: Optional[str] = None,
+                 create: bool = True):
+
+        if create:
+            if capacity < 1 or capacity & (capacity - 1):
+                raise ValueError("capacity must be a power of two")
+            size = self.header_size + capacity * dtype.itemsize
+            self.shared_memory = SharedMemory(name=name, create=True, size=size)
+        else:
+            self.shared_memory = SharedMemory(name=name)
+            # Only the creator should unlink the segment, but on attach Python < 3.13
+            # registers it to be unlinked when this process exits. Child processes share
+            # their parent's tracker, so only a separate process unregisters it. The tracker
+            # knows the segment by its POSIX name, which has a leading slash.
+            if parent_process() is None:
+                resource_tracker.unregister("/" + self.shared_memory.name, "shared_memory")
+
+        buffer = self.shared_memory.buf
+        header = np.ndarray((3,), dtype=np.int64, buffer=buffer, offset=0, strides=(64,))
+        if create:
+            header[:] = (capacity, 0, 0)
+        self._header = header
+        self.name = self.shared_memory.name
+        self.capacity = int(header[0])
+        self.dtype = dtype
+        self.records = np.ndarray((self.capacity,), dtype=dtype, buffer=buffer,
+                                  offset=self.header_size)
+
+    def __len__(self) -> int:
+        header = self._header
+        return int(header[2] - header[1])
+
+    def put(self, records: np.ndarray) -> int:
+        """ Write as many records as fit, in order. Producer only.
+
+        Returns the number of records written, which is less than len(records) if the ring is full.
+        """
+        header = self._header
+        head = int(header[1])
+        tail = int(header[2])
+        capacity = self.capacity
+        n = min(len(records), capacity - (tail - head))
+        if n <= 0:
+            return 0
+
+        start = tail & (capacity - 1)
+        first = min(n, capacity - start)
+        self.records[start:start + first] = records[:first]
+        if n > first:
+            self.records[:n - first] = records[first:n]
+        header[2] = tail + n
+        return n
+
+    def get(self, max_count: int) -> np.ndarray:
+        """ Take up to max_count records, oldest first. Consumer only.
+
+        The records are copied out before their slots are freed, so the result
+        stays valid after the producer reuses them.
+        """
+        header = self._header
+        head = int(header[1])
+        tail = int(header[2])
+        n = min(tail - head, max_count)
+        if n <= 0:
+            return self.records[:0].copy()
+
+        capacity = self.capacity
+        start = head & (capacity - 1)
+        first = min(n, capacity - start)
+        if n > first:
+            batch = np.concatenate((self.records[start:], self.records[:n - first]))
+        else:
+            batch = self.records[start:start + n].copy()
+        header[1] = head + n
+        return batch
+
+    def close(self) -> None:
+        """ Detach from the shared memory segment. The ring cannot be used afterwards."""
+
+        # The views onto the segment must go before it can be closed.
+        del self.records
+        del self._header
+        self.shared_memory.close()
+
+    def unlink(self) -> None:
+        """ Destroy the shared memory segment. Call once, from the creating process."""
+
+        self.shared_memory.unlink()
@@ -0,0 +1,2 @@
+from .instrument_statistics import InstrumentStatistics, BAR
+from .trade_statistics import TradeStatistics, STATISTICS
@@ -0,0 +1,264 @@
+from collections import deque
+from typing import Deque, Optional, Tuple
+import numpy as np
+import math
+
+# A completed bar, as returned by InstrumentStatistics.bar_history().
+# -- start -> The start of the bar, nanoseconds since the epoch. Bars are aligned to multiples of the interval.
+# -- open, high, low, close -> The first, highest, lowest and last trade prices of the bar.
+# A bar without trades has all four at the previous close.
+# -- volume -> The quantity traded in the bar.
+# -- notional -> The total price * quantity traded in the bar.
+BAR = np.dtype([("start", np.int64),
+                ("open", np.float64),
+                ("high", np.float64),
+                ("low", np.float64),
+                ("close", np.float64),
+                ("volume", np.float64),
+                ("notional", np.float64)])
+
+NAN = float("nan")
+NO_BAR = -(1 << 63)
+
+
+class InstrumentStatistics:
+    """ Price statistics of one instrument, updated incrementally with each trade.
+
+    Each trade updates the current bar, the session totals and the rolling window
+    in a few arithmetic operations, so every statistic is read in O(1) rather than
+    recomputed from the trades. When a trade falls in a later bar, the current bar is
+    closed into the history and the rolling window, followed by a flat bar for each
+    interval without trades. The rolling window keeps running sums of its bars,
+    added to as bars close and subtracted from as they leave the window.
+
+    Attributes:
+    -- bar_interval -> The length of each bar in nanoseconds.
+    -- window -> The number of completed bars in the rolling window.
+    -- last_price, last_time -> The price and time of the most recent trade, nan and NO_BAR before the first.
+    -- bar_start, bar_open, bar_high, bar_low, bar_close, bar_volume, bar_notional -> The current bar.
+    -- bar_trades -> The number of trades in the current bar.
+    -- volume, notional, trades -> The session totals, cleared by reset_session().
+    -- bars -> The most recent completed bars as (start, open, high, low, close, volume, notional) tuples.
+    -- window_bars -> The (volume, notional, log return) of each completed bar in the rolling window.
+    The return is that of the bar's close on the previous close, None for the first bar.
+    -- window_volume, window_notional -> The totals of window_bars.
+    -- window_returns, window_return_sum, window_return_squares -> The count, sum and sum of squares
+    of the returns in window_bars.
+    """
+
+    __slots__ = ("bar_interval", "window", "last_price", "last_time",
+                 "bar_start", "bar_open", "bar_high", "bar_low", "bar_close", "bar_volume", "bar_notional",
+                 "bar_trades", "volume", "notional", "trades", "bars", "window_bars",
+                 "window_volume", "window_notional", "window_returns", "window_return_sum",
+                 "window_return_squares")
+
+    def __init__(self, bar_interval: int = 60_000_000_000, window: int = 30, max_bars: int = 1440):
+        self.bar_interval = bar_interval
+        self.window = window
+        self.last_price = NAN
+        self.last_time = NO_BAR
+        self.bar_start = NO_BAR
+        self.bar_open = NAN
+        self.bar_high = NAN
+        self.bar_low = NAN
+        self.bar_close = NAN
+        self.bar_volume = 0.
+        self.bar_notional = 0.
+        self.bar_trades = 0
+        self.volume = 0.
+        self.notional = 0.
+        self.trades = 0
+        self.bars: Deque[Tuple[int, float, float, float, float, float, float]] = deque(maxlen=max_bars)
+        self.window_bars: Deque[Tuple[float, float, Optional[float]]] = deque()
+        self.window_volume = 0.
+        self.window_notional = 0.
+        self.window_returns = 0
+        self.window_return_sum = 0.
+        self.window_return_squares = 0.
+
+    def update(self, timestamp: int, price: float, quantity: float) -> None:
+        """ Add a trade. Trades are expected in time order; a late trade counts towards the current bar."""
+
+        if timestamp - self.bar_start >= self.bar_interval:
+            self.advance(timestamp)
+        if self.bar_trades:
+            if price > self.bar_high:
+                self.bar_high = price
+            elif price < self.bar_low:
+                self.bar_low = price
+        else:
+            self.bar_open = self.bar_high = self.bar_low = price
+        self.bar_close = price
+        notional = price * quantity
+        self.bar_volume += quantity
+        self.bar_notional += notional
+        self.bar_trades += 1
+        self.volume += quantity
+        self.notional += notional
+        self.trades += 1
+        self.last_price = price
+        self.last_time = timestamp
+
+    def advance(self, timestamp: int) -> None:
+        """ Close the current bar, and any bars without trades, up to the bar containing timestamp.
+
+        At most max(window, max_bars) bars without trades are added, as older ones
+        would leave both the history and the rolling window straight away.
+        """
+        interval = self.bar_interval
+        bar_start = timestamp - timestamp % interval
+        if bar_start <= self.bar_start:
+            return None
+        if self.last_time != NO_BAR:
+            self.close_bar(self.bar_start)
+            close = self.last_price
+            gap = min((bar_start - self.bar_start) // interval - 1,
+                      max(self.window, self.bars.maxlen or 0))
+            for start in range(bar_start - gap * interval, bar_start, interval):
+                self.bar_open = self.bar_high = self.bar_low = self.bar_close = close
+                self.close_bar(start)
+        self.bar_start = bar_start
+        self.bar_open = self.bar_high = self.bar_low = self.bar_close = NAN
+        self.bar_volume = 0.
+        self.bar_notional = 0.
+        self.bar_trades = 0
+
+    def close_bar(self, start: int) -> None:
+        """ Move the current bar, starting at start, into the history and the rolling window."""
+
+        close = self.bar_close
+        if not self.bar_trades:
+            close = self.last_price
+            self.bar_open = self.bar_high = self.bar_low = close
+        previous = self.bars[-1][4] if self.bars else None
+        self.bars.append((start, self.bar_open, self.bar_high, self.bar_low, close,
+                          self.bar_volume, self.bar_notional))
+        self.add_to_window(self.bar_volume, self.bar_notional,
+                           math.log(close / previous) if previous is not None else None)
+        self.bar_volume = 0.
+        self.bar_notional = 0.
+        self.bar_trades = 0
+
+    def add_to_window(self, volume: float, notional: float, log_return: Optional[float]) -> None:
+        """ Add a completed bar to the rolling window, dropping the oldest once it is full."""
+
+        window_bars = self.window_bars
+        window_bars.append((volume, notional, log_return))
+        self.window_volume += volume
+        self.window_notional += notional
+        if log_return is not None:
+            self.window_returns += 1
+            self.window_return_sum += log_return
+            self.window_return_squares += log_return * log_return
+        if len(window_bars) > self.window:
+            volume, notional, log_return = window_bars.popleft()
+            self.window_volume -= volume
+            self.window_notional -= notional
+            if log_return is not None:
+                self.window_returns -= 1
+                self.window_return_sum -= log_return
+                self.window_return_squares -= log_return * log_return
+
+    def reset_session(self) -> None:
+        """ Start a new session, clearing the session totals behind vwap."""
+
+        self.volume = 0.
+        self.notional = 0.
+        self.trades = 0
+
+    @property
+    def vwap(self) -> float:
+        """ The volume weighted average price of the session, nan before its first trade."""
+
+        return self.notional / self.volume if self.volume else NAN
+
+    @property
+    def rolling_vwap(self) -> float:
+        """ The volume weighted average price of the rolling window and the current bar."""
+
+        volume = self.window_volume + self.bar_volume
+        return (self.window_notional + self.bar_notional) / volume if volume else NAN
+
+    @property
+    def rolling_volatility(self) -> float:
+        """ The sample standard deviation of the log returns of bar closes in the rolling window.
+
+        Per bar, not annualised. nan with fewer than two returns.
+        """
+        count = self.window_returns
+        if count < 2:
+            return NAN
+        mean = self.window_return_sum / count
+        variance = (self.window_return_squares - count * mean * mean) / (count - 1)
+        return math.sqrt(variance) if variance > 0 else 0.
+
+    def bar_history(self) -> np.ndarray:
+        """ The completed bars, oldest first, as a BAR array."""
+
+        return np.array(list(self.bars), dtype=BAR)
+
+    def backfill(self, times: np.ndarray, prices: np.ndarray, quantities: np.ndarray) -> None:
+        """ Rebuild the statistics from a journal of trades in time order, as on a restart.
+
+        Bars are aggregated with NumPy in one pass over the trades, and only the bars
+        kept in the history and the rolling window are built as Python objects.
+        The trades become the session, and the bar of the last trade stays open
+        for the trades which follow. Must be called before any other trade is added.
+        """
+        if self.last_time != NO_BAR:
+            raise ValueError("Backfill must come before any other trade")
+        if not len(times):
+            return None
+        times = np.asarray(times, dtype=np.int64)
+        prices = np.asarray(prices, dtype=np.float64)
+        quantities = np.asarray(quantities, dtype=np.float64)
+        interval = self.bar_interval
+        notionals = prices * quantities
+
+        bar_ids = times // interval
+        firsts = np.flatnonzero(np.r_[True, bar_ids[1:] != bar_ids[:-1]])
+        lasts = np.r_[firsts[1:] - 1, len(times) - 1]
+        ids = bar_ids[firsts]
+        closes = prices[lasts]
+
+        # Every bar from the first trade's to the one before the last trade's, but only
+        # as many as are kept, with bars without trades flat at the previous close.
+        kept = max(self.window, self.bars.maxlen or 0)
+        slots = np.arange(max(ids[0], ids[-1] - kept), ids[-1])
+        previous = np.searchsorted(ids, slots, side="right") - 1
+        traded = ids[previous] == slots
+        slot_closes = closes[previous]
+        bars = np.zeros(len(slots), dtype=BAR)
+        bars["start"] = slots * interval
+        bars["close"] = slot_closes
+        for name, values in (("open", prices[firsts]),
+                             ("high", np.maximum.reduceat(prices, firsts)),
+                             ("low", np.minimum.reduceat(prices, firsts))):
+            bars[name] = np.where(traded, values[previous], slot_closes)
+        bars["volume"] = np.where(traded, np.add.reduceat(quantities, firsts)[previous], 0.)
+        bars["notional"] = np.where(traded, np.add.reduceat(notionals, firsts)[previous], 0.)
+
+        if len(slots):
+            before = closes[np.searchsorted(ids, slots[0] - 1, side="right") - 1] if slots[0] > ids[0] else NAN
+            log_returns = np.log(slot_closes / np.r_[before, slot_closes[:-1]])
+            rows = list(zip(bars["start"].tolist(), bars["open"].tolist(), bars["high"].tolist(),
+                            bars["low"].tolist(), bars["close"].tolist(), bars["volume"].tolist(),
+                            bars["notional"].tolist()))
+            self.bars.extend(rows)
+            for row, log_return in zip(rows[-self.window:], log_returns[-self.window:].tolist()):
+                self.add_to_window(row[5], row[6], None if math.isnan(log_return) else log_return)
+
+        last = firsts[-1]
+        self.bar_start = int(ids[-1]) * interval
+        self.bar_open = float(prices[last])
+        self.bar_high = float(prices[last:].max())
+        self.bar_low = float(prices[last:].min())
+        self.bar_close = float(prices[-1])
+        self.bar_volume = float(quantities[last:].sum())
+        self.bar_notional = float(notionals[last:].sum())
+        self.bar_trades = len(times) - int(last)
+        self.volume = float(quantities.sum())
+        self.notional = float(notionals.sum())
+        self.trades = len(times)
+        self.last_price = float(prices[-1])
+        self.last_time = int(times[-1])
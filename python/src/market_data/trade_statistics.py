@@ -0,0 +1,116 @@
+from python.src.market_data.instrument_statistics import InstrumentStatistics
+from python.src.orders import BaseOrder
+from typing import Any, Callable, Dict, Optional
+import numpy as np
+
+# The statistics of one instrument, as returned by TradeStatistics.summary().
+# -- instrument_id -> Instrument id, at most 14 bytes.
+# -- last_price -> The most recent trade price.
+# -- open, high, low, close, volume -> The current bar, nan and 0 if it has no trades yet.
+# -- vwap -> The session volume weighted average price.
+# -- rolling_vwap -> The volume weighted average price of the rolling window and the current bar.
+# -- rolling_volatility -> The standard deviation of bar close log returns in the rolling window.
+# -- session_volume -> The quantity traded in the session.
+STATISTICS = np.dtype([("instrument_id", "S14"),
+                       ("last_price", np.float64),
+                       ("open", np.float64),
+                       ("high", np.float64),
+                       ("low", np.float64),
+                       ("close", np.float64),
+                       ("volume", np.float64),
+                       ("vwap", np.float64),
+                       ("rolling_vwap", np.float64),
+                       ("rolling_volatility", np.float64),
+                       ("session_volume", np.float64)])
+
+
+class TradeStatistics:
+    """ Incremental price statistics of every instrument, kept current as a trade sink.
+
+    Registered as the trade_sink of a MatchingEngine or OrderBook, it is called with
+    each trade as it happens and updates the InstrumentStatistics of the trade's
+    instrument, created the first time the instrument trades. Another trade sink,
+    such as a TradeBuffer, can be chained behind it.
+
+    Attributes:
+    -- instruments -> The InstrumentStatistics of each instrument, by instrument id.
+    -- bar_interval, window, max_bars -> The settings of each InstrumentStatistics.
+    -- trade_sink -> If set, every trade is passed on to it after the statistics are updated.
+    """
+
+    def __init__(self,
+                 bar_interval: int = 60_000_000_000,
+                 window: int = 30,
+                 max_bars: int = 1440,
+                 trade_sink: Optional[Callable[[Any, float, float, BaseOrder, BaseOrder], None]] = None):
+
+        self.bar_interval = bar_interval
+        self.window = window
+        self.max_bars = max_bars
+        self.trade_sink = trade_sink
+        self.instruments: Dict[str, InstrumentStatistics] = {}
+
+    def __call__(self, timestamp: int, price: float, quantity: float, bid: BaseOrder, ask: BaseOrder) -> None:
+        """ Record a trade between bid and ask."""
+
+        statistics = self.instruments.get(bid.instrument_id)
+        if statistics is None:
+            statistics = self.statistics(bid.instrument_id)
+        statistics.update(timestamp, price, quantity)
+        if self.trade_sink is not None:
+            self.trade_sink(timestamp, price, quantity, bid, ask)
+
+    def statistics(self, instrument_id: str) -> InstrumentStatistics:
+        """ The statistics of an instrument, created empty if it has not traded."""
+
+        statistics = self.instruments.get(instrument_id)
+        if statistics is None:
+            statistics = self.instruments[instrument_id] = InstrumentStatistics(self.bar_interval, self.window,
+                                                                                self.max_bars)
+        return statistics
+
+    def backfill(self, trades: np.ndarray) -> None:
+        """ Rebuild the statistics of every instrument from a journal of TRADE records in time order.
+
+        The trades are grouped by instrument with one stable sort, then each
+        instrument is backfilled from its own columns (see InstrumentStatistics.backfill()).
+        """
+        if not len(trades):
+            return None
+        # Sorting the ids as two integers is several times faster than sorting them as strings.
+        keys = np.zeros(len(trades), dtype="S16")
+        keys[:] = trades["instrument_id"]
+        halves = keys.view("<u8").reshape(-1, 2)
+        order = np.lexsort((halves[:, 1], halves[:, 0]))
+        halves = halves[order]
+        bounds = np.r_[np.flatnonzero(np.r_[True, (halves[1:] != halves[:-1]).any(axis=1)]), len(trades)].tolist()
+        instrument_ids = trades["instrument_id"][order[bounds[:-1]]].tolist()
+        times = trades["timestamp"][order]
+        prices = trades["price"][order]
+        quantities = trades["quantity"][order]
+        for instrument_id, start, end in zip(instrument_ids, bounds[:-1], bounds[1:]):
+            self.statistics(instrument_id.decode()).backfill(times[start:end], prices[start:end],
+                                                             quantities[start:end])
+
+    def advance(self, timestamp: int) -> None:
+        """ Close the bars of every instrument up to the bar containing timestamp, even without trades."""
+
+        for statistics in self.instruments.values():
+            statistics.advance(timestamp)
+
+    def reset_session(self) -> None:
+        """ Start a new session for every instrument."""
+
+        for statistics in self.instruments.values():
+            statistics.reset_session()
+
+    def summary(self) -> np.ndarray:
+        """ The current statistics of every instrument as a STATISTICS array, for dashboards.
+
+        Each row is a handful of O(1) reads, so a summary costs O(instruments) however many trades there were.
+        """
+        summary = np.zeros(len(self.instruments), dtype=STATISTICS)
+        summary[:] = [(instrument_id.encode(), s.last_price, s.bar_open, s.bar_high, s.bar_low, s.bar_close,
+                       s.bar_volume, s.vwap, s.rolling_vwap, s.rolling_volatility, s.volume)
+                      for instrument_id, s in self.instruments.items()]
+        return summary
@@ -1,6 +1,25 @@
-from typing import Dict, Type
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, cast
 from python.src.order_book import OrderBook
+from python.src.orders import AnyOrder
 from python.src.orders import BaseOrder
+from python.src.orders import CancelOrder
+from python.src.orders import MassCancelOrder
+from python.src.orders import MassQuote
+from python.src.events import EventSink
+from python.src.events import EventFanout
+from python.src.risk import RiskCheck
+from python.src.instrument_queues import InstrumentQueues
+from python.src.symbol_registry import SymbolRegistry
+from python.src.pools import OrderPool
+from python.src.runtime import LowLatencyMode
+from python.src.snapshots import SnapshotPublisher
+from python.src.enums import OrderStatus
+from python.src.exceptions import InvalidOrderDirectionException
+from python.src.exceptions import OffTickPriceException
+from python.src.exceptions import QuoteWithoutAccountException
+from python.src.exceptions import UnpricedMarketOrderException
+from python.src.enums import MatchingAlgorithm
+from python.src.enums import ExecutionPriceRule
 from collections import deque
 import threading
 import logging
@@ -11,48 +30,380 @@ class MatchingEngine():
 
     Attributes:
     -- order_books -> A dict of order books, one per instrument
-    -- orders -> All orders queued to be processed. 
-    This is a dequeus (linked lists) because we require fast (O(1))  access,
-    fast insert, and never need to search the list
+    -- symbols -> Interns each instrument to a dense symbol id. Instruments already in it when
+    the engine is created have their books created up front.
+    -- books -> The order book of each symbol id. Dispatch is a symbol lookup and a list index,
+    and books are only created the first time an instrument is seen, off the per-order path.
+    -- orders -> All orders queued to be processed, in one queue per instrument.
+    Queues are drained a batch at a time in the order chosen by its scheduling policy,
+    so a burst on one instrument does not hold up the others.
     -- processed_orders -> orders that have been processed
     This is a (linked lists) because we require fast (O(1)) access,
     fast insert, and never need to search the list
+    -- max_history -> If set, processed_orders and each book's trades and complete_orders
+    keep only this many of the most recent entries. None keeps everything.
+    -- order_pool -> If set, every order book releases the orders and trades leaving its history to it
+    for reuse. processed_orders is then not kept, as it would hold orders past their release.
+    -- clock -> If set, every order book stamps trades with its time in nanoseconds
+    since the epoch rather than the wall clock.
     -- live -> a switch to stop processing.
+    -- matching_algorithms -> The matching algorithm for each instrument.
+    Instruments not listed use matching_algorithm.
+    -- matching_algorithm -> The matching algorithm of instruments not in matching_algorithms.
+    -- tick_size -> If set, the tick size of every order book. Orders priced off it are rejected.
+    -- in_auction -> Whether new order books start in a call auction.
+    -- execution_price_rule -> The execution price rule of every order book.
+    -- trade_sink -> If set, every order book reports trades to it rather than building Trade objects.
+    -- event_sinks -> Sinks receiving the order events of every instrument.
+    -- instrument_event_sinks -> Sinks receiving the order events of a single instrument.
+    -- risk_check -> If set, every order must pass its pre-trade checks before reaching its book.
+    It is registered as an event sink for every instrument, without fills, and as the fill hook
+    of every book, which passes it each trade to keep its exposures current. Books still record
+    trades as they would without it.
+    -- low_latency -> If set, process() runs in low-latency mode: it warms up, freezes the heap and
+    only collects garbage in idle gaps. Its gc_pauses records every collection pause.
+    -- snapshots -> If set, every book changed by a batch is snapshotted when its events are
+    flushed, so other threads can read consistent top-of-book views while the engine runs.
+    -- ingress_sources -> Sources polled for new orders by the processing loop, such as an
+    OrderIngress reading from a gateway process through shared memory.
+    -- order_history -> If set, an OrderHistory to which every order reaching a book is logged,
+    so any book can be rebuilt as it was at an earlier sequence number or time. Auction starts
+    and uncrosses are logged for every book too.
     """
 
-    def __init__(self):
+    def __init__(self,
+                 matching_algorithms: Optional[Dict[str, MatchingAlgorithm]] = None,
+                 execution_price_rule: ExecutionPriceRule = ExecutionPriceRule.resting,
+                 trade_sink: Optional[Callable[..., Any]] = None,
+                 risk_check: Optional[RiskCheck] = None,
+                 order_queues: Optional[InstrumentQueues] = None,
+                 max_history: Optional[int] = None,
+                 clock: Optional[Callable[[], int]] = None,
+                 matching_algorithm: MatchingAlgorithm = MatchingAlgorithm.price_time,
+                 tick_size: Optional[float] = None,
+                 symbols: Optional[SymbolRegistry] = None,
+                 order_pool: Optional[OrderPool] = None,
+                 low_latency: Optional[LowLatencyMode] = None,
+                 snapshots: Optional[SnapshotPublisher] = None,
+                 order_history: Optional[Any] = None):
 
         self.order_books: Dict[str, OrderBook] = {}
-        self.orders: deque = deque()
-        self.processed_orders: deque = deque()
+        self.symbols: SymbolRegistry = symbols if symbols is not None else SymbolRegistry()
+        self.books: List[OrderBook] = []
+        self.orders: InstrumentQueues = order_queues if order_queues is not None else InstrumentQueues()
+        self.max_history = max_history
+        self.clock = clock
+        self.order_pool = order_pool
+        self.processed_orders: deque = deque(maxlen=max_history if order_pool is None else 0)
         self.live: bool = True
+        self.matching_algorithms: Dict[str, MatchingAlgorithm] = matching_algorithms or {}
+        self.matching_algorithm = matching_algorithm
+        self.tick_size = tick_size
+        self.in_auction: bool = False
+        self.execution_price_rule = execution_price_rule
+        self.trade_sink = trade_sink
+        self.event_sinks: List[EventSink] = []
+        self.instrument_event_sinks: Dict[str, List[EventSink]] = {}
+        self.risk_check = risk_check
+        self.ingress_sources: List[Any] = []
+        self.low_latency = low_latency
+        self.snapshots = snapshots
+        self.order_history = order_history
+        if risk_check is not None:
+            self.add_event_sink(risk_check)
+        self.add_books()
 
     def match(self):
 
-        while self.orders:
-            order = self.orders.popleft()
-            instrument_id = order.instrument_id
+        orders = self.orders
+        symbol_ids = self.symbols.ids
+        books = self.books
+        execute = self.execute
+        snapshots = self.snapshots
+        while orders:
+            instrument_id, batch = orders.next_batch()
+            if instrument_id is None:
+                # A mass cancel of every instrument, after every order queued before it.
+                for order in batch:
+                    self.cancel_everywhere(cast(MassCancelOrder, order))
+                continue
+
+            symbol_id = symbol_ids.get(instrument_id)
+            if symbol_id is None or symbol_id >= len(books):
+                symbol_id = self.add_instrument(instrument_id)
+            order_book = books[symbol_id]
+
+            for order in batch:
+                execute(order, order_book)
+            if snapshots is not None:
+                snapshots.mark(instrument_id, order_book)
+
+            self.processed_orders.extend(batch)
+
+        self.flush_events()
+
+    def submit(self, order: AnyOrder) -> None:
+        """ Process a single order immediately, bypassing the instrument queues.
 
-            order_books = self.order_books
-            if instrument_id in order_books.keys():
-                order_book = order_books[instrument_id]
+        Used where each order must be processed at a known time, as in a replay.
+        Events are buffered until flush_events() is called.
+        """
+        instrument_id = order.instrument_id
+        if instrument_id is None:
+            self.cancel_everywhere(cast(MassCancelOrder, order))
+            return None
+        symbol_id = self.symbols.ids.get(instrument_id)
+        if symbol_id is None or symbol_id >= len(self.books):
+            if self.symbols.frozen and symbol_id is None:
+                self.reject_unknown(order)
+                return None
+            symbol_id = self.add_instrument(instrument_id)
+        order_book = self.books[symbol_id]
+        self.execute(order, order_book)
+        self.processed_orders.append(order)
+        if self.snapshots is not None:
+            self.snapshots.mark(instrument_id, order_book)
+
+    def execute(self, order: AnyOrder, order_book: OrderBook) -> None:
+        """ Risk check an order, then add it to its book and match."""
+
+        reason = None
+        if self.risk_check is not None:
+            reason = self.risk_check.check(order, order_book.last_price)
+
+        if reason is None:
+            if self.order_history is not None:
+                self.order_history.record(cast(str, order.instrument_id), order, order_book)
+            try:
                 order_book.add_order(order)
                 order_book.match()
-            else:
-                order_book = OrderBook()
-                order_book.add_order(order)
-                order_books[instrument_id] = order_book
+            except InvalidOrderDirectionException:
+                self.reject(order, order_book, "Invalid order direction")
+            except OffTickPriceException:
+                self.reject(order, order_book, "Price not on tick")
+            except QuoteWithoutAccountException:
+                self.reject(order, order_book, "Quote without account")
+            except UnpricedMarketOrderException:
+                self.reject(order, order_book, "No price for market order")
+        else:
+            self.reject(order, order_book, reason)
+
+    def reject(self, order: AnyOrder, order_book: OrderBook, reason: str) -> None:
+        """ Refuse an order and report it to the instrument's event sinks."""
+
+        self.report_rejection(order, order_book.event_sink, reason)
+
+    def reject_unknown(self, order: AnyOrder) -> None:
+        """ Refuse an order for an instrument missing from a frozen symbol registry."""
+
+        self.report_rejection(order, self.event_sink_for(cast(str, order.instrument_id)), "Unknown instrument")
+
+    def report_rejection(self, order: AnyOrder, event_sink: Optional[EventSink], reason: str) -> None:
+        """ Mark an order rejected and report it, refused cancels as rejected cancels."""
+
+        if isinstance(order, BaseOrder):
+            order.status = OrderStatus.rejected
+        if event_sink is None:
+            return None
+        if isinstance(order, CancelOrder):
+            event_sink.on_cancel_rejected(order)
+        else:
+            event_sink.on_rejected(order, reason)
+
+    def add_event_sink(self, event_sink: EventSink, instrument_id: Optional[str] = None) -> None:
+        """ Register a sink for the events of one instrument, or of every instrument if None."""
+
+        if instrument_id is None:
+            self.event_sinks.append(event_sink)
+            for instrument_id, order_book in self.order_books.items():
+                order_book.event_sink = self.event_sink_for(instrument_id)
+        else:
+            self.instrument_event_sinks.setdefault(instrument_id, []).append(event_sink)
+            if instrument_id in self.order_books:
+                self.order_books[instrument_id].event_sink = self.event_sink_for(instrument_id)
+
+    def event_sink_for(self, instrument_id: str) -> Optional[EventSink]:
+        """ The sink an instrument's book reports to: None, a single sink, or a fan-out."""
+
+        sinks = self.event_sinks + self.instrument_event_sinks.get(instrument_id, [])
+        if not sinks:
+            return None
+        elif len(sinks) == 1:
+            return sinks[0]
+        return EventFanout(sinks)
+
+    def flush_events(self) -> None:
+        """ Ask every registered sink to deliver its buffered events, and publish snapshots of changed books."""
+
+        for event_sink in self.event_sinks:
+            event_sink.flush()
+        for event_sinks in self.instrument_event_sinks.values():
+            for event_sink in event_sinks:
+                event_sink.flush()
+        if self.snapshots is not None:
+            self.snapshots.publish()
+
+    def add_instrument(self, instrument_id: str) -> int:
+        """ Register an instrument and create its book, if it has none. Returns its symbol id.
+
+        Raises KeyError if the instrument is unknown and the symbol registry is frozen.
+        """
+        symbol_id = self.symbols.intern(instrument_id)
+        self.add_books()
+        return symbol_id
+
+    def add_books(self) -> None:
+        """ Create the books of every registered instrument without one.
+
+        A registry shared between engines can gain instruments through another engine,
+        so this catches up on all of them rather than only the newest.
+        """
+        books = self.books
+        symbols = self.symbols.symbols
+        while len(books) < len(symbols):
+            instrument_id = symbols[len(books)]
+            order_book = self.create_order_book(instrument_id)
+            books.append(order_book)
+            self.order_books[instrument_id] = order_book
+
+    def preload(self, instrument_ids: Iterable[str]) -> None:
+        """ Create the books of an instrument universe up front, as read by read_instruments."""
+
+        for instrument_id in instrument_ids:
+            self.add_instrument(instrument_id)
+
+    def create_order_book(self, instrument_id: str) -> OrderBook:
+        matching_algorithm = self.matching_algorithms.get(instrument_id, self.matching_algorithm)
+        order_book = OrderBook(matching_algorithm=matching_algorithm,
+                               execution_price_rule=self.execution_price_rule,
+                               trade_sink=self.trade_sink,
+                               event_sink=self.event_sink_for(instrument_id),
+                               max_history=self.max_history,
+                               clock=self.clock,
+                               tick_size=self.tick_size,
+                               order_pool=self.order_pool,
+                               fill_hook=self.risk_check.on_trade if self.risk_check is not None else None)
+        if self.in_auction:
+            order_book.start_auction()
+        return order_book
+
+    def start_auction(self) -> None:
+        """ Put every order book, including books not yet created, into a call auction.
+
+        Orders are still dispatched to their books, but nothing matches until uncross().
+        """
+        self.in_auction = True
+        order_history = self.order_history
+        for instrument_id, order_book in self.order_books.items():
+            if order_history is not None:
+                order_history.record_start_auction(instrument_id, order_book)
+            order_book.start_auction()
+
+    def uncross(self) -> Dict[str, Tuple[float, float]]:
+        """ Dispatch queued orders, then uncross every book and resume continuous matching.
+
+        Returns the clearing price and volume of each instrument which traded.
+        """
+        self.match()
+        self.in_auction = False
+        results = {}
+        order_history = self.order_history
+        for instrument_id, order_book in self.order_books.items():
+            if order_history is not None:
+                order_history.record_uncross(instrument_id, order_book)
+            result = order_book.uncross()
+            if result:
+                results[instrument_id] = result
+                if self.snapshots is not None:
+                    self.snapshots.mark(instrument_id, order_book)
+        if self.snapshots is not None:
+            self.snapshots.publish()
+        return results
+
+    def add_order(self, order: AnyOrder):
+        """ Queue an order for the engine thread.
+
+        A mass cancel without an instrument_id is queued behind every order queued before it
+        (see InstrumentQueues), and applied to every book when match() reaches it.
+        """
+        instrument_id = order.instrument_id
+        symbols = self.symbols
+        if instrument_id is not None and symbols.frozen and instrument_id not in symbols.ids:
+            self.reject_unknown(order)
+        else:
+            self.orders.append(order)
+
+    def mass_cancel(self, order: MassCancelOrder) -> int:
+        """ Process a mass cancel immediately, after every order queued before it.
+
+        Without an instrument_id it is applied to every book. Returns the number of orders cancelled.
+        It matches on the caller's thread, so it must not be called while process() is running:
+        add_order() queues a mass cancel for the engine thread instead.
+        """
+        self.match()
+        if order.instrument_id is None:
+            self.cancel_everywhere(order)
+        else:
+            self.submit(order)
+        self.flush_events()
+        return order.cancelled
+
+    def mass_quote(self, mass_quote: MassQuote) -> None:
+        """ Queue a market maker's quotes, one on each instrument's queue.
+
+        Each book applies its quote in place of the account's resting quote as a single order,
+        and all of its quotes in one batch, with a single match() after each.
+        """
+        for quote in mass_quote.quotes:
+            self.add_order(quote)
+
+    def cancel_everywhere(self, order: MassCancelOrder) -> None:
+        """ Risk check a mass cancel without an instrument_id, then apply it to every book.
+
+        A refused mass cancel is reported to the sinks of every instrument.
+        """
+        if self.risk_check is not None:
+            reason = self.risk_check.check(order, None)
+            if reason is not None:
+                for event_sink in self.event_sinks:
+                    self.report_rejection(order, event_sink, reason)
+                return None
+        snapshots = self.snapshots
+        order_history = self.order_history
+        for instrument_id, order_book in self.order_books.items():
+            if order_history is not None:
+                order_history.record(instrument_id, order, order_book)
+            order_book.mass_cancel(order)
+            if snapshots is not None:
+                snapshots.mark(instrument_id, order_book)
+
+    def add_ingress(self, source: Any) -> None:
+        """ Poll source for orders in the processing loop. It must provide poll(matching_engine)."""
+
+        self.ingress_sources.append(source)
 
-            self.processed_orders.append(order)
+    def poll_ingress(self) -> int:
+        """ Queue the next batch of orders from every ingress source. Returns the number queued."""
 
-    def add_order(self, order: BaseOrder):
-        self.orders.append(order)
+        return sum(source.poll(self) for source in self.ingress_sources)
 
     def process(self):
         logging.info("Process: Thread starting")
-        while self.live:
-            if self.orders:
-                self.match()
+        low_latency = self.low_latency
+        if low_latency is not None:
+            low_latency.start(self)
+        try:
+            while self.live:
+                if self.ingress_sources:
+                    self.poll_ingress()
+                busy = bool(self.orders)
+                if busy:
+                    self.match()
+                if low_latency is not None:
+                    low_latency.tick(busy)
+        finally:
+            if low_latency is not None:
+                low_latency.stop()
 
         logging.info("Process: Thread finishing")
 
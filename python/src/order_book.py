@@ -1,14 +1,31 @@
 from python.src.orders import BaseOrder
 from python.src.orders import CancelOrder
+from python.src.orders import AnyOrder
+from python.src.orders import MassCancelOrder
+from python.src.orders import LimitOrder
+from python.src.orders import Quote
 from python.src.enums import OrderDirection
 from python.src.enums import OrderType
 from python.src.enums import OrderStatus
+from python.src.enums import MatchingAlgorithm
+from python.src.enums import ExecutionPriceRule
 from python.src.exceptions import InvalidOrderDirectionException
+from python.src.exceptions import OffTickPriceException
+from python.src.exceptions import QuoteWithoutAccountException
+from python.src.exceptions import UnpricedMarketOrderException
 from python.src.trades import Trade
+from python.src.trigger_book import TriggerBook, Stop
+from python.src.events import EventSink
+from python.src.pools import OrderPool
+from python.src.pools import RecyclingDeque
+from python.src import allocation
+from python.src import auction
 from sortedcontainers import SortedKeyList
 from collections import deque
-from typing import Optional, List
+from itertools import compress
+from typing import Any, Callable, Dict, Optional, List, Tuple, cast
 import numpy as np
+import time
 import matplotlib.pyplot as plt
 
 
@@ -29,16 +46,93 @@ class OrderBook:
     --complete_orders -> A record of completed orders.
      This is a dequeus (linked lists) because we require fast (O(1))  access,
     fast insert, and never need to search the list
+    --max_history -> If set, trades and complete_orders keep only this many of the most recent
+    entries, so a long-running book uses bounded memory. None keeps everything.
+    --trigger_book -> Stop and stop-limit orders waiting for the market to trade through them.
+    --last_price -> The price of the most recent trade, None before the first trade.
+    --matching_algorithm -> How crossing quantity is allocated between orders at the best price.
+    --fifo_fraction -> The share of each crossing allocated FIFO under fifo_pro_rata.
+    --in_auction -> Whether the book is collecting orders for a call auction.
+    While in auction, orders are added but match() does nothing until uncross().
+    --execution_price_rule -> Whether crossing orders trade at the resting order's price or the midpoint.
+    --aggressor -> The most recent order to become best bid or best ask, which is the
+    incoming side of any cross. The other side is the resting order.
+    --trade_sink -> If set, called as trade_sink(timestamp, price, quantity, bid, ask) for each
+    trade instead of building Trade objects. Timestamps are nanoseconds since the epoch, orders
+    are updated with fill() and neither trades nor fill_info are recorded.
+    --fill_hook -> If set, called as fill_hook(price, quantity, bid, ask) for each trade once both
+    orders are updated, whether trades are recorded as Trade objects or through the trade sink.
+    --event_sink -> If set, receives the lifecycle events of every order in the book.
+    Fills are only reported if it wants them (see EventSink.wants_fills).
+    --clock -> If set, called for the time of each trade in nanoseconds since the epoch,
+    in place of the wall clock. Replays use it to stamp trades with historical times.
+    --tick_size -> If set, limit prices must be a multiple of the tick size. Limit and stop-limit
+    orders and quotes with other prices raise OffTickPriceException when added.
+    --order_pool -> If set, orders and trades leaving complete_orders and trades under max_history
+    are released to it for reuse, and trades are built through it.
+    --order_index -> Every live order in the book or trigger book, by order_id.
+    Cancels look their order up here in O(1) rather than scanning the book.
+    Orders leave the index as they complete.
+    --account_orders -> The live orders in the book or trigger book of each account, by account_id
+    then order_id. Orders without an account_id are not indexed. Mass cancels for an account
+    visit only that account's orders.
+    --quotes -> The order_ids of each account's resting quote orders, as [bid, ask], None for a side
+    without a quote. Quote orders which have since filled or been cancelled are no longer in order_index.
     """
 
-    def __init__(self):
+    def __init__(self,
+                 matching_algorithm: MatchingAlgorithm = MatchingAlgorithm.price_time,
+                 fifo_fraction: float = 0.5,
+                 execution_price_rule: ExecutionPriceRule = ExecutionPriceRule.resting,
+                 trade_sink: Optional[Callable[[Any, float, float, BaseOrder, BaseOrder], None]] = None,
+                 event_sink: Optional[EventSink] = None,
+                 max_history: Optional[int] = None,
+                 clock: Optional[Callable[[], int]] = None,
+                 tick_size: Optional[float] = None,
+                 order_pool: Optional[OrderPool] = None,
+                 fill_hook: Optional[Callable[[float, float, BaseOrder, BaseOrder], None]] = None):
         self.bids = SortedKeyList(key=lambda x: -x.price)
         self.asks = SortedKeyList(key=lambda x: x.price)
         self.best_bid: Optional[BaseOrder] = None
         self.best_ask: Optional[BaseOrder] = None
         self.attempt_match = False
-        self.trades: deque = deque()
-        self.complete_orders: deque = deque()
+        self.max_history = max_history
+        self.order_pool = order_pool
+        self.trades: deque
+        self.complete_orders: deque
+        self.new_trade: Callable[[Any, float, float], Trade]
+        if order_pool is None:
+            self.trades = deque(maxlen=max_history)
+            self.complete_orders = deque(maxlen=max_history)
+            self.new_trade = Trade
+        else:
+            self.trades = RecyclingDeque(order_pool.release_trade, maxlen=max_history)
+            self.complete_orders = RecyclingDeque(self.release_order, maxlen=max_history)
+            self.new_trade = order_pool.trade
+        self.trigger_book = TriggerBook()
+        self.last_price: Optional[float] = None
+        self.matching_algorithm = matching_algorithm
+        self.fifo_fraction = fifo_fraction
+        self.in_auction = False
+        self.execution_price_rule = execution_price_rule
+        self.aggressor: Optional[BaseOrder] = None
+        self.trade_sink = trade_sink
+        self.fill_hook = fill_hook
+        self.event_sink = event_sink
+        self.order_index: Dict[int, BaseOrder] = {}
+        self.account_orders: Dict[str, Dict[int, BaseOrder]] = {}
+        self.quotes: Dict[str, List[Optional[int]]] = {}
+        self.clock = clock
+        self.tick_size = tick_size
+
+    def release_order(self, order: BaseOrder) -> None:
+        """ Release an order leaving complete_orders to the order pool.
+
+        The aggressor is recognised by identity, so it must not point at an order which may be reused.
+        """
+        if order is self.aggressor:
+            self.aggressor = None
+        cast(OrderPool, self.order_pool).release_order(order)
 
     def add_bid(self, order: BaseOrder) -> None:
         """ Adding a bid to the order book
@@ -51,12 +145,14 @@ class OrderBook:
         best_bid = self.best_bid
         if not best_bid:
             self.best_bid = order
+            self.aggressor = order
             self.attempt_match = True
         elif order.price <= best_bid.price:
             self.bids.add(order)
         else:
             self.bids.add(best_bid)
             self.best_bid = order
+            self.aggressor = order
             self.attempt_match = True
 
     def add_ask(self, order: BaseOrder) -> None:
@@ -69,70 +165,226 @@ class OrderBook:
         best_ask = self.best_ask
         if not best_ask:
             self.best_ask = order
+            self.aggressor = order
             self.attempt_match = True
         elif order.price >= best_ask.price:
             self.asks.add(order)
         else:
             self.asks.add(best_ask)
             self.best_ask = order
+            self.aggressor = order
             self.attempt_match = True
 
-    def find_in_list(self, orders: List[BaseOrder], order_id: int) -> Optional[BaseOrder]:
-
-        for order in orders:
-            if order.order_id == order_id:
-                return order
-        return None
-
     def add_cancel(self, order: CancelOrder) -> None:
         """  Cancelling an existing order
 
-        Check all orders to find the first matching order_id and cancel it if possible.
+        Look the order up by order_id and cancel it if it is live on the cancel's side.
         """
-        if order.order_direction == OrderDirection.buy and self.best_bid is not None:
+        matched_order = self.order_index.get(order.order_id)
+        if matched_order is not None and matched_order.order_direction != order.order_direction:
+            matched_order = None
+
+        if matched_order is not None:
+            self.remove(matched_order)
+
+        event_sink = self.event_sink
+        if matched_order is not None:
+            order.cancel_order(matched_order)
+            if event_sink is not None:
+                event_sink.on_cancelled(matched_order, order)
+            self.complete_orders.append(matched_order)
+        elif event_sink is not None:
+            event_sink.on_cancel_rejected(order)
+        return None
 
-            best_bid = self.best_bid
+    def remove(self, order: BaseOrder) -> None:
+        """ Take a live order out of the book or trigger book, and out of the indexes.
+
+        A best order is replaced by the next in the book, any other order is removed
+        from the book or the trigger book.
+        """
+        self.unindex(order)
+        order_type = order.order_type
+        if order is self.best_bid:
             bids = self.bids
+            if bids:
+                self.best_bid = bids.pop(0)
+                self.attempt_match = True
+            else:
+                self.best_bid = None
+        elif order is self.best_ask:
+            asks = self.asks
+            if asks:
+                self.best_ask = asks.pop(0)
+                self.attempt_match = True
+            else:
+                self.best_ask = None
+        elif order_type == OrderType.stop or order_type == OrderType.stop_limit:
+            self.trigger_book.remove(cast(Stop, order))
+        elif order.order_direction == OrderDirection.buy:
+            self.bids.remove(order)
+        else:
+            self.asks.remove(order)
+
+    def unindex(self, order: BaseOrder) -> None:
+        """ Drop a completed order from order_index and account_orders."""
+
+        order_id = order.order_id
+        self.order_index.pop(order_id, None)
+        account_id = order.account_id
+        if account_id is not None:
+            account_orders = self.account_orders.get(account_id)
+            if account_orders is not None:
+                account_orders.pop(order_id, None)
+                if not account_orders:
+                    del self.account_orders[account_id]
+
+    def mass_cancel(self, order: MassCancelOrder) -> None:
+        """ Cancel every live order in the book and trigger book matching the mass cancel's filters.
+
+        An account's orders are found through account_orders, and without an account
+        every order is found through order_index, so only the k cancelled orders are visited.
+        Cancelling a whole side clears it outright, and see remove_many() for the rest.
+        The cancelled orders are reported in a single on_mass_cancelled event.
+        """
+        order_direction = order.order_direction
+        if order.account_id is None:
+            candidates = self.order_index.values()
+        else:
+            candidates = self.account_orders.get(order.account_id, {}).values()
+        cancelled = [o for o in candidates
+                     if order_direction is None or o.order_direction == order_direction]
+        if not cancelled:
+            return None
 
-            if order.order_id == best_bid.order_id:
-                order.cancel_order(best_bid)
-                self.complete_orders.append(best_bid)
-                if bids:
-                    self.best_bid = bids.pop(0)
-                    self.attempt_match = True
-                else:
-                    self.best_bid = None
-            elif bids:
-                matched_order = self.find_in_list(bids, order.order_id)
-                if matched_order:
-                    bids.remove(matched_order)
-                    self.complete_orders.append(matched_order)
-                    order.cancel_order(matched_order)
+        for cancelled_order in cancelled:
+            cancelled_order.status = OrderStatus.cancelled
+        if order.account_id is None:
+            if order_direction is None or order_direction == OrderDirection.buy:
+                self.bids.clear()
+                self.best_bid = None
+            if order_direction is None or order_direction == OrderDirection.sell:
+                self.asks.clear()
+                self.best_ask = None
+            self.trigger_book.clear(order_direction)
+            for cancelled_order in cancelled:
+                self.unindex(cancelled_order)
+        else:
+            self.remove_many(cancelled)
 
-        elif order.order_direction == OrderDirection.sell and self.best_ask is not None:
+        order.cancelled += len(cancelled)
+        if self.event_sink is not None:
+            self.event_sink.on_mass_cancelled(cancelled, order)
+        complete_orders = self.complete_orders
+        for cancelled_order in cancelled:
+            complete_orders.append(cancelled_order)
 
-            best_ask = self.best_ask
-            asks = self.asks
+    def remove_many(self, orders: List[BaseOrder]) -> None:
+        """ Take many orders, already marked cancelled, out of the book, trigger book and indexes."""
 
-            if order.order_id == best_ask.order_id:
-                order.cancel_order(best_ask)
-                self.complete_orders.append(best_ask)
-                if self.asks:
-                    self.best_ask = self.asks.pop(0)
-                    self.attempt_match = True
-                else:
-                    self.best_ask = None
-            elif asks:
-                matched_order = self.find_in_list(asks, order.order_id)
-                if matched_order:
-                    asks.remove(matched_order)
-                    self.complete_orders.append(matched_order)
-                    order.cancel_order(matched_order)
-        return None
+        bids: List[BaseOrder] = []
+        asks: List[BaseOrder] = []
+        for order in orders:
+            self.unindex(order)
+            order_type = order.order_type
+            if order_type == OrderType.stop or order_type == OrderType.stop_limit:
+                self.trigger_book.remove(cast(Stop, order))
+            elif order.order_direction == OrderDirection.buy:
+                bids.append(order)
+            else:
+                asks.append(order)
+        if bids:
+            self.best_bid = self.remove_from_side(self.best_bid, self.bids, bids)
+        if asks:
+            self.best_ask = self.remove_from_side(self.best_ask, self.asks, asks)
+
+    def remove_from_side(self, best_order: Optional[BaseOrder], orders: SortedKeyList,
+                         removed: List[BaseOrder]) -> Optional[BaseOrder]:
+        """ Take orders no longer live out of one side of the book, and return its new best order.
+
+        Removing an order from the sorted book scans every order at its price ahead of it,
+        which is slow in deep levels. Once more than 1 in 256 of the side's orders go,
+        it is cheaper to rebuild the side from the orders which stay. Rebuilding sorts
+        them stably, so time priority within each price is kept.
+        """
+        if len(removed) * 256 > len(orders):
+            remaining = [o for o in orders if o.status == OrderStatus.live]
+            orders.clear()
+            orders.update(remaining)
+        else:
+            for order in removed:
+                if order is not best_order:
+                    orders.remove(order)
+        if best_order is not None and best_order.status != OrderStatus.live:
+            best_order = orders.pop(0) if orders else None
+        return best_order
+
+    def add_stop(self, order: Stop) -> None:
+        """ Adding a stop or stop-limit order
+
+        The order is held in the trigger book until a trade crosses its stop price.
+        If the last trade has already crossed it, it is triggered immediately.
+        """
+        last_price = self.last_price
+        if last_price is not None and self.trigger_book.is_triggered(order, last_price):
+            order.trigger()
+            self.add_triggered(order)
+        else:
+            self.trigger_book.add(order)
+
+    def add_triggered(self, order: Stop) -> None:
+        """ Adding a triggered stop, which was accepted when it arrived."""
+
+        if order.order_direction == OrderDirection.buy:
+            self.add_bid(order)
+        else:
+            self.add_ask(order)
 
-    def add_order(self, order: BaseOrder) -> None:
-        if order.order_type == OrderType.cancel:
-            self.add_cancel(order)
+    def check_tick(self, price: float, tick_size: float) -> None:
+        """ Raise OffTickPriceException unless price is a multiple of tick_size.
+
+        Prices are kept as sent rather than moved onto the grid, as multiplying a number
+        of ticks back out leaves floating point residue in the price. A small tolerance
+        accepts prices on the grid up to floating point error.
+        """
+        ticks = price / tick_size
+        if abs(ticks - round(ticks)) > 1e-9:
+            raise OffTickPriceException(price, tick_size)
+
+    def check_market_price(self, order: BaseOrder) -> None:
+        """ Raise UnpricedMarketOrderException if a market order would meet a resting market order
+        before the book has traded, as neither has a price to trade at.
+
+        The incoming order is refused rather than left resting, as the two market orders
+        would otherwise stay at the top of the book and block every other order.
+        """
+        if order.order_direction == OrderDirection.buy:
+            opposite = self.best_ask
+        else:
+            opposite = self.best_bid
+        if opposite and opposite.order_type == OrderType.market:
+            raise UnpricedMarketOrderException()
+
+    def add_order(self, order: AnyOrder) -> None:
+        order_type = order.order_type
+        if order_type == OrderType.cancel:
+            self.add_cancel(cast(CancelOrder, order))
+            return None
+        if order_type == OrderType.mass_cancel:
+            self.mass_cancel(cast(MassCancelOrder, order))
+            return None
+        if order_type == OrderType.quote:
+            self.quote(cast(Quote, order))
+            return None
+        order = cast(BaseOrder, order)
+        tick_size = self.tick_size
+        if tick_size is not None and (order_type == OrderType.limit or order_type == OrderType.stop_limit):
+            self.check_tick(order.price, tick_size)
+        elif order_type == OrderType.market and self.last_price is None and not self.in_auction:
+            self.check_market_price(order)
+
+        if order_type == OrderType.stop or order_type == OrderType.stop_limit:
+            self.add_stop(cast(Stop, order))
         elif order.order_direction == OrderDirection.buy:
             self.add_bid(order)
         elif order.order_direction == OrderDirection.sell:
@@ -140,16 +392,225 @@ class OrderBook:
         else:
             raise InvalidOrderDirectionException()
 
+        if order.status == OrderStatus.live:
+            self.index(order)
+        if self.event_sink is not None:
+            self.event_sink.on_accepted(order)
+
+    def index(self, order: BaseOrder) -> None:
+        """ Add a live order to order_index and account_orders."""
+
+        self.order_index[order.order_id] = order
+        account_id = order.account_id
+        if account_id is not None:
+            account_orders = self.account_orders.get(account_id)
+            if account_orders is None:
+                account_orders = self.account_orders[account_id] = {}
+            account_orders[order.order_id] = order
+
+    def quote(self, quote: Quote) -> None:
+        """ Replace the quote of the quote's account with its new bid and ask.
+
+        Both sides are applied before the next match(), so the book never shows
+        one side of the new quote alongside the other side of the old one.
+        Both prices are checked against the tick size before either side is applied.
+        Quotes without an account_id raise QuoteWithoutAccountException, as they would
+        all replace one another.
+        """
+        account_id = quote.account_id
+        if account_id is None:
+            raise QuoteWithoutAccountException()
+        tick_size = self.tick_size
+        if tick_size is not None:
+            if quote.bid_quantity > 0:
+                self.check_tick(quote.bid_price, tick_size)
+            if quote.ask_quantity > 0:
+                self.check_tick(quote.ask_price, tick_size)
+        quote_ids = self.quotes.get(account_id)
+        if quote_ids is None:
+            quote_ids = self.quotes[account_id] = [None, None]
+        order_index = self.order_index
+        bid_id, ask_id = quote_ids
+        bid = order_index.get(bid_id) if bid_id is not None else None
+        ask = order_index.get(ask_id) if ask_id is not None else None
+        bid = self.requote(bid, OrderDirection.buy, quote.bid_price, quote.bid_quantity, quote, quote.bid_order_id)
+        ask = self.requote(ask, OrderDirection.sell, quote.ask_price, quote.ask_quantity, quote, quote.ask_order_id)
+        quote_ids[0] = bid.order_id if bid is not None else None
+        quote_ids[1] = ask.order_id if ask is not None else None
+
+    def requote(self, current: Optional[BaseOrder], order_direction: OrderDirection,
+                price: float, quantity: float, quote: Quote, order_id: int = 0) -> Optional[BaseOrder]:
+        """ Move one side of a quote to a new price and quantity, returning the side's live order.
+
+        A zero quantity cancels the resting order, and a side without one gets a new limit order,
+        given order_id if it is not 0.
+        Otherwise the resting order is replaced in place, keeping its order_id: at the same
+        price with no more quantity it keeps its time priority, else it is moved to the back
+        of its new price. Quantity already filled is kept, so quantity stays filled plus unfilled.
+        """
+        event_sink = self.event_sink
+        if quantity <= 0:
+            if current is not None:
+                self.remove(current)
+                current.status = OrderStatus.cancelled
+                if event_sink is not None:
+                    event_sink.on_cancelled(current, quote)
+                self.complete_orders.append(current)
+            return None
+
+        if current is None:
+            order_pool = self.order_pool
+            if order_pool is None:
+                order = LimitOrder(quote.instrument_id, order_direction, quantity, price,
+                                   quote.account_id, quote.client_order_id)
+            else:
+                order = order_pool.limit_order(quote.instrument_id, order_direction, quantity, price,
+                                               quote.account_id, quote.client_order_id)
+            if order_id:
+                order.order_id = order_id
+            self.add_order(order)
+            return order
+
+        previous_price = current.price
+        previous_quantity = current.unfilled_quantity
+        if price == previous_price and quantity <= previous_quantity:
+            current.quantity -= previous_quantity - quantity
+            current.unfilled_quantity = quantity
+        else:
+            self.remove(current)
+            current.price = price
+            current.quantity += quantity - previous_quantity
+            current.unfilled_quantity = quantity
+            if order_direction == OrderDirection.buy:
+                self.add_bid(current)
+            else:
+                self.add_ask(current)
+            self.index(current)
+        if event_sink is not None:
+            event_sink.on_replaced(current, previous_price, previous_quantity)
+        return current
+
     def match(self) -> None:
         """ Attempt to match orders.
 
+        Cross the book, then release any stops crossed by the resulting trades
+        into the book and cross again. Cascades are handled iteratively, one
+        release per round, until a round triggers no further stops.
+        """
+        if self.in_auction:
+            return None
+
+        cross = self.crossing_method()
+        low, high = cross()
+        if low <= high and self.trigger_book:
+            self.release_stops(low, high, cross)
+
+    def crossing_method(self) -> Callable[[], Tuple[float, float]]:
+        """ The cross for this book's matching algorithm."""
+
+        if self.matching_algorithm == MatchingAlgorithm.price_time:
+            return self.cross
+        return self.cross_levels
+
+    def execution_price(self, best_bid: BaseOrder, best_ask: BaseOrder) -> float:
+        """ The price at which the best bid and best ask trade.
+
+        Under the resting rule a resting market order has no price of its own,
+        so the aggressor's price is used, or the last trade price if both are market orders.
+        add_order() refuses a market order which would meet a market order before there is one.
+        """
+        if self.execution_price_rule == ExecutionPriceRule.midpoint:
+            return (best_bid.price + best_ask.price) / 2
+
+        if best_bid is self.aggressor:
+            resting, incoming = best_ask, best_bid
+        else:
+            resting, incoming = best_bid, best_ask
+        if resting.order_type != OrderType.market:
+            return resting.price
+        if incoming.order_type != OrderType.market:
+            return incoming.price
+        return cast(float, self.last_price)
+
+    def timestamp(self) -> Any:
+        """ The time of a trade, as a datetime64 for Trade objects or nanoseconds for a trade sink."""
+
+        clock = self.clock
+        if clock is not None:
+            if self.trade_sink is None:
+                return np.datetime64(clock(), "ns")
+            return clock()
+        if self.trade_sink is None:
+            return np.datetime64("now")
+        return time.time_ns()
+
+    def record_trade(self, timestamp: Any, price: float, quantity: float,
+                     bid: BaseOrder, ask: BaseOrder) -> None:
+        """ Update both orders on a trade and record it, in a Trade or through the trade sink."""
+
+        trade_sink = self.trade_sink
+        if trade_sink is None:
+            trade = self.new_trade(timestamp, price, quantity)
+            bid.update_on_trade(trade)
+            ask.update_on_trade(trade)
+            self.trades.append(trade)
+        else:
+            bid.fill(quantity)
+            ask.fill(quantity)
+            trade_sink(timestamp, price, quantity, bid, ask)
+        fill_hook = self.fill_hook
+        if fill_hook is not None:
+            fill_hook(price, quantity, bid, ask)
+        event_sink = self.event_sink
+        if event_sink is not None and event_sink.wants_fills:
+            self.report_fill(bid, price, quantity)
+            self.report_fill(ask, price, quantity)
+
+    def report_fill(self, order: BaseOrder, price: float, quantity: float) -> None:
+        """ Report a fill to the event sink as filled or partially filled."""
+
+        event_sink = cast(EventSink, self.event_sink)
+        if order.status == OrderStatus.filled:
+            event_sink.on_filled(order, price, quantity)
+        else:
+            event_sink.on_partially_filled(order, price, quantity)
+
+    def release_stops(self, low: float, high: float, cross: Callable[[], Tuple[float, float]]) -> None:
+        """ Release the stops crossed by trades between low and high, cross, and repeat."""
+
+        trigger_book = self.trigger_book
+        while trigger_book and low <= high:
+            triggered = trigger_book.release(low, high)
+            if not triggered:
+                break
+            for order in triggered:
+                order.trigger()
+                self.add_triggered(order)
+            low, high = cross()
+
+    def cross(self) -> Tuple[float, float]:
+        """ Match crossing orders.
+
         If possible, match orders and replace the best bid and best ask
         as needed.
         Continue matching until you no longer can.
 
         If no match occurs, update so that no match is attempted until
         conditions change.
+
+        A sweep is one event, so every fill in a call shares a single timestamp,
+        taken at the first fill.
+
+        Returns the lowest and highest trade prices, (inf, -inf) if nothing traded.
         """
+        low = float("inf")
+        high = float("-inf")
+        now = None
+        trade_sink = self.trade_sink
+        fill_hook = self.fill_hook
+        event_sink = self.event_sink
+        report_fills = event_sink is not None and event_sink.wants_fills
+        new_trade = self.new_trade
         while self.attempt_match and self.best_bid and self.best_ask:
 
             self.attempt_match = False
@@ -157,21 +618,40 @@ class OrderBook:
             best_ask = self.best_ask
             if (best_bid.price >= best_ask.price):
 
-                execution_price = (best_bid.price +
-                                   best_ask.price) / 2
+                execution_price = self.execution_price(best_bid, best_ask)
 
                 matched_quantity = min(best_ask.unfilled_quantity,
                                        best_bid.unfilled_quantity)
 
-                trade = Trade(datetime=np.datetime64("now"),
-                              price=execution_price,
-                              quantity=matched_quantity)
+                if now is None:
+                    now = self.timestamp()
+                if trade_sink is None:
+                    trade = new_trade(now, execution_price, matched_quantity)
 
-                best_bid.update_on_trade(trade)
-                best_ask.update_on_trade(trade)
-                self.trades.append(trade)
+                    best_bid.update_on_trade(trade)
+                    best_ask.update_on_trade(trade)
+                    self.trades.append(trade)
+                else:
+                    best_bid.unfilled_quantity -= matched_quantity
+                    if best_bid.unfilled_quantity == 0:
+                        best_bid.status = OrderStatus.filled
+                    best_ask.unfilled_quantity -= matched_quantity
+                    if best_ask.unfilled_quantity == 0:
+                        best_ask.status = OrderStatus.filled
+                    trade_sink(now, execution_price, matched_quantity, best_bid, best_ask)
+                if fill_hook is not None:
+                    fill_hook(execution_price, matched_quantity, best_bid, best_ask)
+                if report_fills:
+                    self.report_fill(best_bid, execution_price, matched_quantity)
+                    self.report_fill(best_ask, execution_price, matched_quantity)
+                self.last_price = execution_price
+                if execution_price < low:
+                    low = execution_price
+                if execution_price > high:
+                    high = execution_price
 
                 if best_bid.status != OrderStatus.live:
+                    self.unindex(best_bid)
                     self.complete_orders.append(best_bid)
                     if self.bids:
                         self.best_bid = self.bids.pop(0)
@@ -180,6 +660,7 @@ class OrderBook:
                         self.best_bid = None
 
                 if best_ask.status != OrderStatus.live:
+                    self.unindex(best_ask)
                     self.complete_orders.append(best_ask)
                     if self.asks:
                         self.best_ask = self.asks.pop(0)
@@ -189,6 +670,201 @@ class OrderBook:
             else:
                 break
         self.attempt_match = False
+        return low, high
+
+    def best_level(self, best_order: BaseOrder, orders: SortedKeyList) -> List[BaseOrder]:
+        """ All orders at the best order's price, in time priority.
+
+        Equal prices are contiguous at the front of the sorted book,
+        so the level is a bisect and a slice.
+        """
+        count = orders.bisect_key_right(orders.key(best_order))
+        return [best_order] + orders[:count]
+
+    def allocate(self, quantities: np.ndarray, total: float) -> np.ndarray:
+        """ Allocate total across the quantities of one level under the matching algorithm."""
+
+        matching_algorithm = self.matching_algorithm
+        if matching_algorithm == MatchingAlgorithm.pro_rata:
+            return allocation.pro_rata(quantities, total)
+        elif matching_algorithm == MatchingAlgorithm.fifo_pro_rata:
+            return allocation.fifo_pro_rata(quantities, total, self.fifo_fraction)
+        return allocation.fifo(quantities, total)
+
+    def settle_level(self, level: List[BaseOrder], filled: np.ndarray) -> None:
+        """ Mark the orders allocated their whole quantity as filled.
+
+        Fractional quantities are split with floating point arithmetic,
+        so a completed order can be left with a rounding residue of at most
+        allocation.FILL_EPSILON, which is cleared.
+        """
+        for order in compress(level, filled.tolist()):
+            if order.unfilled_quantity:
+                order.unfilled_quantity = 0.
+            order.status = OrderStatus.filled
+
+    def refill_level(self, level: List[BaseOrder], orders: SortedKeyList) -> Optional[BaseOrder]:
+        """ Return the live orders of a level to the book and give the new best order.
+
+        The rest of the level is removed from the book before being re-added,
+        so orders which are still live keep their time priority.
+        """
+        del orders[:len(level) - 1]
+        live_orders = []
+        for order in level:
+            if order.status == OrderStatus.live:
+                live_orders.append(order)
+            else:
+                self.unindex(order)
+                self.complete_orders.append(order)
+
+        if live_orders:
+            for order in live_orders[1:]:
+                orders.add(order)
+            return live_orders[0]
+        elif orders:
+            return orders.pop(0)
+        return None
+
+    def cross_levels(self) -> Tuple[float, float]:
+        """ Match crossing orders a whole price level at a time.
+
+        The quantity crossing between the best bid level and the best ask level
+        is the smaller of the two level totals. It is allocated across each level
+        in one vectorized pass, and the two allocations are paired into trades.
+        The smaller level fills completely, so each round moves at least one side
+        to its next price.
+
+        Returns the lowest and highest trade prices, (inf, -inf) if nothing traded.
+        """
+        low = float("inf")
+        high = float("-inf")
+        while self.attempt_match and self.best_bid and self.best_ask:
+
+            self.attempt_match = False
+            best_bid = self.best_bid
+            best_ask = self.best_ask
+            if (best_bid.price >= best_ask.price):
+
+                execution_price = self.execution_price(best_bid, best_ask)
+
+                bid_level = self.best_level(best_bid, self.bids)
+                ask_level = self.best_level(best_ask, self.asks)
+                # Integer quantities stay integers, so fills match those of price-time matching.
+                bid_quantities = np.array([o.unfilled_quantity for o in bid_level])
+                ask_quantities = np.array([o.unfilled_quantity for o in ask_level])
+                matched_quantity = min(bid_quantities.sum(), ask_quantities.sum())
+
+                bid_fills = self.allocate(bid_quantities, matched_quantity)
+                ask_fills = self.allocate(ask_quantities, matched_quantity)
+                bid_index, ask_index, quantities = allocation.pair_fills(bid_fills, ask_fills)
+
+                now = self.timestamp()
+                for i, j, quantity in zip(bid_index.tolist(), ask_index.tolist(), quantities.tolist()):
+                    self.record_trade(now, execution_price, quantity, bid_level[i], ask_level[j])
+                self.settle_level(bid_level, allocation.filled(bid_fills, bid_quantities))
+                self.settle_level(ask_level, allocation.filled(ask_fills, ask_quantities))
+
+                self.last_price = execution_price
+                if execution_price < low:
+                    low = execution_price
+                if execution_price > high:
+                    high = execution_price
+
+                self.best_bid = self.refill_level(bid_level, self.bids)
+                self.best_ask = self.refill_level(ask_level, self.asks)
+                self.attempt_match = True
+            else:
+                break
+        self.attempt_match = False
+        return low, high
+
+    def start_auction(self) -> None:
+        """ Collect orders without matching until uncross() is called."""
+
+        self.in_auction = True
+
+    def uncross(self) -> Optional[Tuple[float, float]]:
+        """ Uncross the book at a single clearing price and return to continuous matching.
+
+        The clearing price maximises executed volume (see auction.clearing_price),
+        with the last trade price as the reference for ties. Every order which can
+        trade at that price is filled in price-time priority in one pass:
+        eligible orders are a prefix of each side, allocated with fifo and paired
+        into trades at the clearing price. Stops crossed by the clearing price are
+        then released, and the book resumes continuous matching.
+
+        Returns the clearing price and volume, None if nothing traded.
+        """
+        self.in_auction = False
+        result = None
+        if self.best_bid and self.best_ask:
+            bid_orders = [self.best_bid] + list(self.bids)
+            ask_orders = [self.best_ask] + list(self.asks)
+            bid_prices = np.array([o.price for o in bid_orders], dtype=float)
+            ask_prices = np.array([o.price for o in ask_orders], dtype=float)
+            bid_quantities = np.array([o.unfilled_quantity for o in bid_orders])
+            ask_quantities = np.array([o.unfilled_quantity for o in ask_orders])
+
+            price, volume = auction.clearing_price(bid_prices, bid_quantities,
+                                                   ask_prices, ask_quantities,
+                                                   reference_price=self.last_price)
+            if volume > 0:
+                bid_count = np.searchsorted(-bid_prices, -price, side="right")
+                ask_count = np.searchsorted(ask_prices, price, side="right")
+                bid_level = bid_orders[:bid_count]
+                ask_level = ask_orders[:ask_count]
+                # Integer quantities are filled in integers, as in continuous matching.
+                fill_volume = np.result_type(bid_quantities, ask_quantities).type(volume)
+                bid_fills = allocation.fifo(bid_quantities[:bid_count], fill_volume)
+                ask_fills = allocation.fifo(ask_quantities[:ask_count], fill_volume)
+                bid_index, ask_index, quantities = allocation.pair_fills(bid_fills, ask_fills)
+
+                now = self.timestamp()
+                for i, j, quantity in zip(bid_index.tolist(), ask_index.tolist(), quantities.tolist()):
+                    self.record_trade(now, price, quantity, bid_level[i], ask_level[j])
+                self.settle_level(bid_level, allocation.filled(bid_fills, bid_quantities[:bid_count]))
+                self.settle_level(ask_level, allocation.filled(ask_fills, ask_quantities[:ask_count]))
+
+                self.last_price = price
+                self.aggressor = None
+                self.best_bid = self.refill_level(bid_level, self.bids)
+                self.best_ask = self.refill_level(ask_level, self.asks)
+                self.attempt_match = True
+                result = (price, volume)
+
+        if result and self.trigger_book:
+            self.release_stops(result[0], result[0], self.crossing_method())
+        self.match()
+        return result
+
+    def depth(self, levels: int) -> Tuple[Tuple[Tuple[float, float], ...], Tuple[Tuple[float, float], ...]]:
+        """ The price and total unfilled quantity of the best levels of each side, best first.
+
+        Returns (bids, asks), each a tuple of at most levels (price, quantity) pairs.
+        Only the orders of those levels are visited, however deep the book.
+        """
+        return (self.side_depth(self.best_bid, self.bids, levels),
+                self.side_depth(self.best_ask, self.asks, levels))
+
+    def side_depth(self, best_order: Optional[BaseOrder], orders: SortedKeyList,
+                   levels: int) -> Tuple[Tuple[float, float], ...]:
+        """ The best levels of one side, aggregated from its best order and the rest of its book."""
+
+        if best_order is None or levels <= 0:
+            return ()
+        prices: List[float] = [best_order.price]
+        quantities: List[float] = [best_order.unfilled_quantity]
+        for order in orders:
+            price = order.price
+            if price == prices[-1]:
+                quantities[-1] += order.unfilled_quantity
+            elif len(prices) == levels:
+                break
+            else:
+                prices.append(price)
+                quantities.append(order.unfilled_quantity)
+        return tuple(zip(prices, quantities))
 
     def plot_order_book(self) -> None:
         """ Create a line plot showing order book volume and prices"""
@@ -229,8 +905,8 @@ class OrderBook:
         ax.step(bid_prices, bids, color='green')
         ax.step(ask_prices, asks, color='red')
 
-        ax.set_xlim([min(bid_prices),
-                     max(ask_prices)])
+        ax.set_xlim((min(bid_prices),
+                     max(ask_prices)))
         plt.savefig("images/order_book.png")
 
     def plot_executions(self) -> None:
@@ -253,6 +929,6 @@ class OrderBook:
         ax2.plot(times,
                  [t.quantity for t in self.trades])
 
-        ax1.set_xlim([min(times), max(times)])
-        ax2.set_xlim([min(times), max(times)])
+        ax1.set_xlim((min(times), max(times)))
+        ax2.set_xlim((min(times), max(times)))
         plt.savefig("images/executions.png")
@@ -0,0 +1 @@
+from .order_flow_generator import OrderFlowGenerator, to_orders
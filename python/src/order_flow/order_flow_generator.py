@@ -0,0 +1,186 @@
+from python.src.codec import ORDER, records_to_orders
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from python.src.orders import AnyOrder
+from python.src.pools import OrderPool
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+
+
+class OrderFlowGenerator:
+    """ Synthetic order flow, generated a column at a time with NumPy.
+
+    Orders arrive as a Poisson process and each goes to an instrument drawn from
+    hot/cold weights. Sizes follow a power law. Limit prices sit a geometric number
+    of ticks from a mid price which random walks per instrument, mostly passive,
+    so books build depth, with a fraction placed through the mid which cross.
+    Cancels target earlier limit orders, favouring recent ones.
+
+    Every column is drawn in one vectorised call, so millions of orders take
+    seconds, and the same seed always gives the same flow.
+
+    Attributes:
+    -- instrument_ids -> The instruments to generate orders for.
+    -- instrument_weights -> The relative order rate of each instrument. None for
+    Zipf weights, 1 / rank ** hotness, so the first instruments are hot and the rest cold.
+    -- hotness -> The Zipf exponent used when instrument_weights is None. 0 weights every instrument equally.
+    -- arrival_rate -> The mean number of orders per second, across all instruments.
+    -- mid_price -> The starting mid price of every instrument.
+    -- volatility -> The standard deviation of each mid price move, in ticks per order.
+    -- tick_size -> Prices are multiples of the tick size.
+    -- price_distance -> The mean distance of a limit price from the mid, in ticks.
+    -- cross_ratio -> The fraction of limit orders priced through the mid, which cross on arrival.
+    -- size_exponent -> The power law exponent of order sizes. Smaller gives a heavier tail.
+    -- min_size -> The smallest order size. Sizes are whole multiples of it.
+    -- max_size -> The largest order size. None for no limit.
+    -- market_ratio -> The fraction of orders which are market orders.
+    -- cancel_ratio -> The fraction of orders which are cancels.
+    -- cancel_lag -> The mean number of limit orders between a cancel and the order it cancels.
+    -- start_ns -> The time of the first order, in nanoseconds since the epoch.
+    -- seed -> Seeds the random generator.
+    -- next_id -> The order_id of the next generated order, so ids stay unique across calls to generate().
+    """
+
+    def __init__(self,
+                 instrument_ids: Sequence[str] = ("AAPL", "MSFT", "TSLA", "FB", "NFLX"),
+                 instrument_weights: Optional[Sequence[float]] = None,
+                 hotness: float = 1.,
+                 arrival_rate: float = 1e5,
+                 mid_price: float = 40.,
+                 volatility: float = 0.1,
+                 tick_size: float = 0.01,
+                 price_distance: float = 20.,
+                 cross_ratio: float = 0.1,
+                 size_exponent: float = 1.5,
+                 min_size: float = 100.,
+                 max_size: Optional[float] = 100_000.,
+                 market_ratio: float = 0.05,
+                 cancel_ratio: float = 0.4,
+                 cancel_lag: float = 50.,
+                 start_ns: int = 1_600_000_000_000_000_000,
+                 seed: Optional[int] = None):
+
+        self.instrument_ids = list(instrument_ids)
+        self.instrument_weights = instrument_weights
+        self.hotness = hotness
+        self.arrival_rate = arrival_rate
+        self.mid_price = mid_price
+        self.volatility = volatility
+        self.tick_size = tick_size
+        self.price_distance = price_distance
+        self.cross_ratio = cross_ratio
+        self.size_exponent = size_exponent
+        self.min_size = min_size
+        self.max_size = max_size
+        self.market_ratio = market_ratio
+        self.cancel_ratio = cancel_ratio
+        self.cancel_lag = cancel_lag
+        self.start_ns = start_ns
+        self.rng = np.random.default_rng(seed)
+        self.next_id = 1
+
+    def weights(self) -> np.ndarray:
+        """ The probability of an order going to each instrument."""
+
+        if self.instrument_weights is not None:
+            weights = np.asarray(self.instrument_weights, dtype=np.float64)
+        else:
+            weights = 1 / np.arange(1, len(self.instrument_ids) + 1) ** self.hotness
+        return weights / weights.sum()
+
+    def generate(self, n: int) -> np.ndarray:
+        """ Generate n orders as an array of ORDER, in arrival order.
+
+        order_id has its codec meaning, as in a recorded order file: every order but
+        a cancel carries its own id, numbered from 1 across calls, and a cancel the
+        id of the order it cancels. ReplayDriver replays them under those ids, and
+        to_orders points cancels at the ids the engine gives instead.
+        Cancels drawn before any limit order become limit orders.
+        """
+        rng = self.rng
+        records = np.zeros(n, dtype=ORDER)
+
+        gaps = rng.exponential(1e9 / self.arrival_rate, n)
+        records["sent_ns"] = self.start_ns + np.cumsum(gaps).astype(np.int64)
+
+        instruments = rng.choice(len(self.instrument_ids), n, p=self.weights())
+        records["instrument_id"] = np.array([i.encode() for i in self.instrument_ids], dtype="S14")[instruments]
+
+        draw = rng.random(n)
+        order_types = np.full(n, OrderType.limit.value, dtype=np.uint8)
+        order_types[draw < self.market_ratio + self.cancel_ratio] = OrderType.market.value
+        order_types[draw < self.cancel_ratio] = OrderType.cancel.value
+
+        buy = rng.random(n) < 0.5
+        records["order_direction"] = np.where(buy, OrderDirection.buy.value, OrderDirection.sell.value)
+
+        # Pareto sizes in whole lots: P(size > x) falls as x ** -size_exponent.
+        lots = np.floor(rng.pareto(self.size_exponent, n) + 1)
+        sizes = lots * self.min_size
+        if self.max_size is not None:
+            np.minimum(sizes, self.max_size, out=sizes)
+        records["quantity"] = sizes
+
+        # Each instrument's mid random walks only on its own orders.
+        steps = rng.normal(0, self.volatility, n)
+        order = np.argsort(instruments, kind="stable")
+        walked = np.cumsum(steps[order])
+        starts = np.searchsorted(instruments[order], np.arange(len(self.instrument_ids)))
+        offsets = np.repeat(np.append(0, walked)[starts], np.diff(np.append(starts, n)))
+        mids = np.empty(n)
+        mids[order] = walked - offsets
+        ticks = np.round(self.mid_price / self.tick_size + mids)
+
+        # Passive orders sit away from the mid on their own side, crossing orders on the other.
+        distance = rng.geometric(1 / max(self.price_distance, 1.), n)
+        side = np.where(buy, -1, 1) * np.where(rng.random(n) < self.cross_ratio, -1, 1)
+        limit = order_types == OrderType.limit.value
+        records["price"] = np.where(limit, (ticks + side * distance) * self.tick_size, 0.)
+
+        self.add_cancels(records, order_types)
+        records["order_type"] = order_types
+        return records
+
+    def add_cancels(self, records: np.ndarray, order_types: np.ndarray) -> None:
+        """ Number every order but the cancels, then point each cancel at an earlier limit order
+        and copy its id, instrument and direction."""
+
+        rng = self.rng
+        cancels = np.flatnonzero(order_types == OrderType.cancel.value)
+        limits = np.flatnonzero(order_types == OrderType.limit.value)
+        earlier = np.searchsorted(limits, cancels)
+
+        orphans = earlier == 0
+        order_types[cancels[orphans]] = OrderType.limit.value
+        records["price"][cancels[orphans]] = self.mid_price
+        cancels = cancels[~orphans]
+        earlier = earlier[~orphans]
+
+        placed = order_types != OrderType.cancel.value
+        count = int(np.count_nonzero(placed))
+        records["order_id"][placed] = np.arange(self.next_id, self.next_id + count)
+        self.next_id += count
+
+        lag = rng.geometric(1 / max(self.cancel_lag, 1.), len(cancels))
+        targets = limits[np.maximum(earlier - lag, 0)]
+        records["order_id"][cancels] = records["order_id"][targets]
+        records["instrument_id"][cancels] = records["instrument_id"][targets]
+        records["order_direction"][cancels] = records["order_direction"][targets]
+        records["quantity"][cancels] = 0.
+
+
+def to_orders(records: np.ndarray, order_pool: Optional[OrderPool] = None) -> List[AnyOrder]:
+    """ Build the orders generated by OrderFlowGenerator, pointing each cancel at its order's engine id.
+
+    Orders are given fresh engine ids, so several generators can feed one engine.
+    Every cancel must be in the same array as the order it cancels.
+    """
+    orders = records_to_orders(records, order_pool)
+    engine_ids: Dict[int, int] = {}
+    order: Any
+    for order, order_id in zip(orders, records["order_id"].tolist()):
+        if order.order_type is OrderType.cancel:
+            order.order_id = engine_ids[order_id]
+        else:
+            engine_ids[order_id] = order.order_id
+    return orders
@@ -0,0 +1 @@
+from .order_state_store import OrderStateStore, ORDER_STATE
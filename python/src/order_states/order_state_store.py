@@ -0,0 +1,221 @@
+from python.src.events import EventSink
+from python.src.orders import BaseOrder
+from python.src.orders import AnyCancel
+from python.src.orders import AnyOrder
+from python.src.enums import OrderStatus
+from python.src.symbol_registry import SymbolRegistry
+from array import array
+from typing import Dict, Iterable, Optional
+import numpy as np
+
+# The state of one order, as returned by OrderStateStore.lookup().
+# -- status -> The OrderStatus value of the order, 0 if the order is unknown or evicted.
+# -- filled_quantity -> The quantity traded so far.
+# -- average_price -> The volume weighted average fill price, nan before the first fill.
+# -- symbol_id -> The order's instrument in the store's SymbolRegistry, -1 if unknown.
+ORDER_STATE = np.dtype([("status", np.int8),
+                        ("filled_quantity", np.float64),
+                        ("average_price", np.float64),
+                        ("symbol_id", np.int32)])
+
+UNKNOWN = 0
+LIVE = OrderStatus.live.value
+FILLED = OrderStatus.filled.value
+CANCELLED = OrderStatus.cancelled.value
+REJECTED = OrderStatus.rejected.value
+STATUSES: Dict[int, Optional[OrderStatus]] = {UNKNOWN: None, **{status.value: status for status in OrderStatus}}
+
+
+class StateChunk:
+    """ The states of a contiguous block of order ids, one column per field.
+
+    Columns are array.array, which take Python scalars cheaply, exposed as NumPy
+    arrays sharing the same memory for batch lookups.
+
+    Attributes:
+    -- statuses, filled_quantities, notionals, symbol_ids -> The columns, indexed by order id within the chunk.
+    A notional is the total price * quantity filled, from which the average price is derived.
+    -- seen -> The number of orders of the chunk recorded.
+    -- open -> The number of those which are live, so the chunk cannot yet be evicted.
+    """
+
+    __slots__ = ("statuses", "filled_quantities", "notionals", "symbol_ids", "seen", "open",
+                 "status_view", "filled_quantity_view", "notional_view", "symbol_id_view")
+
+    def __init__(self, size: int):
+        self.statuses = array("b", bytes(size))
+        self.filled_quantities = array("d", bytes(8 * size))
+        self.notionals = array("d", bytes(8 * size))
+        self.symbol_ids = array("i", [-1]) * size
+        self.status_view = np.frombuffer(self.statuses, dtype=np.int8)
+        self.filled_quantity_view = np.frombuffer(self.filled_quantities, dtype=np.float64)
+        self.notional_view = np.frombuffer(self.notionals, dtype=np.float64)
+        self.symbol_id_view = np.frombuffer(self.symbol_ids, dtype=np.int32)
+        self.seen = 0
+        self.open = 0
+
+
+class OrderStateStore(EventSink):
+    """ The status, filled quantity, average price and instrument of every order, by order id.
+
+    Registered as an event sink of a MatchingEngine, the store is kept current by the
+    accepted, fill, cancel and reject events of every instrument, so a gateway can
+    answer status requests without holding orders or scanning complete_orders.
+
+    Order ids are split into chunks of 2 ** chunk_bits consecutive ids. A point lookup
+    is a dict lookup of the chunk and an index into its columns, and a batch lookup
+    gathers each chunk's rows with NumPy. Ids need not be dense: chunks are only
+    created for ids which are seen, so ids handed out by BlockIdGenerator shards
+    cost at most a partly used chunk per block.
+
+    Once every order of a chunk is filled, cancelled or rejected and the chunk lies
+    wholly more than retention ids behind the newest order seen, the chunk is evicted.
+    Lookups of evicted orders report them as unknown.
+
+    Attributes:
+    -- symbols -> Interns the instruments of recorded orders. Sharing the engine's registry
+    makes symbol ids agree with the engine's books.
+    -- chunk_bits -> The base 2 logarithm of the number of ids in each chunk.
+    -- retention -> How many of the most recent order ids to keep after they complete.
+    None keeps every order.
+    -- chunks -> The StateChunk of each chunk number, order_id >> chunk_bits.
+    -- newest -> The highest order id seen, -1 before the first.
+    -- evicted -> The number of order states evicted.
+    """
+
+    def __init__(self,
+                 symbols: Optional[SymbolRegistry] = None,
+                 chunk_bits: int = 12,
+                 retention: Optional[int] = 1 << 20):
+
+        self.symbols = symbols if symbols is not None else SymbolRegistry()
+        self.chunk_bits = chunk_bits
+        self.retention = retention
+        self.chunks: Dict[int, StateChunk] = {}
+        self.newest = -1
+        self.evicted = 0
+        self._mask = (1 << chunk_bits) - 1
+
+    def __len__(self) -> int:
+        return sum(chunk.seen for chunk in self.chunks.values())
+
+    def symbol_id(self, instrument_id: str) -> int:
+        """ The symbol id of an instrument, -1 if it is missing from a frozen registry."""
+
+        symbols = self.symbols
+        symbol_id = symbols.ids.get(instrument_id)
+        if symbol_id is None:
+            if symbols.frozen:
+                return -1
+            symbol_id = symbols.intern(instrument_id)
+        return symbol_id
+
+    def record(self, order: BaseOrder, status: int) -> None:
+        """ Record the first state of a newly seen order."""
+
+        order_id = order.order_id
+        chunk_number = order_id >> self.chunk_bits
+        chunk = self.chunks.get(chunk_number)
+        if chunk is None:
+            chunk = self.chunks[chunk_number] = StateChunk(1 << self.chunk_bits)
+            self.evict()
+        row = order_id & self._mask
+        if chunk.statuses[row] == UNKNOWN:
+            chunk.seen += 1
+            if status == LIVE:
+                chunk.open += 1
+            chunk.symbol_ids[row] = self.symbol_id(order.instrument_id)
+        chunk.statuses[row] = status
+        if order_id > self.newest:
+            self.newest = order_id
+
+    def complete(self, order_id: int, status: int) -> None:
+        """ Move a live order to a terminal status."""
+
+        chunk = self.chunks.get(order_id >> self.chunk_bits)
+        if chunk is None:
+            return None
+        row = order_id & self._mask
+        if chunk.statuses[row] == LIVE:
+            chunk.open -= 1
+        chunk.statuses[row] = status
+
+    def fill(self, order_id: int, price: float, quantity: float) -> None:
+        """ Add a fill to an order's filled quantity and notional."""
+
+        chunk = self.chunks.get(order_id >> self.chunk_bits)
+        if chunk is None:
+            return None
+        row = order_id & self._mask
+        chunk.filled_quantities[row] += quantity
+        chunk.notionals[row] += price * quantity
+
+    def evict(self) -> None:
+        """ Drop the chunks of completed orders more than retention ids behind the newest order.
+        Nothing is dropped when retention is None."""
+
+        if self.retention is None:
+            return None
+        limit = (self.newest - self.retention) >> self.chunk_bits
+        for chunk_number in [c for c, chunk in self.chunks.items() if c < limit and not chunk.open]:
+            self.evicted += self.chunks.pop(chunk_number).seen
+
+    def on_accepted(self, order: BaseOrder) -> None:
+        self.record(order, LIVE)
+
+    def on_rejected(self, order: AnyOrder, reason: str) -> None:
+        if isinstance(order, BaseOrder):
+            self.record(order, REJECTED)
+
+    def on_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        order_id = order.order_id
+        self.fill(order_id, price, quantity)
+        self.complete(order_id, FILLED)
+
+    def on_partially_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        self.fill(order.order_id, price, quantity)
+
+    def on_cancelled(self, order: BaseOrder, cancel_order: AnyCancel) -> None:
+        self.complete(order.order_id, CANCELLED)
+
+    def status(self, order_id: int) -> Optional[OrderStatus]:
+        """ The status of an order, None if it is unknown or evicted."""
+
+        chunk = self.chunks.get(order_id >> self.chunk_bits)
+        if chunk is None:
+            return None
+        return STATUSES[chunk.statuses[order_id & self._mask]]
+
+    def lookup(self, order_ids: Iterable[int]) -> np.ndarray:
+        """ The states of many orders, an array or any iterable of ids, as an ORDER_STATE array in their order.
+
+        Unknown and evicted orders have status 0, no fills and symbol id -1.
+        The ids are grouped by chunk with one sort, so each chunk is gathered from once.
+        """
+        if isinstance(order_ids, np.ndarray):
+            order_ids = order_ids.astype(np.int64, copy=False)
+        else:
+            order_ids = np.fromiter(order_ids, dtype=np.int64)
+        states = np.zeros(len(order_ids), dtype=ORDER_STATE)
+        states["symbol_id"] = -1
+        notionals = np.zeros(len(order_ids))
+        chunk_numbers = order_ids >> self.chunk_bits
+        rows = order_ids & self._mask
+        by_chunk = np.argsort(chunk_numbers)
+        sorted_numbers = chunk_numbers[by_chunk]
+        starts = np.flatnonzero(np.diff(sorted_numbers, prepend=-1))
+        ends = np.append(starts[1:], len(order_ids))
+        for chunk_number, start, end in zip(sorted_numbers[starts].tolist(), starts.tolist(), ends.tolist()):
+            chunk = self.chunks.get(chunk_number)
+            if chunk is None:
+                continue
+            selected = by_chunk[start:end]
+            chunk_rows = rows[selected]
+            states["status"][selected] = chunk.status_view[chunk_rows]
+            states["filled_quantity"][selected] = chunk.filled_quantity_view[chunk_rows]
+            states["symbol_id"][selected] = chunk.symbol_id_view[chunk_rows]
+            notionals[selected] = chunk.notional_view[chunk_rows]
+        filled = states["filled_quantity"]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            states["average_price"] = np.where(filled > 0, notionals / filled, np.nan)
+        return states
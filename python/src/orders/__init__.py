@@ -2,3 +2,9 @@ from .limit_order import LimitOrder
 from .market_order import MarketOrder
 from .base_order import BaseOrder
 from .cancel_order import CancelOrder
+from .mass_cancel_order import MassCancelOrder
+from .quote import Quote
+from .mass_quote import MassQuote
+from .stop_order import StopOrder
+from .stop_limit_order import StopLimitOrder
+from .any_order import AnyOrder, AnyCancel
@@ -0,0 +1,12 @@
+from .base_order import BaseOrder
+from .cancel_order import CancelOrder
+from .mass_cancel_order import MassCancelOrder
+from .quote import Quote
+from typing import Union
+
+# Anything which can be sent to a MatchingEngine or an OrderBook. Cancels are not BaseOrders.
+AnyOrder = Union[BaseOrder, CancelOrder, MassCancelOrder, Quote]
+
+# Anything which can cancel an order, as reported with each cancelled order to event sinks.
+# A Quote cancels its account's resting quote on a side it pulls.
+AnyCancel = Union[CancelOrder, MassCancelOrder, Quote]
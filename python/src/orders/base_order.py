@@ -2,20 +2,23 @@ from python.src.enums import OrderDirection
 from python.src.enums import OrderType
 from python.src.enums import OrderStatus
 from python.src.trades import Trade
+from python.src.ids import IdGenerator
 from abc import ABC
-from typing import List
+from typing import Callable, ClassVar, List, Optional
 
 
 class BaseOrder(ABC):
     """ An abstract class define regular orders.
 
     Class Attributes:
-    -- a counter for the total number of orders recieved. This acts as an order_id in cases
-    when an order_id is not provided (all but cancels).
+    -- id_generator -> called once per order to give its order_id (all but cancels).
+    Ids are unique and increasing. A worker sharding orders across processes
+    replaces it with a BlockIdGenerator on a shared IdSequence.
 
     Instance Attributes
     -- instrument_id -> A unique identifier for the instrument
-    -- order_id -> A unique id defining the order. On cancels this will be referenced.
+    -- order_id -> A unique id assigned by the engine. On cancels this will be referenced.
+    -- client_order_id -> The sender's own reference for the order, never used for routing. None if not given.
     -- order_direction -> whether the order is a Buy or Sell
     -- order_type -> denoting how the order is implemented - limit order, market order etc.
     -- price -> the limit price of the orders. For market orders these may be infinite
@@ -24,35 +27,71 @@ class BaseOrder(ABC):
     -- fill_info -> A dict mapping execution times to Price * Quantity.
         This will be updated over time.
     -- status -> an OrderStatus value to reference whether an order is still live (in the market)
+    -- account_id -> the account which owns the order, used for risk limits. None if untagged.
     """
 
-    counter: int = 1
+    id_generator: ClassVar[Callable[[], int]] = IdGenerator()
 
     def __init__(self,
                  instrument_id: str,
                  order_direction: OrderDirection,
-                 quantity: int,
+                 quantity: float,
                  order_type: OrderType,
-                 price: float
+                 price: float,
+                 account_id: Optional[str] = None,
+                 client_order_id: Optional[str] = None
                  ):
 
+        self.instrument_id = instrument_id
+        self.order_direction = order_direction
+        self.order_type = order_type
+        self.quantity = quantity
+        self.unfilled_quantity: float = quantity
+        self.price: float = price
+        self.account_id = account_id
+        self.client_order_id = client_order_id
+
+        self.order_id: int = BaseOrder.id_generator()
+        self.fill_info: List[Trade] = []
+        self.status = OrderStatus.live
+
+    def reset(self,
+              instrument_id: str,
+              order_direction: OrderDirection,
+              quantity: float,
+              order_type: OrderType,
+              price: float,
+              account_id: Optional[str] = None,
+              client_order_id: Optional[str] = None
+              ) -> None:
+        """ Make a used order new again, as __init__ would, keeping its fill_info list emptied.
+
+        Pools reuse orders through this rather than calling __init__ again on an existing
+        instance, which compiled classes do not support.
+        """
         self.instrument_id = instrument_id
         self.order_direction = order_direction
         self.order_type = order_type
         self.quantity = quantity
         self.unfilled_quantity = quantity
         self.price = price
+        self.account_id = account_id
+        self.client_order_id = client_order_id
 
-        self.counter += 1
-        self.order_id: int = self.counter
-        self.fill_info: List[Trade] = []
+        self.order_id = BaseOrder.id_generator()
+        self.fill_info.clear()
         self.status = OrderStatus.live
 
     def update_on_trade(self, trade: Trade) -> None:
         """ On a trade occuring, update the order."""
 
         self.fill_info.append(trade)
-        self.unfilled_quantity -= trade.quantity
+        self.fill(trade.quantity)
+
+    def fill(self, quantity: float) -> None:
+        """ On a fill reported to a trade sink, update the order without recording a Trade."""
+
+        self.unfilled_quantity -= quantity
 
         if self.unfilled_quantity == 0:
             self.status = OrderStatus.filled
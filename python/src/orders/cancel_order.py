@@ -3,7 +3,7 @@ from python.src.enums import OrderStatus
 from python.src.enums import OrderDirection
 from python.src.exceptions import InvalidOrderDirectionException
 from python.src.orders import BaseOrder
-from typing import Type
+from typing import Optional
 
 
 class CancelOrder():
@@ -11,7 +11,9 @@ class CancelOrder():
 
         Instance Attributes
         -- instrument_id -> A unique identifier for the instrument
-        -- order_id -> A unique id defining the order.
+        -- order_id -> The engine order_id of the order to cancel.
+        -- client_order_id -> The sender's own reference for this cancel. None if not given.
+        -- account_id -> The account sending the cancel, whose message rate it counts against. None if untagged.
         -- order_type -> denoting how the order is implemented - limit order, market order etc.
         -- cancel_success -> a boolean checking whether the relevant order was cancelled
         -- order_direction -> whether the order is a Buy or Sell
@@ -21,16 +23,20 @@ class CancelOrder():
     def __init__(self,
                  instrument_id: str,
                  order_id: int,
-                 order_direction: OrderDirection
+                 order_direction: OrderDirection,
+                 client_order_id: Optional[str] = None,
+                 account_id: Optional[str] = None
                  ):
 
         self.instrument_id = instrument_id
         self.order_id = order_id
         self.order_type: OrderType = OrderType.cancel
         self.order_direction = order_direction
+        self.client_order_id = client_order_id
+        self.account_id = account_id
         self.cancel_success: bool = False
 
-    def cancel_order(self, order: Type[BaseOrder]) -> None:
+    def cancel_order(self, order: BaseOrder) -> None:
         """ Modify in place the Order to be cancelled """
 
         if order.status == OrderStatus.live:
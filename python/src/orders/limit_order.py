@@ -1,6 +1,7 @@
 from python.src.enums import OrderDirection
 from python.src.enums import OrderType
 from .base_order import BaseOrder
+from typing import Optional
 
 
 class LimitOrder(BaseOrder):
@@ -11,12 +12,28 @@ class LimitOrder(BaseOrder):
     def __init__(self,
                  instrument_id: str,
                  order_direction: OrderDirection,
-                 quantity: int,
-                 price: float
+                 quantity: float,
+                 price: float,
+                 account_id: Optional[str] = None,
+                 client_order_id: Optional[str] = None
                  ):
 
         super().__init__(instrument_id=instrument_id,
                          order_direction=order_direction,
                          order_type=OrderType.limit,
                          quantity=quantity,
-                         price=price)
+                         price=price,
+                         account_id=account_id,
+                         client_order_id=client_order_id)
+
+    def reinit(self,
+               instrument_id: str,
+               order_direction: OrderDirection,
+               quantity: float,
+               price: float,
+               account_id: Optional[str] = None,
+               client_order_id: Optional[str] = None
+               ) -> None:
+        """ Re-initialise a used order in place, taking the same arguments as __init__."""
+
+        self.reset(instrument_id, order_direction, quantity, OrderType.limit, price, account_id, client_order_id)
@@ -2,6 +2,7 @@ from .base_order import BaseOrder
 from python.src.enums import OrderDirection
 from python.src.enums import OrderType
 from python.src.exceptions import InvalidOrderDirectionException
+from typing import Optional
 
 
 class MarketOrder(BaseOrder):
@@ -11,13 +12,15 @@ class MarketOrder(BaseOrder):
     def __init__(self,
                  instrument_id: str,
                  order_direction: OrderDirection,
-                 quantity: int
+                 quantity: float,
+                 account_id: Optional[str] = None,
+                 client_order_id: Optional[str] = None
                  ):
 
         if order_direction == OrderDirection.buy:
             price = float("inf")
         elif order_direction == OrderDirection.sell:
-            price = 0
+            price = 0.
         else:
             raise InvalidOrderDirectionException()
 
@@ -25,4 +28,23 @@ class MarketOrder(BaseOrder):
                          order_direction=order_direction,
                          order_type=OrderType.market,
                          quantity=quantity,
-                         price=price)
+                         price=price,
+                         account_id=account_id,
+                         client_order_id=client_order_id)
+
+    def reinit(self,
+               instrument_id: str,
+               order_direction: OrderDirection,
+               quantity: float,
+               account_id: Optional[str] = None,
+               client_order_id: Optional[str] = None
+               ) -> None:
+        """ Re-initialise a used order in place, taking the same arguments as __init__."""
+
+        if order_direction == OrderDirection.buy:
+            price = float("inf")
+        elif order_direction == OrderDirection.sell:
+            price = 0.
+        else:
+            raise InvalidOrderDirectionException()
+        self.reset(instrument_id, order_direction, quantity, OrderType.market, price, account_id, client_order_id)
@@ -0,0 +1,34 @@
+from python.src.enums import OrderType
+from python.src.enums import OrderDirection
+from typing import Optional
+
+
+class MassCancelOrder():
+    """ An order to cancel every live order matching its filters at once.
+
+    Each filter left as None matches everything, so a MassCancelOrder with no filters
+    cancels the whole market. Without an instrument_id it must be sent through
+    MatchingEngine.add_order() or MatchingEngine.mass_cancel(), which apply it to every book.
+
+        Instance Attributes
+        -- instrument_id -> Only cancel orders of this instrument. None for every instrument.
+        -- account_id -> Only cancel orders of this account. None for every account.
+        -- order_direction -> Only cancel orders on this side. None for both sides.
+        -- client_order_id -> The sender's own reference for this cancel. None if not given.
+        -- order_type -> denoting how the order is implemented - limit order, market order etc.
+        -- cancelled -> The number of orders cancelled.
+    """
+
+    def __init__(self,
+                 instrument_id: Optional[str] = None,
+                 account_id: Optional[str] = None,
+                 order_direction: Optional[OrderDirection] = None,
+                 client_order_id: Optional[str] = None
+                 ):
+
+        self.instrument_id = instrument_id
+        self.account_id = account_id
+        self.order_direction = order_direction
+        self.client_order_id = client_order_id
+        self.order_type: OrderType = OrderType.mass_cancel
+        self.cancelled: int = 0
@@ -0,0 +1,29 @@
+from .quote import Quote
+from typing import List, Optional
+
+
+class MassQuote():
+    """ A market maker's quotes in many instruments, submitted together with MatchingEngine.mass_quote().
+
+    Each Quote is queued on its own instrument and applied to its book in a single step,
+    so a requote costs one message per instrument rather than a cancel and a new order per side.
+
+        Instance Attributes
+        -- account_id -> The market maker's account, given to every quote.
+        -- quotes -> The quote in each instrument.
+        -- client_order_id -> The sender's own reference, given to quotes without their own.
+    """
+
+    def __init__(self,
+                 account_id: str,
+                 quotes: List[Quote],
+                 client_order_id: Optional[str] = None
+                 ):
+
+        self.account_id = account_id
+        self.quotes = quotes
+        self.client_order_id = client_order_id
+        for quote in quotes:
+            quote.account_id = account_id
+            if quote.client_order_id is None:
+                quote.client_order_id = client_order_id
@@ -0,0 +1,47 @@
+from python.src.enums import OrderType
+from typing import Optional
+
+
+class Quote():
+    """ A market maker's two-sided quote in one instrument, replacing its previous quote there.
+
+    The book keeps at most one resting order per side for each account's quotes. A side
+    with a positive quantity is quoted at its price: the resting order is amended in place
+    if it keeps its price and does not grow, else it is moved to the new price and quantity,
+    losing its time priority. A side with zero quantity is pulled.
+
+        Instance Attributes
+        -- instrument_id -> A unique identifier for the instrument
+        -- bid_price -> The price to bid at.
+        -- bid_quantity -> How many shares to bid for. 0 pulls the bid.
+        -- ask_price -> The price to offer at.
+        -- ask_quantity -> How many shares to offer. 0 pulls the ask.
+        -- account_id -> The market maker whose quote is replaced. Set by the MassQuote carrying the quote.
+        Quotes without one are rejected.
+        -- client_order_id -> The sender's own reference for the quote. None if not given.
+        -- bid_order_id, ask_order_id -> The order_id to give the order the quote creates on each side,
+        if it creates one. 0 numbers it as any new order. An OrderHistory logging the quote sets them,
+        so a replay of the log creates the same orders.
+        -- order_type -> denoting how the order is implemented - limit order, market order etc.
+    """
+
+    def __init__(self,
+                 instrument_id: str,
+                 bid_price: float = 0.,
+                 bid_quantity: float = 0.,
+                 ask_price: float = 0.,
+                 ask_quantity: float = 0.,
+                 account_id: Optional[str] = None,
+                 client_order_id: Optional[str] = None
+                 ):
+
+        self.instrument_id = instrument_id
+        self.bid_price = bid_price
+        self.bid_quantity = bid_quantity
+        self.ask_price = ask_price
+        self.ask_quantity = ask_quantity
+        self.account_id = account_id
+        self.client_order_id = client_order_id
+        self.bid_order_id: int = 0
+        self.ask_order_id: int = 0
+        self.order_type: OrderType = OrderType.quote
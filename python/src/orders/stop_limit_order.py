@@ -0,0 +1,53 @@
+from .base_order import BaseOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from typing import Optional
+
+
+class StopLimitOrder(BaseOrder):
+    """ A stop-limit order becomes a limit order once the market trades through its stop price.
+
+    Until then it is held in the TriggerBook, outside the visible order book.
+
+    Instance Attributes
+    -- stop_price -> the trade price which releases the order into the book.
+    """
+
+    def __init__(self,
+                 instrument_id: str,
+                 order_direction: OrderDirection,
+                 quantity: float,
+                 stop_price: float,
+                 price: float,
+                 account_id: Optional[str] = None,
+                 client_order_id: Optional[str] = None
+                 ):
+
+        super().__init__(instrument_id=instrument_id,
+                         order_direction=order_direction,
+                         order_type=OrderType.stop_limit,
+                         quantity=quantity,
+                         price=price,
+                         account_id=account_id,
+                         client_order_id=client_order_id)
+        self.stop_price = stop_price
+
+    def reinit(self,
+               instrument_id: str,
+               order_direction: OrderDirection,
+               quantity: float,
+               stop_price: float,
+               price: float,
+               account_id: Optional[str] = None,
+               client_order_id: Optional[str] = None
+               ) -> None:
+        """ Re-initialise a used order in place, taking the same arguments as __init__."""
+
+        self.reset(instrument_id, order_direction, quantity, OrderType.stop_limit, price,
+                   account_id, client_order_id)
+        self.stop_price = stop_price
+
+    def trigger(self) -> None:
+        """ On the stop price being reached, convert to a limit order."""
+
+        self.order_type = OrderType.limit
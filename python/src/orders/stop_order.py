@@ -0,0 +1,66 @@
+from .base_order import BaseOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from python.src.exceptions import InvalidOrderDirectionException
+from typing import Optional
+
+
+class StopOrder(BaseOrder):
+    """ A stop order becomes a market order once the market trades through its stop price.
+
+    Until then it is held in the TriggerBook, outside the visible order book.
+    A buy stop triggers on a trade at or above the stop price,
+    a sell stop on a trade at or below it.
+
+    Instance Attributes
+    -- stop_price -> the trade price which releases the order into the book.
+    """
+
+    def __init__(self,
+                 instrument_id: str,
+                 order_direction: OrderDirection,
+                 quantity: float,
+                 stop_price: float,
+                 account_id: Optional[str] = None,
+                 client_order_id: Optional[str] = None
+                 ):
+
+        if order_direction == OrderDirection.buy:
+            price = float("inf")
+        elif order_direction == OrderDirection.sell:
+            price = 0.
+        else:
+            raise InvalidOrderDirectionException()
+
+        super().__init__(instrument_id=instrument_id,
+                         order_direction=order_direction,
+                         order_type=OrderType.stop,
+                         quantity=quantity,
+                         price=price,
+                         account_id=account_id,
+                         client_order_id=client_order_id)
+        self.stop_price = stop_price
+
+    def reinit(self,
+               instrument_id: str,
+               order_direction: OrderDirection,
+               quantity: float,
+               stop_price: float,
+               account_id: Optional[str] = None,
+               client_order_id: Optional[str] = None
+               ) -> None:
+        """ Re-initialise a used order in place, taking the same arguments as __init__."""
+
+        if order_direction == OrderDirection.buy:
+            price = float("inf")
+        elif order_direction == OrderDirection.sell:
+            price = 0.
+        else:
+            raise InvalidOrderDirectionException()
+        self.reset(instrument_id, order_direction, quantity, OrderType.stop, price, account_id, client_order_id)
+        self.stop_price = stop_price
+
+    def trigger(self) -> None:
+        """ On the stop price being reached, convert to a market order."""
+
+        self.order_type = OrderType.market
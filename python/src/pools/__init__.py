@@ -0,0 +1,3 @@
+from .object_pool import ObjectPool
+from .recycling_deque import RecyclingDeque
+from .order_pool import OrderPool
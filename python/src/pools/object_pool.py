@@ -0,0 +1,75 @@
+from python.src.exceptions import UseAfterReleaseException
+from collections import deque
+from typing import Any, Optional
+
+
+def _use_after_release(obj: Any, name: str, *args: Any) -> None:
+    raise UseAfterReleaseException("{}.{}".format(type(obj).__name__, name))
+
+
+class ObjectPool:
+    """ A free list of released objects of one class, reused in place of new allocations.
+
+    acquire() hands back a released object for the caller to re-initialise, or None
+    when the free list is empty and the caller must allocate. Releasing more than
+    capacity objects leaves the excess to the garbage collector.
+
+    In debug mode a released object's class is swapped for a subclass which raises
+    UseAfterReleaseException on any attribute access, so a reference kept past release
+    fails loudly instead of seeing the object's next use. The class is restored when
+    the object is acquired. Objects are reused oldest first in debug mode, to keep each
+    poisoned for as long as possible, and newest first otherwise, as those are most
+    likely still in cache. Debug mode needs the pure Python build: the classes of
+    compiled objects cannot be swapped.
+
+    Attributes:
+    -- cls -> The class of the pooled objects.
+    -- capacity -> The most released objects kept for reuse.
+    -- debug -> Whether released objects are poisoned.
+    -- free -> The released objects waiting for reuse.
+    -- created -> The number of times acquire() found the free list empty.
+    -- reused -> The number of objects acquire() handed back for reuse.
+    -- released -> The number of objects released into the free list.
+    """
+
+    def __init__(self, cls: type, capacity: int = 1 << 16, debug: bool = False):
+        self.cls = cls
+        self.capacity = capacity
+        self.debug = debug
+        self.free: deque = deque()
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.released_cls = type("Released" + cls.__name__, (cls,),
+                                 {"__slots__": (),
+                                  "__getattribute__": _use_after_release,
+                                  "__setattr__": _use_after_release})
+
+    def __len__(self) -> int:
+        return len(self.free)
+
+    def acquire(self) -> Optional[Any]:
+        """ A released object to re-initialise, None if there is none."""
+
+        free = self.free
+        if not free:
+            self.created += 1
+            return None
+        self.reused += 1
+        if self.debug:
+            obj = free.popleft()
+            object.__setattr__(obj, "__class__", self.cls)
+            return obj
+        return free.pop()
+
+    def release(self, obj: Any) -> None:
+        """ Take back an object which nothing else references any more."""
+
+        if self.debug:
+            if type(obj) is self.released_cls:
+                raise UseAfterReleaseException(self.cls.__name__)
+            object.__setattr__(obj, "__class__", self.released_cls)
+        free = self.free
+        if len(free) < self.capacity:
+            free.append(obj)
+            self.released += 1
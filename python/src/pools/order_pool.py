@@ -0,0 +1,118 @@
+from python.src.pools.object_pool import ObjectPool
+from python.src.orders import BaseOrder
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.orders import StopOrder
+from python.src.orders import StopLimitOrder
+from python.src.enums import OrderDirection
+from python.src.trades import Trade
+from typing import Any, Dict, List, Optional, cast
+
+
+class PooledTrade(Trade):
+    """ A Trade built by an OrderPool, counting how many of its holders have released it."""
+
+    __slots__ = ("holds",)
+
+    def __init__(self, datetime: Any, price: float, quantity: float):
+        super().__init__(datetime, price, quantity)
+        self.holds = 0
+
+
+class OrderPool:
+    """ Recycles the orders and trades of OrderBooks, opt-in, to cut allocation churn.
+
+    Orders and trades are built through the pool's factory methods, which take the
+    same arguments as the constructors and re-initialise a released object when one
+    is free, through the order's reinit() as compiled classes cannot run __init__ again.
+    A recycled order keeps its fill_info list, cleared, and is given a new order_id.
+
+    The release protocol:
+    -- An order is released when it leaves its book's complete_orders under max_history.
+    -- A trade is held by the book's trades and by the fill_info of its bid and its ask.
+    It is released once all three have let it go, as its orders are released and it
+    leaves trades.
+    -- Once released, an object belongs to the pool. Anything else holding it, including
+    the MatchingEngine's processed_orders, which is therefore not kept when pooling,
+    must drop it first. Debug mode raises UseAfterReleaseException on any later use.
+
+    Attributes:
+    -- order_pools -> The ObjectPool of each order class, and of each class's released stand-in.
+    -- trade_pool -> The ObjectPool of trades.
+    """
+
+    def __init__(self, capacity: int = 1 << 16, debug: bool = False):
+        self.order_pools: Dict[type, ObjectPool] = {}
+        for cls in (LimitOrder, MarketOrder, StopOrder, StopLimitOrder):
+            pool = ObjectPool(cls, capacity, debug)
+            self.order_pools[cls] = pool
+            self.order_pools[pool.released_cls] = pool
+        self.trade_pool = ObjectPool(PooledTrade, capacity, debug)
+
+    def recycle(self, cls: type) -> Optional[Any]:
+        """ A released order of class cls to re-initialise, None if there is none."""
+
+        return self.order_pools[cls].acquire()
+
+    def limit_order(self, instrument_id: str, order_direction: OrderDirection, quantity: float, price: float,
+                    account_id: Optional[str] = None, client_order_id: Optional[str] = None) -> LimitOrder:
+        order = self.recycle(LimitOrder)
+        if order is None:
+            return LimitOrder(instrument_id, order_direction, quantity, price, account_id, client_order_id)
+        order.reinit(instrument_id, order_direction, quantity, price, account_id, client_order_id)
+        return order
+
+    def market_order(self, instrument_id: str, order_direction: OrderDirection, quantity: float,
+                     account_id: Optional[str] = None, client_order_id: Optional[str] = None) -> MarketOrder:
+        order = self.recycle(MarketOrder)
+        if order is None:
+            return MarketOrder(instrument_id, order_direction, quantity, account_id, client_order_id)
+        order.reinit(instrument_id, order_direction, quantity, account_id, client_order_id)
+        return order
+
+    def stop_order(self, instrument_id: str, order_direction: OrderDirection, quantity: float, stop_price: float,
+                   account_id: Optional[str] = None, client_order_id: Optional[str] = None) -> StopOrder:
+        order = self.recycle(StopOrder)
+        if order is None:
+            return StopOrder(instrument_id, order_direction, quantity, stop_price, account_id, client_order_id)
+        order.reinit(instrument_id, order_direction, quantity, stop_price, account_id, client_order_id)
+        return order
+
+    def stop_limit_order(self, instrument_id: str, order_direction: OrderDirection, quantity: float,
+                         stop_price: float, price: float, account_id: Optional[str] = None,
+                         client_order_id: Optional[str] = None) -> StopLimitOrder:
+        order = self.recycle(StopLimitOrder)
+        if order is None:
+            return StopLimitOrder(instrument_id, order_direction, quantity, stop_price, price,
+                                  account_id, client_order_id)
+        order.reinit(instrument_id, order_direction, quantity, stop_price, price, account_id, client_order_id)
+        return order
+
+    def trade(self, datetime: Any, price: float, quantity: float) -> PooledTrade:
+        trade = self.trade_pool.acquire()
+        if trade is None:
+            return PooledTrade(datetime, price, quantity)
+        trade.datetime = datetime
+        trade.price = price
+        trade.quantity = quantity
+        trade.holds = 0
+        return trade
+
+    def release_order(self, order: BaseOrder) -> None:
+        """ Take back an order which has left its book, and let go of its trades."""
+
+        # Orders of a pooling book only ever trade through trades built by the pool.
+        for trade in cast(List[PooledTrade], order.fill_info):
+            if trade.holds == 2:
+                self.trade_pool.release(trade)
+            else:
+                trade.holds += 1
+        self.order_pools[type(order)].release(order)
+
+    def release_trade(self, trade: PooledTrade) -> None:
+        """ Record one holder letting go of a trade, and take it back once all three have."""
+
+        if trade.holds == 2:
+            self.trade_pool.release(trade)
+        else:
+            trade.holds += 1
@@ -0,0 +1,23 @@
+from collections import deque
+from typing import Any, Callable, Iterable, Optional
+
+
+class RecyclingDeque(deque):
+    """ A bounded deque which hands each entry it evicts to a release callback.
+
+    Used for an OrderBook's complete_orders and trades when pooling, so objects are
+    released exactly when they leave the book's retention window. With maxlen 0 an
+    entry is released as soon as it is appended.
+    """
+
+    def __init__(self, release: Callable[[Any], None], iterable: Iterable = (), maxlen: Optional[int] = None):
+        super().__init__(iterable, maxlen)
+        self.release = release
+
+    def append(self, item: Any) -> None:
+        if len(self) == self.maxlen:
+            if not self.maxlen:
+                self.release(item)
+                return None
+            self.release(self[0])
+        super().append(item)
@@ -0,0 +1,3 @@
+from .simulated_clock import SimulatedClock
+from .order_files import read_csv, write_csv, read_binary, write_binary
+from .replay_driver import ReplayDriver
@@ -0,0 +1,104 @@
+from python.src.codec import ORDER, encode_frame, decode_order_records, complete_frames_length
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from python.src.enums import MessageType
+from itertools import islice
+from typing import Iterator
+import numpy as np
+
+# Order files hold one order per row or record, in the order they were sent,
+# with the time each was sent in nanoseconds since the epoch.
+#
+# CSV files have a header line and the columns below. Order types and directions
+# are written by name, and unused numeric fields as 0.
+CSV_COLUMNS = ("timestamp", "order_type", "order_direction", "instrument_id", "order_id",
+               "quantity", "price", "stop_price", "account_id", "client_order_id")
+CSV_ROW = np.dtype([("timestamp", np.int64),
+                    ("order_type", "U10"),
+                    ("order_direction", "U4"),
+                    ("instrument_id", "U14"),
+                    ("order_id", np.int64),
+                    ("quantity", np.float64),
+                    ("price", np.float64),
+                    ("stop_price", np.float64),
+                    ("account_id", "U16"),
+                    ("client_order_id", "U16")])
+
+# Binary files are a sequence of codec frames of ORDER, with the time in sent_ns.
+
+
+def encode_names(names: np.ndarray, members) -> np.ndarray:
+    """ Map an array of enum member names to their values, all at once."""
+
+    member_names = np.array(sorted(member.name for member in members))
+    member_values = np.array([members[name].value for name in member_names])
+    index = np.searchsorted(member_names, names).clip(0, len(member_names) - 1)
+    unknown = member_names[index] != names
+    if unknown.any():
+        raise ValueError("Unknown {}: {}".format(members.__name__, names[unknown][0]))
+    return member_values[index]
+
+
+def read_csv(path: str, chunk_size: int = 1 << 16) -> Iterator[np.ndarray]:
+    """ Read a CSV order file as arrays of ORDER of at most chunk_size orders.
+
+    Only one chunk of lines is held at a time, and each is parsed by np.loadtxt in one call.
+    """
+    with open(path) as f:
+        next(f)
+        while True:
+            lines = list(islice(f, chunk_size))
+            if not lines:
+                break
+            rows = np.loadtxt(lines, delimiter=",", dtype=CSV_ROW, ndmin=1)
+            records = np.zeros(len(rows), dtype=ORDER)
+            records["order_type"] = encode_names(rows["order_type"], OrderType)
+            records["order_direction"] = encode_names(rows["order_direction"], OrderDirection)
+            for name in ("instrument_id", "account_id", "client_order_id"):
+                records[name] = np.char.encode(rows[name], "ascii")
+            for name in ("order_id", "quantity", "price", "stop_price"):
+                records[name] = rows[name]
+            records["sent_ns"] = rows["timestamp"]
+            yield records
+
+
+def write_csv(path: str, records: np.ndarray) -> None:
+    """ Write an array of ORDER as a CSV order file."""
+
+    order_types = {order_type.value: order_type.name for order_type in OrderType}
+    directions = {direction.value: direction.name for direction in OrderDirection}
+    with open(path, "w") as f:
+        f.write(",".join(CSV_COLUMNS) + "\n")
+        for (order_type, order_direction, instrument_id, order_id, quantity, price, stop_price,
+             sent_ns, account_id, client_order_id) in records.tolist():
+            f.write("{},{},{},{},{},{!r},{!r},{!r},{},{}\n".format(
+                sent_ns, order_types[order_type], directions[order_direction], instrument_id.decode(),
+                order_id, quantity, price, stop_price, account_id.decode(), client_order_id.decode()))
+
+
+def read_binary(path: str, chunk_bytes: int = 1 << 22) -> Iterator[np.ndarray]:
+    """ Read a binary order file as arrays of ORDER, reading chunk_bytes at a time.
+
+    A frame cut off by the end of a chunk is completed from the next.
+    """
+    with open(path, "rb") as f:
+        pending = b""
+        while True:
+            data = f.read(chunk_bytes)
+            if not data:
+                break
+            buffer = pending + data if pending else data
+            length = complete_frames_length(buffer)
+            if length:
+                yield decode_order_records(memoryview(buffer)[:length])
+            pending = buffer[length:]
+        if pending:
+            raise ValueError("Order file ends part way through a frame")
+
+
+def write_binary(path: str, records: np.ndarray, frame_size: int = 1 << 12) -> None:
+    """ Write an array of ORDER as a binary order file, in frames of at most frame_size orders."""
+
+    with open(path, "wb") as f:
+        for start in range(0, len(records), frame_size):
+            f.write(encode_frame(MessageType.order, records[start:start + frame_size]))
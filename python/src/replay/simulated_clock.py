@@ -0,0 +1,15 @@
+class SimulatedClock:
+    """ A clock which reads whatever time it was last set to.
+
+    Passed to a MatchingEngine as its clock, so a replay stamps trades with
+    the historical time of the order being processed.
+
+    Attributes:
+    -- now -> The current time, in nanoseconds since the epoch.
+    """
+
+    def __init__(self, now: int = 0):
+        self.now = now
+
+    def __call__(self) -> int:
+        return self.now
@@ -0,0 +1,2 @@
+from .risk_limits import RiskLimits
+from .risk_check import RiskCheck
@@ -0,0 +1,264 @@
+from .risk_limits import RiskLimits
+from python.src.events import EventSink
+from python.src.orders import BaseOrder
+from python.src.orders import AnyCancel
+from python.src.orders import AnyOrder
+from python.src.orders import Quote
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from typing import Dict, Optional, cast
+import time
+
+INF = float("inf")
+BUY = OrderDirection.buy
+CANCEL = OrderType.cancel
+MASS_CANCEL = OrderType.mass_cancel
+QUOTE = OrderType.quote
+MARKET = OrderType.market
+STOP = OrderType.stop
+ORDER_QUANTITY = "Order quantity limit breached"
+NOTIONAL = "Notional limit breached"
+POSITION = "Position limit breached"
+PRICE_BAND = "Price outside band around last trade"
+MESSAGE_RATE = "Message rate limit breached"
+
+
+class Exposure:
+    """ The running exposure of an account in one instrument.
+
+    Attributes:
+    -- position -> filled buys less filled sells.
+    -- open_buys -> the unfilled quantity of the account's live buy orders.
+    -- open_sells -> the unfilled quantity of the account's live sell orders.
+    """
+
+    __slots__ = ("position", "open_buys", "open_sells")
+
+    def __init__(self):
+        self.position = 0.
+        self.open_buys = 0.
+        self.open_sells = 0.
+
+
+class Throttle:
+    """ A token bucket limiting an account's message rate.
+
+    Attributes:
+    -- tokens -> the number of orders which may be sent now.
+    -- updated -> when tokens was last refilled, in seconds.
+    """
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+
+class RiskCheck(EventSink):
+    """ Pre-trade risk checks applied by the MatchingEngine before an order reaches its book.
+
+    Every check is a handful of dict lookups and comparisons against counters
+    which are kept current incrementally: exposures change on the accepted, cancel
+    and replace events this class receives as an event sink, and on the trades
+    passed to on_trade(), and throttles refill as orders arrive. Nothing is
+    recomputed from the book and a check allocates nothing once an account has been seen.
+
+    Fills are taken from trades rather than fill events, one call per trade rather than
+    two events, so registering a RiskCheck does not turn on fill reporting in the books.
+    The MatchingEngine makes on_trade() the fill hook of every book, which leaves the
+    books recording trades as they would without it.
+
+    Cancels and mass cancels only count towards the message rate, as they can only
+    reduce risk otherwise. Quotes are checked by check_quote().
+
+    Attributes:
+    -- default_limits -> the limits of accounts with no limits of their own.
+    -- account_limits -> limits by account, for every instrument.
+    -- instrument_limits -> limits by account then instrument, overriding account_limits.
+    -- exposures -> the Exposure of each account in each instrument, by account then instrument.
+    -- throttles -> the Throttle of each account.
+    -- clock -> returns the current time in seconds, for throttling.
+    """
+
+    wants_fills = False
+
+    def __init__(self,
+                 default_limits: Optional[RiskLimits] = None,
+                 clock=time.monotonic):
+
+        self.default_limits = default_limits or RiskLimits()
+        self.account_limits: Dict[Optional[str], RiskLimits] = {}
+        self.instrument_limits: Dict[Optional[str], Dict[str, RiskLimits]] = {}
+        self.exposures: Dict[Optional[str], Dict[str, Exposure]] = {}
+        self.throttles: Dict[Optional[str], Throttle] = {}
+        self.clock = clock
+
+    def set_limits(self, limits: RiskLimits, account_id: Optional[str],
+                   instrument_id: Optional[str] = None) -> None:
+        """ Set the limits of an account, in one instrument or in all of them if instrument_id is None."""
+
+        if instrument_id is None:
+            self.account_limits[account_id] = limits
+        else:
+            self.instrument_limits.setdefault(account_id, {})[instrument_id] = limits
+
+    def limits_for(self, account_id: Optional[str], instrument_id: str) -> RiskLimits:
+        instrument_limits = self.instrument_limits.get(account_id)
+        if instrument_limits is not None:
+            limits = instrument_limits.get(instrument_id)
+            if limits is not None:
+                return limits
+        return self.account_limits.get(account_id, self.default_limits)
+
+    def exposure(self, account_id: Optional[str], instrument_id: str) -> Exposure:
+        exposures = self.exposures.get(account_id)
+        if exposures is None:
+            exposures = self.exposures[account_id] = {}
+        exposure = exposures.get(instrument_id)
+        if exposure is None:
+            exposure = exposures[instrument_id] = Exposure()
+        return exposure
+
+    def check(self, order: AnyOrder, last_price: Optional[float]) -> Optional[str]:
+        """ Check an order against its account's limits.
+
+        Enum members are bound to module constants, as attribute access on Enum
+        classes dominates the cost of so few comparisons.
+
+        Returns None if the order may proceed, else the reason it breaches a limit.
+        """
+        order_type = order.order_type
+        if order_type is CANCEL or order_type is MASS_CANCEL:
+            return self.check_cancel(cast(AnyCancel, order))
+        if order_type is QUOTE:
+            return self.check_quote(cast(Quote, order), last_price)
+        order = cast(BaseOrder, order)
+
+        account_id = order.account_id
+        instrument_id = order.instrument_id
+        limits = self.limits_for(account_id, instrument_id)
+        if self.throttled(account_id, limits):
+            return MESSAGE_RATE
+
+        quantity = order.quantity
+        if quantity > limits.max_order_quantity:
+            return ORDER_QUANTITY
+
+        price = order.price
+        is_market = order_type is MARKET or order_type is STOP
+        if last_price is not None:
+            if is_market:
+                price = last_price
+            elif abs(price - last_price) > limits.price_band * last_price:
+                return PRICE_BAND
+        if not is_market or last_price is not None:
+            if quantity * price > limits.max_notional:
+                return NOTIONAL
+
+        max_position = limits.max_position
+        if max_position != INF:
+            exposures = self.exposures.get(account_id)
+            exposure = exposures.get(instrument_id) if exposures is not None else None
+            if exposure is not None:
+                if order.order_direction is BUY:
+                    if exposure.position + exposure.open_buys + quantity > max_position:
+                        return POSITION
+                elif exposure.position - exposure.open_sells - quantity < -max_position:
+                    return POSITION
+            elif quantity > max_position:
+                return POSITION
+        return None
+
+    def check_quote(self, quote: Quote, last_price: Optional[float]) -> Optional[str]:
+        """ Check each side of a quote against its account's limits, as one message.
+
+        The order quantity, price band and notional limits apply to each side.
+        Position limits are not checked, as a quote replaces the account's resting
+        quote rather than adding to it.
+        """
+        limits = self.limits_for(quote.account_id, quote.instrument_id)
+        if self.throttled(quote.account_id, limits):
+            return MESSAGE_RATE
+
+        for price, quantity in ((quote.bid_price, quote.bid_quantity), (quote.ask_price, quote.ask_quantity)):
+            if quantity <= 0:
+                continue
+            if quantity > limits.max_order_quantity:
+                return ORDER_QUANTITY
+            if last_price is not None and abs(price - last_price) > limits.price_band * last_price:
+                return PRICE_BAND
+            if quantity * price > limits.max_notional:
+                return NOTIONAL
+        return None
+
+    def check_cancel(self, cancel_order: AnyCancel) -> Optional[str]:
+        """ Count a cancel or mass cancel against its account's message rate.
+
+        Cancels without an account_id share the throttle of untagged orders.
+        A mass cancel of every instrument is checked against the account's own limits.
+        """
+        account_id = cancel_order.account_id
+        instrument_id = cancel_order.instrument_id
+        limits = self.limits_for(account_id, instrument_id) if instrument_id is not None \
+            else self.account_limits.get(account_id, self.default_limits)
+        if self.throttled(account_id, limits):
+            return MESSAGE_RATE
+        return None
+
+    def throttled(self, account_id: Optional[str], limits: RiskLimits) -> bool:
+        """ Take a message from the account's token bucket. Returns True if the bucket is empty."""
+
+        max_message_rate = limits.max_message_rate
+        if max_message_rate == INF:
+            return False
+        now = self.clock()
+        throttle = self.throttles.get(account_id)
+        if throttle is None:
+            throttle = self.throttles[account_id] = Throttle(limits.max_message_burst, now)
+        else:
+            throttle.tokens = min(limits.max_message_burst,
+                                  throttle.tokens + (now - throttle.updated) * max_message_rate)
+            throttle.updated = now
+        if throttle.tokens < 1:
+            return True
+        throttle.tokens -= 1
+        return False
+
+    def on_trade(self, price: float, quantity: float, bid: BaseOrder, ask: BaseOrder) -> None:
+        """ Update the exposures of both sides of a trade."""
+
+        self.on_filled(bid, price, quantity)
+        self.on_filled(ask, price, quantity)
+
+    def on_accepted(self, order: BaseOrder) -> None:
+        exposure = self.exposure(order.account_id, order.instrument_id)
+        if order.order_direction is BUY:
+            exposure.open_buys += order.unfilled_quantity
+        else:
+            exposure.open_sells += order.unfilled_quantity
+
+    def on_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        exposure = self.exposure(order.account_id, order.instrument_id)
+        if order.order_direction is BUY:
+            exposure.open_buys -= quantity
+            exposure.position += quantity
+        else:
+            exposure.open_sells -= quantity
+            exposure.position -= quantity
+
+    on_partially_filled = on_filled
+
+    def on_cancelled(self, order: BaseOrder, cancel_order: AnyCancel) -> None:
+        exposure = self.exposure(order.account_id, order.instrument_id)
+        if order.order_direction is BUY:
+            exposure.open_buys -= order.unfilled_quantity
+        else:
+            exposure.open_sells -= order.unfilled_quantity
+
+    def on_replaced(self, order: BaseOrder, previous_price: float, previous_quantity: float) -> None:
+        exposure = self.exposure(order.account_id, order.instrument_id)
+        if order.order_direction is BUY:
+            exposure.open_buys += order.unfilled_quantity - previous_quantity
+        else:
+            exposure.open_sells += order.unfilled_quantity - previous_quantity
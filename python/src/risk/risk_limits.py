@@ -0,0 +1,32 @@
+class RiskLimits:
+    """ Pre-trade limits for an account's orders in an instrument.
+
+    Every limit defaults to inf, meaning it is never breached, so checks
+    need no branches for limits which are not set.
+
+    Attributes:
+    -- max_order_quantity -> the largest quantity of a single order.
+    -- max_notional -> the largest quantity * price of a single order.
+    Market orders are valued at the last trade price.
+    -- max_position -> the largest absolute position the account may reach if every
+    one of its open orders in the instrument filled.
+    -- price_band -> the furthest a limit price may be from the last trade price,
+    as a fraction of the last trade price.
+    -- max_message_rate -> the sustained number of orders per second from the account.
+    -- max_message_burst -> the number of orders the account may send at once.
+    """
+
+    def __init__(self,
+                 max_order_quantity: float = float("inf"),
+                 max_notional: float = float("inf"),
+                 max_position: float = float("inf"),
+                 price_band: float = float("inf"),
+                 max_message_rate: float = float("inf"),
+                 max_message_burst: float = float("inf")):
+
+        self.max_order_quantity = max_order_quantity
+        self.max_notional = max_notional
+        self.max_position = max_position
+        self.price_band = price_band
+        self.max_message_rate = max_message_rate
+        self.max_message_burst = max_message_burst
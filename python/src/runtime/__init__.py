@@ -0,0 +1,2 @@
+from .gc_pauses import GcPauses
+from .low_latency_mode import LowLatencyMode
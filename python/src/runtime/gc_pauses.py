@@ -0,0 +1,53 @@
+from collections import deque
+from typing import Any, Dict
+import numpy as np
+import time
+import gc
+
+
+class GcPauses:
+    """ Records the duration of every garbage collection while installed.
+
+    Hooks gc.callbacks, which the interpreter calls at the start and end of each
+    collection, automatic or explicit, so every pause is seen whatever triggered it.
+
+    Attributes:
+    -- collections -> The number of collections of each generation.
+    -- total -> The total pause of each generation, in nanoseconds.
+    -- longest -> The longest pause of each generation, in nanoseconds.
+    -- recent -> The most recent pauses of any generation, in nanoseconds.
+    """
+
+    def __init__(self, history: int = 1 << 16):
+        self.collections = [0, 0, 0]
+        self.total = [0, 0, 0]
+        self.longest = [0, 0, 0]
+        self.recent: deque = deque(maxlen=history)
+        self._start = 0
+
+    def __call__(self, phase: str, info: Dict[str, Any]) -> None:
+        if phase == "start":
+            self._start = time.perf_counter_ns()
+            return None
+        pause = time.perf_counter_ns() - self._start
+        generation = info["generation"]
+        self.collections[generation] += 1
+        self.total[generation] += pause
+        if pause > self.longest[generation]:
+            self.longest[generation] = pause
+        self.recent.append(pause)
+
+    def install(self) -> None:
+        if self not in gc.callbacks:
+            gc.callbacks.append(self)
+
+    def uninstall(self) -> None:
+        if self in gc.callbacks:
+            gc.callbacks.remove(self)
+
+    def percentile(self, q: float) -> float:
+        """ The q-th percentile of the recent pauses, in nanoseconds. 0 if there were none."""
+
+        if not self.recent:
+            return 0.
+        return float(np.percentile(np.fromiter(self.recent, dtype=np.int64, count=len(self.recent)), q))
@@ -0,0 +1,122 @@
+from python.src.runtime.gc_pauses import GcPauses
+from python.src.order_flow import OrderFlowGenerator, to_orders
+from typing import Any, Callable, Optional
+import time
+import gc
+
+
+class LowLatencyMode:
+    """ Keeps garbage collection out of the matching path of MatchingEngine.process().
+
+    Collections pause the whole interpreter while they traverse every tracked object
+    of a generation, and the resting orders of a deep book make those traversals long.
+    On start():
+    -- The code paths are warmed up by matching synthetic orders in a scratch engine
+    configured like the real one, so the first real orders run specialised bytecode
+    and find every lazily built structure in place.
+    -- Everything alive, including preloaded books and reference data, is collected
+    once and frozen with gc.freeze(), so later collections never traverse it.
+    -- Automatic collection is disabled.
+    While trading, tick() is called after every pass of the processing loop. When the
+    engine is idle and the youngest generation has pending objects, it collects in
+    the gap: the young generations every idle_interval, everything every full_interval.
+    If the load never lets up, max_pending bounds the garbage which can build up, by
+    collecting the young generation even while busy.
+    stop() re-enables automatic collection and unfreezes.
+
+    Attributes:
+    -- warm_up_orders -> The number of synthetic orders used to warm up. 0 to skip warm-up.
+    -- idle_interval -> How long to wait between idle collections of the young generations, in seconds.
+    -- full_interval -> How long to wait between idle collections of every generation, in seconds.
+    -- max_pending -> The most objects allocated since the last collection before one is forced.
+    -- gc_pauses -> The pause of every collection while the mode is active.
+    -- clock -> The time source, in seconds.
+    -- active -> Whether the mode has been started and not stopped.
+    """
+
+    def __init__(self,
+                 warm_up_orders: int = 20_000,
+                 idle_interval: float = 1e-3,
+                 full_interval: float = 60.,
+                 max_pending: int = 1_000_000,
+                 clock: Callable[[], float] = time.monotonic):
+
+        self.warm_up_orders = warm_up_orders
+        self.idle_interval = idle_interval
+        self.full_interval = full_interval
+        self.max_pending = max_pending
+        self.gc_pauses = GcPauses()
+        self.clock = clock
+        self.active = False
+        self._last_collection = 0.
+        self._last_full_collection = 0.
+        self._was_enabled = True
+
+    def warm_up(self, matching_engine: Any) -> None:
+        """ Match synthetic orders through a scratch engine configured like matching_engine.
+
+        The scratch engine has no sinks, no risk check and keeps no history, so nothing
+        of the warm-up is visible to the real engine or its consumers.
+        """
+        if not self.warm_up_orders:
+            return None
+        algorithms = {matching_engine.matching_algorithm}
+        algorithms.update(matching_engine.matching_algorithms.values())
+        # Orders off the engine's tick would be rejected without reaching the matching code.
+        tick_size = matching_engine.tick_size
+        if tick_size is None:
+            generator = OrderFlowGenerator(instrument_ids=["WARMUP"], seed=0)
+        else:
+            generator = OrderFlowGenerator(instrument_ids=["WARMUP"], tick_size=tick_size, seed=0)
+        for matching_algorithm in algorithms:
+            scratch = type(matching_engine)(matching_algorithm=matching_algorithm,
+                                            execution_price_rule=matching_engine.execution_price_rule,
+                                            tick_size=matching_engine.tick_size,
+                                            max_history=0)
+            for order in to_orders(generator.generate(self.warm_up_orders)):
+                scratch.add_order(order)
+            scratch.match()
+
+    def start(self, matching_engine: Optional[Any] = None) -> None:
+        """ Warm up, freeze everything alive and disable automatic collection."""
+
+        if matching_engine is not None:
+            self.warm_up(matching_engine)
+        self._was_enabled = gc.isenabled()
+        gc.disable()
+        gc.collect()
+        gc.freeze()
+        self.gc_pauses.install()
+        now = self.clock()
+        self._last_collection = now
+        self._last_full_collection = now
+        self.active = True
+
+    def tick(self, busy: bool) -> None:
+        """ Collect if the engine is idle and a collection is due, or if too much garbage is pending."""
+
+        pending = gc.get_count()[0]
+        if not pending:
+            return None
+        if busy:
+            if pending > self.max_pending:
+                gc.collect(0)
+            return None
+
+        now = self.clock()
+        if now - self._last_full_collection >= self.full_interval:
+            gc.collect()
+            self._last_full_collection = now
+            self._last_collection = now
+        elif now - self._last_collection >= self.idle_interval:
+            gc.collect(1)
+            self._last_collection = now
+
+    def stop(self) -> None:
+        """ Return the garbage collector to normal operation."""
+
+        gc.unfreeze()
+        if self._was_enabled:
+            gc.enable()
+        self.gc_pauses.uninstall()
+        self.active = False
@@ -0,0 +1,2 @@
+from .execution_reports import Connection, ExecutionReports
+from .order_entry_server import OrderEntryServer
@@ -0,0 +1,137 @@
+from python.src.codec import EXECUTION_REPORT
+from python.src.codec import encode_frame
+from python.src.events import EventSink
+from python.src.events import NO_ORDER
+from python.src.orders import BaseOrder
+from python.src.orders import CancelOrder
+from python.src.orders import AnyCancel
+from python.src.orders import AnyOrder
+from python.src.enums import EventType
+from python.src.enums import MessageType
+from asyncio import StreamWriter
+from typing import Dict, List, Optional, Set
+import numpy as np
+
+NAN = float("nan")
+
+
+class Connection:
+    """ A client connection to the order-entry server.
+
+    Reports are buffered as rows and written in a single frame on flush(),
+    so a batch of events costs one write rather than one per event.
+
+    Attributes:
+    -- writer -> The stream the connection's reports are written to.
+    -- reports -> The rows of EXECUTION_REPORT waiting to be written.
+    -- received -> The number of orders received on the connection.
+    -- sent -> The number of reports written to the connection.
+    -- accounts -> The account ids of the orders received on the connection.
+    -- order_ids -> The live orders accepted from the connection.
+    """
+
+    def __init__(self, writer: StreamWriter):
+        self.writer = writer
+        self.reports: List[tuple] = []
+        self.received = 0
+        self.sent = 0
+        self.accounts: Set[str] = set()
+        self.order_ids: Set[int] = set()
+
+    def flush(self) -> None:
+        """ Write the buffered reports as one frame."""
+
+        reports = self.reports
+        if reports and not self.writer.is_closing():
+            records = np.array(reports, dtype=EXECUTION_REPORT)
+            self.writer.write(encode_frame(MessageType.execution_report, records))
+            self.sent += len(reports)
+        self.reports = []
+
+
+class ExecutionReports(EventSink):
+    """ Routes order events back to the connection which sent the order.
+
+    Orders are attributed to the connection being read when they are accepted,
+    and looked up by order_id for later fills and cancels. Rejections concern
+    orders from the connection being read, which never reach the book.
+
+    Attributes:
+    -- current -> The connection whose orders are being processed.
+    -- owners -> The connection of each live order, by order_id. Orders of closed connections are dropped.
+    -- pending -> Connections with reports waiting to be written.
+    """
+
+    def __init__(self):
+        self.current: Optional[Connection] = None
+        self.owners: Dict[int, Connection] = {}
+        self.pending: Dict[int, Connection] = {}
+
+    def report(self, connection: Optional[Connection], event_type: EventType, order_id: int,
+               client_order_id: Optional[str], instrument_id: str, price: float, quantity: float) -> None:
+        if connection is None:
+            return None
+        connection.reports.append((event_type, order_id, (client_order_id or "").encode(),
+                                   instrument_id.encode(), price, quantity))
+        self.pending[id(connection)] = connection
+
+    def release(self, order_id: int, default: Optional[Connection] = None) -> Optional[Connection]:
+        """ Forget the connection of an order which is no longer live, returning it."""
+
+        connection = self.owners.pop(order_id, None)
+        if connection is None:
+            return default
+        connection.order_ids.discard(order_id)
+        return connection
+
+    def on_accepted(self, order: BaseOrder) -> None:
+        current = self.current
+        if current is not None:
+            self.owners[order.order_id] = current
+            current.order_ids.add(order.order_id)
+        self.report(current, EventType.accepted, order.order_id, order.client_order_id,
+                    order.instrument_id, NAN, order.unfilled_quantity)
+
+    def on_rejected(self, order: AnyOrder, reason: str) -> None:
+        if not isinstance(order, BaseOrder):
+            self.report(self.current, EventType.rejected, NO_ORDER, order.client_order_id,
+                        order.instrument_id or "", NAN, 0.)
+            return None
+        self.report(self.current, EventType.rejected, order.order_id, order.client_order_id,
+                    order.instrument_id, NAN, order.unfilled_quantity)
+
+    def on_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        self.report(self.release(order.order_id), EventType.filled, order.order_id,
+                    order.client_order_id, order.instrument_id, price, quantity)
+
+    def on_partially_filled(self, order: BaseOrder, price: float, quantity: float) -> None:
+        self.report(self.owners.get(order.order_id), EventType.partially_filled, order.order_id,
+                    order.client_order_id, order.instrument_id, price, quantity)
+
+    def on_cancelled(self, order: BaseOrder, cancel_order: AnyCancel) -> None:
+        self.report(self.release(order.order_id, self.current), EventType.cancelled, order.order_id,
+                    cancel_order.client_order_id, order.instrument_id, NAN, order.unfilled_quantity)
+
+    def on_replaced(self, order: BaseOrder, previous_price: float, previous_quantity: float) -> None:
+        self.report(self.owners.get(order.order_id), EventType.replaced, order.order_id,
+                    order.client_order_id, order.instrument_id, order.price, order.unfilled_quantity)
+
+    def on_cancel_rejected(self, cancel_order: CancelOrder) -> None:
+        self.report(self.current, EventType.cancel_rejected, cancel_order.order_id,
+                    cancel_order.client_order_id, cancel_order.instrument_id, NAN, 0.)
+
+    def flush(self) -> None:
+        """ Write each connection's buffered reports as one frame."""
+
+        for connection in self.pending.values():
+            connection.flush()
+        self.pending.clear()
+
+    def disconnect(self, connection: Connection) -> None:
+        """ Stop reporting to a closed connection. Its resting orders stay in the book."""
+
+        self.pending.pop(id(connection), None)
+        owners = self.owners
+        for order_id in connection.order_ids:
+            owners.pop(order_id, None)
+        connection.order_ids.clear()
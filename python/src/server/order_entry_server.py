@@ -0,0 +1,122 @@
+from python.src.server.execution_reports import Connection, ExecutionReports
+from python.src.codec import decode_orders, complete_frames_length
+from python.src.matching_engine import MatchingEngine
+from python.src.orders import BaseOrder
+from python.src.orders import MassCancelOrder
+from asyncio import StreamReader, StreamWriter
+from typing import Optional
+import asyncio
+import logging
+
+
+class OrderEntryServer:
+    """ Accepts orders in the binary protocol over TCP and reports back on the same connections.
+
+    Each read takes whatever the socket has buffered, up to read_size bytes, and
+    every complete frame in it is decoded in one batch, queued on the engine and
+    matched. The resulting reports are coalesced into one write per connection.
+    Everything runs on the event loop's thread, so the engine is never shared.
+
+    Attributes:
+    -- matching_engine -> The engine orders are fed to.
+    -- host -> The address to listen on.
+    -- port -> The port to listen on. 0 picks a free port, available as port once started.
+    -- read_size -> The most bytes read from a connection at once.
+    -- execution_reports -> The event sink routing reports to connections.
+    -- connections -> The number of open connections.
+    -- cancel_on_disconnect -> Whether a connection closing cancels the live orders of every
+    account it sent orders for, with one mass cancel per account. That includes the
+    account's orders from its other connections, even open ones, so an account should
+    use one connection. Orders without an account_id cannot be attributed to an account
+    and are left in the book.
+    """
+
+    def __init__(self,
+                 matching_engine: MatchingEngine,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 read_size: int = 1 << 16,
+                 cancel_on_disconnect: bool = False):
+
+        self.matching_engine = matching_engine
+        self.host = host
+        self.port = port
+        self.read_size = read_size
+        self.cancel_on_disconnect = cancel_on_disconnect
+        self.execution_reports = ExecutionReports()
+        self.connections = 0
+        self.server: Optional[asyncio.AbstractServer] = None
+        matching_engine.add_event_sink(self.execution_reports)
+
+    async def start(self) -> asyncio.AbstractServer:
+        """ Start listening. The server then runs as long as the event loop does."""
+
+        server = self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        logging.info("Order entry: listening on %s:%s", self.host, self.port)
+        return server
+
+    async def serve_forever(self) -> None:
+        server = self.server if self.server is not None else await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def stop(self) -> None:
+        server = self.server
+        if server is None:
+            return None
+        server.close()
+        await server.wait_closed()
+
+    def process(self, connection: Connection, data: bytes) -> None:
+        """ Queue and match a batch of complete frames from one connection."""
+
+        orders = decode_orders(data)
+        connection.received += len(orders)
+        matching_engine = self.matching_engine
+        accounts = connection.accounts
+        for order in orders:
+            if self.cancel_on_disconnect and isinstance(order, BaseOrder) and order.account_id is not None:
+                accounts.add(order.account_id)
+            matching_engine.add_order(order)
+        self.execution_reports.current = connection
+        try:
+            matching_engine.match()
+        finally:
+            self.execution_reports.current = None
+
+    async def handle_connection(self, reader: StreamReader, writer: StreamWriter) -> None:
+        connection = Connection(writer)
+        self.connections += 1
+        buffer = bytearray()
+        try:
+            while True:
+                data = await reader.read(self.read_size)
+                if not data:
+                    break
+                buffer += data
+                length = complete_frames_length(buffer)
+                if length:
+                    data = bytes(buffer[:length])
+                    del buffer[:length]
+                    self.process(connection, data)
+                    await writer.drain()
+        except (ConnectionResetError, ValueError, KeyError) as error:
+            # Undecodable frames, including unknown enum values, close the connection rather than the server.
+            logging.warning("Order entry: closing connection: %s", error)
+        finally:
+            self.connections -= 1
+            self.execution_reports.disconnect(connection)
+            if self.cancel_on_disconnect:
+                self.cancel_accounts(connection)
+            writer.close()
+
+    def cancel_accounts(self, connection: Connection) -> None:
+        """ Cancel every live order of the accounts a closed connection sent orders for.
+
+        Orders are cancelled by account, not by connection: an account's orders entered
+        on other connections, including ones still open, are cancelled too.
+        """
+
+        for account_id in sorted(connection.accounts):
+            self.matching_engine.mass_cancel(MassCancelOrder(account_id=account_id))
@@ -0,0 +1,2 @@
+from .book_snapshot import BookSnapshot
+from .snapshot_publisher import SnapshotPublisher
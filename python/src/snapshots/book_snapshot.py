@@ -0,0 +1,53 @@
+from typing import Optional, Tuple
+
+Levels = Tuple[Tuple[float, float], ...]
+
+
+class BookSnapshot:
+    """ An immutable view of the top of one order book, as it stood after a batch.
+
+    Snapshots are built by the engine thread and never modified once published,
+    so any number of reader threads can hold and read them without locking.
+
+    Attributes:
+    -- instrument_id -> The instrument of the book.
+    -- version -> The SnapshotPublisher version which published this snapshot.
+    -- bids -> (price, quantity) of the best bid levels, best first.
+    -- asks -> (price, quantity) of the best ask levels, best first.
+    -- last_price -> The price of the most recent trade, None before the first trade.
+    """
+
+    __slots__ = ("instrument_id", "version", "bids", "asks", "last_price")
+
+    def __init__(self,
+                 instrument_id: str,
+                 version: int,
+                 bids: Levels,
+                 asks: Levels,
+                 last_price: Optional[float]):
+
+        self.instrument_id = instrument_id
+        self.version = version
+        self.bids = bids
+        self.asks = asks
+        self.last_price = last_price
+
+    def __repr__(self) -> str:
+        return f"BookSnapshot({self.instrument_id!r}, version={self.version}, bids={self.bids}, asks={self.asks})"
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        """ The best bid price, None if there are no bids."""
+        return self.bids[0][0] if self.bids else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        """ The best ask price, None if there are no asks."""
+        return self.asks[0][0] if self.asks else None
+
+    @property
+    def spread(self) -> Optional[float]:
+        """ The best ask less the best bid, None if either side is empty."""
+        if self.bids and self.asks:
+            return self.asks[0][0] - self.bids[0][0]
+        return None
@@ -0,0 +1,60 @@
+from python.src.snapshots.book_snapshot import BookSnapshot
+from python.src.order_book import OrderBook
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
+
+
+class SnapshotPublisher:
+    """ Publishes consistent top-of-book views of a MatchingEngine to concurrent readers.
+
+    While the engine thread mutates its books inside match(), readers must not look
+    at them directly. Instead the engine marks each book it touches, and after each
+    batch publish() builds an immutable BookSnapshot of the top depth levels of every
+    marked book. The snapshots of all instruments are collected into a new read-only
+    mapping which replaces the previous one with a single reference assignment.
+
+    This is epoch-style publication: a reader takes snapshots once and reads from it,
+    and everything it sees belongs to a single version, however long it takes and
+    whatever the engine does meanwhile. Reading takes no lock and copies nothing;
+    the engine never waits for readers, and superseded versions are freed once the
+    last reader drops them. Only the top levels of books which changed are rebuilt.
+
+    Attributes:
+    -- depth -> The number of price levels of each side in every snapshot.
+    -- version -> The number of publications so far. Each publication stamps its snapshots with it.
+    -- snapshots -> The latest snapshot of every instrument, in a read-only mapping
+    which is replaced, never changed, by each publication.
+    -- pending -> The books changed since the last publication, by instrument id.
+    """
+
+    def __init__(self, depth: int = 10):
+        self.depth = depth
+        self.version = 0
+        self.snapshots: Mapping[str, BookSnapshot] = MappingProxyType({})
+        self.pending: Dict[str, OrderBook] = {}
+
+    def mark(self, instrument_id: str, order_book: OrderBook) -> None:
+        """ Record that a book has changed and needs a new snapshot."""
+
+        self.pending[instrument_id] = order_book
+
+    def publish(self) -> None:
+        """ Snapshot every changed book and make them all visible to readers at once."""
+
+        pending = self.pending
+        if not pending:
+            return None
+        version = self.version + 1
+        depth = self.depth
+        snapshots = dict(self.snapshots)
+        for instrument_id, order_book in pending.items():
+            bids, asks = order_book.depth(depth)
+            snapshots[instrument_id] = BookSnapshot(instrument_id, version, bids, asks, order_book.last_price)
+        pending.clear()
+        self.snapshots = MappingProxyType(snapshots)
+        self.version = version
+
+    def snapshot(self, instrument_id: str) -> Optional[BookSnapshot]:
+        """ The latest snapshot of an instrument, None if it has not been published."""
+
+        return self.snapshots.get(instrument_id)
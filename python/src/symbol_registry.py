@@ -0,0 +1,70 @@
+from typing import Dict, Iterable, List
+
+
+class SymbolRegistry:
+    """ Interns instrument ids to dense integer ids, 0, 1, 2, ... in order of registration.
+
+    A MatchingEngine keeps its order books in a list indexed by these ids, so once an
+    instrument is registered its book is found with a list index. Loading the whole
+    instrument universe at startup creates every book before the first order arrives,
+    and freezing the registry then refuses orders for anything else.
+
+    Attributes:
+    -- symbols -> The instrument id of each symbol id.
+    -- ids -> The symbol id of each instrument id.
+    -- frozen -> Whether new instruments are refused. intern() raises KeyError for them.
+    """
+
+    def __init__(self, instrument_ids: Iterable[str] = (), frozen: bool = False):
+        self.symbols: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.frozen = False
+        for instrument_id in instrument_ids:
+            self.intern(instrument_id)
+        self.frozen = frozen
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, instrument_id: str) -> bool:
+        return instrument_id in self.ids
+
+    def __getitem__(self, instrument_id: str) -> int:
+        return self.ids[instrument_id]
+
+    def intern(self, instrument_id: str) -> int:
+        """ The symbol id of an instrument, registering it if it is new."""
+
+        symbol_id = self.ids.get(instrument_id)
+        if symbol_id is None:
+            if self.frozen:
+                raise KeyError("Unknown instrument: {}".format(instrument_id))
+            symbol_id = self.ids[instrument_id] = len(self.symbols)
+            self.symbols.append(instrument_id)
+        return symbol_id
+
+    def symbol(self, symbol_id: int) -> str:
+        """ The instrument id of a symbol id."""
+
+        return self.symbols[symbol_id]
+
+    def freeze(self) -> None:
+        """ Refuse any instrument not yet registered."""
+
+        self.frozen = True
+
+
+def read_instruments(path: str) -> List[str]:
+    """ Read the instrument universe from a reference file.
+
+    The file lists one instrument per line. Only the first comma separated field
+    is used, so a CSV of reference data with the instrument id first can be read
+    directly. Blank lines, lines starting with # and an instrument_id header are skipped.
+    """
+    instrument_ids = []
+    with open(path) as f:
+        for line in f:
+            instrument_id = line.split(",", 1)[0].strip()
+            if instrument_id and not instrument_id.startswith("#") and instrument_id != "instrument_id":
+                instrument_ids.append(instrument_id)
+    return instrument_ids
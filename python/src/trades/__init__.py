@@ -1 +1,3 @@
 from .trade import Trade
+from .trade_buffer import TradeBuffer
+from .trade_store import TradeStore, InstrumentTrades, STORED_TRADE
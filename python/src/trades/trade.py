@@ -10,7 +10,9 @@ class Trade:
     -- quantity -> the number of shares traded.
     """
 
-    def __init__(self, datetime: datetime64, price: float, quantity: int):
+    __slots__ = ("datetime", "price", "quantity")
+
+    def __init__(self, datetime: datetime64, price: float, quantity: float):
 
         self.datetime = datetime
         self.price = price
@@ -0,0 +1,82 @@
+from array import array
+import numpy as np
+
+
+class TradeBuffer:
+    """ A preallocated, columnar record of trades which can be used as an OrderBook trade sink.
+
+    Each trade is written into the next row of fixed columns instead of becoming
+    a Trade object. Columns are stored in array.array, which takes Python floats
+    and ints far more cheaply than NumPy item assignment, and are exposed as
+    NumPy arrays sharing the same memory. Once full, capacity doubles.
+    A consumer reads the filled rows and calls clear() to reuse the same memory,
+    so steady-state recording allocates nothing.
+
+    Attributes:
+    -- size -> the number of trades recorded.
+    -- times -> trade timestamps, nanoseconds since the epoch.
+    -- prices -> the price of each trade.
+    -- quantities -> the number of shares in each trade.
+    -- bid_order_ids -> the order_id of the bid in each trade.
+    -- ask_order_ids -> the order_id of the ask in each trade.
+    Each array has capacity rows, of which only the first size are filled.
+    """
+
+    columns = (("times", "q"),
+               ("prices", "d"),
+               ("quantities", "d"),
+               ("bid_order_ids", "q"),
+               ("ask_order_ids", "q"))
+
+    # Each column is set by allocate(), as an array.array under its name with a leading
+    # underscore, written to by __call__, and as a NumPy view of it under its name.
+    _times: array
+    _prices: array
+    _quantities: array
+    _bid_order_ids: array
+    _ask_order_ids: array
+    times: np.ndarray
+    prices: np.ndarray
+    quantities: np.ndarray
+    bid_order_ids: np.ndarray
+    ask_order_ids: np.ndarray
+    capacity: int
+
+    def __init__(self, capacity: int = 65536):
+
+        self.size = 0
+        self.allocate(capacity)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __call__(self, timestamp: int, price: float, quantity: float, bid, ask) -> None:
+        """ Record a trade between bid and ask."""
+
+        size = self.size
+        if size == self.capacity:
+            self.allocate(2 * self.capacity)
+        self._times[size] = timestamp
+        self._prices[size] = price
+        self._quantities[size] = quantity
+        self._bid_order_ids[size] = bid.order_id
+        self._ask_order_ids[size] = ask.order_id
+        self.size = size + 1
+
+    def allocate(self, capacity: int) -> None:
+        """ Allocate columns of the given capacity, keeping the recorded trades."""
+
+        capacity = max(capacity, 1)
+        size = self.size
+        for name, typecode in self.columns:
+            column = array(typecode, bytes(8 * capacity))
+            if size:
+                column[:size] = getattr(self, "_" + name)[:size]
+            setattr(self, "_" + name, column)
+            setattr(self, name, np.frombuffer(column, dtype=typecode))
+        self.capacity = capacity
+
+    def clear(self) -> None:
+        """ Forget the recorded trades, keeping the memory for reuse."""
+
+        self.size = 0
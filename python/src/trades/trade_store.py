@@ -0,0 +1,207 @@
+from bisect import bisect_left
+from struct import Struct
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+import os
+
+# A trade stored by TradeStore, in memory and on disk. The instrument is implied by where it is stored.
+# -- timestamp -> Nanoseconds since the epoch.
+# -- price -> Execution price.
+# -- quantity -> Executed quantity.
+# -- bid_order_id -> The order_id of the bid, 0 if unknown.
+# -- ask_order_id -> The order_id of the ask, 0 if unknown.
+STORED_TRADE = np.dtype([("timestamp", "<i8"),
+                         ("price", "<f8"),
+                         ("quantity", "<f8"),
+                         ("bid_order_id", "<i8"),
+                         ("ask_order_id", "<i8")])
+RECORD = Struct("<qddqq")
+
+
+class InstrumentTrades:
+    """ The trades of one instrument in time order, in chunks of STORED_TRADE records.
+
+    Trades are packed into the last chunk, which is preallocated and never grows.
+    Once it is full a new chunk is started, and if the instrument has a directory
+    the full chunk is written to it and replaced by a read-only memory map of the file.
+
+    Attributes:
+    -- chunk_size -> The number of trades in a full chunk.
+    -- directory -> If set, where full chunks are written, one .npy file per chunk.
+    -- chunks -> The records of each chunk, oldest first. Only the first size records of a
+    live last chunk are filled.
+    -- first_times, last_times -> The time of the first and last trade of each chunk.
+    Trades are in time order, so both are sorted and can be bisected.
+    -- size -> The number of trades in the live last chunk.
+    -- buffer -> The memory of the live last chunk, None if every chunk is sealed.
+    -- clamped -> The number of trades stamped before the last trade, and stored at its time instead.
+    """
+
+    __slots__ = ("chunk_size", "directory", "chunks", "first_times", "last_times", "size", "buffer", "clamped")
+
+    def __init__(self, chunk_size: int = 1 << 16, directory: Optional[str] = None):
+        self.chunk_size = chunk_size
+        self.directory = directory
+        self.chunks: List[np.ndarray] = []
+        self.first_times: List[int] = []
+        self.last_times: List[int] = []
+        self.size = 0
+        self.buffer: Optional[bytearray] = None
+        self.clamped = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            for name in sorted(os.listdir(directory)):
+                chunk = np.load(os.path.join(directory, name), mmap_mode="r")
+                if len(chunk):
+                    self.chunks.append(chunk)
+                    self.first_times.append(int(chunk["timestamp"][0]))
+                    self.last_times.append(int(chunk["timestamp"][-1]))
+
+    def __len__(self) -> int:
+        if self.buffer is None:
+            return sum(len(chunk) for chunk in self.chunks)
+        return sum(len(chunk) for chunk in self.chunks[:-1]) + self.size
+
+    def append(self, timestamp: int, price: float, quantity: float, bid_order_id: int, ask_order_id: int) -> None:
+        """ Add a trade. One stamped before the last trade is stored at the last trade's time.
+
+        A wall clock can step backwards, and the store is called from inside the engine's
+        match(), after orders have been filled, where raising would leave the book half updated.
+        Clamping keeps the trades in time order instead.
+        """
+        last_times = self.last_times
+        if last_times and timestamp < last_times[-1]:
+            timestamp = last_times[-1]
+            self.clamped += 1
+        buffer = self.buffer
+        size = self.size
+        if buffer is None or size == self.chunk_size:
+            buffer = self.open_chunk()
+            size = 0
+            self.first_times.append(timestamp)
+            last_times.append(timestamp)
+        else:
+            last_times[-1] = timestamp
+        RECORD.pack_into(buffer, size * RECORD.size,
+                         timestamp, price, quantity, bid_order_id, ask_order_id)
+        self.size = size + 1
+
+    def open_chunk(self) -> bytearray:
+        """ Seal the live chunk, if any, and start a new one. Returns its memory."""
+
+        self.seal()
+        buffer = self.buffer = bytearray(self.chunk_size * RECORD.size)
+        self.chunks.append(np.frombuffer(buffer, dtype=STORED_TRADE))
+        self.size = 0
+        return buffer
+
+    def seal(self) -> None:
+        """ Finish the live chunk. With a directory, it is written out and replaced by a memory map of the file.
+
+        Views of the chunk already handed out stay valid, as they keep its memory alive.
+        """
+        if self.buffer is None:
+            return None
+        self.buffer = None
+        chunk = self.chunks.pop()[:self.size]
+        if not len(chunk):
+            return None
+        if self.directory is not None:
+            path = os.path.join(self.directory, "{:010d}.npy".format(len(self.chunks)))
+            np.save(path, chunk)
+            chunk = np.load(path, mmap_mode="r")
+        self.chunks.append(chunk)
+
+    def between(self, start: int, end: int) -> List[np.ndarray]:
+        """ The trades with start <= timestamp < end, as views of each chunk they span, oldest first.
+
+        The chunks are found by bisecting their first and last times, and the range is
+        found within the first and last of them by binary search on their timestamps.
+        Chunks in between are returned whole, so a query costs O(log n) plus one view per chunk.
+        """
+        first = bisect_left(self.last_times, start)
+        last = bisect_left(self.first_times, end)
+        chunks = self.chunks
+        live = len(chunks) - 1 if self.buffer is not None else -1
+        views = []
+        for k in range(first, last):
+            chunk = chunks[k]
+            if k == live:
+                chunk = chunk[:self.size]
+            low = chunk["timestamp"].searchsorted(start) if self.first_times[k] < start else 0
+            high = chunk["timestamp"].searchsorted(end) if self.last_times[k] >= end else len(chunk)
+            if low < high:
+                views.append(chunk[low:high])
+        return views
+
+
+class TradeStore:
+    """ Every instrument's trades, stored in time order for range queries, usable as a trade sink.
+
+    Each instrument's trades are kept in an InstrumentTrades. A query for an instrument's trades
+    between two times bisects the chunk time index, then searches the timestamps of the
+    chunks at either end, and returns views of the records without copying them.
+
+    With a directory, each instrument's full chunks are written to its own subdirectory
+    and memory mapped, so old history stays queryable without being held in memory.
+    Chunks already in the directory are mapped when the store is created, and close()
+    writes out the partly filled chunks, so history survives a restart.
+
+    Attributes:
+    -- chunk_size -> The number of trades in each chunk.
+    -- directory -> If set, where chunks are written and read.
+    -- instruments -> The InstrumentTrades of each instrument, by instrument id.
+    -- trade_sink -> If set, every trade is passed on to it after it is stored.
+    """
+
+    def __init__(self,
+                 chunk_size: int = 1 << 16,
+                 directory: Optional[str] = None,
+                 trade_sink: Optional[Callable[..., Any]] = None):
+
+        self.chunk_size = chunk_size
+        self.directory = directory
+        self.trade_sink = trade_sink
+        self.instruments: Dict[str, InstrumentTrades] = {}
+        if directory is not None and os.path.isdir(directory):
+            for instrument_id in sorted(os.listdir(directory)):
+                self.trades(instrument_id)
+
+    def __call__(self, timestamp: int, price: float, quantity: float, bid, ask) -> None:
+        """ Record a trade between bid and ask."""
+
+        trades = self.instruments.get(bid.instrument_id)
+        if trades is None:
+            trades = self.trades(bid.instrument_id)
+        trades.append(timestamp, price, quantity, bid.order_id, ask.order_id)
+        if self.trade_sink is not None:
+            self.trade_sink(timestamp, price, quantity, bid, ask)
+
+    def trades(self, instrument_id: str) -> InstrumentTrades:
+        """ The trades of an instrument, created empty if it has none."""
+
+        trades = self.instruments.get(instrument_id)
+        if trades is None:
+            directory = None if self.directory is None else os.path.join(self.directory, instrument_id)
+            trades = self.instruments[instrument_id] = InstrumentTrades(self.chunk_size, directory)
+        return trades
+
+    def append(self, instrument_id: str, timestamp: int, price: float, quantity: float,
+               bid_order_id: int = 0, ask_order_id: int = 0) -> None:
+        """ Add a trade of an instrument. One stamped before its last trade is stored at that trade's time."""
+
+        self.trades(instrument_id).append(timestamp, price, quantity, bid_order_id, ask_order_id)
+
+    def between(self, instrument_id: str, start: int, end: int) -> List[np.ndarray]:
+        """ An instrument's trades with start <= timestamp < end, as STORED_TRADE views of each chunk they span."""
+
+        trades = self.instruments.get(instrument_id)
+        if trades is None:
+            return []
+        return trades.between(start, end)
+
+    def close(self) -> None:
+        """ Seal every instrument's live chunk, writing it out if the store has a directory."""
+
+        for trades in self.instruments.values():
+            trades.seal()
@@ -0,0 +1,88 @@
+from python.src.orders import StopOrder
+from python.src.orders import StopLimitOrder
+from python.src.enums import OrderDirection
+from python.src.exceptions import InvalidOrderDirectionException
+from sortedcontainers import SortedKeyList
+from typing import Optional, List, Union
+
+Stop = Union[StopOrder, StopLimitOrder]
+
+
+class TriggerBook:
+    """ Pending stop and stop-limit orders for a single instrument, indexed by stop price.
+
+    Stops are not visible in the OrderBook until the market trades through them.
+    Keeping each side sorted by the direction in which it triggers means every stop
+    crossed by a trade sits at the front of its list, so releasing them is a bisect
+    plus a slice: O(log n + k) for k released stops, rather than a scan of every stop.
+
+    Attributes:
+    --buy_stops -> Buy stops sorted by ascending stop price.
+    A buy stop is released by a trade at or above its stop price.
+    --sell_stops -> Sell stops sorted by descending stop price.
+    A sell stop is released by a trade at or below its stop price.
+    SortedKeyList inserts equal keys to the right, so stops at the same price keep time order.
+    """
+
+    def __init__(self):
+        self.buy_stops = SortedKeyList(key=lambda x: x.stop_price)
+        self.sell_stops = SortedKeyList(key=lambda x: -x.stop_price)
+
+    def __len__(self) -> int:
+        return len(self.buy_stops) + len(self.sell_stops)
+
+    def add(self, order: Stop) -> None:
+        """ Hold a stop order until it is triggered."""
+
+        if order.order_direction == OrderDirection.buy:
+            self.buy_stops.add(order)
+        elif order.order_direction == OrderDirection.sell:
+            self.sell_stops.add(order)
+        else:
+            raise InvalidOrderDirectionException()
+
+    def is_triggered(self, order: Stop, price: float) -> bool:
+        """ Whether a trade at price would release the stop order."""
+
+        if order.order_direction == OrderDirection.buy:
+            return price >= order.stop_price
+        return price <= order.stop_price
+
+    def remove(self, order: Stop) -> None:
+        if order.order_direction == OrderDirection.buy:
+            self.buy_stops.remove(order)
+        else:
+            self.sell_stops.remove(order)
+
+    def clear(self, order_direction: Optional[OrderDirection] = None) -> None:
+        """ Drop every stop on one side, or on both sides if order_direction is None."""
+
+        if order_direction is None or order_direction == OrderDirection.buy:
+            self.buy_stops.clear()
+        if order_direction is None or order_direction == OrderDirection.sell:
+            self.sell_stops.clear()
+
+    def release(self, low: float, high: float) -> List[Stop]:
+        """ Remove and return every stop crossed by trades between low and high.
+
+        Buy stops are released first in ascending stop price, then sell stops in
+        descending stop price, each in time order within a price. This keeps
+        trigger cascades deterministic.
+        """
+        released: List[Stop] = []
+
+        buy_stops = self.buy_stops
+        if buy_stops:
+            index = buy_stops.bisect_key_right(high)
+            if index:
+                released += buy_stops[:index]
+                del buy_stops[:index]
+
+        sell_stops = self.sell_stops
+        if sell_stops:
+            index = sell_stops.bisect_key_right(-low)
+            if index:
+                released += sell_stops[:index]
+                del sell_stops[:index]
+
+        return released
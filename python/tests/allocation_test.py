@@ -0,0 +1,98 @@
+from python.src import allocation
+import numpy as np
+import pytest
+
+
+def test_fifo_fills_in_time_priority():
+    quantities = np.array([30., 50., 20.])
+    fills = allocation.fifo(quantities, 60)
+
+    assert fills.tolist() == [30, 30, 0], "Test Failed: fifo should fill in order"
+    pass
+
+
+def test_pro_rata_fills_in_proportion():
+    quantities = np.array([100., 300., 600.])
+    fills = allocation.pro_rata(quantities, 500)
+
+    assert fills.tolist() == [50, 150, 300], "Test Failed: pro-rata should be proportional"
+    pass
+
+
+def test_pro_rata_hands_out_remainder_by_largest_remainder():
+    fills = allocation.pro_rata(np.array([10, 10, 10]), 20)
+
+    assert fills.sum() == 20, "Test Failed: allocation should sum to the total"
+    assert fills.tolist() == [7, 7, 6], "Test Failed: tied remainders should go to the earliest orders"
+
+    fills = allocation.pro_rata(np.array([10, 20, 70]), 7)
+    assert fills.tolist() == [1, 1, 5], "Test Failed: the leftover unit should go to the largest remainder"
+    pass
+
+
+def test_pro_rata_keeps_integer_quantities():
+    fills = allocation.pro_rata(np.array([100, 300, 601]), 500)
+
+    assert fills.dtype.kind == "i", "Test Failed: integer quantities should be allocated in integers"
+    assert fills.sum() == 500, "Test Failed: allocation should sum to the total"
+    assert allocation.fifo_pro_rata(np.array([100, 100, 200]), 201, 0.5).dtype.kind == "i", \
+        "Test Failed: the hybrid allocation should keep integers"
+    pass
+
+
+def test_pro_rata_allocates_fractional_quantities():
+    quantities = np.array([0.5, 0.25, 1.25])
+    fills = allocation.pro_rata(quantities, 1.5)
+
+    assert fills.sum() == pytest.approx(1.5), "Test Failed: allocation should sum to the total"
+    assert np.all(fills <= quantities), "Test Failed: no order should be over-allocated"
+    pass
+
+
+def test_pro_rata_fills_everything_when_total_exceeds_level():
+    quantities = np.array([10., 20.])
+    fills = allocation.pro_rata(quantities, 50)
+
+    assert fills.tolist() == [10, 20], "Test Failed: every order should fill"
+    pass
+
+
+def test_fifo_pro_rata_gives_first_order_priority():
+    quantities = np.array([100, 100, 200])
+    fills = allocation.fifo_pro_rata(quantities, 200, 0.5)
+
+    assert fills.sum() == 200, "Test Failed: allocation should sum to the total"
+    assert fills.tolist() == [100, 33, 67], "Test Failed: incorrect hybrid allocation"
+    pass
+
+
+def test_filled_needs_the_whole_quantity():
+    quantities = np.array([100000, 100000])
+    assert allocation.filled(np.array([100000, 99999]), quantities).tolist() == [True, False], \
+        "Test Failed: integer orders should only fill exactly"
+    fills = np.array([100000. - 1e-11, 99999.])
+    assert allocation.filled(fills, quantities.astype(float)).tolist() == [True, False], \
+        "Test Failed: fractional orders should only fill within an absolute epsilon"
+    pass
+
+
+def test_pair_fills_splits_on_every_boundary():
+    bid_fills = np.array([50., 50.])
+    ask_fills = np.array([30., 70.])
+    bid_index, ask_index, quantities = allocation.pair_fills(bid_fills, ask_fills)
+
+    assert bid_index.tolist() == [0, 0, 1], "Test Failed: incorrect bid index"
+    assert ask_index.tolist() == [0, 1, 1], "Test Failed: incorrect ask index"
+    assert quantities.tolist() == [30, 20, 50], "Test Failed: incorrect quantities"
+    pass
+
+
+def test_pair_fills_skips_unallocated_orders():
+    bid_fills = np.array([0., 40., 0.])
+    ask_fills = np.array([40.])
+    bid_index, ask_index, quantities = allocation.pair_fills(bid_fills, ask_fills)
+
+    assert bid_index.tolist() == [1], "Test Failed: incorrect bid index"
+    assert ask_index.tolist() == [0], "Test Failed: incorrect ask index"
+    assert quantities.tolist() == [40], "Test Failed: incorrect quantities"
+    pass
@@ -0,0 +1,50 @@
+from python.src import auction
+import numpy as np
+import pytest
+
+
+def test_clearing_price_maximises_volume():
+    price, volume = auction.clearing_price(bid_prices=np.array([10., 9., 8.]),
+                                           bid_quantities=np.array([100., 100., 100.]),
+                                           ask_prices=np.array([8., 9., 11.]),
+                                           ask_quantities=np.array([50., 100., 100.]))
+
+    assert price == 9, "Test Failed: incorrect clearing price"
+    assert volume == 150, "Test Failed: incorrect clearing volume"
+    pass
+
+
+def test_clearing_price_breaks_ties_on_reference_price():
+    bid_prices = np.array([10.])
+    ask_prices = np.array([9.])
+    quantities = np.array([100.])
+
+    price, _ = auction.clearing_price(bid_prices, quantities, ask_prices, quantities)
+    assert price == 9, "Test Failed: ties should go to the price nearest the midpoint"
+
+    price, _ = auction.clearing_price(bid_prices, quantities, ask_prices, quantities,
+                                      reference_price=10)
+    assert price == 10, "Test Failed: ties should go to the price nearest the reference"
+    pass
+
+
+def test_clearing_price_counts_market_orders_at_every_price():
+    price, volume = auction.clearing_price(bid_prices=np.array([float("inf"), 9.]),
+                                           bid_quantities=np.array([100., 100.]),
+                                           ask_prices=np.array([10.]),
+                                           ask_quantities=np.array([150.]))
+
+    assert price == 10, "Test Failed: market orders should not set the price"
+    assert volume == 100, "Test Failed: only the market bid can trade at 10"
+    pass
+
+
+def test_clearing_price_without_a_cross():
+    price, volume = auction.clearing_price(bid_prices=np.array([9.]),
+                                           bid_quantities=np.array([100.]),
+                                           ask_prices=np.array([10.]),
+                                           ask_quantities=np.array([100.]))
+
+    assert np.isnan(price), "Test Failed: there should be no clearing price"
+    assert volume == 0, "Test Failed: there should be no volume"
+    pass
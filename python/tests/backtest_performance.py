@@ -0,0 +1,55 @@
+from python.src.backtest import BacktestRunner, Scenario, RESULT, run_scenario
+from python.src.replay import write_binary
+from python.src.risk import RiskLimits
+from python.src.codec import ORDER
+from python.src.enums import MatchingAlgorithm
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+import numpy as np
+import tempfile
+import time
+import os
+
+n = 50_000
+
+
+def get_records(n, seed=0):
+    """ Limit orders about a fixed price, so most of them cross and the books stay shallow."""
+
+    rng = np.random.default_rng(seed)
+    records = np.zeros(n, dtype=ORDER)
+    records["order_type"] = OrderType.limit.value
+    records["order_direction"] = rng.choice([OrderDirection.buy.value, OrderDirection.sell.value], n)
+    records["instrument_id"] = rng.choice([b"AAPL", b"MSFT", b"TSLA", b"FB", b"NFLX"], n)
+    records["quantity"] = 100 + rng.uniform(-50, 50, n)
+    records["price"] = 40 + rng.uniform(-2.5, 2.5, n)
+    records["sent_ns"] = 1_600_000_000_000_000_000 + np.cumsum(rng.exponential(1e5, n)).astype(np.int64)
+    return records
+
+
+scenarios = [Scenario("price_time"),
+             Scenario("pro_rata", matching_algorithm=MatchingAlgorithm.pro_rata),
+             Scenario("fifo_pro_rata", matching_algorithm=MatchingAlgorithm.fifo_pro_rata),
+             Scenario("tick_0.05", tick_size=0.05),
+             Scenario("tick_0.25", tick_size=0.25),
+             Scenario("max_qty_120", risk_limits=RiskLimits(max_order_quantity=120)),
+             Scenario("band_2pct", risk_limits=RiskLimits(price_band=0.02)),
+             Scenario("max_position_1k", risk_limits=RiskLimits(max_position=1_000))]
+
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "orders.bin")
+    write_binary(path, get_records(n))
+
+    start = time.perf_counter()
+    sequential = np.array([run_scenario(path, scenario) for scenario in scenarios], dtype=RESULT)
+    sequential_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = BacktestRunner(path, scenarios).run()
+    parallel_elapsed = time.perf_counter() - start
+
+    for row in parallel:
+        print(f"{row['name']:>16}: {row['trades']:>7,} trades, vwap {row['vwap']:.4f}, "
+              f"{row['rejected']:>6,} rejected, {row['elapsed']:.2f}s")
+    print(f"{len(scenarios)} scenarios of {n:,} orders on {os.cpu_count()} CPUs: "
+          f"sequential {sequential_elapsed:.2f}s, parallel {parallel_elapsed:.2f}s")
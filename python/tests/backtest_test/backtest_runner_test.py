@@ -0,0 +1,83 @@
+from python.src.backtest import BacktestRunner, Scenario, RESULT, run_scenario
+from python.src.replay import write_binary
+from python.src.risk import RiskLimits
+from python.src.codec import ORDER
+from python.src.enums import MatchingAlgorithm
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+import numpy as np
+
+
+def write_orders(path, n=200, cancels=False):
+    rng = np.random.default_rng(0)
+    records = np.zeros(n, dtype=ORDER)
+    records["order_type"] = OrderType.limit.value
+    records["order_direction"] = np.where(rng.random(n) < 0.5, OrderDirection.buy.value, OrderDirection.sell.value)
+    records["instrument_id"] = rng.choice([b"AAPL", b"MSFT"], n)
+    records["quantity"] = rng.integers(1, 10, n) * 10
+    records["price"] = 100 + rng.normal(0, 0.5, n)
+    records["sent_ns"] = np.arange(n) * 1_000_000
+    if cancels:
+        # Every fifth order cancels the order two before it, by the id it is replayed with.
+        rows = np.arange(4, n, 5)
+        records["order_type"][rows] = OrderType.cancel.value
+        targets = rows - 2
+        records["order_id"][rows] = targets - targets // 5 + 1
+        records["order_direction"][rows] = records["order_direction"][targets]
+        records["instrument_id"][rows] = records["instrument_id"][targets]
+    write_binary(path, records, frame_size=64)
+    return records
+
+
+def get_scenarios():
+    return [Scenario("price_time"),
+            Scenario("pro_rata", matching_algorithm=MatchingAlgorithm.pro_rata),
+            Scenario("tick", tick_size=0.25),
+            Scenario("risk", risk_limits=RiskLimits(max_order_quantity=50))]
+
+
+def test_run_scenario_summarises_trades(tmp_path):
+    path = str(tmp_path / "orders.bin")
+    write_orders(path)
+
+    row = np.array([run_scenario(path, Scenario("risk", risk_limits=RiskLimits(max_order_quantity=50)))],
+                   dtype=RESULT)[0]
+
+    assert row["orders"] == 200, "Test Failed: every order should be replayed"
+    assert row["rejected"] > 0, "Test Failed: large orders should be rejected"
+    assert row["accepted"] + row["rejected"] == 200, "Test Failed: every order should be accepted or rejected"
+    assert row["trades"] > 0, "Test Failed: crossing orders should trade"
+    assert row["low"] <= row["vwap"] <= row["high"], "Test Failed: vwap should lie within the traded range"
+    pass
+
+
+def test_backtest_runner_matches_sequential_runs(tmp_path):
+    path = str(tmp_path / "orders.bin")
+    write_orders(path)
+    scenarios = get_scenarios()
+
+    results = BacktestRunner(path, scenarios, max_workers=2).run()
+    expected = np.array([run_scenario(path, scenario) for scenario in scenarios], dtype=RESULT)
+
+    assert results.dtype == RESULT, "Test Failed: results should be a RESULT table"
+    assert list(results["name"]) == [s.name for s in scenarios], "Test Failed: rows should be in scenario order"
+    for field in ("orders", "accepted", "rejected", "filled", "cancelled", "trades", "volume"):
+        assert np.array_equal(results[field], expected[field]), \
+            "Test Failed: {} should not depend on the worker".format(field)
+    assert np.allclose(results["vwap"], expected["vwap"], equal_nan=True), \
+        "Test Failed: vwap should not depend on the worker"
+    pass
+
+
+def test_identical_scenarios_give_identical_rows(tmp_path):
+    path = str(tmp_path / "orders.bin")
+    write_orders(path, cancels=True)
+
+    results = BacktestRunner(path, [Scenario("price_time"), Scenario("price_time")], max_workers=1).run()
+
+    assert results["cancelled"][0] > 0, "Test Failed: replayed cancels should find their orders"
+    for field in RESULT.names:
+        if field != "elapsed":
+            assert results[field][0] == results[field][1] or np.isnan(results[field][0]) and \
+                np.isnan(results[field][1]), "Test Failed: {} should not depend on earlier scenarios".format(field)
+    pass
@@ -0,0 +1,50 @@
+from python.src.codec import encode_orders, decode_orders
+from python.src.codec import trade_buffer_to_records, encode_trades, decode_trades
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.enums import OrderDirection
+from python.src.trades import TradeBuffer
+import random
+import time
+
+num_orders = 100_000
+
+
+def get_data(n):
+    directions = [OrderDirection.buy, OrderDirection.sell]
+    output = []
+    for i in range(n):
+        direction = random.choice(directions)
+        quantity = 100 + random.uniform(-50, 50)
+        if i % 4:
+            output.append(LimitOrder(instrument_id="AAPL",
+                                     order_direction=direction,
+                                     quantity=quantity,
+                                     price=40 + random.uniform(-2.5, 2.5)))
+        else:
+            output.append(MarketOrder(instrument_id="AAPL",
+                                      order_direction=direction,
+                                      quantity=quantity))
+    return output
+
+
+def timed(f, *args):
+    start = time.perf_counter()
+    result = f(*args)
+    return result, 1e9 * (time.perf_counter() - start) / num_orders
+
+
+random.seed(0)
+orders = get_data(num_orders)
+buffer, elapsed = timed(encode_orders, orders)
+print(f"Encode orders: {elapsed:.0f} ns per order, {len(buffer) / num_orders:.1f} bytes per order")
+_, elapsed = timed(decode_orders, memoryview(buffer))
+print(f"Decode orders: {elapsed:.0f} ns per order")
+
+trade_buffer = TradeBuffer(capacity=num_orders)
+for i in range(num_orders):
+    trade_buffer(i, 40., 100., orders[i], orders[i])
+buffer, elapsed = timed(lambda: encode_trades(trade_buffer_to_records(trade_buffer, "AAPL")))
+print(f"Encode trades: {elapsed:.1f} ns per trade")
+_, elapsed = timed(decode_trades, memoryview(buffer))
+print(f"Decode trades: {elapsed:.2f} ns per trade")
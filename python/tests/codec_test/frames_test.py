@@ -0,0 +1,40 @@
+from python.src.codec import HEADER, TRADE, LIMIT_ORDER
+from python.src.codec import encode_frame, decode_frame, iter_frames
+from python.src.enums import MessageType
+import numpy as np
+import pytest
+
+
+def test_frames_decode_as_views():
+    records = np.zeros(3, dtype=TRADE)
+    records["price"] = [1., 2., 3.]
+    buffer = bytearray(encode_frame(MessageType.trade, records))
+
+    message_type, decoded, offset = decode_frame(memoryview(buffer))
+    assert message_type == MessageType.trade, "Test Failed: incorrect message type"
+    assert list(decoded["price"]) == [1., 2., 3.], "Test Failed: incorrect prices"
+    assert offset == len(buffer), "Test Failed: the next frame should follow these records"
+
+    price_offset = HEADER.size + TRADE.fields["price"][1]
+    buffer[price_offset:price_offset + 8] = np.float64(9.).tobytes()
+    assert decoded["price"][0] == 9., "Test Failed: decoded records should share the buffer"
+    pass
+
+
+def test_iter_frames_reads_consecutive_frames():
+    trades = np.zeros(2, dtype=TRADE)
+    limits = np.zeros(1, dtype=LIMIT_ORDER)
+    buffer = encode_frame(MessageType.trade, trades) + encode_frame(MessageType.limit_order, limits)
+
+    frames = list(iter_frames(buffer))
+    assert [(m, len(r)) for m, r in frames] == [(MessageType.trade, 2), (MessageType.limit_order, 1)], \
+        "Test Failed: incorrect frames"
+    pass
+
+
+def test_frames_check_layout_and_version():
+    with pytest.raises(ValueError):
+        encode_frame(MessageType.limit_order, np.zeros(1, dtype=TRADE))
+    with pytest.raises(ValueError):
+        decode_frame(HEADER.pack(MessageType.trade, 99, 0))
+    pass
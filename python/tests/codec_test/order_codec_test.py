@@ -0,0 +1,118 @@
+from python.src.codec import ORDER, LIMIT_ORDER, MARKET_ORDER, CANCEL_ORDER
+from python.src.codec import orders_to_records, records_to_orders, encode_orders, decode_orders
+from python.src.codec import iter_frames, encode_trades, TRADE
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.orders import CancelOrder
+from python.src.orders import MassCancelOrder
+from python.src.orders import StopOrder
+from python.src.orders import StopLimitOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from python.src.enums import MessageType
+import numpy as np
+import pytest
+
+
+def get_orders():
+    return [LimitOrder("AAPL", OrderDirection.buy, 100, 10.5, account_id="acct", client_order_id="c1"),
+            LimitOrder("AAPL", OrderDirection.sell, 10, 11.5),
+            MarketOrder("MSFT", OrderDirection.sell, 50),
+            CancelOrder("AAPL", 42, OrderDirection.buy, client_order_id="c2"),
+            StopOrder("TSLA", OrderDirection.sell, 10, 95.),
+            StopLimitOrder("TSLA", OrderDirection.buy, 10, 105., 106.)]
+
+
+def assert_round_trip(orders, decoded):
+    assert [type(o) for o in decoded] == [type(o) for o in orders], "Test Failed: incorrect order classes"
+    for order, result in zip(orders, decoded):
+        assert result.instrument_id == order.instrument_id, "Test Failed: incorrect instrument_id"
+        assert result.order_direction == order.order_direction, "Test Failed: incorrect order_direction"
+        assert result.order_type == order.order_type, "Test Failed: incorrect order_type"
+        assert result.client_order_id == order.client_order_id, "Test Failed: incorrect client_order_id"
+        assert result.account_id == order.account_id, "Test Failed: incorrect account_id"
+        if order.order_type == OrderType.cancel:
+            assert result.order_id == order.order_id, "Test Failed: cancels should keep the id they reference"
+        else:
+            assert result.quantity == order.quantity, "Test Failed: incorrect quantity"
+            assert result.price == order.price, "Test Failed: incorrect price"
+            assert result.order_id != order.order_id, "Test Failed: the engine should assign new ids"
+            assert getattr(result, "stop_price", None) == getattr(order, "stop_price", None), \
+                "Test Failed: incorrect stop_price"
+
+
+def test_order_records_round_trip():
+    orders = get_orders()
+    records = orders_to_records(orders, sent_ns=7)
+
+    assert records.dtype == ORDER, "Test Failed: incorrect record dtype"
+    assert all(records["sent_ns"] == 7), "Test Failed: incorrect sent time"
+    assert_round_trip(orders, records_to_orders(records))
+    pass
+
+
+def test_order_frames_round_trip():
+    orders = get_orders()
+    buffer = encode_orders(orders, min_run=1)
+    frames = list(iter_frames(buffer))
+
+    assert [m for m, _ in frames] == [MessageType.limit_order, MessageType.market_order,
+                                      MessageType.cancel_order, MessageType.order], \
+        "Test Failed: each run of one order type should be one frame"
+    assert frames[0][1].dtype == LIMIT_ORDER and len(frames[0][1]) == 2, "Test Failed: incorrect limit frame"
+    assert frames[2][1].dtype == CANCEL_ORDER, "Test Failed: incorrect cancel frame"
+    assert len(buffer) == 4 * 8 + 2 * LIMIT_ORDER.itemsize + MARKET_ORDER.itemsize + CANCEL_ORDER.itemsize + 2 * ORDER.itemsize, \
+        "Test Failed: frames should be packed"
+    assert_round_trip(orders, decode_orders(memoryview(buffer)))
+    pass
+
+
+def test_order_frames_send_short_runs_as_order():
+    orders = get_orders()
+    frames = list(iter_frames(encode_orders(orders, min_run=2)))
+
+    assert [(m, len(r)) for m, r in frames] == [(MessageType.limit_order, 2), (MessageType.order, 4)], \
+        "Test Failed: short runs should be merged into one ORDER frame"
+    pass
+
+
+def test_cancels_keep_their_account():
+    orders = [CancelOrder("AAPL", i, OrderDirection.buy, account_id="acct" if i % 2 else None) for i in range(4)]
+    frames = list(iter_frames(encode_orders(orders, min_run=1)))
+
+    assert [m for m, _ in frames] == [MessageType.cancel_order, MessageType.order] * 2, \
+        "Test Failed: cancels with an account should not use the compact message"
+    assert_round_trip(orders, decode_orders(encode_orders(orders, min_run=1)))
+    pass
+
+
+def test_long_ids_are_not_truncated():
+    with pytest.raises(ValueError):
+        orders_to_records([LimitOrder("ABCDEFGHIJKLMNO", OrderDirection.buy, 1, 10)])
+    with pytest.raises(ValueError):
+        orders_to_records([MarketOrder("AAPL", OrderDirection.buy, 1, account_id="a" * 17)])
+    with pytest.raises(ValueError):
+        orders_to_records([CancelOrder("AAPL", 1, OrderDirection.buy, client_order_id="\u00e9" * 9)])
+
+    orders = [LimitOrder("A" * 14, OrderDirection.buy, 1, 10, "b" * 16, "c" * 16)]
+    assert_round_trip(orders, records_to_orders(orders_to_records(orders)))
+    pass
+
+
+def test_decode_orders_rejects_other_messages():
+    with pytest.raises(ValueError):
+        decode_orders(encode_trades(np.zeros(1, dtype=TRADE)))
+    pass
+
+
+def test_mass_cancels_round_trip():
+    orders = [MassCancelOrder("AAPL", "acct", OrderDirection.sell, client_order_id="m1"),
+              MassCancelOrder(account_id="acct")]
+
+    decoded = decode_orders(encode_orders(orders))
+
+    assert [type(o) for o in decoded] == [MassCancelOrder] * 2, "Test Failed: incorrect order classes"
+    assert [(o.instrument_id, o.account_id, o.order_direction, o.client_order_id) for o in decoded] == \
+        [("AAPL", "acct", OrderDirection.sell, "m1"), (None, "acct", None, None)], \
+        "Test Failed: the filters should survive encoding"
+    pass
@@ -0,0 +1,50 @@
+from python.src.codec import TRADE
+from python.src.codec import trades_to_records, trade_buffer_to_records, records_to_trades
+from python.src.codec import encode_trades, decode_trades
+from python.src.trades import Trade
+from python.src.trades import TradeBuffer
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+import numpy as np
+
+
+def test_trades_round_trip():
+    trades = [Trade(datetime=np.datetime64("2021-01-04T09:30:00"), price=10., quantity=100),
+              Trade(datetime=np.datetime64("2021-01-04T09:30:01"), price=10.5, quantity=50)]
+
+    records = decode_trades(encode_trades(trades_to_records(trades, "AAPL")))
+    decoded = records_to_trades(records)
+
+    assert records.dtype == TRADE, "Test Failed: incorrect record dtype"
+    assert list(records["instrument_id"]) == [b"AAPL", b"AAPL"], "Test Failed: incorrect instrument_id"
+    for trade, result in zip(trades, decoded):
+        assert result.datetime == trade.datetime, "Test Failed: incorrect datetime"
+        assert result.price == trade.price, "Test Failed: incorrect price"
+        assert result.quantity == trade.quantity, "Test Failed: incorrect quantity"
+    pass
+
+
+def test_trade_buffer_round_trip():
+    trade_buffer = TradeBuffer(capacity=4)
+    bid = LimitOrder("AAPL", OrderDirection.buy, 100, 10)
+    ask = LimitOrder("AAPL", OrderDirection.sell, 100, 10)
+    trade_buffer(1_000, 10., 60., bid, ask)
+    trade_buffer(2_000, 10., 40., bid, ask)
+
+    records = decode_trades(encode_trades(trade_buffer_to_records(trade_buffer, "AAPL")))
+
+    assert list(records["timestamp"]) == [1_000, 2_000], "Test Failed: incorrect timestamps"
+    assert list(records["quantity"]) == [60., 40.], "Test Failed: incorrect quantities"
+    assert list(records["bid_order_id"]) == [bid.order_id] * 2, "Test Failed: incorrect bid ids"
+    assert list(records["ask_order_id"]) == [ask.order_id] * 2, "Test Failed: incorrect ask ids"
+    pass
+
+
+def test_decode_trades_joins_frames():
+    records = np.zeros(2, dtype=TRADE)
+    records["price"] = [1., 2.]
+    buffer = encode_trades(records[:1]) + encode_trades(records[1:])
+
+    assert list(decode_trades(buffer)["price"]) == [1., 2.], "Test Failed: frames should be joined in order"
+    assert len(decode_trades(b"")) == 0, "Test Failed: an empty buffer has no trades"
+    pass
@@ -0,0 +1,60 @@
+from python.src.events import EventBatch
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+from python.src.enums import EventType
+import numpy as np
+import pytest
+
+
+def make_order(order_id):
+    order = LimitOrder(instrument_id="AAPL",
+                       order_direction=OrderDirection.buy,
+                       quantity=100,
+                       price=10)
+    order.order_id = order_id
+    return order
+
+
+def test_event_batch_delivers_on_flush():
+    batches = []
+    event_batch = EventBatch(lambda *columns: batches.append([c.tolist() for c in columns]))
+    order = make_order(1)
+    event_batch.on_accepted(order)
+    event_batch.on_partially_filled(order, 10.5, 40)
+
+    assert not batches, "Test Failed: nothing should be delivered before flush"
+    assert len(event_batch) == 2, "Test Failed: two events should be buffered"
+
+    event_batch.flush()
+    event_types, order_ids, prices, quantities = batches[0]
+
+    assert event_types == [EventType.accepted, EventType.partially_filled], "Test Failed: incorrect event types"
+    assert order_ids == [1, 1], "Test Failed: incorrect order ids"
+    assert prices[1] == 10.5, "Test Failed: incorrect price"
+    assert quantities == [100, 40], "Test Failed: incorrect quantities"
+    assert len(event_batch) == 0, "Test Failed: the batch should be empty after flush"
+    pass
+
+
+def test_event_batch_delivers_early_when_full():
+    batches = []
+    event_batch = EventBatch(lambda event_types, *_: batches.append(event_types.tolist()),
+                             capacity=2)
+    for i in range(5):
+        event_batch.on_filled(make_order(i), 10, 100)
+    event_batch.flush()
+
+    assert [len(b) for b in batches] == [2, 2, 1], "Test Failed: batches should be capacity sized"
+    pass
+
+
+def test_event_batch_reuses_columns():
+    event_batch = EventBatch(lambda *_: None, capacity=4)
+    prices = event_batch.prices
+    event_batch.on_filled(make_order(1), 10, 100)
+    event_batch.flush()
+    event_batch.on_filled(make_order(2), 11, 100)
+
+    assert event_batch.prices is prices, "Test Failed: columns should be reused"
+    assert prices[0] == 11, "Test Failed: the first row should be reused"
+    pass
@@ -0,0 +1,24 @@
+from python.src.events import EventFanout
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+from python.src.enums import EventType
+from python.tests.events_test.recording_sink import RecordingSink
+import pytest
+
+
+def test_event_fanout_reports_to_every_sink():
+    sinks = [RecordingSink(), RecordingSink()]
+    event_fanout = EventFanout(sinks)
+    order = LimitOrder(instrument_id="AAPL",
+                       order_direction=OrderDirection.buy,
+                       quantity=100,
+                       price=10)
+    event_fanout.on_accepted(order)
+    event_fanout.on_filled(order, 10, 100)
+    event_fanout.flush()
+
+    for sink in sinks:
+        assert sink.events == [(EventType.accepted, order.order_id),
+                               (EventType.filled, order.order_id)], "Test Failed: incorrect events"
+        assert sink.flushes == 1, "Test Failed: flush should be forwarded"
+    pass
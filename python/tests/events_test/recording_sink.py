@@ -0,0 +1,36 @@
+from python.src.events import EventSink
+from python.src.events import NO_ORDER
+from python.src.orders import BaseOrder
+from python.src.enums import EventType
+
+
+class RecordingSink(EventSink):
+    """ Records every event as an (EventType, order_id) pair, for tests."""
+
+    def __init__(self):
+        self.events = []
+        self.flushes = 0
+
+    def on_accepted(self, order):
+        self.events.append((EventType.accepted, order.order_id))
+
+    def on_rejected(self, order, reason):
+        self.events.append((EventType.rejected, order.order_id if isinstance(order, BaseOrder) else NO_ORDER))
+
+    def on_filled(self, order, price, quantity):
+        self.events.append((EventType.filled, order.order_id))
+
+    def on_partially_filled(self, order, price, quantity):
+        self.events.append((EventType.partially_filled, order.order_id))
+
+    def on_cancelled(self, order, cancel_order):
+        self.events.append((EventType.cancelled, order.order_id))
+
+    def on_replaced(self, order, previous_price, previous_quantity):
+        self.events.append((EventType.replaced, order.order_id))
+
+    def on_cancel_rejected(self, cancel_order):
+        self.events.append((EventType.cancel_rejected, cancel_order.order_id))
+
+    def flush(self):
+        self.flushes += 1
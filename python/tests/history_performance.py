@@ -0,0 +1,68 @@
+from python.src.history import OrderHistory
+from python.src.history.order_history import replay
+from python.src.matching_engine import MatchingEngine
+from python.src.order_book import OrderBook
+from python.src.replay import SimulatedClock
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.orders import CancelOrder
+from python.src.enums import OrderDirection
+import numpy as np
+import time
+
+n = 200_000
+instrument_ids = ["AAPL", "MSFT", "IBM", "GOOG"]
+rng = np.random.default_rng(0)
+kinds = rng.random(n).tolist()
+instruments = rng.integers(0, len(instrument_ids), n).tolist()
+directions = rng.integers(0, 2, n).tolist()
+quantities = rng.integers(1, 10, n).tolist()
+prices = rng.integers(95, 106, n).tolist()
+
+
+def run(order_history):
+    clock = SimulatedClock()
+    matching_engine = MatchingEngine(clock=clock, order_history=order_history)
+    placed = {instrument_id: [] for instrument_id in instrument_ids}
+    start = time.perf_counter()
+    for i in range(n):
+        instrument_id = instrument_ids[instruments[i]]
+        direction = OrderDirection.buy if directions[i] else OrderDirection.sell
+        clock.now = i * 1000
+        if kinds[i] < 0.7 or not placed[instrument_id]:
+            order = LimitOrder(instrument_id, direction, quantities[i], prices[i])
+            placed[instrument_id].append(order)
+        elif kinds[i] < 0.8:
+            order = MarketOrder(instrument_id, direction, quantities[i])
+        else:
+            target = placed[instrument_id][-1 - i % len(placed[instrument_id])]
+            order = CancelOrder(instrument_id, target.order_id, target.order_direction)
+        matching_engine.submit(order)
+    return time.perf_counter() - start
+
+
+base = run(None)
+order_history = OrderHistory(checkpoint_interval=10_000)
+logged = run(order_history)
+print(f"processing {n} orders: {1e9 * base / n:.0f}ns per order, "
+      f"{1e9 * logged / n:.0f}ns with the order log and checkpoints")
+
+targets = rng.integers(0, n, 20).tolist()
+start = time.perf_counter()
+for sequence in targets:
+    order_history.reconstruct("AAPL", sequence=sequence)
+elapsed = (time.perf_counter() - start) / len(targets)
+print(f"rebuild one book from its nearest checkpoint: {1e3 * elapsed:.1f}ms")
+
+history = order_history.instruments["AAPL"]
+start = time.perf_counter()
+for sequence in targets[:5]:
+    clock = SimulatedClock()
+    replay(OrderBook(clock=clock), history.between(0, sequence), clock)
+elapsed = (time.perf_counter() - start) / 5
+print(f"for comparison, replaying the log from the start: {1e3 * elapsed:.1f}ms")
+
+start = time.perf_counter()
+order_history.reconstruct_many(instrument_ids, sequence=n // 2)
+elapsed = time.perf_counter() - start
+print(f"rebuild {len(instrument_ids)} books in parallel processes: {1e3 * elapsed:.1f}ms")
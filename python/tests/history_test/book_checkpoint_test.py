@@ -0,0 +1,82 @@
+from python.src.history import BookCheckpoint, capture
+from python.src.order_book import OrderBook
+from python.src.orders import LimitOrder
+from python.src.orders import StopOrder
+from python.src.orders import StopLimitOrder
+from python.src.orders import Quote
+from python.src.enums import OrderDirection
+from python.src.enums import MatchingAlgorithm
+from python.src.enums import ExecutionPriceRule
+import pickle
+
+
+def test_checkpoint_round_trip():
+    order_book = OrderBook(matching_algorithm=MatchingAlgorithm.pro_rata, fifo_fraction=0.25,
+                           execution_price_rule=ExecutionPriceRule.midpoint, tick_size=0.5)
+    first = LimitOrder("AAPL", OrderDirection.buy, 10, 99, "a", "c1")
+    second = LimitOrder("AAPL", OrderDirection.buy, 5, 99, "b")
+    order_book.add_order(first)
+    order_book.add_order(second)
+    third = LimitOrder("AAPL", OrderDirection.buy, 5, 98)
+    order_book.add_order(third)
+    order_book.add_order(LimitOrder("AAPL", OrderDirection.sell, 4, 101))
+    order_book.add_order(LimitOrder("AAPL", OrderDirection.sell, 3, 99))
+    order_book.match()
+    order_book.add_order(StopOrder("AAPL", OrderDirection.sell, 2, 97))
+    order_book.add_order(StopLimitOrder("AAPL", OrderDirection.buy, 2, 102, 103))
+
+    checkpoint = capture(order_book, "AAPL", 7, 123)
+    assert (checkpoint.sequence, checkpoint.timestamp) == (7, 123), "Test Failed: incorrect sequence or timestamp"
+    assert checkpoint.orders["order_id"].tolist()[:3] == [first.order_id, second.order_id, third.order_id], \
+        "Test Failed: bids should be in priority order"
+
+    checkpoint = pickle.loads(pickle.dumps(checkpoint))
+    restored = checkpoint.restore()
+    assert capture(restored, "AAPL", 7, 123).orders.tolist() == checkpoint.orders.tolist(), \
+        "Test Failed: the restored book differs"
+    assert restored.matching_algorithm == MatchingAlgorithm.pro_rata and restored.fifo_fraction == 0.25, \
+        "Test Failed: incorrect matching algorithm"
+    assert restored.tick_size == 0.5 and restored.last_price == order_book.last_price, \
+        "Test Failed: incorrect book state"
+    assert restored.order_index[first.order_id].unfilled_quantity == first.unfilled_quantity, \
+        "Test Failed: partly filled orders should keep their unfilled quantity"
+    assert restored.account_orders["a"].keys() == {first.order_id}, "Test Failed: incorrect account orders"
+    assert restored.order_index[first.order_id].client_order_id == "c1", "Test Failed: incorrect client order id"
+    pass
+
+
+def test_restored_stops_trigger():
+    order_book = OrderBook()
+    order_book.add_order(LimitOrder("AAPL", OrderDirection.buy, 10, 95))
+    stop = StopOrder("AAPL", OrderDirection.sell, 4, 97)
+    order_book.add_order(stop)
+    restored = capture(order_book, "AAPL", 0, 0).restore()
+
+    restored.add_order(LimitOrder("AAPL", OrderDirection.buy, 1, 96))
+    restored.add_order(LimitOrder("AAPL", OrderDirection.sell, 1, 96))
+    restored.match()
+    assert restored.best_bid.unfilled_quantity == 6, "Test Failed: the restored stop should have triggered"
+    pass
+
+
+def test_empty_book_checkpoint():
+    checkpoint = capture(OrderBook(), "AAPL", 0, 0)
+    restored = BookCheckpoint(checkpoint.state, checkpoint.orders).restore()
+    assert restored.best_bid is None and restored.best_ask is None and restored.last_price is None, \
+        "Test Failed: an empty book should restore empty"
+    pass
+
+
+def test_checkpoint_keeps_resting_quotes():
+    order_book = OrderBook()
+    order_book.quote(Quote("AAPL", 99, 10, 101, 10, account_id="mm"))
+    order_book.quote(Quote("AAPL", 98, 5, 0, 0, account_id="other"))
+    restored = capture(order_book, "AAPL", 0, 0).restore()
+
+    assert restored.quotes == {"mm": order_book.quotes["mm"], "other": [order_book.quotes["other"][0], None]}, \
+        "Test Failed: the restored book should know each account's quote orders"
+    bid_id = order_book.quotes["mm"][0]
+    restored.quote(Quote("AAPL", 99, 8, 101, 10, account_id="mm"))
+    assert restored.quotes["mm"][0] == bid_id and restored.order_index[bid_id].unfilled_quantity == 8, \
+        "Test Failed: a new quote should amend the restored quote orders"
+    pass
@@ -0,0 +1,169 @@
+from python.src.history import OrderHistory, capture, load_history
+from python.src.history.order_history import START_AUCTION, UNCROSS
+from python.src.matching_engine import MatchingEngine
+from python.src.replay import SimulatedClock
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.orders import CancelOrder
+from python.src.orders import MassCancelOrder
+from python.src.orders import StopOrder
+from python.src.orders import StopLimitOrder
+from python.src.orders import Quote
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+import random
+
+
+def order_flow(instrument_ids, n, seed=0):
+    """ A random flow of every order type the log supports, around a price of 100."""
+
+    rng = random.Random(seed)
+    placed = {instrument_id: [] for instrument_id in instrument_ids}
+    for _ in range(n):
+        instrument_id = rng.choice(instrument_ids)
+        direction = rng.choice([OrderDirection.buy, OrderDirection.sell])
+        account_id = rng.choice(["a", "b", "c"])
+        kind = rng.random()
+        if kind < 0.6:
+            order = LimitOrder(instrument_id, direction, rng.randint(1, 10), rng.randint(95, 105), account_id)
+            placed[instrument_id].append(order)
+        elif kind < 0.7:
+            order = MarketOrder(instrument_id, direction, rng.randint(1, 5), account_id)
+        elif kind < 0.8 and placed[instrument_id]:
+            target = rng.choice(placed[instrument_id])
+            order = CancelOrder(instrument_id, target.order_id, target.order_direction)
+        elif kind < 0.85:
+            order = StopOrder(instrument_id, direction, rng.randint(1, 5), rng.randint(95, 105), account_id)
+        elif kind < 0.9:
+            order = StopLimitOrder(instrument_id, direction, rng.randint(1, 5), rng.randint(95, 105),
+                                   rng.randint(95, 105), account_id)
+        elif kind < 0.92:
+            order = MassCancelOrder(instrument_id, account_id)
+        elif kind < 0.97:
+            bid_price = rng.randint(96, 100)
+            order = Quote(instrument_id, bid_price, rng.randint(0, 10), bid_price + rng.randint(1, 4),
+                          rng.randint(0, 10), account_id=rng.choice(["mm1", "mm2"]))
+        else:
+            order = LimitOrder(instrument_id, direction, rng.randint(1, 10), rng.randint(98, 102))
+        yield order
+
+
+def book_state(order_book):
+    return capture(order_book, "", 0, 0).orders.tolist(), order_book.last_price
+
+
+def run_engine(instrument_ids, n, checkpoint_interval, seed=0):
+    """ Process a flow one order at a time, keeping the state of every book after each order."""
+
+    clock = SimulatedClock()
+    order_history = OrderHistory(checkpoint_interval=checkpoint_interval, chunk_size=16)
+    matching_engine = MatchingEngine(clock=clock, order_history=order_history)
+    states = []
+    for i, order in enumerate(order_flow(instrument_ids, n, seed)):
+        clock.now = 1000 + 10 * i
+        matching_engine.submit(order)
+        states.append({instrument_id: book_state(order_book)
+                       for instrument_id, order_book in matching_engine.order_books.items()})
+    return matching_engine, order_history, states
+
+
+def test_reconstruct_matches_the_live_book_at_every_sequence():
+    matching_engine, order_history, states = run_engine(["AAPL"], 300, checkpoint_interval=25)
+
+    assert len(order_history.instruments["AAPL"].checkpoints) == 12, "Test Failed: incorrect number of checkpoints"
+    for sequence, state in enumerate(states):
+        order_book = order_history.reconstruct("AAPL", sequence=sequence)
+        assert book_state(order_book) == state["AAPL"], "Test Failed: book differs at {}".format(sequence)
+    assert book_state(order_history.reconstruct("AAPL")) == book_state(matching_engine.order_books["AAPL"]), \
+        "Test Failed: the current book should be rebuilt by default"
+    pass
+
+
+def test_reconstruct_by_timestamp():
+    _, order_history, states = run_engine(["AAPL", "MSFT"], 200, checkpoint_interval=10)
+
+    for sequence in [0, 37, 99, 150, 199]:
+        timestamp = 1000 + 10 * sequence
+        for instrument_id in ["AAPL", "MSFT"]:
+            order_book = order_history.reconstruct(instrument_id, timestamp=timestamp + 5)
+            if instrument_id in states[sequence]:
+                assert book_state(order_book) == states[sequence][instrument_id], \
+                    "Test Failed: {} differs at time {}".format(instrument_id, timestamp)
+    assert order_history.reconstruct("AAPL", timestamp=0) is None, \
+        "Test Failed: there is no book before the first order"
+    assert order_history.reconstruct("IBM") is None, "Test Failed: an unknown instrument has no book"
+    pass
+
+
+def test_reconstructed_books_keep_matching():
+    _, order_history, _ = run_engine(["AAPL"], 100, checkpoint_interval=20)
+
+    order_book = order_history.reconstruct("AAPL", sequence=50)
+    best_ask = order_book.best_ask
+    if best_ask is not None:
+        order_book.add_order(LimitOrder("AAPL", OrderDirection.buy, best_ask.unfilled_quantity, best_ask.price))
+        order_book.match()
+        assert not best_ask.unfilled_quantity, "Test Failed: a rebuilt book should match its resting orders"
+    pass
+
+
+def test_reconstruct_many_in_parallel():
+    instrument_ids = ["AAPL", "MSFT", "IBM", "GOOG"]
+    _, order_history, states = run_engine(instrument_ids, 400, checkpoint_interval=15)
+
+    books = order_history.reconstruct_many(instrument_ids, sequence=333, max_workers=2)
+    assert sorted(books) == sorted(instrument_ids), "Test Failed: every instrument should be rebuilt"
+    for instrument_id, order_book in books.items():
+        assert book_state(order_book) == states[333][instrument_id], \
+            "Test Failed: {} differs".format(instrument_id)
+    pass
+
+
+def test_save_and_load(tmp_path):
+    _, order_history, states = run_engine(["AAPL", "MSFT"], 150, checkpoint_interval=20)
+    order_history.save(str(tmp_path))
+
+    loaded = load_history(str(tmp_path), checkpoint_interval=20)
+    assert loaded.sequence == order_history.sequence, "Test Failed: incorrect sequence after loading"
+    for sequence in [10, 75, 149]:
+        for instrument_id in ["AAPL", "MSFT"]:
+            assert book_state(loaded.reconstruct(instrument_id, sequence=sequence)) == \
+                states[sequence][instrument_id], "Test Failed: loaded history differs"
+    pass
+
+
+def test_reconstruct_across_quotes_and_auctions():
+    clock = SimulatedClock()
+    order_history = OrderHistory(checkpoint_interval=7, chunk_size=16)
+    matching_engine = MatchingEngine(clock=clock, order_history=order_history)
+    states = {}
+    flow = order_flow(["AAPL", "MSFT"], 240, seed=1)
+    for step in range(6):
+        for i, order in zip(range(40), flow):
+            clock.now += 10
+            matching_engine.submit(order)
+            states[order_history.sequence - 1] = {instrument_id: book_state(order_book)
+                                                  for instrument_id, order_book in matching_engine.order_books.items()}
+        clock.now += 10
+        if step % 2:
+            matching_engine.uncross()
+        else:
+            matching_engine.start_auction()
+        states[order_history.sequence - 1] = {instrument_id: book_state(order_book)
+                                              for instrument_id, order_book in matching_engine.order_books.items()}
+
+    order_types = order_history.instruments["AAPL"].log()["order_type"].tolist()
+    assert OrderType.quote.value in order_types, "Test Failed: quotes should be logged"
+    assert order_types.count(START_AUCTION) == 3 and order_types.count(UNCROSS) == 3, \
+        "Test Failed: auction starts and uncrosses should be logged"
+    for sequence, state in states.items():
+        for instrument_id in state:
+            assert book_state(order_history.reconstruct(instrument_id, sequence=sequence)) == state[instrument_id], \
+                "Test Failed: {} differs at {}".format(instrument_id, sequence)
+    order_book = order_history.reconstruct("AAPL")
+    live = matching_engine.order_books["AAPL"]
+    assert order_book.quotes.keys() <= live.quotes.keys(), "Test Failed: rebuilt books should know their quotes"
+    for account_id, quote_ids in order_book.quotes.items():
+        assert [i if i in live.order_index else None for i in live.quotes[account_id]] == quote_ids, \
+            "Test Failed: incorrect quote orders for {}".format(account_id)
+    pass
@@ -0,0 +1,48 @@
+from python.src.ids import BlockIdGenerator
+from python.src.ids import IdSequence
+from multiprocessing import Process, Queue
+import pytest
+
+
+def take_ids(sequence, block_size, n, queue):
+    id_generator = BlockIdGenerator(sequence, block_size=block_size)
+    queue.put([id_generator() for _ in range(n)])
+
+
+def test_id_sequence_reserves_disjoint_blocks():
+    sequence = IdSequence(start=1)
+
+    assert sequence.reserve(10) == range(1, 11), "Test Failed: incorrect first block"
+    assert sequence.reserve(5) == range(11, 16), "Test Failed: incorrect second block"
+    assert sequence.peek() == 16, "Test Failed: incorrect next id"
+    with pytest.raises(ValueError):
+        sequence.reserve(0)
+    pass
+
+
+def test_block_id_generator_reserves_a_new_block_when_exhausted():
+    sequence = IdSequence()
+    first = BlockIdGenerator(sequence, block_size=3)
+    second = BlockIdGenerator(sequence, block_size=3)
+
+    ids = [first(), second(), first(), first(), first()]
+
+    assert ids == [1, 4, 2, 3, 7], "Test Failed: each generator should draw from its own blocks"
+    pass
+
+
+def test_block_id_generator_is_unique_across_processes():
+    sequence = IdSequence()
+    queue = Queue()
+    workers = [Process(target=take_ids, args=(sequence, 100, 1000, queue)) for _ in range(3)]
+    for worker in workers:
+        worker.start()
+    batches = [queue.get(timeout=30) for _ in workers]
+    for worker in workers:
+        worker.join()
+    ids = [i for batch in batches for i in batch]
+
+    assert len(set(ids)) == 3000, "Test Failed: no id should be handed out twice"
+    assert all(batch == sorted(batch) for batch in batches), "Test Failed: ids should increase in each worker"
+    assert sequence.peek() == 3001, "Test Failed: every reserved id should be used"
+    pass
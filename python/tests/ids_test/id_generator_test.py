@@ -0,0 +1,25 @@
+from python.src.ids import IdGenerator
+from concurrent.futures import ThreadPoolExecutor
+
+
+def test_id_generator_is_monotonic():
+    id_generator = IdGenerator(start=5)
+    ids = [id_generator() for _ in range(10)]
+
+    assert ids == list(range(5, 15)), "Test Failed: ids should increase by one from start"
+    pass
+
+
+def test_id_generator_is_unique_across_threads():
+    id_generator = IdGenerator()
+
+    def take(n):
+        return [id_generator() for _ in range(n)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        batches = list(executor.map(take, [10000] * 4))
+    ids = [i for batch in batches for i in batch]
+
+    assert len(set(ids)) == 40000, "Test Failed: no id should be handed out twice"
+    assert all(batch == sorted(batch) for batch in batches), "Test Failed: ids should increase in each thread"
+    pass
@@ -0,0 +1,135 @@
+from python.src.instrument_queues import InstrumentQueues
+from python.src.orders import LimitOrder
+from python.src.orders import MassCancelOrder
+from python.src.enums import OrderDirection
+from python.src.enums import SchedulingPolicy
+import pytest
+import threading
+
+
+def make_orders(instrument_id, n):
+    return [LimitOrder(instrument_id=instrument_id,
+                       order_direction=OrderDirection.buy,
+                       quantity=100,
+                       price=10) for _ in range(n)]
+
+
+def drain(queues):
+    batches = []
+    while queues:
+        instrument_id, batch = queues.next_batch()
+        batches.append((instrument_id, len(batch)))
+    return batches
+
+
+def test_instrument_queues_init():
+    queues = InstrumentQueues()
+
+    assert not queues, "Test Failed: queues should be empty"
+    assert len(queues) == 0, "Test Failed: queues should be empty"
+    with pytest.raises(ValueError):
+        InstrumentQueues(policy=SchedulingPolicy.test)
+    pass
+
+
+def test_instrument_queues_round_robin():
+    queues = InstrumentQueues(batch_size=2)
+    for order in make_orders("AAPL", 5) + make_orders("MSFT", 1):
+        queues.append(order)
+
+    assert len(queues) == 6, "Test Failed: there should be 6 orders queued"
+    assert queues.backlog() == {"AAPL": 5, "MSFT": 1}, "Test Failed: incorrect backlog"
+    assert drain(queues) == [("AAPL", 2), ("MSFT", 1), ("AAPL", 2), ("AAPL", 1)], \
+        "Test Failed: instruments should take turns"
+    assert queues.max_backlog == {"AAPL": 5, "MSFT": 1}, "Test Failed: incorrect max backlog"
+    assert queues.dequeued == queues.enqueued, "Test Failed: every order should be dequeued"
+    pass
+
+
+def test_instrument_queues_keep_arrival_order():
+    queues = InstrumentQueues(batch_size=2)
+    orders = make_orders("AAPL", 5)
+    for order in orders:
+        queues.append(order)
+
+    drained = []
+    while queues:
+        drained += queues.next_batch()[1]
+    assert drained == orders, "Test Failed: orders should leave in arrival order"
+    pass
+
+
+def test_instrument_queues_weighted():
+    queues = InstrumentQueues(policy=SchedulingPolicy.weighted,
+                              batch_size=2,
+                              weights={"AAPL": 3})
+    for order in make_orders("AAPL", 8) + make_orders("MSFT", 4):
+        queues.append(order)
+
+    assert drain(queues) == [("AAPL", 6), ("MSFT", 2), ("AAPL", 2), ("MSFT", 2)], \
+        "Test Failed: batches should be scaled by weight"
+    pass
+
+
+def test_instrument_queues_deadline():
+    now = [0.]
+    queues = InstrumentQueues(policy=SchedulingPolicy.deadline,
+                              batch_size=2,
+                              deadlines={"AAPL": 10., "MSFT": 1.},
+                              clock=lambda: now[0])
+    for order in make_orders("AAPL", 4):
+        queues.append(order)
+    now[0] = 5.
+    for order in make_orders("MSFT", 1):
+        queues.append(order)
+
+    assert queues.oldest_wait("AAPL") == 5., "Test Failed: incorrect wait"
+    assert drain(queues) == [("MSFT", 1), ("AAPL", 2), ("AAPL", 2)], \
+        "Test Failed: the instrument due first should go first"
+    assert queues.oldest_wait("AAPL") == 0., "Test Failed: an empty queue has no wait"
+    pass
+
+
+def test_instrument_queues_hold_engine_wide_mass_cancels_as_barriers():
+    for policy in [SchedulingPolicy.round_robin, SchedulingPolicy.deadline]:
+        queues = InstrumentQueues(policy=policy, batch_size=2, clock=lambda: 0.)
+        for order in make_orders("AAPL", 3) + make_orders("MSFT", 1):
+            queues.append(order)
+        queues.append(MassCancelOrder(account_id="a"))
+        for order in make_orders("AAPL", 2) + make_orders("IBM", 1):
+            queues.append(order)
+
+        assert len(queues) == 8, "Test Failed: the mass cancel should be queued"
+        assert drain(queues) == [("AAPL", 2), ("MSFT", 1), ("AAPL", 1), (None, 1), ("IBM", 1), ("AAPL", 2)], \
+            "Test Failed: the mass cancel should come after every order queued before it, and before the rest"
+    queues = InstrumentQueues()
+    queues.append(MassCancelOrder(account_id="a"))
+    assert drain(queues) == [(None, 1)], "Test Failed: a mass cancel of an empty queue should go straight out"
+    pass
+
+
+def test_instrument_queues_append_while_draining():
+    queues = InstrumentQueues(batch_size=8)
+    orders = {instrument_id: make_orders(instrument_id, 5000) for instrument_id in ["AAPL", "MSFT", "IBM"]}
+    received = {instrument_id: [] for instrument_id in orders}
+
+    def produce(instrument_id):
+        for order in orders[instrument_id]:
+            queues.append(order)
+
+    producers = [threading.Thread(target=produce, args=(instrument_id,)) for instrument_id in orders]
+    for producer in producers:
+        producer.start()
+    while any(producer.is_alive() for producer in producers) or queues:
+        if queues:
+            instrument_id, batch = queues.next_batch()
+            received[instrument_id].extend(batch)
+    for producer in producers:
+        producer.join()
+
+    assert len(queues) == 0, "Test Failed: every order should have been taken"
+    for instrument_id, batch in received.items():
+        assert batch == orders[instrument_id], "Test Failed: {} lost or reordered orders".format(instrument_id)
+        assert queues.enqueued[instrument_id] == queues.dequeued[instrument_id] == 5000, \
+            "Test Failed: incorrect counts"
+    pass
@@ -0,0 +1,89 @@
+from python.src.ipc import RingBuffer
+from python.src.codec import ORDER, records_to_orders
+from python.src.matching_engine import MatchingEngine
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from multiprocessing import Process
+import numpy as np
+import time
+
+num_orders = 100_000
+batch_size = 64
+
+
+def get_records(n):
+    rng = np.random.default_rng(0)
+    records = np.zeros(n, dtype=ORDER)
+    records["order_type"] = OrderType.limit.value
+    records["order_direction"] = rng.choice([OrderDirection.buy.value, OrderDirection.sell.value], n)
+    records["instrument_id"] = b"AAPL"
+    records["quantity"] = 100 + rng.uniform(-50, 50, n)
+    records["price"] = 40 + rng.uniform(-2.5, 2.5, n)
+    return records
+
+
+def gateway(name, n, batch_size, wait_for_empty):
+    """ A producer process writing batches of limit order records.
+
+    If wait_for_empty, each batch is only sent once the engine has taken the last,
+    so latencies exclude time spent queueing behind earlier batches.
+    """
+    ring_buffer = RingBuffer(ORDER, name=name, create=False)
+    records = get_records(n)
+    sent = 0
+    while sent < n:
+        if wait_for_empty and len(ring_buffer):
+            time.sleep(0)
+            continue
+        batch = records[sent:sent + batch_size]
+        batch["sent_ns"] = time.perf_counter_ns()
+        written = ring_buffer.put(batch)
+        sent += written
+        if written < len(batch):
+            time.sleep(0)
+    ring_buffer.close()
+
+
+def run(wait_for_empty):
+    """ Decode, queue and match every record, timing each from the gateway write to the end of matching."""
+
+    ring_buffer = RingBuffer(ORDER, capacity=4096)
+    matching_engine = MatchingEngine()
+    latencies = np.zeros(num_orders, dtype=np.int64)
+    producer = Process(target=gateway, args=(ring_buffer.name, num_orders, batch_size, wait_for_empty))
+    producer.start()
+    start = time.perf_counter()
+    received = 0
+    while received < num_orders:
+        records = ring_buffer.get(batch_size)
+        n = len(records)
+        if not n:
+            time.sleep(0)
+            continue
+        for order in records_to_orders(records):
+            matching_engine.add_order(order)
+        matching_engine.match()
+        latencies[received:received + n] = time.perf_counter_ns() - records["sent_ns"]
+        received += n
+    elapsed = time.perf_counter() - start
+    producer.join()
+    ring_buffer.close()
+    ring_buffer.unlink()
+    return elapsed, latencies
+
+
+def report(name, elapsed, latencies):
+    print(f"{name}: {num_orders / elapsed:,.0f} orders per second, gateway to matched latency "
+          f"p50 {np.percentile(latencies, 50) / 1e3:.1f} us, "
+          f"p99 {np.percentile(latencies, 99) / 1e3:.1f} us, max {latencies.max() / 1e3:.1f} us")
+
+
+# Saturated: the gateway writes as fast as the ring accepts, so latency includes queueing
+report("Saturated", *run(wait_for_empty=False))
+# One batch in flight at a time: latency is transport, decode and matching
+report("Unloaded ", *run(wait_for_empty=True))
+
+records = get_records(num_orders)
+start = time.perf_counter()
+records_to_orders(records)
+print(f"Decode: {1e9 * (time.perf_counter() - start) / num_orders:.0f} ns per record")
@@ -0,0 +1,82 @@
+from python.src.ipc import RingBuffer, OrderIngress
+from python.src.codec import ORDER, orders_to_records
+from python.src.matching_engine import MatchingEngine
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+from multiprocessing import Process
+import numpy as np
+import pytest
+
+
+def make_records(start, n):
+    records = np.zeros(n, dtype=ORDER)
+    records["order_id"] = np.arange(start, start + n)
+    return records
+
+
+def produce(name, n):
+    ring_buffer = RingBuffer(ORDER, name=name, create=False)
+    sent = 0
+    while sent < n:
+        sent += ring_buffer.put(make_records(sent, min(7, n - sent)))
+    ring_buffer.close()
+
+
+def test_ring_buffer_requires_power_of_two_capacity():
+    with pytest.raises(ValueError):
+        RingBuffer(ORDER, capacity=12)
+    pass
+
+
+def test_ring_buffer_wraps_around():
+    ring_buffer = RingBuffer(ORDER, capacity=8)
+    try:
+        assert ring_buffer.put(make_records(0, 6)) == 6, "Test Failed: all records should fit"
+        assert list(ring_buffer.get(4)["order_id"]) == [0, 1, 2, 3], "Test Failed: incorrect first batch"
+        assert ring_buffer.put(make_records(6, 10)) == 6, "Test Failed: only free slots should be written"
+        assert len(ring_buffer) == 8, "Test Failed: the ring should be full"
+        assert ring_buffer.put(make_records(12, 1)) == 0, "Test Failed: a full ring takes nothing"
+        assert list(ring_buffer.get(100)["order_id"]) == list(range(4, 12)), \
+            "Test Failed: records should wrap around in order"
+        assert len(ring_buffer.get(100)) == 0, "Test Failed: the ring should be empty"
+    finally:
+        ring_buffer.close()
+        ring_buffer.unlink()
+    pass
+
+
+def test_ring_buffer_across_processes():
+    n = 1000
+    ring_buffer = RingBuffer(ORDER, capacity=16)
+    try:
+        producer = Process(target=produce, args=(ring_buffer.name, n))
+        producer.start()
+        received = []
+        while len(received) < n and (producer.is_alive() or len(ring_buffer)):
+            received += ring_buffer.get(5)["order_id"].tolist()
+        producer.join()
+        assert received == list(range(n)), "Test Failed: every record should arrive once, in order"
+    finally:
+        ring_buffer.close()
+        ring_buffer.unlink()
+    pass
+
+
+def test_order_ingress_feeds_matching_engine():
+    orders = [LimitOrder("AAPL", OrderDirection.buy, 100, 10),
+              LimitOrder("AAPL", OrderDirection.sell, 100, 10)]
+    ring_buffer = RingBuffer(ORDER, capacity=8)
+    try:
+        ring_buffer.put(orders_to_records(orders))
+        matching_engine = MatchingEngine()
+        matching_engine.add_ingress(OrderIngress(ring_buffer, batch_size=1))
+
+        assert matching_engine.poll_ingress() == 1, "Test Failed: one record per batch"
+        assert matching_engine.poll_ingress() == 1, "Test Failed: one record per batch"
+        assert matching_engine.poll_ingress() == 0, "Test Failed: the ring should be empty"
+        matching_engine.match()
+        assert len(matching_engine.order_books["AAPL"].trades) == 1, "Test Failed: the orders should trade"
+    finally:
+        ring_buffer.close()
+        ring_buffer.unlink()
+    pass
@@ -0,0 +1,37 @@
+from python.src.market_data import TradeStatistics
+from python.src.codec import TRADE
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+import numpy as np
+import time
+
+n = 1_000_000
+instruments = [f"S{i}".encode() for i in range(500)]
+rng = np.random.default_rng(0)
+trades = np.zeros(n, dtype=TRADE)
+trades["timestamp"] = np.sort(rng.integers(0, 6 * 3600 * 10 ** 9, n))
+trades["instrument_id"] = np.array(instruments)[rng.integers(0, len(instruments), n)]
+trades["price"] = 100 + rng.normal(0, 1, n)
+trades["quantity"] = rng.integers(1, 100, n)
+
+bids = {i: LimitOrder(i.decode(), OrderDirection.buy, 1, 0) for i in instruments}
+rows = list(zip(trades["timestamp"].tolist(), trades["instrument_id"].tolist(),
+                trades["price"].tolist(), trades["quantity"].tolist()))
+trade_statistics = TradeStatistics()
+start = time.perf_counter()
+for timestamp, instrument_id, price, quantity in rows:
+    bid = bids[instrument_id]
+    trade_statistics(timestamp, price, quantity, bid, bid)
+live = time.perf_counter() - start
+print(f"live updates: {1e9 * live / n:.0f}ns per trade")
+
+start = time.perf_counter()
+for _ in range(100):
+    summary = trade_statistics.summary()
+print(f"summary of {len(summary)} instruments: {1e3 * (time.perf_counter() - start) / 100:.2f}ms")
+
+trade_statistics = TradeStatistics()
+start = time.perf_counter()
+trade_statistics.backfill(trades)
+backfill = time.perf_counter() - start
+print(f"backfill of {n:,} trades: {1e3 * backfill:.0f}ms, {live / backfill:.1f}x faster than replaying them")
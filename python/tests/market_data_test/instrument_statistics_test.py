@@ -0,0 +1,74 @@
+from python.src.market_data import InstrumentStatistics
+import numpy as np
+import math
+import pytest
+
+
+def test_instrument_statistics_builds_bars():
+    statistics = InstrumentStatistics(bar_interval=10, window=3, max_bars=5)
+    for timestamp, price, quantity in [(1, 10, 1), (3, 12, 2), (5, 9, 1), (12, 11, 4), (35, 13, 1)]:
+        statistics.update(timestamp, price, quantity)
+
+    bars = statistics.bar_history()
+    assert bars["start"].tolist() == [0, 10, 20], "Test Failed: bars should be aligned to the interval"
+    assert bars[0].tolist()[1:] == (10, 12, 9, 9, 4, 43), "Test Failed: incorrect first bar"
+    assert bars[2].tolist()[1:] == (11, 11, 11, 11, 0, 0), "Test Failed: a bar without trades should be flat"
+    assert (statistics.bar_start, statistics.bar_open, statistics.bar_volume) == (30, 13, 1), \
+        "Test Failed: incorrect current bar"
+    assert statistics.vwap == pytest.approx(100 / 9), "Test Failed: incorrect session vwap"
+    assert statistics.last_price == 13, "Test Failed: incorrect last price"
+    pass
+
+
+def test_instrument_statistics_rolls_the_window():
+    statistics = InstrumentStatistics(bar_interval=10, window=3)
+    closes = [10, 11, 10.5, 12, 11.5, 13]
+    for i, close in enumerate(closes):
+        statistics.update(10 * i, close, i + 1)
+    statistics.advance(60)
+
+    log_returns = np.diff(np.log(closes))[-3:]
+    assert len(statistics.window_bars) == 3, "Test Failed: the window should hold 3 bars"
+    assert statistics.rolling_vwap == pytest.approx(np.dot(closes[-3:], [4, 5, 6]) / 15), \
+        "Test Failed: incorrect rolling vwap"
+    assert statistics.rolling_volatility == pytest.approx(np.std(log_returns, ddof=1)), \
+        "Test Failed: incorrect rolling volatility"
+    assert math.isnan(InstrumentStatistics().rolling_volatility), "Test Failed: no volatility without returns"
+    pass
+
+
+def test_instrument_statistics_caps_bars_without_trades():
+    statistics = InstrumentStatistics(bar_interval=10, window=2, max_bars=4)
+    statistics.update(0, 10, 1)
+    statistics.update(10 ** 9, 12, 1)
+
+    assert len(statistics.bars) == 4, "Test Failed: the history should be full"
+    assert statistics.bars[-1][0] == 10 ** 9 - 10, "Test Failed: the bars should lead up to the trade"
+    assert statistics.window_volume == 0, "Test Failed: the window should only hold empty bars"
+    pass
+
+
+def test_instrument_statistics_backfill_matches_live_updates():
+    rng = np.random.default_rng(0)
+    times = np.sort(rng.integers(0, 2_000, 500))
+    times[250:] += 5_000
+    prices = 100 + np.cumsum(rng.normal(0, 0.1, 500))
+    quantities = rng.integers(1, 100, 500).astype(float)
+
+    for window, max_bars in [(5, 20), (50, 10), (1000, 1000)]:
+        live = InstrumentStatistics(bar_interval=50, window=window, max_bars=max_bars)
+        for timestamp, price, quantity in zip(times.tolist(), prices.tolist(), quantities.tolist()):
+            live.update(timestamp, price, quantity)
+        backfilled = InstrumentStatistics(bar_interval=50, window=window, max_bars=max_bars)
+        backfilled.backfill(times, prices, quantities)
+
+        np.testing.assert_allclose(backfilled.bar_history().tolist(), live.bar_history().tolist())
+        for name in ("rolling_vwap", "rolling_volatility", "vwap", "bar_high", "bar_low", "bar_volume"):
+            assert getattr(backfilled, name) == pytest.approx(getattr(live, name)), \
+                "Test Failed: backfill should match live updates for " + name
+        assert (backfilled.bar_start, backfilled.trades, backfilled.window_returns) == \
+            (live.bar_start, live.trades, live.window_returns), "Test Failed: incorrect backfilled state"
+
+    with pytest.raises(ValueError):
+        live.backfill(times, prices, quantities)
+    pass
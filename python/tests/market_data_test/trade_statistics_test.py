@@ -0,0 +1,50 @@
+from python.src.market_data import TradeStatistics
+from python.src.matching_engine import MatchingEngine
+from python.src.orders import LimitOrder
+from python.src.trades import TradeBuffer
+from python.src.codec import TRADE
+from python.src.enums import OrderDirection
+import numpy as np
+import pytest
+
+
+def test_trade_statistics_follows_engine_trades():
+    now = [0]
+    trade_buffer = TradeBuffer()
+    trade_statistics = TradeStatistics(bar_interval=10, trade_sink=trade_buffer)
+    matching_engine = MatchingEngine(trade_sink=trade_statistics, clock=lambda: now[0])
+
+    for instrument_id, price in [("AAPL", 10), ("MSFT", 20)]:
+        matching_engine.add_order(LimitOrder(instrument_id, OrderDirection.buy, 100, price))
+        matching_engine.add_order(LimitOrder(instrument_id, OrderDirection.sell, 40, price))
+    matching_engine.match()
+    now[0] = 15
+    matching_engine.add_order(LimitOrder("AAPL", OrderDirection.sell, 60, 10))
+    matching_engine.match()
+
+    aapl = trade_statistics.statistics("AAPL")
+    assert aapl.volume == 100 and aapl.vwap == 10, "Test Failed: incorrect session statistics"
+    assert len(aapl.bars) == 1 and aapl.bar_volume == 60, "Test Failed: the second trade should open a new bar"
+    assert len(trade_buffer) == 3, "Test Failed: trades should be passed on to the chained sink"
+
+    summary = trade_statistics.summary()
+    assert summary["instrument_id"].tolist() == [b"AAPL", b"MSFT"], "Test Failed: incorrect instruments"
+    assert summary["session_volume"].tolist() == [100, 40], "Test Failed: incorrect volumes"
+    pass
+
+
+def test_trade_statistics_backfills_from_a_trade_journal():
+    trades = np.zeros(4, dtype=TRADE)
+    trades["timestamp"] = [1, 2, 12, 13]
+    trades["instrument_id"] = [b"AAPL", b"MSFT", b"AAPL", b"AAPL"]
+    trades["price"] = [10, 20, 11, 12]
+    trades["quantity"] = [1, 2, 3, 4]
+
+    trade_statistics = TradeStatistics(bar_interval=10)
+    trade_statistics.backfill(trades)
+
+    aapl = trade_statistics.statistics("AAPL")
+    assert aapl.vwap == pytest.approx((10 + 33 + 48) / 8), "Test Failed: incorrect backfilled vwap"
+    assert (aapl.bar_open, aapl.bar_close, aapl.bar_volume) == (11, 12, 7), "Test Failed: incorrect current bar"
+    assert trade_statistics.statistics("MSFT").last_price == 20, "Test Failed: incorrect MSFT statistics"
+    pass
@@ -0,0 +1,48 @@
+from python.src.matching_engine import MatchingEngine
+from python.src.orders import LimitOrder
+from python.src.orders import CancelOrder
+from python.src.orders import MassCancelOrder
+from python.src.enums import OrderDirection
+import numpy as np
+import time
+
+n = 200_000
+accounts = 20
+rng = np.random.default_rng(0)
+distances = np.round(0.01 + np.abs(rng.normal(0, 2, n)), 2).tolist()
+sides = rng.integers(0, 2, n).tolist()
+
+
+def build():
+    """ A book of n resting orders spread evenly over the accounts, bids below 100 and asks above."""
+
+    matching_engine = MatchingEngine(max_history=0)
+    orders = []
+    for i, (distance, side) in enumerate(zip(distances, sides)):
+        direction = OrderDirection.buy if side else OrderDirection.sell
+        price = 100 - distance if side else 100 + distance
+        orders.append(LimitOrder("AAPL", direction, 10, price, account_id=f"A{i % accounts}"))
+    for order in orders:
+        matching_engine.add_order(order)
+    matching_engine.match()
+    return matching_engine, [o for o in orders if o.account_id == "A0"]
+
+
+matching_engine, maker_orders = build()
+start = time.perf_counter()
+for order in maker_orders:
+    matching_engine.add_order(CancelOrder("AAPL", order.order_id, order.order_direction))
+matching_engine.match()
+single = time.perf_counter() - start
+print(f"{len(maker_orders):,} single cancels: {1e3 * single:.1f}ms")
+
+matching_engine, maker_orders = build()
+start = time.perf_counter()
+cancelled = matching_engine.mass_cancel(MassCancelOrder(account_id="A0"))
+mass = time.perf_counter() - start
+print(f"one mass cancel of {cancelled:,} orders: {1e3 * mass:.1f}ms, {single / mass:.1f}x faster")
+
+matching_engine, _ = build()
+start = time.perf_counter()
+cancelled = matching_engine.mass_cancel(MassCancelOrder("AAPL", order_direction=OrderDirection.buy))
+print(f"one mass cancel of a whole side of {cancelled:,} orders: {1e3 * (time.perf_counter() - start):.1f}ms")
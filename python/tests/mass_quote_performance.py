@@ -0,0 +1,64 @@
+from python.src.matching_engine import MatchingEngine
+from python.src.orders import LimitOrder
+from python.src.orders import CancelOrder
+from python.src.orders import Quote
+from python.src.orders import MassQuote
+from python.src.enums import OrderDirection
+from typing import Dict, Tuple
+import numpy as np
+import time
+
+instruments = [f"S{i}" for i in range(50)]
+depth = 2_000
+rounds = 200
+rng = np.random.default_rng(0)
+# Each round moves the maker's quote by at most a tick, and changes its size half the time.
+moves = np.round(rng.integers(-1, 2, (rounds, len(instruments))) * 0.01, 2)
+sizes = np.where(rng.random((rounds, len(instruments))) < 0.5, 100, 80).tolist()
+mids = (100 + np.cumsum(moves, axis=0)).tolist()
+
+
+def build():
+    """ A book per instrument of depth resting orders from other accounts, away from the maker's quotes."""
+
+    matching_engine = MatchingEngine(max_history=0)
+    for instrument_id in instruments:
+        for i in range(depth):
+            distance = 0.5 + 0.01 * (i // 2)
+            if i % 2:
+                matching_engine.add_order(LimitOrder(instrument_id, OrderDirection.buy, 10, 100 - distance))
+            else:
+                matching_engine.add_order(LimitOrder(instrument_id, OrderDirection.sell, 10, 100 + distance))
+    matching_engine.match()
+    return matching_engine
+
+
+matching_engine = build()
+resting: Dict[str, Tuple[LimitOrder, LimitOrder]] = {}
+start = time.perf_counter()
+for mid, size in zip(mids, sizes):
+    for instrument_id, price, quantity in zip(instruments, mid, size):
+        previous = resting.get(instrument_id)
+        if previous is not None:
+            for order in previous:
+                matching_engine.add_order(CancelOrder(instrument_id, order.order_id, order.order_direction))
+        bid = LimitOrder(instrument_id, OrderDirection.buy, quantity, round(price - 0.05, 2), account_id="maker")
+        ask = LimitOrder(instrument_id, OrderDirection.sell, quantity, round(price + 0.05, 2), account_id="maker")
+        matching_engine.add_order(bid)
+        matching_engine.add_order(ask)
+        resting[instrument_id] = (bid, ask)
+    matching_engine.match()
+separate = time.perf_counter() - start
+updates = rounds * len(instruments)
+print(f"{updates:,} requotes as cancels and new orders: {1e6 * separate / updates:.1f}us each")
+
+matching_engine = build()
+start = time.perf_counter()
+for mid, size in zip(mids, sizes):
+    matching_engine.mass_quote(MassQuote("maker", [Quote(instrument_id, round(price - 0.05, 2), quantity,
+                                                         round(price + 0.05, 2), quantity)
+                                                   for instrument_id, price, quantity
+                                                   in zip(instruments, mid, size)]))
+    matching_engine.match()
+mass = time.perf_counter() - start
+print(f"{updates:,} requotes in mass quotes: {1e6 * mass / updates:.1f}us each, {separate / mass:.1f}x faster")
@@ -2,9 +2,22 @@ from python.src.matching_engine import MatchingEngine
 from python.src.order_book import OrderBook
 from python.src.orders import LimitOrder
 from python.src.orders import MarketOrder
+from python.src.orders import MassCancelOrder
+from python.src.orders import CancelOrder
+from python.src.orders import Quote
+from python.src.orders import MassQuote
 from python.src.enums import OrderDirection
 from python.src.enums import OrderDirection
 from python.src.enums import OrderStatus
+from python.src.enums import MatchingAlgorithm
+from python.src.enums import EventType
+from python.src.events import NO_ORDER
+from python.src.events import EventBatch
+from python.src.risk import RiskCheck
+from python.src.risk import RiskLimits
+from python.tests.events_test.recording_sink import RecordingSink
+from python.src.instrument_queues import InstrumentQueues
+from python.src.symbol_registry import SymbolRegistry
 from python.src.exceptions import InvalidOrderDirectionException
 import pytest
 
@@ -209,3 +222,346 @@ def test_matching_engine_can_add_and_run_multiple_instruments():
         order_book.complete_orders) == 10, "Test Failed: complete_orders should have all orders"
     assert not order_book.attempt_match, "Test Failed: attempt_match should be False"
     pass
+
+
+def test_matching_engine_creates_books_with_configured_algorithm():
+    limit_orders = [LimitOrder(instrument_id=instrument_id,
+                               order_direction=OrderDirection.buy,
+                               quantity=100,
+                               price=10) for instrument_id in ["AAPL", "ES"]]
+
+    matching_engine = MatchingEngine(matching_algorithms={"ES": MatchingAlgorithm.pro_rata})
+    for order in limit_orders:
+        matching_engine.add_order(order)
+    matching_engine.match()
+
+    assert matching_engine.order_books["AAPL"].matching_algorithm == MatchingAlgorithm.price_time, \
+        "Test Failed: AAPL should default to price-time"
+    assert matching_engine.order_books["ES"].matching_algorithm == MatchingAlgorithm.pro_rata, \
+        "Test Failed: ES should be pro-rata"
+    pass
+
+
+def test_matching_engine_can_run_an_opening_auction():
+    instrument_id = "AAPL"
+    quantity = 100
+    price = 10
+    limit_orders = [LimitOrder(instrument_id=instrument_id,
+                               order_direction=OrderDirection.buy if i % 2 else OrderDirection.sell,
+                               quantity=quantity,
+                               price=price + (i if i % 2 else -i)) for i in range(10)]
+
+    matching_engine = MatchingEngine()
+    matching_engine.start_auction()
+    for order in limit_orders:
+        matching_engine.add_order(order)
+    matching_engine.match()
+    order_book = matching_engine.order_books[instrument_id]
+
+    assert order_book.in_auction, "Test Failed: new books should start in auction"
+    assert not order_book.trades, "Test Failed: nothing should trade in auction"
+
+    results = matching_engine.uncross()
+    clearing_price, volume = results[instrument_id]
+
+    assert volume == 500, "Test Failed: every order should trade"
+    assert all(t.price == clearing_price for t in order_book.trades), \
+        "Test Failed: every trade should be at the clearing price"
+    assert order_book.best_bid is None, "Test Failed: best_bid should be empty"
+    assert order_book.best_ask is None, "Test Failed: best_ask should be empty"
+    assert not matching_engine.in_auction, "Test Failed: the engine should leave the auction"
+    pass
+
+
+def test_matching_engine_reports_events_per_engine_and_instrument():
+    engine_sink = RecordingSink()
+    msft_sink = RecordingSink()
+    orders = [LimitOrder(instrument_id=instrument_id,
+                         order_direction=OrderDirection.buy,
+                         quantity=100,
+                         price=10) for instrument_id in ["AAPL", "MSFT"]]
+
+    matching_engine = MatchingEngine()
+    matching_engine.add_event_sink(engine_sink)
+    matching_engine.add_event_sink(msft_sink, instrument_id="MSFT")
+    for order in orders:
+        matching_engine.add_order(order)
+    matching_engine.match()
+
+    assert engine_sink.events == [(EventType.accepted, orders[0].order_id),
+                                  (EventType.accepted, orders[1].order_id)], \
+        "Test Failed: the engine sink should see every instrument"
+    assert msft_sink.events == [(EventType.accepted, orders[1].order_id)], \
+        "Test Failed: the instrument sink should only see MSFT"
+    assert engine_sink.flushes == 1, "Test Failed: sinks should be flushed after the batch"
+    pass
+
+
+def test_matching_engine_rejects_prices_off_tick():
+    event_sink = RecordingSink()
+    order = LimitOrder("AAPL", OrderDirection.buy, 100, 10.3)
+
+    matching_engine = MatchingEngine(tick_size=0.25)
+    matching_engine.add_event_sink(event_sink)
+    matching_engine.add_order(order)
+    matching_engine.add_order(Quote("AAPL", 10, 100, 10.6, 100, account_id="maker"))
+    matching_engine.match()
+
+    assert order.status == OrderStatus.rejected, "Test Failed: the order should be rejected"
+    assert event_sink.events == [(EventType.rejected, order.order_id), (EventType.rejected, NO_ORDER)], \
+        "Test Failed: both the order and the quote should be rejected"
+    assert matching_engine.order_books["AAPL"].best_bid is None, "Test Failed: nothing should rest"
+    pass
+
+
+def test_matching_engine_rejects_invalid_orders():
+    event_sink = RecordingSink()
+    order = LimitOrder(instrument_id="AAPL",
+                       order_direction=OrderDirection.test,
+                       quantity=100,
+                       price=10)
+
+    matching_engine = MatchingEngine()
+    matching_engine.add_event_sink(event_sink)
+    matching_engine.add_order(order)
+    matching_engine.match()
+
+    assert order.status == OrderStatus.rejected, "Test Failed: the order should be rejected"
+    assert event_sink.events == [(EventType.rejected, order.order_id)], "Test Failed: incorrect events"
+    pass
+
+
+def test_matching_engine_applies_risk_checks():
+    event_sink = RecordingSink()
+    orders = [LimitOrder(instrument_id="AAPL",
+                         order_direction=OrderDirection.buy,
+                         quantity=quantity,
+                         price=10,
+                         account_id="MM1") for quantity in [100, 1000, 100]]
+
+    matching_engine = MatchingEngine(risk_check=RiskCheck(RiskLimits(max_order_quantity=500,
+                                                                     max_position=250)))
+    matching_engine.add_event_sink(event_sink)
+    for order in orders:
+        matching_engine.add_order(order)
+    matching_engine.match()
+
+    assert [o.status for o in orders] == [OrderStatus.live, OrderStatus.rejected, OrderStatus.live], \
+        "Test Failed: only the large order should be rejected"
+    assert (EventType.rejected, orders[1].order_id) in event_sink.events, \
+        "Test Failed: the rejection should be reported"
+
+    order = LimitOrder(instrument_id="AAPL",
+                       order_direction=OrderDirection.buy,
+                       quantity=100,
+                       price=10,
+                       account_id="MM1")
+    matching_engine.add_order(order)
+    matching_engine.match()
+    assert order.status == OrderStatus.rejected, "Test Failed: the position limit should be breached"
+    pass
+
+
+def test_matching_engine_does_not_hold_quiet_instruments_behind_a_burst():
+    matching_engine = MatchingEngine(order_queues=InstrumentQueues(batch_size=10))
+    for i in range(100):
+        matching_engine.add_order(LimitOrder(instrument_id="AAPL",
+                                             order_direction=OrderDirection.buy,
+                                             quantity=100,
+                                             price=10 + i % 5))
+    quiet_order = LimitOrder(instrument_id="MSFT",
+                             order_direction=OrderDirection.buy,
+                             quantity=100,
+                             price=10)
+    matching_engine.add_order(quiet_order)
+
+    assert matching_engine.orders.backlog() == {"AAPL": 100, "MSFT": 1}, "Test Failed: incorrect backlog"
+    matching_engine.match()
+
+    position = list(matching_engine.processed_orders).index(quiet_order)
+    assert position == 10, "Test Failed: the quiet order should follow one batch of the burst"
+    assert len(matching_engine.processed_orders) == 101, "Test Failed: every order should be processed"
+    pass
+
+
+def test_matching_engine_preloads_books_by_symbol_id():
+    matching_engine = MatchingEngine(symbols=SymbolRegistry(["AAPL", "MSFT"]))
+    matching_engine.preload(["MSFT", "TSLA"])
+
+    assert [matching_engine.symbols.symbol(i) for i in range(3)] == ["AAPL", "MSFT", "TSLA"], \
+        "Test Failed: instruments should be interned in order"
+    assert all(matching_engine.books[matching_engine.symbols[i]] is matching_engine.order_books[i]
+               for i in ["AAPL", "MSFT", "TSLA"]), "Test Failed: books should be indexed by symbol id"
+
+    orders = [LimitOrder(instrument_id="TSLA",
+                         order_direction=direction,
+                         quantity=100,
+                         price=10) for direction in [OrderDirection.buy, OrderDirection.sell]]
+    for order in orders:
+        matching_engine.add_order(order)
+    matching_engine.match()
+
+    assert len(matching_engine.books) == 3, "Test Failed: no book should be created while matching"
+    assert len(matching_engine.books[2].trades) == 1, "Test Failed: the preloaded book should match"
+    pass
+
+
+def test_matching_engine_rejects_unknown_instruments_when_frozen():
+    event_sink = RecordingSink()
+    order = LimitOrder(instrument_id="MSFT",
+                       order_direction=OrderDirection.buy,
+                       quantity=100,
+                       price=10)
+
+    matching_engine = MatchingEngine(symbols=SymbolRegistry(["AAPL"], frozen=True))
+    matching_engine.add_event_sink(event_sink)
+    matching_engine.add_order(order)
+    matching_engine.match()
+
+    assert order.status == OrderStatus.rejected, "Test Failed: the order should be rejected"
+    assert event_sink.events == [(EventType.rejected, order.order_id)], "Test Failed: incorrect events"
+    assert not matching_engine.orders, "Test Failed: the order should not be queued"
+    assert list(matching_engine.order_books) == ["AAPL"], "Test Failed: no book should be created"
+    pass
+
+
+def test_matching_engine_rejects_unknown_cancels_when_frozen():
+    event_sink = RecordingSink()
+    batches = []
+    event_batch = EventBatch(lambda *columns: batches.append([c.tolist() for c in columns]))
+    cancel = CancelOrder("MSFT", 1, OrderDirection.buy)
+
+    matching_engine = MatchingEngine(symbols=SymbolRegistry(["AAPL"], frozen=True))
+    matching_engine.add_event_sink(event_sink)
+    matching_engine.add_event_sink(event_batch)
+    matching_engine.add_order(cancel)
+    matching_engine.add_order(MassCancelOrder("MSFT"))
+    matching_engine.flush_events()
+
+    assert event_sink.events == [(EventType.cancel_rejected, 1), (EventType.rejected, NO_ORDER)], \
+        "Test Failed: the cancel should be a rejected cancel, and the mass cancel rejected"
+    assert batches[0][:2] == [[EventType.cancel_rejected, EventType.rejected], [1, NO_ORDER]], \
+        "Test Failed: batched sinks should report both"
+    assert not cancel.cancel_success, "Test Failed: the cancel should not succeed"
+    pass
+
+
+def test_matching_engine_catches_up_on_a_shared_symbol_registry():
+    symbols = SymbolRegistry()
+    first = MatchingEngine(symbols=symbols)
+    second = MatchingEngine(symbols=symbols)
+    first.preload(["AAPL", "MSFT"])
+
+    second.submit(LimitOrder(instrument_id="MSFT",
+                             order_direction=OrderDirection.buy,
+                             quantity=100,
+                             price=10))
+
+    assert list(second.order_books) == ["AAPL", "MSFT"], "Test Failed: books should follow the registry"
+    assert second.books[1].best_bid is not None, "Test Failed: the order should reach its book"
+    pass
+
+
+def test_matching_engine_mass_cancels_every_instrument():
+    matching_engine = MatchingEngine()
+    maker = [LimitOrder(instrument_id, OrderDirection.buy, 10, 10, account_id="maker")
+             for instrument_id in ["AAPL", "MSFT", "TSLA"]]
+    other = LimitOrder("AAPL", OrderDirection.buy, 10, 9, account_id="other")
+    for order in maker[:2] + [other]:
+        matching_engine.add_order(order)
+    matching_engine.match()
+    matching_engine.add_order(maker[2])
+
+    cancelled = matching_engine.mass_cancel(MassCancelOrder(account_id="maker"))
+
+    assert cancelled == 3, "Test Failed: queued orders should be processed before the mass cancel"
+    assert [order.status for order in maker] == [OrderStatus.cancelled] * 3, "Test Failed: incorrect statuses"
+    assert matching_engine.order_books["AAPL"].best_bid is other, "Test Failed: other accounts should stay"
+
+    matching_engine.add_order(MassCancelOrder("AAPL"))
+    matching_engine.match()
+    assert other.status == OrderStatus.cancelled, "Test Failed: an instrument mass cancel should be queued"
+    pass
+
+
+def test_matching_engine_queues_engine_wide_mass_cancels():
+    event_sink = RecordingSink()
+    risk_check = RiskCheck(RiskLimits(max_message_rate=1, max_message_burst=3), clock=lambda: 0.)
+    matching_engine = MatchingEngine(risk_check=risk_check)
+    matching_engine.add_event_sink(event_sink)
+    before = LimitOrder("AAPL", OrderDirection.buy, 10, 10, account_id="maker")
+    after = LimitOrder("MSFT", OrderDirection.buy, 10, 10, account_id="maker")
+    mass_cancel = MassCancelOrder(account_id="maker")
+    matching_engine.add_order(before)
+    matching_engine.add_order(mass_cancel)
+    matching_engine.add_order(after)
+
+    assert before.status == OrderStatus.live and not matching_engine.order_books, \
+        "Test Failed: nothing should be processed on the caller's thread"
+    matching_engine.match()
+    assert (before.status, after.status) == (OrderStatus.cancelled, OrderStatus.live), \
+        "Test Failed: the mass cancel should only cancel orders queued before it"
+    assert mass_cancel.cancelled == 1, "Test Failed: incorrect number cancelled"
+
+    throttled = MassCancelOrder(account_id="maker")
+    matching_engine.add_order(throttled)
+    matching_engine.match()
+    assert after.status == OrderStatus.live, "Test Failed: the risk check should refuse the mass cancel"
+    assert event_sink.events[-1] == (EventType.rejected, NO_ORDER), "Test Failed: the refusal should be reported"
+    pass
+
+
+def test_matching_engine_rejects_quotes_without_an_account():
+    event_sink = RecordingSink()
+    matching_engine = MatchingEngine()
+    matching_engine.add_event_sink(event_sink)
+    matching_engine.submit(Quote("AAPL", 10, 100, 11, 100))
+    matching_engine.submit(Quote("AAPL", 9, 100, 12, 100))
+
+    assert event_sink.events == [(EventType.rejected, NO_ORDER)] * 2, "Test Failed: both quotes should be rejected"
+    assert matching_engine.order_books["AAPL"].best_bid is None, "Test Failed: nothing should rest"
+    pass
+
+
+def test_matching_engine_mass_quotes_every_instrument():
+    risk_check = RiskCheck(RiskLimits(max_order_quantity=100))
+    matching_engine = MatchingEngine(risk_check=risk_check)
+    event_sink = RecordingSink()
+    matching_engine.add_event_sink(event_sink)
+
+    matching_engine.mass_quote(MassQuote("maker", [Quote("AAPL", 10, 100, 11, 100),
+                                                   Quote("MSFT", 20, 50, 21, 50)]))
+    matching_engine.match()
+    matching_engine.mass_quote(MassQuote("maker", [Quote("AAPL", 10, 60, 11, 100),
+                                                   Quote("MSFT", 20, 50, 21, 500)]))
+    matching_engine.match()
+
+    aapl = matching_engine.order_books["AAPL"]
+    msft = matching_engine.order_books["MSFT"]
+    assert aapl.best_bid.unfilled_quantity == 60 and aapl.best_bid.account_id == "maker", \
+        "Test Failed: the AAPL bid should be replaced"
+    assert msft.best_ask.unfilled_quantity == 50, "Test Failed: a quote breaching a limit should be rejected"
+    assert [event for event, _ in event_sink.events].count(EventType.accepted) == 4, \
+        "Test Failed: only the first quotes should create orders"
+    exposure = risk_check.exposures["maker"]["AAPL"]
+    assert exposure.open_buys == 60 and exposure.open_sells == 100, \
+        "Test Failed: replacing a quote should update open exposure"
+    pass
+
+
+def test_matching_engine_rejects_unpriced_market_orders():
+    event_sink = RecordingSink()
+    resting = MarketOrder(instrument_id="AAPL", order_direction=OrderDirection.sell, quantity=100)
+    order = MarketOrder(instrument_id="AAPL", order_direction=OrderDirection.buy, quantity=100)
+
+    matching_engine = MatchingEngine()
+    matching_engine.add_event_sink(event_sink)
+    matching_engine.add_order(resting)
+    matching_engine.add_order(order)
+    matching_engine.match()
+
+    assert resting.status == OrderStatus.live, "Test Failed: the resting order should stay live"
+    assert order.status == OrderStatus.rejected, "Test Failed: the incoming order should be rejected"
+    assert event_sink.events == [(EventType.accepted, resting.order_id), (EventType.rejected, order.order_id)], \
+        "Test Failed: incorrect events"
+    pass
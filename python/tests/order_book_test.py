@@ -2,10 +2,24 @@ from python.src.order_book import OrderBook
 from python.src.orders import LimitOrder
 from python.src.orders import MarketOrder
 from python.src.orders import CancelOrder
+from python.src.orders import MassCancelOrder
+from python.src.orders import Quote
+from python.src.orders import StopOrder
+from python.src.orders import StopLimitOrder
 from python.src.enums import OrderDirection
 from python.src.enums import OrderDirection
 from python.src.enums import OrderStatus
+from python.src.enums import OrderType
+from python.src.enums import MatchingAlgorithm
+from python.src.enums import ExecutionPriceRule
+from python.src.trades import TradeBuffer
+from python.src.enums import EventType
+from python.tests.events_test.recording_sink import RecordingSink
 from python.src.exceptions import InvalidOrderDirectionException
+from python.src.exceptions import OffTickPriceException
+from python.src.exceptions import QuoteWithoutAccountException
+from python.src.exceptions import UnpricedMarketOrderException
+import numpy as np
 import pytest
 
 
@@ -374,3 +388,761 @@ def test_order_book_can_generate_execution_plot():
     order_book.match()
     order_book.plot_executions()
     pass
+
+
+def test_order_book_holds_stops_off_the_book():
+    instrument_id = "AAPL"
+    stop_order = StopLimitOrder(instrument_id=instrument_id,
+                                order_direction=OrderDirection.buy,
+                                quantity=100,
+                                stop_price=12,
+                                price=12)
+
+    order_book = OrderBook()
+    order_book.add_order(stop_order)
+    order_book.match()
+
+    assert order_book.best_bid is None, "Test Failed: best_bid should be empty"
+    assert len(order_book.trigger_book) == 1, "Test Failed: the stop should be pending"
+    assert stop_order.order_type == OrderType.stop_limit, "Test Failed: the stop should not trigger"
+    pass
+
+
+def test_order_book_releases_stops_on_trade():
+    instrument_id = "AAPL"
+    stop_order = StopLimitOrder(instrument_id=instrument_id,
+                                order_direction=OrderDirection.buy,
+                                quantity=100,
+                                stop_price=12,
+                                price=13)
+    far_stop = StopLimitOrder(instrument_id=instrument_id,
+                              order_direction=OrderDirection.buy,
+                              quantity=100,
+                              stop_price=20,
+                              price=20)
+    resting_ask = LimitOrder(instrument_id=instrument_id,
+                             order_direction=OrderDirection.sell,
+                             quantity=100,
+                             price=13)
+
+    order_book = OrderBook()
+    for order in [stop_order, far_stop, resting_ask]:
+        order_book.add_order(order)
+    order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                    order_direction=OrderDirection.buy,
+                                    quantity=50,
+                                    price=13))
+    order_book.match()
+
+    assert stop_order.order_type == OrderType.limit, "Test Failed: the stop should trigger"
+    assert far_stop.order_type == OrderType.stop_limit, "Test Failed: the far stop should not trigger"
+    assert len(order_book.trigger_book) == 1, "Test Failed: one stop should be pending"
+    assert len(order_book.trades) == 2, "Test Failed: the stop should trade"
+    assert stop_order.unfilled_quantity == 50, "Test Failed: the stop should partially fill"
+    assert order_book.best_bid is stop_order, "Test Failed: the stop should rest as a bid"
+    pass
+
+
+def test_order_book_processes_stop_cascades():
+    instrument_id = "AAPL"
+    sell_stops = [StopLimitOrder(instrument_id=instrument_id,
+                                 order_direction=OrderDirection.sell,
+                                 quantity=100,
+                                 stop_price=10 - i,
+                                 price=9 - i) for i in range(3)]
+    bids = [LimitOrder(instrument_id=instrument_id,
+                       order_direction=OrderDirection.buy,
+                       quantity=100,
+                       price=10 - i) for i in range(4)]
+
+    order_book = OrderBook()
+    for order in sell_stops + bids:
+        order_book.add_order(order)
+    order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                    order_direction=OrderDirection.sell,
+                                    quantity=100,
+                                    price=10))
+    order_book.match()
+
+    assert not order_book.trigger_book, "Test Failed: every stop should cascade"
+    assert all(o.status == OrderStatus.filled for o in sell_stops), \
+        "Test Failed: every stop should fill"
+    assert len(order_book.trades) == 4, "Test Failed: there should be 4 trades"
+    assert order_book.best_bid is None, "Test Failed: the bids should be exhausted"
+    pass
+
+
+def test_order_book_triggers_stop_immediately_when_already_crossed():
+    instrument_id = "AAPL"
+    order_book = OrderBook()
+    order_book.last_price = 12
+
+    stop_order = StopLimitOrder(instrument_id=instrument_id,
+                                order_direction=OrderDirection.buy,
+                                quantity=100,
+                                stop_price=11,
+                                price=12)
+    order_book.add_order(stop_order)
+
+    assert not order_book.trigger_book, "Test Failed: the stop should not be pending"
+    assert order_book.best_bid is stop_order, "Test Failed: the stop should be the best bid"
+    pass
+
+
+def test_order_book_can_cancel_stop():
+    instrument_id = "AAPL"
+    stop_order = StopOrder(instrument_id=instrument_id,
+                           order_direction=OrderDirection.sell,
+                           quantity=100,
+                           stop_price=8)
+    stop_order.order_id = 1
+
+    order_book = OrderBook()
+    order_book.add_order(stop_order)
+    cancel_order = CancelOrder(instrument_id=instrument_id,
+                               order_id=1,
+                               order_direction=OrderDirection.sell)
+    order_book.add_order(cancel_order)
+
+    assert cancel_order.cancel_success, "Test Failed: cancel should succeed"
+    assert not order_book.trigger_book, "Test Failed: the stop should be removed"
+    assert stop_order.status == OrderStatus.cancelled, "Test Failed: the stop should be cancelled"
+    pass
+
+
+def test_order_book_pro_rata_allocates_by_size():
+    instrument_id = "AAPL"
+    bids = [LimitOrder(instrument_id=instrument_id,
+                       order_direction=OrderDirection.buy,
+                       quantity=quantity,
+                       price=10) for quantity in [100, 300, 600]]
+    lower_bid = LimitOrder(instrument_id=instrument_id,
+                           order_direction=OrderDirection.buy,
+                           quantity=100,
+                           price=9)
+    ask = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.sell,
+                     quantity=500,
+                     price=10)
+
+    order_book = OrderBook(matching_algorithm=MatchingAlgorithm.pro_rata)
+    for order in bids + [lower_bid, ask]:
+        order_book.add_order(order)
+    order_book.match()
+
+    assert [o.unfilled_quantity for o in bids] == [50, 150, 300], \
+        "Test Failed: bids should fill in proportion to size"
+    # Compiled builds store quantities as floats, so check for whole amounts rather than int.
+    quantities = [t.quantity for t in order_book.trades] + [bids[0].unfilled_quantity]
+    assert all(not isinstance(q, np.floating) and float(q).is_integer() for q in quantities), \
+        "Test Failed: integer quantities should fill in whole, unrounded amounts"
+    assert ask.status == OrderStatus.filled, "Test Failed: the ask should fill"
+    assert len(order_book.trades) == 3, "Test Failed: there should be 3 trades"
+    assert order_book.best_bid is bids[0], "Test Failed: time priority should be kept"
+    assert list(order_book.bids) == bids[1:] + [lower_bid], "Test Failed: the level should be kept"
+    assert order_book.best_ask is None, "Test Failed: best_ask should be empty"
+    pass
+
+
+def test_order_book_pro_rata_sweeps_levels():
+    instrument_id = "AAPL"
+    asks = [LimitOrder(instrument_id=instrument_id,
+                       order_direction=OrderDirection.sell,
+                       quantity=100,
+                       price=10 + i // 2) for i in range(4)]
+    bid = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.buy,
+                     quantity=300,
+                     price=11)
+
+    order_book = OrderBook(matching_algorithm=MatchingAlgorithm.pro_rata)
+    for order in asks + [bid]:
+        order_book.add_order(order)
+    order_book.match()
+
+    assert bid.status == OrderStatus.filled, "Test Failed: the bid should fill"
+    assert [o.unfilled_quantity for o in asks] == [0, 0, 50, 50], \
+        "Test Failed: the second level should share the remainder"
+    assert len(order_book.complete_orders) == 3, "Test Failed: three orders should complete"
+    assert len(order_book.asks) == 1, "Test Failed: one ask should remain in the book"
+    pass
+
+
+def test_order_book_pro_rata_matches_like_price_time_for_single_orders():
+    instrument_id = "AAPL"
+    quantity = 100
+    price = 10
+    limit_orders = [LimitOrder(instrument_id=instrument_id,
+                               order_direction=OrderDirection.buy if i % 2 else OrderDirection.sell,
+                               quantity=quantity,
+                               price=price + (i if i % 2 else -i)) for i in range(10)]
+
+    order_book = OrderBook(matching_algorithm=MatchingAlgorithm.pro_rata)
+
+    for order in limit_orders:
+        order_book.add_order(order)
+    order_book.match()
+    assert not order_book.bids, "Test Failed: There should be no bids after complete matching"
+    assert not order_book.asks, "Test Failed: There should be no asks after complete matching"
+    assert len(order_book.trades) == 5, "Test Failed: trades should have 5 orders"
+    assert len(
+        order_book.complete_orders) == 10, "Test Failed: complete_orders should have all orders"
+    assert not order_book.attempt_match, "Test Failed: attempt_match should be False"
+    pass
+
+
+def test_order_book_pro_rata_keeps_large_partly_filled_orders():
+    instrument_id = "AAPL"
+    bids = [LimitOrder(instrument_id=instrument_id,
+                       order_direction=OrderDirection.buy,
+                       quantity=100000,
+                       price=10) for _ in range(2)]
+    ask = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.sell,
+                     quantity=199999,
+                     price=10)
+
+    order_book = OrderBook(matching_algorithm=MatchingAlgorithm.pro_rata)
+    for order in bids + [ask]:
+        order_book.add_order(order)
+    order_book.match()
+
+    assert sum(t.quantity for t in order_book.trades) == 199999, "Test Failed: incorrect volume"
+    assert sum(o.unfilled_quantity for o in bids) == 1, "Test Failed: one unit should be left unfilled"
+    assert [o.status for o in bids].count(OrderStatus.filled) == 1, "Test Failed: only one bid should fill"
+    assert order_book.best_bid.unfilled_quantity == 1, "Test Failed: the partly filled bid should rest"
+    pass
+
+
+def test_order_book_accumulates_orders_in_auction():
+    instrument_id = "AAPL"
+    quantity = 100
+    price = 10
+    limit_orders = [LimitOrder(instrument_id=instrument_id,
+                               order_direction=OrderDirection.buy if i % 2 else OrderDirection.sell,
+                               quantity=quantity,
+                               price=price + (i if i % 2 else -i)) for i in range(10)]
+
+    order_book = OrderBook()
+    order_book.start_auction()
+    for order in limit_orders:
+        order_book.add_order(order)
+        order_book.match()
+
+    assert order_book.in_auction, "Test Failed: the book should be in auction"
+    assert not order_book.trades, "Test Failed: nothing should trade in auction"
+    assert len(order_book.bids) == 4, "Test Failed: There should be 4 bids"
+    assert len(order_book.asks) == 4, "Test Failed: There should be 4 asks"
+    pass
+
+
+def test_order_book_uncrosses_at_a_single_price():
+    instrument_id = "AAPL"
+    bids = [LimitOrder(instrument_id=instrument_id,
+                       order_direction=OrderDirection.buy,
+                       quantity=100,
+                       price=price) for price in [10, 9, 8]]
+    asks = [LimitOrder(instrument_id=instrument_id,
+                       order_direction=OrderDirection.sell,
+                       quantity=quantity,
+                       price=price) for quantity, price in [(50, 8), (100, 9), (100, 11)]]
+
+    order_book = OrderBook()
+    order_book.start_auction()
+    for order in bids + asks:
+        order_book.add_order(order)
+    result = order_book.uncross()
+
+    assert result == (9, 150), "Test Failed: incorrect clearing price and volume"
+    assert not order_book.in_auction, "Test Failed: the book should resume continuous trading"
+    assert all(t.price == 9 for t in order_book.trades), "Test Failed: every trade should be at 9"
+    assert sum(t.quantity for t in order_book.trades) == 150, "Test Failed: incorrect volume"
+    assert order_book.last_price == 9, "Test Failed: last_price should be the clearing price"
+    assert order_book.best_bid is bids[1], "Test Failed: the partial bid should be best"
+    assert bids[1].unfilled_quantity == 50, "Test Failed: the marginal bid should partially fill"
+    assert order_book.best_ask is asks[2], "Test Failed: the 11 ask should be best"
+    assert len(order_book.complete_orders) == 3, "Test Failed: three orders should complete"
+    pass
+
+
+def test_order_book_uncross_keeps_large_partly_filled_orders():
+    instrument_id = "AAPL"
+    bid = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.buy,
+                     quantity=100000,
+                     price=10)
+    ask = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.sell,
+                     quantity=99999,
+                     price=10)
+
+    order_book = OrderBook()
+    order_book.start_auction()
+    order_book.add_order(bid)
+    order_book.add_order(ask)
+
+    assert order_book.uncross() == (10, 99999), "Test Failed: incorrect clearing price and volume"
+    assert bid.status == OrderStatus.live, "Test Failed: the bid should only partly fill"
+    assert bid.unfilled_quantity == 1, "Test Failed: the bid should keep its last unit"
+    assert order_book.best_bid is bid, "Test Failed: the bid should rest"
+    assert ask.status == OrderStatus.filled, "Test Failed: the ask should fill"
+    pass
+
+
+def test_order_book_uncross_without_a_cross():
+    instrument_id = "AAPL"
+    order_book = OrderBook()
+    order_book.start_auction()
+    order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                    order_direction=OrderDirection.buy,
+                                    quantity=100,
+                                    price=9))
+    order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                    order_direction=OrderDirection.sell,
+                                    quantity=100,
+                                    price=10))
+
+    assert order_book.uncross() is None, "Test Failed: nothing should trade"
+    assert not order_book.in_auction, "Test Failed: the book should resume continuous trading"
+    assert not order_book.trades, "Test Failed: trades should be empty"
+    pass
+
+
+def test_order_book_trades_at_resting_price_by_default():
+    instrument_id = "AAPL"
+    resting_ask = LimitOrder(instrument_id=instrument_id,
+                             order_direction=OrderDirection.sell,
+                             quantity=100,
+                             price=10)
+    incoming_bid = LimitOrder(instrument_id=instrument_id,
+                              order_direction=OrderDirection.buy,
+                              quantity=100,
+                              price=12)
+
+    order_book = OrderBook()
+    order_book.add_order(resting_ask)
+    order_book.add_order(incoming_bid)
+    order_book.match()
+
+    assert order_book.trades[0].price == 10, "Test Failed: the trade should be at the resting price"
+    assert order_book.last_price == 10, "Test Failed: last_price should be the resting price"
+    pass
+
+
+def test_order_book_can_trade_at_midpoint():
+    instrument_id = "AAPL"
+    order_book = OrderBook(execution_price_rule=ExecutionPriceRule.midpoint)
+    order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                    order_direction=OrderDirection.sell,
+                                    quantity=100,
+                                    price=10))
+    order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                    order_direction=OrderDirection.buy,
+                                    quantity=100,
+                                    price=12))
+    order_book.match()
+
+    assert order_book.trades[0].price == 11, "Test Failed: the trade should be at the midpoint"
+    pass
+
+
+def test_order_book_prices_market_orders_against_the_limit_side():
+    instrument_id = "AAPL"
+    market_order = MarketOrder(instrument_id=instrument_id,
+                               order_direction=OrderDirection.buy,
+                               quantity=100)
+    limit_order = LimitOrder(instrument_id=instrument_id,
+                             order_direction=OrderDirection.sell,
+                             quantity=100,
+                             price=10)
+
+    order_book = OrderBook()
+    order_book.add_order(market_order)
+    order_book.add_order(limit_order)
+    order_book.match()
+
+    assert order_book.trades[0].price == 10, "Test Failed: the trade should be at the limit price"
+    pass
+
+
+def test_order_book_refuses_market_orders_against_market_orders_before_a_trade():
+    instrument_id = "AAPL"
+    order_book = OrderBook()
+    order_book.add_order(MarketOrder(instrument_id=instrument_id,
+                                     order_direction=OrderDirection.buy,
+                                     quantity=100))
+    with pytest.raises(UnpricedMarketOrderException):
+        order_book.add_order(MarketOrder(instrument_id=instrument_id,
+                                         order_direction=OrderDirection.sell,
+                                         quantity=100))
+    order_book.match()
+
+    assert not order_book.trades, "Test Failed: market orders should not trade without a price"
+    assert not order_book.best_ask, "Test Failed: the refused order should not rest"
+
+    order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                    order_direction=OrderDirection.sell,
+                                    quantity=50,
+                                    price=10))
+    order_book.match()
+    order_book.add_order(MarketOrder(instrument_id=instrument_id,
+                                     order_direction=OrderDirection.sell,
+                                     quantity=50))
+    order_book.match()
+
+    assert [t.price for t in order_book.trades] == [10, 10], \
+        "Test Failed: once traded, market orders should trade at the last price"
+    pass
+
+
+def test_order_book_sweep_fills_share_a_timestamp():
+    instrument_id = "AAPL"
+    order_book = OrderBook()
+    for i in range(3):
+        order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                        order_direction=OrderDirection.sell,
+                                        quantity=100,
+                                        price=10 + i))
+    order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                    order_direction=OrderDirection.buy,
+                                    quantity=300,
+                                    price=12))
+    order_book.match()
+
+    assert [t.price for t in order_book.trades] == [10, 11, 12], "Test Failed: the sweep should walk the asks"
+    assert len({t.datetime for t in order_book.trades}) == 1, "Test Failed: sweep fills should share a timestamp"
+    pass
+
+
+def test_order_book_reports_trades_to_sink():
+    instrument_id = "AAPL"
+    quantity = 100
+    price = 10
+    limit_orders = [LimitOrder(instrument_id=instrument_id,
+                               order_direction=OrderDirection.buy if i % 2 else OrderDirection.sell,
+                               quantity=quantity,
+                               price=price + (i if i % 2 else -i)) for i in range(10)]
+    trade_buffer = TradeBuffer(capacity=2)
+
+    order_book = OrderBook(trade_sink=trade_buffer)
+    for order in limit_orders:
+        order_book.add_order(order)
+    order_book.match()
+
+    assert not order_book.trades, "Test Failed: trades should not be built"
+    assert len(trade_buffer) == 5, "Test Failed: the buffer should have 5 trades"
+    assert (trade_buffer.quantities[:5] == 100).all(), "Test Failed: incorrect quantities"
+    assert len(order_book.complete_orders) == 10, "Test Failed: complete_orders should have all orders"
+    assert all(o.status == OrderStatus.filled for o in limit_orders), "Test Failed: all orders should fill"
+    assert not limit_orders[0].fill_info, "Test Failed: fill_info should not be recorded"
+    pass
+
+
+def test_order_book_reports_events():
+    instrument_id = "AAPL"
+    bid = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.buy,
+                     quantity=100,
+                     price=10)
+    ask = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.sell,
+                     quantity=40,
+                     price=10)
+    bid.order_id = 1
+    ask.order_id = 2
+    event_sink = RecordingSink()
+
+    order_book = OrderBook(event_sink=event_sink)
+    order_book.add_order(bid)
+    order_book.add_order(ask)
+    order_book.match()
+    order_book.add_order(CancelOrder(instrument_id=instrument_id,
+                                     order_id=1,
+                                     order_direction=OrderDirection.buy))
+    order_book.add_order(CancelOrder(instrument_id=instrument_id,
+                                     order_id=1,
+                                     order_direction=OrderDirection.buy))
+
+    assert event_sink.events == [(EventType.accepted, 1),
+                                 (EventType.accepted, 2),
+                                 (EventType.partially_filled, 1),
+                                 (EventType.filled, 2),
+                                 (EventType.cancelled, 1),
+                                 (EventType.cancel_rejected, 1)], "Test Failed: incorrect events"
+    pass
+
+
+def test_order_book_accepts_triggered_stops_once():
+    instrument_id = "AAPL"
+    stop_order = StopLimitOrder(instrument_id=instrument_id,
+                                order_direction=OrderDirection.buy,
+                                quantity=100,
+                                stop_price=10,
+                                price=10)
+    stop_order.order_id = 1
+    event_sink = RecordingSink()
+
+    order_book = OrderBook(event_sink=event_sink)
+    order_book.add_order(stop_order)
+    order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                    order_direction=OrderDirection.sell,
+                                    quantity=100,
+                                    price=10))
+    order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                    order_direction=OrderDirection.buy,
+                                    quantity=50,
+                                    price=10))
+    order_book.match()
+
+    accepted = [e for e in event_sink.events if e == (EventType.accepted, 1)]
+    assert len(accepted) == 1, "Test Failed: the stop should be accepted once"
+    assert (EventType.partially_filled, 1) in event_sink.events, "Test Failed: the stop should fill"
+    pass
+
+
+def test_orders_have_unique_ids():
+    orders = [LimitOrder(instrument_id="AAPL",
+                         order_direction=OrderDirection.buy,
+                         quantity=100,
+                         price=10,
+                         client_order_id="client-1") for _ in range(10)]
+    order_ids = [order.order_id for order in orders]
+
+    assert len(set(order_ids)) == 10, "Test Failed: order ids should be unique"
+    assert order_ids == sorted(order_ids), "Test Failed: order ids should increase"
+    assert all(order.client_order_id == "client-1" for order in orders), \
+        "Test Failed: client ids should be kept apart from order ids"
+    pass
+
+
+def test_order_book_indexes_live_orders():
+    instrument_id = "AAPL"
+    bid = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.buy,
+                     quantity=100,
+                     price=10)
+    ask = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.sell,
+                     quantity=40,
+                     price=10)
+    stop_order = StopOrder(instrument_id=instrument_id,
+                           order_direction=OrderDirection.sell,
+                           quantity=10,
+                           stop_price=5)
+
+    order_book = OrderBook()
+    for order in (bid, ask, stop_order):
+        order_book.add_order(order)
+    assert len(order_book.order_index) == 3, "Test Failed: every live order should be indexed"
+
+    order_book.match()
+    assert order_book.order_index == {bid.order_id: bid, stop_order.order_id: stop_order}, \
+        "Test Failed: filled orders should leave the index"
+
+    order_book.add_order(CancelOrder(instrument_id=instrument_id,
+                                     order_id=stop_order.order_id,
+                                     order_direction=OrderDirection.sell))
+    assert stop_order.status == OrderStatus.cancelled, "Test Failed: the stop should be cancelled"
+    assert not order_book.trigger_book, "Test Failed: the stop should leave the trigger book"
+    assert order_book.order_index == {bid.order_id: bid}, "Test Failed: cancelled orders should leave the index"
+    pass
+
+
+def test_order_book_rejects_cancel_on_wrong_side():
+    instrument_id = "AAPL"
+    bid = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.buy,
+                     quantity=100,
+                     price=10)
+    cancel_order = CancelOrder(instrument_id=instrument_id,
+                               order_id=bid.order_id,
+                               order_direction=OrderDirection.sell)
+
+    order_book = OrderBook()
+    order_book.add_order(bid)
+    order_book.add_order(cancel_order)
+
+    assert not cancel_order.cancel_success, "Test Failed: cancel should fail"
+    assert order_book.best_bid is bid, "Test Failed: the bid should stay in the book"
+    pass
+
+
+def test_order_book_rejects_prices_off_tick():
+    instrument_id = "AAPL"
+    bid = LimitOrder(instrument_id=instrument_id,
+                     order_direction=OrderDirection.buy,
+                     quantity=100,
+                     price=10.07)
+    stop_limit = StopLimitOrder(instrument_id, OrderDirection.sell, 100, 10, 10.12)
+    on_tick = LimitOrder(instrument_id=instrument_id,
+                         order_direction=OrderDirection.sell,
+                         quantity=100,
+                         price=10.15)
+
+    order_book = OrderBook(tick_size=0.05)
+    for order in (bid, stop_limit):
+        with pytest.raises(OffTickPriceException):
+            order_book.add_order(order)
+    order_book.add_order(on_tick)
+
+    assert order_book.best_bid is None and not order_book.trigger_book, \
+        "Test Failed: orders off the tick should not be added"
+    assert order_book.best_ask is on_tick and on_tick.price == 10.15, \
+        "Test Failed: prices on a tick should be kept as sent"
+    with pytest.raises(OffTickPriceException):
+        order_book.add_order(Quote(instrument_id, 10, 100, 10.22, 100, account_id="maker"))
+    assert order_book.best_bid is None, "Test Failed: neither side of an off-tick quote should be applied"
+    pass
+
+
+def test_order_book_aggregates_depth_by_price_level():
+    instrument_id = "AAPL"
+    order_book = OrderBook()
+    for price, quantity in [(10, 100), (9, 50), (10, 25), (8, 10), (7, 5)]:
+        order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                        order_direction=OrderDirection.buy,
+                                        quantity=quantity,
+                                        price=price))
+    for price, quantity in [(12, 30), (11, 20)]:
+        order_book.add_order(LimitOrder(instrument_id=instrument_id,
+                                        order_direction=OrderDirection.sell,
+                                        quantity=quantity,
+                                        price=price))
+
+    bids, asks = order_book.depth(3)
+
+    assert bids == ((10, 125), (9, 50), (8, 10)), "Test Failed: incorrect bid levels"
+    assert asks == ((11, 20), (12, 30)), "Test Failed: incorrect ask levels"
+    assert OrderBook().depth(3) == ((), ()), "Test Failed: an empty book has no levels"
+    pass
+
+
+def test_order_book_mass_cancels_an_account():
+    class MassCancelSink(RecordingSink):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+
+        def on_mass_cancelled(self, orders, mass_cancel):
+            self.batches.append([order.order_id for order in orders])
+
+    instrument_id = "AAPL"
+    maker = [LimitOrder(instrument_id, OrderDirection.buy, 10, 10, account_id="maker"),
+             LimitOrder(instrument_id, OrderDirection.buy, 10, 9, account_id="maker"),
+             LimitOrder(instrument_id, OrderDirection.sell, 10, 12, account_id="maker"),
+             StopOrder(instrument_id, OrderDirection.sell, 10, 8, account_id="maker")]
+    other = [LimitOrder(instrument_id, OrderDirection.buy, 10, 9.5, account_id="other"),
+             LimitOrder(instrument_id, OrderDirection.sell, 10, 13)]
+    event_sink = MassCancelSink()
+    order_book = OrderBook(event_sink=event_sink)
+    for order in maker + other:
+        order_book.add_order(order)
+
+    bids_only = MassCancelOrder(instrument_id, account_id="maker", order_direction=OrderDirection.buy)
+    order_book.add_order(bids_only)
+    assert bids_only.cancelled == 2, "Test Failed: both maker bids should be cancelled"
+    assert order_book.best_bid is other[0], "Test Failed: the best bid should be replaced"
+    assert order_book.best_ask is maker[2], "Test Failed: the maker's ask should stay"
+
+    everything = MassCancelOrder(instrument_id, account_id="maker")
+    order_book.add_order(everything)
+    assert everything.cancelled == 2, "Test Failed: the maker's ask and stop should be cancelled"
+    assert [order.status for order in maker] == [OrderStatus.cancelled] * 4, "Test Failed: incorrect statuses"
+    assert order_book.best_ask is other[1] and not order_book.trigger_book, "Test Failed: incorrect book"
+    assert "maker" not in order_book.account_orders, "Test Failed: the account should leave the index"
+    assert event_sink.batches == [[maker[0].order_id, maker[1].order_id],
+                                  [maker[2].order_id, maker[3].order_id]], \
+        "Test Failed: each mass cancel should be one event"
+    assert list(order_book.complete_orders) == maker, "Test Failed: incorrect complete orders"
+    pass
+
+
+def test_order_book_mass_cancels_a_side():
+    instrument_id = "AAPL"
+    bids = [LimitOrder(instrument_id, OrderDirection.buy, 10, price, account_id=account_id)
+            for price, account_id in [(10, "a"), (9, None), (9, "b")]]
+    ask = LimitOrder(instrument_id, OrderDirection.sell, 10, 12, account_id="a")
+    stop = StopOrder(instrument_id, OrderDirection.buy, 10, 14)
+    event_sink = RecordingSink()
+    order_book = OrderBook(event_sink=event_sink)
+    for order in bids + [ask, stop]:
+        order_book.add_order(order)
+
+    mass_cancel = MassCancelOrder(instrument_id, order_direction=OrderDirection.buy)
+    order_book.add_order(mass_cancel)
+
+    assert mass_cancel.cancelled == 4, "Test Failed: every buy order should be cancelled"
+    assert order_book.best_bid is None and not order_book.bids, "Test Failed: the bids should be empty"
+    assert not order_book.trigger_book, "Test Failed: buy stops should be cancelled"
+    assert order_book.best_ask is ask, "Test Failed: the ask should stay"
+    assert list(order_book.order_index.values()) == [ask], "Test Failed: only the ask should stay live"
+    assert list(order_book.account_orders) == ["a"], "Test Failed: only the ask's account should stay"
+    assert event_sink.events[-4:] == [(EventType.cancelled, order.order_id) for order in bids + [stop]], \
+        "Test Failed: sinks without batch handling should see each cancel"
+    pass
+
+
+def test_order_book_rejects_quotes_without_an_account():
+    order_book = OrderBook()
+    order_book.add_order(Quote("AAPL", 10, 100, 12, 100, account_id="maker"))
+    with pytest.raises(QuoteWithoutAccountException):
+        order_book.add_order(Quote("AAPL", 9, 50, 13, 50))
+
+    assert (order_book.best_bid.price, order_book.best_ask.price) == (10, 12), \
+        "Test Failed: the maker's quote should not be replaced"
+    assert list(order_book.quotes) == ["maker"], "Test Failed: no quote should be kept without an account"
+    pass
+
+
+def test_order_book_replaces_quotes_in_place():
+    instrument_id = "AAPL"
+    event_sink = RecordingSink()
+    order_book = OrderBook(event_sink=event_sink, tick_size=0.5)
+    order_book.add_order(Quote(instrument_id, 10, 100, 12, 100, account_id="maker"))
+    bid, ask = order_book.best_bid, order_book.best_ask
+    behind = LimitOrder(instrument_id, OrderDirection.buy, 50, 10)
+    order_book.add_order(behind)
+
+    order_book.add_order(Quote(instrument_id, 10, 60, 11.5, 100, account_id="maker"))
+    assert order_book.best_bid is bid and bid.unfilled_quantity == 60, \
+        "Test Failed: a smaller bid at the same price should keep its priority"
+    assert order_book.best_ask is ask and ask.price == 11.5, "Test Failed: the ask should move to its new price"
+    assert event_sink.events[-2:] == [(EventType.replaced, bid.order_id), (EventType.replaced, ask.order_id)], \
+        "Test Failed: both sides should be replaced"
+
+    order_book.add_order(Quote(instrument_id, 10, 80, 0, 0, account_id="maker"))
+    assert order_book.best_bid is behind and list(order_book.bids) == [bid], \
+        "Test Failed: a larger bid should lose its priority"
+    assert ask.status == OrderStatus.cancelled and order_book.best_ask is None, \
+        "Test Failed: a zero quantity should pull the ask"
+    assert event_sink.events[-1] == (EventType.cancelled, ask.order_id), "Test Failed: the pull should be a cancel"
+
+    order_book.add_order(Quote(instrument_id, 9, 10, 13, 10, account_id="maker"))
+    assert order_book.order_index[bid.order_id] is bid and bid.price == 9, \
+        "Test Failed: the bid should keep its order_id at its new price"
+    assert order_book.best_ask is not ask and order_book.best_ask.account_id == "maker", \
+        "Test Failed: a pulled side should be quoted with a new order"
+    pass
+
+
+def test_order_book_requotes_partially_filled_quotes():
+    instrument_id = "AAPL"
+    order_book = OrderBook()
+    order_book.add_order(Quote(instrument_id, 10, 100, 12, 100, account_id="maker"))
+    bid = order_book.best_bid
+    order_book.add_order(LimitOrder(instrument_id, OrderDirection.sell, 40, 10))
+    order_book.match()
+
+    order_book.add_order(Quote(instrument_id, 10.5, 100, 12, 100, account_id="maker"))
+    assert order_book.best_bid is bid, "Test Failed: the bid should be requoted in place"
+    assert bid.unfilled_quantity == 100 and bid.quantity == 140, \
+        "Test Failed: the filled quantity should be kept"
+
+    offer = LimitOrder(instrument_id, OrderDirection.sell, 100, 11)
+    order_book.add_order(offer)
+    order_book.add_order(Quote(instrument_id, 11, 100, 12, 100, account_id="maker"))
+    order_book.match()
+    assert bid.status == OrderStatus.filled and offer.status == OrderStatus.filled, \
+        "Test Failed: a requote should cross the book like a new order"
+    assert order_book.trades[-1].price == 11, "Test Failed: the requoted bid should trade at the resting price"
+    pass
@@ -0,0 +1,72 @@
+from python.src.order_flow import OrderFlowGenerator, to_orders
+from python.src.codec import ORDER
+from python.src.enums import OrderType
+from python.src.matching_engine import MatchingEngine
+import numpy as np
+
+
+def test_order_flow_generator_is_reproducible():
+    first = OrderFlowGenerator(seed=7).generate(1_000)
+    second = OrderFlowGenerator(seed=7).generate(1_000)
+
+    assert first.dtype == ORDER, "Test Failed: orders should be ORDER records"
+    assert np.array_equal(first, second), "Test Failed: the same seed should give the same flow"
+    assert np.all(np.diff(first["sent_ns"]) >= 0), "Test Failed: orders should be in arrival order"
+    pass
+
+
+def test_order_flow_generator_distributions():
+    generator = OrderFlowGenerator(instrument_weights=[3, 1], instrument_ids=["HOT", "COLD"],
+                                   market_ratio=0.1, cancel_ratio=0.3, tick_size=0.05, seed=0)
+    records = generator.generate(100_000)
+    order_types = records["order_type"]
+    limits = records[order_types == OrderType.limit.value]
+
+    assert abs(np.mean(order_types == OrderType.cancel.value) - 0.3) < 0.01, "Test Failed: cancel ratio"
+    assert abs(np.mean(order_types == OrderType.market.value) - 0.1) < 0.01, "Test Failed: market ratio"
+    assert abs(np.mean(records["instrument_id"] == b"HOT") - 0.75) < 0.01, "Test Failed: hot instrument weight"
+    assert np.allclose(limits["price"] / 0.05, np.round(limits["price"] / 0.05)), \
+        "Test Failed: limit prices should be on the tick grid"
+    assert np.all(limits["quantity"] % generator.min_size == 0), "Test Failed: sizes should be whole lots"
+    assert np.max(limits["quantity"]) > 10 * np.median(limits["quantity"]), "Test Failed: sizes should be heavy tailed"
+    pass
+
+
+def test_order_flow_cancels_target_earlier_limit_orders():
+    generator = OrderFlowGenerator(seed=3)
+    records = generator.generate(10_000)
+    cancels = np.flatnonzero(records["order_type"] == OrderType.cancel.value)
+    placed = np.flatnonzero(records["order_type"] != OrderType.cancel.value)
+
+    assert np.array_equal(records["order_id"][placed], np.arange(1, len(placed) + 1)), \
+        "Test Failed: orders should be numbered in arrival order"
+    targets = placed[records["order_id"][cancels] - 1]
+    assert np.all(targets < cancels), "Test Failed: cancels should follow their order"
+    assert np.all(records["order_type"][targets] == OrderType.limit.value), "Test Failed: cancels should target limits"
+    assert np.array_equal(records["instrument_id"][targets], records["instrument_id"][cancels]), \
+        "Test Failed: cancels should be for their order's instrument"
+
+    orders = to_orders(records)
+    for cancel, target in zip(cancels[:100], targets[:100]):
+        assert orders[cancel].order_id == orders[target].order_id, "Test Failed: cancels should use engine ids"
+
+    matching_engine = MatchingEngine()
+    for order in orders:
+        matching_engine.add_order(order)
+    matching_engine.match()
+    assert any(o.cancel_success for o in (orders[i] for i in cancels)), "Test Failed: some cancels should succeed"
+    pass
+
+
+def test_order_flow_ids_continue_across_calls():
+    generator = OrderFlowGenerator(seed=5)
+    first = generator.generate(1_000)
+    second = generator.generate(1_000)
+    placed = np.concatenate([records["order_id"][records["order_type"] != OrderType.cancel.value]
+                             for records in (first, second)])
+
+    assert np.array_equal(placed, np.arange(1, len(placed) + 1)), "Test Failed: ids should not repeat"
+    cancels = second["order_id"][second["order_type"] == OrderType.cancel.value]
+    assert np.all(cancels > placed[np.count_nonzero(first["order_type"] != OrderType.cancel.value) - 1]), \
+        "Test Failed: cancels should target orders of their own call"
+    pass
@@ -0,0 +1,44 @@
+from python.src.order_states import OrderStateStore
+from python.src.order_flow import OrderFlowGenerator
+from python.src.order_flow import to_orders
+from python.src.matching_engine import MatchingEngine
+from python.src.orders import BaseOrder
+import numpy as np
+import time
+
+n = 500_000
+records = OrderFlowGenerator(seed=0).generate(n)
+
+
+def run(order_states):
+    """ Match every order, with or without the order state store as an event sink."""
+
+    orders = to_orders(records)
+    matching_engine = MatchingEngine(max_history=0)
+    if order_states is not None:
+        matching_engine.add_event_sink(order_states)
+    start = time.perf_counter()
+    for order in orders:
+        matching_engine.add_order(order)
+    matching_engine.match()
+    return time.perf_counter() - start, [o.order_id for o in orders if isinstance(o, BaseOrder)]
+
+
+elapsed, _ = run(None)
+print(f"without store: {1e6 * elapsed / n:.2f}us per order")
+order_states = OrderStateStore()
+elapsed, order_ids = run(order_states)
+print(f"with store:    {1e6 * elapsed / n:.2f}us per order, {len(order_states):,} orders tracked")
+
+queries = np.random.default_rng(0).choice(order_ids, 100_000)
+status = order_states.status
+start = time.perf_counter()
+for order_id in queries.tolist():
+    status(order_id)
+elapsed = time.perf_counter() - start
+print(f"point lookups: {1e9 * elapsed / len(queries):.0f}ns per status")
+
+start = time.perf_counter()
+states = order_states.lookup(queries)
+elapsed = time.perf_counter() - start
+print(f"batch lookup:  {1e9 * elapsed / len(queries):.0f}ns per order of a batch of {len(queries):,}")
@@ -0,0 +1,99 @@
+from python.src.order_states import OrderStateStore
+from python.src.matching_engine import MatchingEngine
+from python.src.risk import RiskCheck
+from python.src.risk import RiskLimits
+from python.src.orders import LimitOrder
+from python.src.orders import CancelOrder
+from python.src.orders import BaseOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderStatus
+from python.src.order_flow import OrderFlowGenerator
+from python.src.order_flow import to_orders
+import numpy as np
+import pytest
+
+
+def limit_order(instrument_id, order_direction, quantity, price):
+    return LimitOrder(instrument_id=instrument_id,
+                      order_direction=order_direction,
+                      quantity=quantity,
+                      price=price)
+
+
+def test_order_state_store_tracks_order_lifecycles():
+    matching_engine = MatchingEngine(risk_check=RiskCheck(RiskLimits(max_order_quantity=1000)))
+    order_states = OrderStateStore(symbols=matching_engine.symbols)
+    matching_engine.add_event_sink(order_states)
+
+    bid = limit_order("AAPL", OrderDirection.buy, 100, 10)
+    first_ask = limit_order("AAPL", OrderDirection.sell, 30, 9)
+    second_ask = limit_order("AAPL", OrderDirection.sell, 70, 10)
+    resting = limit_order("MSFT", OrderDirection.buy, 10, 20)
+    too_big = limit_order("MSFT", OrderDirection.buy, 10_000, 20)
+    for order in (bid, first_ask):
+        matching_engine.add_order(order)
+    matching_engine.match()
+
+    assert order_states.status(bid.order_id) == OrderStatus.live, "Test Failed: a partial fill should stay live"
+    state = order_states.lookup([bid.order_id])[0]
+    assert state["filled_quantity"] == 30 and state["average_price"] == 10, "Test Failed: incorrect fills"
+
+    for order in (second_ask, resting, too_big):
+        matching_engine.add_order(order)
+    matching_engine.match()
+    matching_engine.add_order(CancelOrder("MSFT", resting.order_id, OrderDirection.buy))
+    matching_engine.match()
+
+    states = order_states.lookup([bid.order_id, first_ask.order_id, second_ask.order_id,
+                                  resting.order_id, too_big.order_id, 10 ** 9])
+    assert states["status"].tolist() == [OrderStatus.filled.value, OrderStatus.filled.value,
+                                         OrderStatus.filled.value, OrderStatus.cancelled.value,
+                                         OrderStatus.rejected.value, 0], "Test Failed: incorrect statuses"
+    assert states["filled_quantity"].tolist() == [100, 30, 70, 0, 0, 0], "Test Failed: incorrect filled quantities"
+    assert states["average_price"][0] == 10 and np.isnan(states["average_price"][3]), \
+        "Test Failed: incorrect average prices"
+    assert states["symbol_id"].tolist() == [matching_engine.symbols["AAPL"]] * 3 + \
+        [matching_engine.symbols["MSFT"]] * 2 + [-1], "Test Failed: incorrect instruments"
+    assert order_states.status(10 ** 9) is None, "Test Failed: unknown orders should have no status"
+    pass
+
+
+def test_order_state_store_agrees_with_orders():
+    order_states = OrderStateStore()
+    matching_engine = MatchingEngine()
+    matching_engine.add_event_sink(order_states)
+    orders = [order for order in to_orders(OrderFlowGenerator(seed=2).generate(5_000))
+              if isinstance(order, BaseOrder)]
+    for order in orders:
+        matching_engine.add_order(order)
+    matching_engine.match()
+
+    states = order_states.lookup(order.order_id for order in orders)
+    assert states["status"].tolist() == [order.status.value for order in orders], \
+        "Test Failed: statuses should match the orders"
+    assert states["filled_quantity"] == pytest.approx([order.quantity - order.unfilled_quantity for order in orders]), \
+        "Test Failed: filled quantities should match the orders"
+    assert len(order_states) == len(orders), "Test Failed: every order should be recorded"
+    pass
+
+
+def test_order_state_store_evicts_completed_chunks():
+    order_states = OrderStateStore(chunk_bits=4, retention=32)
+    matching_engine = MatchingEngine()
+    matching_engine.add_event_sink(order_states)
+
+    live = limit_order("AAPL", OrderDirection.buy, 1, 1)
+    matching_engine.add_order(live)
+    for _ in range(100):
+        matching_engine.add_order(limit_order("AAPL", OrderDirection.buy, 1, 10))
+        matching_engine.add_order(limit_order("AAPL", OrderDirection.sell, 1, 10))
+    matching_engine.match()
+    newest = BaseOrder.id_generator() - 1
+
+    assert order_states.evicted > 0, "Test Failed: completed chunks should be evicted"
+    assert order_states.status(live.order_id) == OrderStatus.live, "Test Failed: live orders should be kept"
+    assert order_states.status(newest) == OrderStatus.filled, "Test Failed: recent orders should be kept"
+    assert order_states.status(live.order_id + 1) in (OrderStatus.filled, None), \
+        "Test Failed: only whole chunks should be evicted"
+    assert len(order_states) + order_states.evicted == 201, "Test Failed: every order should be counted"
+    pass
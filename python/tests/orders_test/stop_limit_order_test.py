@@ -0,0 +1,36 @@
+from python.src.orders import StopLimitOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+import pytest
+
+
+def test_stop_limit_order_buy():
+    instrument_id = "AAPL"
+    order_direction = OrderDirection.buy
+    quantity = 100
+    stop_price = 12
+    price = 13
+    stop_limit_order = StopLimitOrder(instrument_id=instrument_id,
+                                      order_direction=order_direction,
+                                      quantity=quantity,
+                                      stop_price=stop_price,
+                                      price=price)
+
+    assert stop_limit_order.quantity == quantity, "Test failed, incorrect quantity"
+    assert stop_limit_order.stop_price == stop_price, "Test failed, incorrect stop price"
+    assert stop_limit_order.price == price, "Test failed, incorrect price"
+    assert stop_limit_order.order_type == OrderType.stop_limit, "Test failed, incorrect order type"
+    pass
+
+
+def test_stop_limit_order_triggers_to_limit():
+    stop_limit_order = StopLimitOrder(instrument_id="AAPL",
+                                      order_direction=OrderDirection.sell,
+                                      quantity=100,
+                                      stop_price=8,
+                                      price=7)
+    stop_limit_order.trigger()
+
+    assert stop_limit_order.price == 7, "Test failed, incorrect price"
+    assert stop_limit_order.order_type == OrderType.limit, "Test failed, incorrect order type"
+    pass
@@ -0,0 +1,47 @@
+from python.src.orders import StopOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from python.src.exceptions import InvalidOrderDirectionException
+import pytest
+
+
+def test_stop_order_buy():
+    instrument_id = "AAPL"
+    order_direction = OrderDirection.buy
+    quantity = 100
+    stop_price = 12
+    stop_order = StopOrder(instrument_id=instrument_id,
+                           order_direction=order_direction,
+                           quantity=quantity,
+                           stop_price=stop_price)
+
+    assert stop_order.quantity == quantity, "Test failed, incorrect quantity"
+    assert stop_order.stop_price == stop_price, "Test failed, incorrect stop price"
+    assert stop_order.price == float("inf"), "Test failed, incorrect price"
+    assert stop_order.order_type == OrderType.stop, "Test failed, incorrect order type"
+    pass
+
+
+def test_stop_order_sell_triggers_to_market():
+    instrument_id = "AAPL"
+    order_direction = OrderDirection.sell
+    quantity = 100
+    stop_price = 8
+    stop_order = StopOrder(instrument_id=instrument_id,
+                           order_direction=order_direction,
+                           quantity=quantity,
+                           stop_price=stop_price)
+    stop_order.trigger()
+
+    assert stop_order.price == 0, "Test failed, incorrect price"
+    assert stop_order.order_type == OrderType.market, "Test failed, incorrect order type"
+    pass
+
+
+def test_stop_order_raises_on_invalid_direction():
+    with pytest.raises(InvalidOrderDirectionException):
+        StopOrder(instrument_id="AAPL",
+                  order_direction=OrderDirection.test,
+                  quantity=100,
+                  stop_price=10)
+    pass
@@ -1,47 +1,15 @@
-from python.src.orders import LimitOrder
-from python.src.orders import MarketOrder
-from python.src.orders import CancelOrder
-from python.src.enums import OrderDirection
+from python.src.order_flow import OrderFlowGenerator, to_orders
 from python.src.enums import OrderStatus
 from python.src.matching_engine import MatchingEngine
-import random
 import cProfile
 import pstats
 
 num_orders = 10_000
 
 
-def get_data(n):
-    instrument_ids = ["AAPL", "MSFT", "TSLA", "FB", "NFLX"]
-    quantity = 100
-    price = 40
-    m = n // len(instrument_ids)
-    output = []
-    for instr in instrument_ids:
-        buy_limits = [LimitOrder(instrument_id=instr,
-                                 order_direction=OrderDirection.buy,
-                                 quantity=quantity + random.uniform(-50, 50),
-                                 price=price + random.uniform(-2.5, 2.5))
-                      for i in range(m//4)]
-        sell_limits = [LimitOrder(instrument_id=instr,
-                                  order_direction=OrderDirection.sell,
-                                  quantity=quantity + random.uniform(-50, 50),
-                                  price=price + random.uniform(-2.5, 2.5))
-                       for i in range(m//4)]
-
-        buy_markets = [MarketOrder(instrument_id=instr,
-                                   order_direction=OrderDirection.buy,
-                                   quantity=quantity + random.uniform(-50, 50))
-                       for i in range(m//4)]
-
-        sell_markets = [MarketOrder(instrument_id=instr,
-                                    order_direction=OrderDirection.sell,
-                                    quantity=quantity +
-                                    random.uniform(-50, 50))
-                        for i in range(m//4)]
-        output += buy_limits + sell_limits + buy_markets + sell_markets
-        random.shuffle(output)
-    return output
+def get_data(n, cancel_ratio=0.):
+    generator = OrderFlowGenerator(cancel_ratio=cancel_ratio, market_ratio=0.1, seed=n)
+    return to_orders(generator.generate(n))
 
 
 orders = get_data(num_orders)
@@ -62,13 +30,7 @@ matches / num_orders
 #  Test cancels
 
 
-orders = get_data(num_orders)
-cancels = [CancelOrder(instrument_id=o.instrument_id,
-                       order_id=o.order_id,
-                       order_direction=o.order_direction)
-           for o in orders]
-orders = orders + cancels
-random.shuffle(orders)
+orders = get_data(2 * num_orders, cancel_ratio=0.5)
 
 matching_engine = MatchingEngine()
 for order in orders:
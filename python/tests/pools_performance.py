@@ -0,0 +1,59 @@
+from python.src.pools import OrderPool
+from python.src.order_flow import OrderFlowGenerator
+from python.src.matching_engine import MatchingEngine
+from python.src.replay import SimulatedClock
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+import numpy as np
+import time
+import gc
+
+n = 500_000
+
+# Half of all limit orders cross on arrival, so the books stay shallow and most orders complete.
+records = OrderFlowGenerator(cancel_ratio=0., market_ratio=0.1, cross_ratio=0.5, price_distance=2., seed=0).generate(n)
+rows = list(zip(records["order_type"].tolist(),
+                [OrderDirection(d) for d in records["order_direction"].tolist()],
+                [i.decode() for i in records["instrument_id"].tolist()],
+                records["quantity"].tolist(),
+                records["price"].tolist()))
+limit = OrderType.limit.value
+
+
+def run(order_pool):
+    """ Build and submit each order in turn, timing each one, with Trade objects and no history."""
+
+    if order_pool is None:
+        limit_order, market_order = LimitOrder, MarketOrder
+    else:
+        limit_order, market_order = order_pool.limit_order, order_pool.market_order
+    matching_engine = MatchingEngine(max_history=0, clock=SimulatedClock(), order_pool=order_pool)
+    submit = matching_engine.submit
+    latencies = np.empty(n, dtype=np.int64)
+    perf_counter_ns = time.perf_counter_ns
+
+    gc.collect()
+    collections = [s["collections"] for s in gc.get_stats()]
+    for i, (order_type, order_direction, instrument_id, quantity, price) in enumerate(rows):
+        start = perf_counter_ns()
+        if order_type == limit:
+            submit(limit_order(instrument_id, order_direction, quantity, price))
+        else:
+            submit(market_order(instrument_id, order_direction, quantity))
+        latencies[i] = perf_counter_ns() - start
+    collections = [s["collections"] - c for s, c in zip(gc.get_stats(), collections)]
+    return latencies, collections
+
+
+for name, order_pool in (("allocating", None), ("pooled", OrderPool())):
+    latencies, collections = run(order_pool)
+    p50, p99, p999 = np.percentile(latencies, [50, 99, 99.9]) / 1e3
+    print(f"{name:>10}: p50 {p50:.1f}us, p99 {p99:.1f}us, p99.9 {p999:.1f}us, max {latencies.max() / 1e3:.0f}us, "
+          f"GC collections per generation {collections}")
+    if order_pool is not None:
+        orders_created = sum(p.created for p in set(order_pool.order_pools.values()))
+        orders_reused = sum(p.reused for p in set(order_pool.order_pools.values()))
+        print(f"{'':>10}  orders allocated {orders_created:,}, reused {orders_reused:,}; "
+              f"trades allocated {order_pool.trade_pool.created:,}, reused {order_pool.trade_pool.reused:,}")
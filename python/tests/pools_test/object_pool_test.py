@@ -0,0 +1,50 @@
+from python.src.pools import ObjectPool, RecyclingDeque
+from python.src.trades import Trade
+from python.src.exceptions import UseAfterReleaseException
+import pytest
+
+
+def test_object_pool_reuses_released_objects():
+    pool = ObjectPool(Trade, capacity=1)
+    first = Trade(None, 10., 100.)
+    second = Trade(None, 11., 100.)
+
+    assert pool.acquire() is None, "Test Failed: an empty pool should have nothing to reuse"
+    pool.release(first)
+    pool.release(second)
+    assert len(pool) == 1, "Test Failed: the pool should keep at most capacity objects"
+    assert pool.acquire() is first, "Test Failed: the released object should be reused"
+    assert (pool.created, pool.reused, pool.released) == (1, 1, 1), "Test Failed: incorrect counts"
+    pass
+
+
+def test_object_pool_detects_use_after_release_in_debug_mode():
+    pool = ObjectPool(Trade, debug=True)
+    trade = Trade(None, 10., 100.)
+    pool.release(trade)
+
+    with pytest.raises(UseAfterReleaseException):
+        trade.price
+    with pytest.raises(UseAfterReleaseException):
+        trade.price = 11.
+    with pytest.raises(UseAfterReleaseException):
+        pool.release(trade)
+
+    assert pool.acquire() is trade, "Test Failed: the released object should be reused"
+    trade.price = 11.
+    assert trade.price == 11., "Test Failed: a reacquired object should be usable"
+    pass
+
+
+def test_recycling_deque_releases_evicted_entries():
+    released = []
+    history = RecyclingDeque(released.append, maxlen=2)
+    for i in range(4):
+        history.append(i)
+    assert list(history) == [2, 3], "Test Failed: the most recent entries should be kept"
+    assert released == [0, 1], "Test Failed: evicted entries should be released in order"
+
+    released.clear()
+    RecyclingDeque(released.append, maxlen=0).append(5)
+    assert released == [5], "Test Failed: with no history entries should be released at once"
+    pass
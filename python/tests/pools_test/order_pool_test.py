@@ -0,0 +1,92 @@
+from python.src.pools import OrderPool
+from python.src.order_book import OrderBook
+from python.src.matching_engine import MatchingEngine
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderStatus
+from python.src.enums import OrderType
+from python.src.exceptions import UseAfterReleaseException
+import pytest
+
+
+def test_order_pool_recycles_completed_orders_and_trades():
+    order_pool = OrderPool()
+    order_book = OrderBook(max_history=0, order_pool=order_pool)
+
+    bid = order_pool.limit_order("AAPL", OrderDirection.buy, 100, 10)
+    ask = order_pool.limit_order("AAPL", OrderDirection.sell, 100, 10)
+    order_book.add_order(bid)
+    order_book.add_order(ask)
+    order_book.match()
+    bid_id = bid.order_id
+
+    assert not order_book.complete_orders, "Test Failed: no history should be kept"
+    assert len(order_pool.trade_pool) == 1, "Test Failed: the trade should be back in the pool"
+
+    order = order_pool.limit_order("AAPL", OrderDirection.buy, 50, 11)
+    assert order is ask, "Test Failed: the most recently released order should be reused"
+    assert order.order_id > bid_id, "Test Failed: a reused order should get a new order_id"
+    assert (order.order_direction, order.quantity, order.unfilled_quantity, order.price) == \
+        (OrderDirection.buy, 50, 50, 11), "Test Failed: a reused order should be re-initialised"
+    assert order.status == OrderStatus.live and not order.fill_info, "Test Failed: a reused order should be fresh"
+    assert order_pool.trade(None, 1., 2.) is not None, "Test Failed: trades should be built through the pool"
+    pass
+
+
+def test_order_pool_reinitialises_every_order_type():
+    order_pool = OrderPool()
+    released = [order_pool.limit_order("AAPL", OrderDirection.buy, 10, 9, "a", "c"),
+                order_pool.market_order("AAPL", OrderDirection.buy, 10, "a", "c"),
+                order_pool.stop_order("AAPL", OrderDirection.buy, 10, 12, "a", "c"),
+                order_pool.stop_limit_order("AAPL", OrderDirection.buy, 10, 12, 13, "a", "c")]
+    for order in released:
+        order.fill(4)
+        order.fill_info.append(None)
+        order_pool.order_pools[type(order)].release(order)
+
+    orders = [order_pool.limit_order("MSFT", OrderDirection.sell, 5, 20),
+              order_pool.market_order("MSFT", OrderDirection.sell, 5),
+              order_pool.stop_order("MSFT", OrderDirection.sell, 5, 18),
+              order_pool.stop_limit_order("MSFT", OrderDirection.sell, 5, 18, 17)]
+    assert [o is r for o, r in zip(orders, released)] == [True] * 4, "Test Failed: every order should be reused"
+    for order in orders:
+        assert (order.instrument_id, order.order_direction, order.quantity, order.unfilled_quantity) == \
+            ("MSFT", OrderDirection.sell, 5, 5), "Test Failed: {} not re-initialised".format(type(order).__name__)
+        assert order.account_id is None and order.client_order_id is None, "Test Failed: ids should be reset"
+        assert order.status == OrderStatus.live and not order.fill_info, "Test Failed: the order should be fresh"
+    assert [o.order_type for o in orders] == [OrderType.limit, OrderType.market, OrderType.stop, OrderType.stop_limit], \
+        "Test Failed: incorrect order types"
+    assert [o.price for o in orders] == [20, 0., 0., 17], "Test Failed: incorrect prices"
+    assert [o.stop_price for o in orders[2:]] == [18, 18], "Test Failed: incorrect stop prices"
+    pass
+
+
+def test_order_pool_keeps_trades_while_an_order_holds_them():
+    order_pool = OrderPool()
+    order_book = OrderBook(max_history=0, order_pool=order_pool)
+
+    bid = order_pool.limit_order("AAPL", OrderDirection.buy, 100, 10)
+    ask = order_pool.limit_order("AAPL", OrderDirection.sell, 40, 10)
+    order_book.add_order(bid)
+    order_book.add_order(ask)
+    order_book.match()
+
+    assert len(order_pool.trade_pool) == 0, "Test Failed: the live bid still holds the trade"
+    assert bid.fill_info[0].quantity == 40, "Test Failed: the live bid's trade should be intact"
+    pass
+
+
+def test_order_pool_detects_use_after_release():
+    order_pool = OrderPool(debug=True)
+    matching_engine = MatchingEngine(max_history=0, order_pool=order_pool)
+
+    bid = order_pool.limit_order("AAPL", OrderDirection.buy, 100, 10)
+    ask = order_pool.limit_order("AAPL", OrderDirection.sell, 100, 10)
+    matching_engine.add_order(bid)
+    matching_engine.add_order(ask)
+    matching_engine.match()
+
+    assert not matching_engine.processed_orders, "Test Failed: processed orders should not be kept"
+    with pytest.raises(UseAfterReleaseException):
+        bid.status
+    pass
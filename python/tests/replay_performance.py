@@ -0,0 +1,52 @@
+from python.src.replay import ReplayDriver, SimulatedClock, read_binary
+from python.src.matching_engine import MatchingEngine
+from python.src.codec import ORDER, encode_frame
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from python.src.enums import MessageType
+import numpy as np
+import resource
+import tempfile
+import time
+import os
+
+chunk_size = 1 << 16
+
+
+def get_records(n, seed):
+    """ Limit and market orders in equal numbers, so the books stay shallow."""
+
+    rng = np.random.default_rng(seed)
+    records = np.zeros(n, dtype=ORDER)
+    records["order_type"] = rng.choice([OrderType.limit.value, OrderType.market.value], n)
+    records["order_direction"] = rng.choice([OrderDirection.buy.value, OrderDirection.sell.value], n)
+    records["instrument_id"] = rng.choice([b"AAPL", b"MSFT", b"TSLA", b"FB", b"NFLX"], n)
+    records["quantity"] = 100 + rng.uniform(-50, 50, n)
+    records["price"] = 40 + rng.uniform(-2.5, 2.5, n)
+    records["sent_ns"] = 1_600_000_000_000_000_000 + np.cumsum(rng.exponential(1e5, n)).astype(np.int64)
+    return records
+
+
+def write_file(path, n):
+    """ Write n orders as a binary order file, one chunk at a time."""
+
+    with open(path, "wb") as f:
+        for start in range(0, n, chunk_size):
+            f.write(encode_frame(MessageType.order, get_records(min(chunk_size, n - start), start)))
+
+
+def replay(path):
+    matching_engine = MatchingEngine(clock=SimulatedClock(), max_history=0)
+    replay_driver = ReplayDriver(matching_engine)
+    start = time.perf_counter()
+    n = replay_driver.run(read_binary(path, chunk_bytes=chunk_size * ORDER.itemsize))
+    return n, time.perf_counter() - start
+
+
+with tempfile.TemporaryDirectory() as directory:
+    for n in (250_000, 1_000_000):
+        path = os.path.join(directory, "orders.bin")
+        write_file(path, n)
+        replayed, elapsed = replay(path)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"{replayed:,} orders: {replayed / elapsed:,.0f} orders per second, peak RSS {peak:.0f} MB")
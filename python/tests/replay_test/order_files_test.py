@@ -0,0 +1,60 @@
+from python.src.replay import read_csv, write_csv, read_binary, write_binary
+from python.src.codec import ORDER, orders_to_records
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.orders import CancelOrder
+from python.src.orders import StopLimitOrder
+from python.src.enums import OrderDirection
+import numpy as np
+import pytest
+
+
+def get_records(n):
+    orders = []
+    for i in range(n):
+        direction = OrderDirection.buy if i % 2 else OrderDirection.sell
+        if i % 4 == 0:
+            orders.append(MarketOrder("MSFT", direction, 10.5 + i, account_id="acct"))
+        elif i % 4 == 1:
+            orders.append(CancelOrder("AAPL", i, direction, client_order_id="c{}".format(i)))
+        elif i % 4 == 2:
+            orders.append(StopLimitOrder("TSLA", direction, 7, 99.5, 100.25))
+        else:
+            orders.append(LimitOrder("AAPL", direction, 1 / 3, 10.1 + i))
+    records = orders_to_records(orders)
+    records["sent_ns"] = 1_600_000_000_000_000_000 + np.arange(n) * 1_000
+    return records
+
+
+def test_csv_order_files_round_trip_in_chunks(tmp_path):
+    records = get_records(10)
+    path = str(tmp_path / "orders.csv")
+    write_csv(path, records)
+
+    chunks = list(read_csv(path, chunk_size=4))
+
+    assert [len(c) for c in chunks] == [4, 4, 2], "Test Failed: incorrect chunks"
+    assert all(c.dtype == ORDER for c in chunks), "Test Failed: incorrect dtype"
+    assert np.array_equal(np.concatenate(chunks), records), "Test Failed: records should round trip"
+    pass
+
+
+def test_csv_order_files_reject_unknown_names(tmp_path):
+    path = tmp_path / "orders.csv"
+    path.write_text("header\n1,limit,hold,AAPL,0,1,1,0,,\n")
+
+    with pytest.raises(ValueError):
+        list(read_csv(str(path)))
+    pass
+
+
+def test_binary_order_files_round_trip_across_chunks(tmp_path):
+    records = get_records(10)
+    path = str(tmp_path / "orders.bin")
+    write_binary(path, records, frame_size=3)
+
+    chunks = list(read_binary(path, chunk_bytes=2 * ORDER.itemsize + 5))
+
+    assert len(chunks) > 1, "Test Failed: the file should be read in chunks"
+    assert np.array_equal(np.concatenate(chunks), records), "Test Failed: records should round trip"
+    pass
@@ -0,0 +1,118 @@
+from python.src.replay import ReplayDriver, SimulatedClock
+from python.src.matching_engine import MatchingEngine
+from python.src.codec import ORDER
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+import numpy as np
+import pytest
+import time
+
+
+def get_records(times):
+    n = len(times)
+    records = np.zeros(n, dtype=ORDER)
+    records["order_type"] = OrderType.limit.value
+    records["order_direction"] = [OrderDirection.sell.value if i % 2 == 0 else OrderDirection.buy.value
+                                  for i in range(n)]
+    records["instrument_id"] = b"AAPL"
+    records["quantity"] = 100
+    records["price"] = 10
+    records["sent_ns"] = times
+    return records
+
+
+def test_replay_driver_requires_simulated_clock():
+    with pytest.raises(ValueError):
+        ReplayDriver(MatchingEngine())
+    pass
+
+
+def test_replay_driver_stamps_trades_with_historical_times():
+    times = [1_600_000_000_000_000_000 + i * 1_000_000 for i in range(6)]
+    matching_engine = MatchingEngine(clock=SimulatedClock(), max_history=2)
+    replay_driver = ReplayDriver(matching_engine)
+
+    records = get_records(times)
+    replayed = replay_driver.run([records[:3], records[3:]])
+    order_book = matching_engine.order_books["AAPL"]
+
+    assert replayed == 6, "Test Failed: every order should be replayed"
+    assert len(matching_engine.processed_orders) == 2, "Test Failed: history should be bounded"
+    assert len(order_book.complete_orders) == 2, "Test Failed: history should be bounded"
+    assert [t.datetime for t in order_book.trades] == [np.datetime64(times[3], "ns"),
+                                                       np.datetime64(times[5], "ns")], \
+        "Test Failed: trades should carry the time of the order which crossed"
+    pass
+
+
+def test_replay_driver_paces_against_the_wall_clock():
+    times = [0, 50_000_000, 100_000_000]
+    matching_engine = MatchingEngine(clock=SimulatedClock())
+    replay_driver = ReplayDriver(matching_engine, speed=2.)
+
+    start = time.perf_counter()
+    replay_driver.run([get_records(times)])
+    elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.05, "Test Failed: 100ms at double speed should take at least 50ms"
+    assert elapsed < 0.5, "Test Failed: the replay should not fall far behind"
+    pass
+
+
+def test_replayed_cancels_find_their_orders():
+    records = get_records([1, 2, 3, 4])
+    records["order_direction"] = OrderDirection.buy.value
+    records["price"] = [10, 11, 12, 13]
+    cancels = np.zeros(3, dtype=ORDER)
+    cancels["order_type"] = OrderType.cancel.value
+    cancels["order_direction"] = OrderDirection.buy.value
+    cancels["instrument_id"] = b"AAPL"
+    cancels["order_id"] = [1, 3, 4]
+    cancels["sent_ns"] = [5, 6, 7]
+
+    # Ids handed out before the replay should not shift the replayed ones.
+    for _ in range(5):
+        LimitOrder("AAPL", OrderDirection.buy, 1, 1)
+    matching_engine = MatchingEngine(clock=SimulatedClock())
+    ReplayDriver(matching_engine).run([records, cancels])
+
+    order_book = matching_engine.order_books["AAPL"]
+    assert sorted(order_book.order_index) == [2], "Test Failed: recorded cancels should cancel their orders"
+    assert order_book.best_bid.price == 11, "Test Failed: the uncancelled order should rest"
+    pass
+
+
+def test_replayed_orders_keep_recorded_ids():
+    records = get_records([1, 2, 3, 4])
+    records["order_direction"] = OrderDirection.buy.value
+    records["price"] = [10, 11, 12, 13]
+    records["order_id"] = [5, 6, 7, 8]
+    cancels = np.zeros(3, dtype=ORDER)
+    cancels["order_type"] = OrderType.cancel.value
+    cancels["order_direction"] = OrderDirection.buy.value
+    cancels["instrument_id"] = b"AAPL"
+    cancels["order_id"] = [5, 7, 8]
+    cancels["sent_ns"] = [5, 6, 7]
+
+    matching_engine = MatchingEngine(clock=SimulatedClock())
+    ReplayDriver(matching_engine).run([records, cancels])
+
+    order_book = matching_engine.order_books["AAPL"]
+    assert sorted(order_book.order_index) == [6], "Test Failed: recorded cancels should cancel their orders"
+    pass
+
+
+def test_replay_driver_rejects_orders_with_and_without_recorded_ids():
+    records = get_records([1, 2, 3, 4])
+    records["order_id"] = [0, 0, 2, 0]
+    with pytest.raises(ValueError):
+        ReplayDriver(MatchingEngine(clock=SimulatedClock())).replay(records)
+
+    # A generated id could equally collide with one recorded in a later chunk.
+    records["order_id"] = [0, 0, 0, 0]
+    later = get_records([5, 6])
+    later["order_id"] = [1, 2]
+    with pytest.raises(ValueError):
+        ReplayDriver(MatchingEngine(clock=SimulatedClock())).run([records, later])
+    pass
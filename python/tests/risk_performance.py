@@ -0,0 +1,59 @@
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+from python.src.risk import RiskCheck
+from python.src.risk import RiskLimits
+from python.src.matching_engine import MatchingEngine
+import random
+import time
+
+num_orders = 200_000
+accounts = [f"ACCOUNT{i}" for i in range(100)]
+instrument_ids = ["AAPL", "MSFT", "TSLA", "FB", "NFLX"]
+
+
+def get_data(n):
+    directions = [OrderDirection.buy, OrderDirection.sell]
+    return [LimitOrder(instrument_id=random.choice(instrument_ids),
+                       order_direction=random.choice(directions),
+                       quantity=100 + random.uniform(-50, 50),
+                       price=40 + random.uniform(-2.5, 2.5),
+                       account_id=random.choice(accounts))
+            for i in range(n)]
+
+
+limits = RiskLimits(max_order_quantity=1_000,
+                    max_notional=100_000,
+                    max_position=1e12,
+                    price_band=0.1,
+                    max_message_rate=1e9,
+                    max_message_burst=1e9)
+
+# Cost of the checks alone
+random.seed(0)
+orders = get_data(num_orders)
+risk_check = RiskCheck(limits)
+check = risk_check.check
+start = time.perf_counter()
+for order in orders:
+    check(order, 40.)
+elapsed = time.perf_counter() - start
+print(f"RiskCheck.check: {1e9 * elapsed / num_orders:.0f} ns per order")
+
+# Added cost inside the engine: checks plus keeping exposures current from events
+
+
+def run(risk_check):
+    random.seed(0)
+    matching_engine = MatchingEngine(risk_check=risk_check)
+    for order in get_data(num_orders):
+        matching_engine.add_order(order)
+    start = time.perf_counter()
+    matching_engine.match()
+    return time.perf_counter() - start
+
+
+without_risk = run(None)
+with_risk = run(RiskCheck(limits))
+print(f"Engine without risk: {1e6 * without_risk / num_orders:.2f} us per order")
+print(f"Engine with risk:    {1e6 * with_risk / num_orders:.2f} us per order")
+print(f"Added cost:          {1e9 * (with_risk - without_risk) / num_orders:.0f} ns per order")
@@ -0,0 +1,174 @@
+from python.src.risk import RiskCheck
+from python.src.risk import RiskLimits
+from python.src.risk import risk_check as reasons
+from python.src.matching_engine import MatchingEngine
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.orders import CancelOrder
+from python.src.orders import MassCancelOrder
+from python.src.orders import Quote
+from python.src.enums import OrderDirection
+import pytest
+
+
+def make_order(quantity=100, price=10, order_direction=OrderDirection.buy, account_id="MM1"):
+    return LimitOrder(instrument_id="AAPL",
+                      order_direction=order_direction,
+                      quantity=quantity,
+                      price=price,
+                      account_id=account_id)
+
+
+def test_risk_check_passes_within_limits():
+    risk_check = RiskCheck(RiskLimits(max_order_quantity=100, max_notional=1000))
+
+    assert risk_check.check(make_order(), last_price=10) is None, "Test Failed: the order should pass"
+    pass
+
+
+def test_risk_check_limits_order_quantity_and_notional():
+    risk_check = RiskCheck(RiskLimits(max_order_quantity=100, max_notional=1500))
+
+    assert risk_check.check(make_order(quantity=101), None) == reasons.ORDER_QUANTITY, \
+        "Test Failed: the quantity limit should be breached"
+    assert risk_check.check(make_order(price=20), None) == reasons.NOTIONAL, \
+        "Test Failed: the notional limit should be breached"
+    pass
+
+
+def test_risk_check_values_market_orders_at_last_price():
+    risk_check = RiskCheck(RiskLimits(max_notional=1500))
+    market_order = MarketOrder(instrument_id="AAPL",
+                               order_direction=OrderDirection.buy,
+                               quantity=100)
+
+    assert risk_check.check(market_order, last_price=10) is None, "Test Failed: the order should pass"
+    assert risk_check.check(market_order, last_price=20) == reasons.NOTIONAL, \
+        "Test Failed: the notional limit should be breached"
+    pass
+
+
+def test_risk_check_enforces_price_band():
+    risk_check = RiskCheck(RiskLimits(price_band=0.1))
+
+    assert risk_check.check(make_order(price=10.5), last_price=10) is None, "Test Failed: the order should pass"
+    assert risk_check.check(make_order(price=11.5), last_price=10) == reasons.PRICE_BAND, \
+        "Test Failed: the price band should be breached"
+    assert risk_check.check(make_order(price=11.5), last_price=None) is None, \
+        "Test Failed: there is no band before the first trade"
+    pass
+
+
+def test_risk_check_counts_open_orders_and_fills_towards_position():
+    risk_check = RiskCheck(RiskLimits(max_position=150))
+    order = make_order()
+    assert risk_check.check(order, None) is None, "Test Failed: the order should pass"
+    risk_check.on_accepted(order)
+
+    assert risk_check.check(make_order(), None) == reasons.POSITION, \
+        "Test Failed: open orders should count towards position"
+
+    risk_check.on_filled(order, 10, 100)
+    exposure = risk_check.exposure("MM1", "AAPL")
+    assert exposure.position == 100, "Test Failed: the fill should add to position"
+    assert exposure.open_buys == 0, "Test Failed: the fill should reduce open buys"
+
+    sell_order = make_order(quantity=250, order_direction=OrderDirection.sell)
+    assert risk_check.check(sell_order, None) is None, "Test Failed: selling down to -150 should pass"
+    risk_check.on_accepted(sell_order)
+    risk_check.on_cancelled(sell_order, CancelOrder(instrument_id="AAPL",
+                                                    order_id=sell_order.order_id,
+                                                    order_direction=OrderDirection.sell))
+    assert exposure.open_sells == 0, "Test Failed: the cancel should reduce open sells"
+    pass
+
+
+def test_risk_check_throttles_message_rate():
+    now = [0.]
+    risk_check = RiskCheck(RiskLimits(max_message_rate=10, max_message_burst=2),
+                           clock=lambda: now[0])
+
+    assert risk_check.check(make_order(), None) is None, "Test Failed: the first order should pass"
+    assert risk_check.check(make_order(), None) is None, "Test Failed: the second order should pass"
+    assert risk_check.check(make_order(), None) == reasons.MESSAGE_RATE, \
+        "Test Failed: the burst should be exhausted"
+    now[0] = 0.1
+    assert risk_check.check(make_order(), None) is None, "Test Failed: the bucket should refill"
+    pass
+
+
+def test_risk_check_prefers_instrument_limits():
+    risk_check = RiskCheck()
+    risk_check.set_limits(RiskLimits(max_order_quantity=50), account_id="MM1")
+    risk_check.set_limits(RiskLimits(max_order_quantity=200), account_id="MM1", instrument_id="AAPL")
+
+    assert risk_check.check(make_order(), None) is None, "Test Failed: the instrument limit should apply"
+    assert risk_check.check(make_order(account_id="MM2"), None) is None, \
+        "Test Failed: other accounts should use the default"
+    assert risk_check.limits_for("MM1", "MSFT").max_order_quantity == 50, \
+        "Test Failed: the account limit should apply to other instruments"
+    pass
+
+
+def test_risk_check_checks_each_side_of_a_quote():
+    risk_check = RiskCheck(RiskLimits(max_order_quantity=100, price_band=0.1))
+
+    assert risk_check.check(Quote("AAPL", 9.5, 100, 10.5, 100, account_id="MM1"), last_price=10) is None, \
+        "Test Failed: the quote should pass"
+    assert risk_check.check(Quote("AAPL", 9.5, 100, 10.5, 101, account_id="MM1"), None) == reasons.ORDER_QUANTITY, \
+        "Test Failed: the ask should breach the quantity limit"
+    assert risk_check.check(Quote("AAPL", 8, 100, 10.5, 0, account_id="MM1"), last_price=10) == reasons.PRICE_BAND, \
+        "Test Failed: the bid should breach the price band"
+    assert risk_check.check(Quote("AAPL", 0, 0, 20, 0, account_id="MM1"), last_price=10) is None, \
+        "Test Failed: pulled sides should not be checked"
+    pass
+
+
+def test_risk_check_throttles_cancels():
+    now = [0.]
+    risk_check = RiskCheck(RiskLimits(max_message_rate=10, max_message_burst=2), clock=lambda: now[0])
+    cancel = CancelOrder("AAPL", 1, OrderDirection.buy, account_id="MM1")
+
+    assert risk_check.check(cancel, None) is None, "Test Failed: the first cancel should pass"
+    assert risk_check.check(MassCancelOrder("AAPL", "MM1"), None) is None, "Test Failed: the mass cancel should pass"
+    assert risk_check.check(cancel, None) == reasons.MESSAGE_RATE, "Test Failed: cancels should be throttled"
+    assert risk_check.check(make_order(), None) == reasons.MESSAGE_RATE, \
+        "Test Failed: cancels should share the account's throttle"
+    assert risk_check.check(CancelOrder("AAPL", 1, OrderDirection.buy, account_id="MM2"), None) is None, \
+        "Test Failed: other accounts should have their own throttle"
+    pass
+
+
+def test_risk_check_takes_fills_from_trades():
+    trades = []
+    risk_check = RiskCheck(RiskLimits(max_position=150))
+    matching_engine = MatchingEngine(risk_check=risk_check, trade_sink=lambda *trade: trades.append(trade))
+    matching_engine.add_order(make_order(quantity=100))
+    matching_engine.add_order(make_order(quantity=60, order_direction=OrderDirection.sell, account_id="MM2"))
+    matching_engine.match()
+
+    assert not matching_engine.order_books["AAPL"].event_sink.wants_fills, \
+        "Test Failed: the books should not report fills for the risk check"
+    buyer = risk_check.exposure("MM1", "AAPL")
+    assert (buyer.position, buyer.open_buys) == (60, 40), "Test Failed: the trade should update the buyer"
+    assert risk_check.exposure("MM2", "AAPL").position == -60, "Test Failed: the trade should update the seller"
+    assert len(trades) == 1, "Test Failed: trades should still reach the engine's trade sink"
+    assert risk_check.check(make_order(quantity=60), None) == reasons.POSITION, \
+        "Test Failed: the position limit should count the fill"
+    pass
+
+
+def test_risk_check_keeps_trades_recorded():
+    risk_check = RiskCheck(RiskLimits(max_position=150))
+    matching_engine = MatchingEngine(risk_check=risk_check)
+    bid = make_order(quantity=100)
+    matching_engine.add_order(bid)
+    matching_engine.add_order(make_order(quantity=60, order_direction=OrderDirection.sell, account_id="MM2"))
+    matching_engine.match()
+
+    order_book = matching_engine.order_books["AAPL"]
+    assert order_book.trade_sink is None, "Test Failed: the risk check should not become the trade sink"
+    assert [t.quantity for t in order_book.trades] == [60], "Test Failed: the book should still record trades"
+    assert [t.quantity for t in bid.fill_info] == [60], "Test Failed: orders should still record their fills"
+    assert risk_check.exposure("MM1", "AAPL").position == 60, "Test Failed: the trade should update the buyer"
+    pass
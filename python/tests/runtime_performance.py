@@ -0,0 +1,53 @@
+from python.src.runtime import GcPauses
+from python.src.runtime import LowLatencyMode
+from python.src.order_flow import OrderFlowGenerator
+from python.src.order_flow import to_orders
+from python.src.matching_engine import MatchingEngine
+from python.src.replay import SimulatedClock
+import numpy as np
+import time
+import gc
+
+n = 400_000
+burst = 1_000
+
+# Few orders cross on arrival, so the books grow deep and every collection has many resting orders to traverse.
+orders = to_orders(OrderFlowGenerator(cancel_ratio=0.2, market_ratio=0.02, cross_ratio=0.05, seed=0).generate(n))
+
+
+def run(low_latency):
+    """ Submit the orders in bursts, timing each one, with an idle gap after each burst."""
+
+    matching_engine = MatchingEngine(max_history=0, clock=SimulatedClock())
+    submit = matching_engine.submit
+    latencies = np.empty(n, dtype=np.int64)
+    perf_counter_ns = time.perf_counter_ns
+    gc_pauses = GcPauses()
+
+    gc.collect()
+    if low_latency is None:
+        gc_pauses.install()
+    else:
+        low_latency.start(matching_engine)
+        gc_pauses = low_latency.gc_pauses
+    try:
+        for i, order in enumerate(orders):
+            start = perf_counter_ns()
+            submit(order)
+            latencies[i] = perf_counter_ns() - start
+            if low_latency is not None and not (i + 1) % burst:
+                low_latency.tick(busy=False)
+    finally:
+        if low_latency is None:
+            gc_pauses.uninstall()
+        else:
+            low_latency.stop()
+    return latencies, gc_pauses
+
+
+for name, low_latency in (("default", None), ("low latency", LowLatencyMode(idle_interval=0.))):
+    latencies, gc_pauses = run(low_latency)
+    p50, p99, p999 = np.percentile(latencies, [50, 99, 99.9]) / 1e3
+    print(f"{name:>11}: p50 {p50:.1f}us, p99 {p99:.1f}us, p99.9 {p999:.1f}us, max {latencies.max() / 1e3:.0f}us")
+    print(f"{'':>11}  GC collections per generation {gc_pauses.collections}, "
+          f"longest pause per generation {[round(p / 1e3) for p in gc_pauses.longest]}us")
@@ -0,0 +1,22 @@
+from python.src.runtime import GcPauses
+import gc
+
+
+def test_gc_pauses_records_collections():
+    gc_pauses = GcPauses()
+    gc_pauses.install()
+    try:
+        gc.collect(0)
+        gc.collect()
+    finally:
+        gc_pauses.uninstall()
+    gc.collect()
+
+    assert gc_pauses.collections[0] >= 1 and gc_pauses.collections[2] >= 1, \
+        "Test Failed: both collections should be recorded"
+    assert len(gc_pauses.recent) == sum(gc_pauses.collections), "Test Failed: every pause should be kept"
+    assert gc_pauses.longest[2] > 0 and gc_pauses.total[2] >= gc_pauses.longest[2], \
+        "Test Failed: pauses should have a duration"
+    assert 0 < gc_pauses.percentile(50) <= max(gc_pauses.longest), "Test Failed: incorrect percentile"
+    assert gc_pauses not in gc.callbacks, "Test Failed: the callback should be removed"
+    pass
@@ -0,0 +1,123 @@
+from python.src.runtime import LowLatencyMode
+from python.src.matching_engine import MatchingEngine
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+from python.src.enums import MatchingAlgorithm
+from python.tests.events_test.recording_sink import RecordingSink
+from typing import List
+import gc
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.
+
+    def __call__(self):
+        return self.now
+
+
+def test_low_latency_mode_freezes_and_collects_when_idle():
+    clock = Clock()
+    low_latency = LowLatencyMode(warm_up_orders=0, idle_interval=1., full_interval=10., clock=clock)
+    low_latency.start()
+    try:
+        assert not gc.isenabled(), "Test Failed: automatic collection should be disabled"
+        assert gc.get_freeze_count() > 0, "Test Failed: live objects should be frozen"
+
+        garbage = [[] for _ in range(100)]
+        del garbage
+        low_latency.tick(busy=False)
+        assert sum(low_latency.gc_pauses.collections) == 0, "Test Failed: no collection should be due yet"
+
+        low_latency.tick(busy=True)
+        clock.now = 2.
+        low_latency.tick(busy=True)
+        assert sum(low_latency.gc_pauses.collections) == 0, "Test Failed: busy engines should not collect"
+
+        low_latency.tick(busy=False)
+        assert low_latency.gc_pauses.collections[1] == 1, "Test Failed: the young generations should be collected"
+
+        garbage = [[] for _ in range(100)]
+        clock.now = 12.
+        low_latency.tick(busy=False)
+        assert low_latency.gc_pauses.collections[2] == 1, "Test Failed: a full collection should be due"
+    finally:
+        low_latency.stop()
+
+    assert gc.isenabled(), "Test Failed: automatic collection should be enabled again"
+    assert gc.get_freeze_count() == 0, "Test Failed: the heap should be unfrozen"
+    pass
+
+
+def test_low_latency_mode_forces_collection_under_sustained_load():
+    low_latency = LowLatencyMode(warm_up_orders=0, max_pending=50)
+    low_latency.start()
+    try:
+        garbage = [[] for _ in range(100)]
+        low_latency.tick(busy=True)
+    finally:
+        low_latency.stop()
+
+    assert low_latency.gc_pauses.collections[0] == 1, "Test Failed: the young generation should be collected"
+    pass
+
+
+def test_low_latency_mode_warms_up_without_touching_the_engine():
+    event_sink = RecordingSink()
+    matching_engine = MatchingEngine(matching_algorithms={"ES": MatchingAlgorithm.pro_rata})
+    matching_engine.add_event_sink(event_sink)
+
+    LowLatencyMode(warm_up_orders=1_000).warm_up(matching_engine)
+
+    assert not matching_engine.order_books, "Test Failed: the engine should have no books"
+    assert not event_sink.events, "Test Failed: the engine's sinks should see nothing"
+    pass
+
+
+class RejectionCountingEngine(MatchingEngine):
+    rejections: List[str] = []
+
+    def reject(self, order, order_book, reason):
+        RejectionCountingEngine.rejections.append(reason)
+        super().reject(order, order_book, reason)
+
+
+def test_low_latency_mode_warms_up_on_the_engine_tick():
+    RejectionCountingEngine.rejections.clear()
+    matching_engine = RejectionCountingEngine(tick_size=0.25)
+
+    LowLatencyMode(warm_up_orders=1_000).warm_up(matching_engine)
+
+    assert "Price not on tick" not in RejectionCountingEngine.rejections, \
+        "Test Failed: warm-up orders should be priced on the engine's tick"
+    pass
+
+
+def test_matching_engine_processes_in_low_latency_mode():
+    orders = [LimitOrder(instrument_id="AAPL",
+                         order_direction=direction,
+                         quantity=100,
+                         price=10) for direction in [OrderDirection.buy, OrderDirection.sell]]
+
+    class StopAfterOrders:
+        def __init__(self):
+            self.polls = 0
+
+        def poll(self, matching_engine):
+            self.polls += 1
+            if self.polls == 1:
+                for order in orders:
+                    matching_engine.add_order(order)
+                return len(orders)
+            matching_engine.live = False
+            return 0
+
+    low_latency = LowLatencyMode(warm_up_orders=100, idle_interval=0.)
+    matching_engine = MatchingEngine(low_latency=low_latency)
+    matching_engine.add_ingress(StopAfterOrders())
+    matching_engine.process()
+
+    assert len(matching_engine.order_books["AAPL"].trades) == 1, "Test Failed: the orders should match"
+    assert sum(low_latency.gc_pauses.collections) >= 1, "Test Failed: the idle gap should be collected"
+    assert not low_latency.active and gc.isenabled(), "Test Failed: the mode should be stopped"
+    pass
@@ -0,0 +1,80 @@
+from python.src.server import OrderEntryServer
+from python.src.matching_engine import MatchingEngine
+from python.src.codec import ORDER, encode_frame, iter_frames, complete_frames_length
+from python.src.enums import OrderDirection
+from python.src.enums import OrderType
+from python.src.enums import EventType
+from python.src.enums import MessageType
+from multiprocessing import Process, Queue
+from multiprocessing import queues
+import numpy as np
+import asyncio
+import time
+
+num_connections = 32
+num_batches = 50
+batch_size = 64
+instrument_ids = [b"AAPL", b"MSFT", b"TSLA", b"FB", b"NFLX"]
+
+
+def run_server(ports):
+    async def serve():
+        server = OrderEntryServer(MatchingEngine())
+        await server.start()
+        ports.put(server.port)
+        await server.serve_forever()
+    asyncio.run(serve())
+
+
+def get_batches(seed):
+    """ Frames of random limit orders, one per batch."""
+
+    rng = np.random.default_rng(seed)
+    batches = []
+    for _ in range(num_batches):
+        records = np.zeros(batch_size, dtype=ORDER)
+        records["order_type"] = OrderType.limit.value
+        records["order_direction"] = rng.choice([OrderDirection.buy.value, OrderDirection.sell.value], batch_size)
+        records["instrument_id"] = rng.choice(instrument_ids, batch_size)
+        records["quantity"] = 100 + rng.uniform(-50, 50, batch_size)
+        records["price"] = 40 + rng.uniform(-2.5, 2.5, batch_size)
+        batches.append(encode_frame(MessageType.order, records))
+    return batches
+
+
+async def client(port, seed, latencies):
+    """ Send a batch, wait until every order in it is acknowledged, and repeat."""
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    buffer = bytearray()
+    for frame in get_batches(seed):
+        start = time.perf_counter()
+        writer.write(frame)
+        acknowledged = 0
+        while acknowledged < batch_size:
+            buffer += await reader.read(1 << 16)
+            length = complete_frames_length(buffer)
+            for _, reports in iter_frames(bytes(buffer[:length])):
+                acknowledged += int(np.count_nonzero(reports["event_type"] == EventType.accepted))
+            del buffer[:length]
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def load(port):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, seed, latencies) for seed in range(num_connections)))
+    return time.perf_counter() - start, np.array(latencies)
+
+
+ports: "queues.Queue[int]" = Queue()
+server = Process(target=run_server, args=(ports,), daemon=True)
+server.start()
+elapsed, latencies = asyncio.run(load(ports.get(timeout=30)))
+server.terminate()
+
+num_orders = num_connections * num_batches * batch_size
+print(f"{num_connections} connections, batches of {batch_size}: {num_orders / elapsed:,.0f} orders per second")
+print(f"Batch round trip: p50 {1e3 * np.percentile(latencies, 50):.2f} ms, "
+      f"p99 {1e3 * np.percentile(latencies, 99):.2f} ms, max {1e3 * latencies.max():.2f} ms")
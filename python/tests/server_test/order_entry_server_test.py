@@ -0,0 +1,133 @@
+from python.src.server import OrderEntryServer
+from python.src.matching_engine import MatchingEngine
+from python.src.codec import encode_orders, iter_frames, complete_frames_length
+from python.src.codec import orders_to_records, encode_frame
+from python.src.orders import LimitOrder
+from python.src.orders import CancelOrder
+from python.src.enums import OrderDirection
+from python.src.enums import EventType
+from python.src.enums import MessageType
+import numpy as np
+import asyncio
+
+
+async def read_reports(reader, n):
+    """ Read until n execution reports have arrived."""
+
+    buffer = bytearray()
+    reports = []
+    while len(reports) < n:
+        buffer += await asyncio.wait_for(reader.read(1 << 16), timeout=5)
+        length = complete_frames_length(buffer)
+        for _, records in iter_frames(bytes(buffer[:length])):
+            reports += records.tolist()
+        del buffer[:length]
+    return reports
+
+
+async def trade_between_connections():
+    server = OrderEntryServer(MatchingEngine())
+    await server.start()
+    seller = await asyncio.open_connection(server.host, server.port)
+    buyer = await asyncio.open_connection(server.host, server.port)
+
+    seller[1].write(encode_orders([LimitOrder("AAPL", OrderDirection.sell, 100, 10, client_order_id="s1"),
+                                   LimitOrder("AAPL", OrderDirection.sell, 100, 11, client_order_id="s2")]))
+    seller_reports = await read_reports(seller[0], 2)
+    buyer[1].write(encode_orders([LimitOrder("AAPL", OrderDirection.buy, 100, 10, client_order_id="b1")]))
+    buyer_reports = await read_reports(buyer[0], 2)
+    seller_reports += await read_reports(seller[0], 1)
+
+    resting_id = seller_reports[1][1]
+    seller[1].write(encode_orders([CancelOrder("AAPL", resting_id, OrderDirection.sell, client_order_id="c1")]))
+    seller_reports += await read_reports(seller[0], 1)
+
+    for _, writer in (seller, buyer):
+        writer.close()
+    await server.stop()
+    return seller_reports, buyer_reports
+
+
+def test_order_entry_server_reports_to_each_connection():
+    seller_reports, buyer_reports = asyncio.run(trade_between_connections())
+
+    assert [(r[0], r[2]) for r in seller_reports] == [(EventType.accepted, b"s1"),
+                                                      (EventType.accepted, b"s2"),
+                                                      (EventType.filled, b"s1"),
+                                                      (EventType.cancelled, b"c1")], \
+        "Test Failed: incorrect seller reports"
+    assert [(r[0], r[2]) for r in buyer_reports] == [(EventType.accepted, b"b1"),
+                                                     (EventType.filled, b"b1")], \
+        "Test Failed: incorrect buyer reports"
+    assert buyer_reports[1][4:] == (10., 100.), "Test Failed: incorrect fill"
+    assert np.isnan(seller_reports[0][4]), "Test Failed: acks have no price"
+    pass
+
+
+async def disconnect_with_resting_orders():
+    matching_engine = MatchingEngine()
+    server = OrderEntryServer(matching_engine, cancel_on_disconnect=True)
+    await server.start()
+    maker = await asyncio.open_connection(server.host, server.port)
+    taker = await asyncio.open_connection(server.host, server.port)
+
+    maker[1].write(encode_orders([LimitOrder("AAPL", OrderDirection.sell, 100, 10, account_id="maker"),
+                                  LimitOrder("MSFT", OrderDirection.buy, 100, 20, account_id="maker"),
+                                  LimitOrder("MSFT", OrderDirection.buy, 100, 19)]))
+    await read_reports(maker[0], 3)
+    taker[1].write(encode_orders([LimitOrder("AAPL", OrderDirection.buy, 100, 9, account_id="taker")]))
+    await read_reports(taker[0], 1)
+
+    maker[1].close()
+    while server.connections > 1:
+        await asyncio.sleep(0.01)
+    books = [(b.best_bid, b.best_ask) for b in (matching_engine.order_books[i] for i in ["AAPL", "MSFT"])]
+    owners = sorted(server.execution_reports.owners)
+    taker[1].close()
+    while server.connections:
+        await asyncio.sleep(0.01)
+    await server.stop()
+    return books, owners, server, matching_engine
+
+
+def test_order_entry_server_cancels_on_disconnect():
+    books, owners, server, matching_engine = asyncio.run(disconnect_with_resting_orders())
+
+    (aapl_bid, aapl_ask), (msft_bid, _) = books
+    assert aapl_ask is None, "Test Failed: the maker's ask should be cancelled"
+    assert aapl_bid is not None and aapl_bid.account_id == "taker", \
+        "Test Failed: other connections' orders should stay"
+    assert msft_bid is not None and msft_bid.account_id is None, \
+        "Test Failed: untagged orders cannot be cancelled by account"
+    assert matching_engine.order_books["AAPL"].best_bid is None, \
+        "Test Failed: the taker's orders should be cancelled when it disconnects"
+    assert owners == [aapl_bid.order_id], "Test Failed: the maker's orders should be forgotten when it disconnects"
+    assert not server.execution_reports.owners, "Test Failed: no orders should be owned once every connection closed"
+    pass
+
+
+async def send_undecodable_order():
+    server = OrderEntryServer(MatchingEngine())
+    await server.start()
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    records = orders_to_records([LimitOrder("AAPL", OrderDirection.buy, 100, 10)])
+    records["order_type"] = 99
+    writer.write(encode_frame(MessageType.order, records))
+    closed = await asyncio.wait_for(reader.read(), timeout=5)
+
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    writer.write(encode_orders([LimitOrder("AAPL", OrderDirection.buy, 100, 10, client_order_id="b1")]))
+    reports = await read_reports(reader, 1)
+    writer.close()
+    await server.stop()
+    return closed, reports
+
+
+def test_order_entry_server_closes_connections_sending_unknown_values(caplog):
+    closed, reports = asyncio.run(send_undecodable_order())
+
+    assert closed == b"", "Test Failed: the connection should be closed"
+    assert "closing connection" in caplog.text, "Test Failed: the decode error should be handled"
+    assert [(r[0], r[2]) for r in reports] == [(EventType.accepted, b"b1")], \
+        "Test Failed: the server should keep accepting connections"
+    pass
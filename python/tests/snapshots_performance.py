@@ -0,0 +1,55 @@
+from python.src.snapshots import SnapshotPublisher
+from python.src.order_flow import OrderFlowGenerator
+from python.src.order_flow import to_orders
+from python.src.matching_engine import MatchingEngine
+import threading
+import time
+
+n = 200_000
+batch = 100
+instrument_ids = [f"S{i}" for i in range(20)]
+
+records = OrderFlowGenerator(instrument_ids=instrument_ids, cross_ratio=0.1, seed=0).generate(n)
+
+
+def run(snapshots, readers):
+    """ Match the orders in batches while reader threads poll the top of every book."""
+
+    orders = to_orders(records)
+    matching_engine = MatchingEngine(max_history=0, snapshots=snapshots)
+    done = threading.Event()
+    reads = [0] * readers
+
+    def read(i):
+        while not done.is_set():
+            view = snapshots.snapshots
+            for instrument_id in instrument_ids:
+                snapshot = view.get(instrument_id)
+                if snapshot is not None:
+                    snapshot.best_bid
+            reads[i] += 1
+            time.sleep(0)
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    for i in range(0, n, batch):
+        for order in orders[i:i + batch]:
+            matching_engine.add_order(order)
+        matching_engine.match()
+    elapsed = time.perf_counter() - start
+    done.set()
+    for thread in threads:
+        thread.join()
+    return elapsed, sum(reads)
+
+
+elapsed, _ = run(None, 0)
+print(f"no snapshots:          {1e6 * elapsed / n:.2f}us per order")
+for depth in (1, 10):
+    elapsed, _ = run(SnapshotPublisher(depth=depth), 0)
+    print(f"depth {depth:>2}, no readers:  {1e6 * elapsed / n:.2f}us per order")
+elapsed, reads = run(SnapshotPublisher(depth=10), 2)
+print(f"depth 10, two readers: {1e6 * elapsed / n:.2f}us per order, {reads:,} consistent views of "
+      f"{len(instrument_ids)} books read")
@@ -0,0 +1,80 @@
+from python.src.snapshots import SnapshotPublisher
+from python.src.matching_engine import MatchingEngine
+from python.src.order_flow import OrderFlowGenerator
+from python.src.order_flow import to_orders
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+import threading
+import pytest
+
+
+def limit_order(instrument_id, order_direction, quantity, price):
+    return LimitOrder(instrument_id=instrument_id,
+                      order_direction=order_direction,
+                      quantity=quantity,
+                      price=price)
+
+
+def test_snapshot_publisher_publishes_changed_books_after_each_batch():
+    snapshots = SnapshotPublisher(depth=2)
+    matching_engine = MatchingEngine(snapshots=snapshots)
+
+    matching_engine.add_order(limit_order("AAPL", OrderDirection.buy, 100, 10))
+    matching_engine.add_order(limit_order("AAPL", OrderDirection.sell, 40, 11))
+    matching_engine.add_order(limit_order("MSFT", OrderDirection.buy, 10, 20))
+    assert snapshots.snapshot("AAPL") is None, "Test Failed: nothing should be published before a batch"
+
+    matching_engine.match()
+    first = snapshots.snapshots
+    aapl = first["AAPL"]
+    assert snapshots.version == 1, "Test Failed: one batch should publish one version"
+    assert aapl.version == first["MSFT"].version == 1, "Test Failed: snapshots should share the version"
+    assert aapl.bids == ((10, 100),) and aapl.asks == ((11, 40),), "Test Failed: incorrect levels"
+    assert aapl.spread == 1 and aapl.last_price is None, "Test Failed: incorrect top of book"
+
+    matching_engine.add_order(limit_order("AAPL", OrderDirection.sell, 60, 10))
+    matching_engine.match()
+    aapl = snapshots.snapshot("AAPL")
+    assert aapl.version == 2 and aapl.bids == ((10, 40),), "Test Failed: the cross should be published"
+    assert aapl.last_price == 10, "Test Failed: the trade should be published"
+    assert snapshots.snapshot("MSFT") is first["MSFT"], "Test Failed: unchanged books should not be rebuilt"
+    assert first["AAPL"].bids == ((10, 100),), "Test Failed: published snapshots should never change"
+    with pytest.raises(TypeError):
+        first["AAPL"] = aapl
+
+    matching_engine.match()
+    assert snapshots.version == 2, "Test Failed: an empty batch should publish nothing"
+    pass
+
+
+def test_snapshot_publisher_gives_readers_consistent_views():
+    snapshots = SnapshotPublisher(depth=5)
+    matching_engine = MatchingEngine(snapshots=snapshots)
+    generator = OrderFlowGenerator(instrument_ids=["A", "B", "C"], seed=1)
+    batches = [to_orders(generator.generate(200)) for _ in range(50)]
+    done = threading.Event()
+    errors = []
+
+    def read():
+        while not done.is_set():
+            view = snapshots.snapshots
+            for snapshot in view.values():
+                bid_prices = [price for price, _ in snapshot.bids]
+                ask_prices = [price for price, _ in snapshot.asks]
+                if bid_prices != sorted(bid_prices, reverse=True) or ask_prices != sorted(ask_prices):
+                    errors.append("order")
+                if snapshot.bids and snapshot.asks and snapshot.best_bid >= snapshot.best_ask:
+                    errors.append("crossed")
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    for batch in batches:
+        for order in batch:
+            matching_engine.add_order(order)
+        matching_engine.match()
+    done.set()
+    reader.join()
+
+    assert not errors, "Test Failed: readers should only see consistent books"
+    assert snapshots.version == len(batches), "Test Failed: every batch should be published"
+    pass
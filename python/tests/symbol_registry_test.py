@@ -0,0 +1,31 @@
+from python.src.symbol_registry import SymbolRegistry, read_instruments
+import pytest
+
+
+def test_symbol_registry_interns_dense_ids():
+    symbols = SymbolRegistry(["AAPL", "MSFT"])
+
+    assert symbols.intern("AAPL") == 0, "Test Failed: known instruments should keep their id"
+    assert symbols.intern("TSLA") == 2, "Test Failed: new instruments should take the next id"
+    assert symbols["MSFT"] == 1, "Test Failed: incorrect symbol id"
+    assert symbols.symbol(2) == "TSLA", "Test Failed: incorrect instrument id"
+    assert len(symbols) == 3, "Test Failed: there should be 3 symbols"
+    pass
+
+
+def test_frozen_symbol_registry_refuses_new_instruments():
+    symbols = SymbolRegistry(["AAPL"], frozen=True)
+
+    assert symbols.intern("AAPL") == 0, "Test Failed: known instruments should still intern"
+    with pytest.raises(KeyError):
+        symbols.intern("MSFT")
+    assert "MSFT" not in symbols, "Test Failed: the instrument should not be registered"
+    pass
+
+
+def test_read_instruments_from_reference_file(tmp_path):
+    path = tmp_path / "instruments.csv"
+    path.write_text("instrument_id,tick_size\n# equities\nAAPL,0.01\n\nMSFT,0.01\nES\n")
+
+    assert read_instruments(str(path)) == ["AAPL", "MSFT", "ES"], "Test Failed: incorrect instruments"
+    pass
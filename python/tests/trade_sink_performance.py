@@ -0,0 +1,71 @@
+from python.src.orders import LimitOrder
+from python.src.orders import MarketOrder
+from python.src.enums import OrderDirection
+from python.src.trades import TradeBuffer
+from python.src.order_book import OrderBook
+from python.src.matching_engine import MatchingEngine
+import random
+import time
+
+num_orders = 100_000
+
+
+def get_data(n):
+    directions = [OrderDirection.buy, OrderDirection.sell]
+    output = []
+    for i in range(n):
+        direction = random.choice(directions)
+        quantity = 100 + random.uniform(-50, 50)
+        if i % 4:
+            output.append(LimitOrder(instrument_id="AAPL",
+                                     order_direction=direction,
+                                     quantity=quantity,
+                                     price=40 + random.uniform(-2.5, 2.5)))
+        else:
+            output.append(MarketOrder(instrument_id="AAPL",
+                                      order_direction=direction,
+                                      quantity=quantity))
+    return output
+
+
+def run_flow(trade_sink):
+    random.seed(0)
+    matching_engine = MatchingEngine(trade_sink=trade_sink)
+    for order in get_data(num_orders):
+        matching_engine.add_order(order)
+    start = time.perf_counter()
+    matching_engine.match()
+    return time.perf_counter() - start
+
+
+def run_sweep(trade_sink):
+    order_book = OrderBook(trade_sink=trade_sink)
+    for i in range(num_orders):
+        order_book.add_order(LimitOrder(instrument_id="AAPL",
+                                        order_direction=OrderDirection.sell,
+                                        quantity=1,
+                                        price=40 + i // 100))
+    order_book.match()
+    order_book.add_order(LimitOrder(instrument_id="AAPL",
+                                    order_direction=OrderDirection.buy,
+                                    quantity=num_orders,
+                                    price=float("inf")))
+    start = time.perf_counter()
+    order_book.match()
+    return time.perf_counter() - start
+
+
+trade_buffer = TradeBuffer(capacity=num_orders)
+
+# Random order flow
+elapsed = run_flow(None)
+print(f"Flow, Trade objects: {1e6 * elapsed / num_orders:.2f} us per order")
+elapsed = run_flow(trade_buffer)
+print(f"Flow, TradeBuffer:   {1e6 * elapsed / num_orders:.2f} us per order")
+
+# One order sweeping the book: every order is a fill
+trade_buffer.clear()
+elapsed = run_sweep(None)
+print(f"Sweep, Trade objects: {1e6 * elapsed / num_orders:.2f} us per fill")
+elapsed = run_sweep(trade_buffer)
+print(f"Sweep, TradeBuffer:   {1e6 * elapsed / num_orders:.2f} us per fill")
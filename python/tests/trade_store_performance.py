@@ -0,0 +1,55 @@
+from python.src.trades import TradeStore
+from python.src.trades import Trade
+from collections import deque
+import numpy as np
+import tempfile
+import time
+
+n = 2_000_000
+queries = 1_000
+rng = np.random.default_rng(0)
+times = np.cumsum(rng.integers(1, 1_000, n)).tolist()
+prices = (100 + rng.normal(0, 1, n)).tolist()
+starts = rng.integers(0, times[-1], queries).tolist()
+# Each query asks for about a thousand trades.
+span = 500_000
+
+
+def fill(trade_store):
+    append = trade_store.trades("AAPL").append
+    start = time.perf_counter()
+    for timestamp, price in zip(times, prices):
+        append(timestamp, price, 1., 0, 0)
+    return time.perf_counter() - start
+
+
+def query(trade_store):
+    start = time.perf_counter()
+    found = 0
+    for t in starts:
+        found += sum(len(view) for view in trade_store.between("AAPL", t, t + span))
+    return (time.perf_counter() - start) / queries, found / queries
+
+
+trade_store = TradeStore()
+elapsed = fill(trade_store)
+print(f"append: {1e9 * elapsed / n:.0f}ns per trade")
+elapsed, found = query(trade_store)
+print(f"in-memory range query: {1e6 * elapsed:.1f}us for {found:.0f} trades")
+
+trades = deque(Trade(np.datetime64(t, "ns"), p, 1.) for t, p in zip(times[:200_000], prices))
+start = time.perf_counter()
+for t in starts[:10]:
+    low, high = np.datetime64(t, "ns"), np.datetime64(t + span, "ns")
+    found = [trade for trade in trades if low <= trade.datetime < high]
+scan = (time.perf_counter() - start) / 10
+print(f"for comparison, scanning a deque of just 200,000 Trades: {1e6 * scan:.0f}us per query")
+
+with tempfile.TemporaryDirectory() as directory:
+    trade_store = TradeStore(directory=directory)
+    elapsed = fill(trade_store)
+    trade_store.close()
+    print(f"append with chunks written to disk: {1e9 * elapsed / n:.0f}ns per trade")
+    trade_store = TradeStore(directory=directory)
+    elapsed, found = query(trade_store)
+    print(f"memory-mapped range query: {1e6 * elapsed:.1f}us for {found:.0f} trades")
@@ -0,0 +1,56 @@
+from python.src.trades import TradeBuffer
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+import pytest
+
+
+def make_orders():
+    bid = LimitOrder(instrument_id="AAPL",
+                     order_direction=OrderDirection.buy,
+                     quantity=100,
+                     price=10)
+    ask = LimitOrder(instrument_id="AAPL",
+                     order_direction=OrderDirection.sell,
+                     quantity=100,
+                     price=10)
+    bid.order_id = 1
+    ask.order_id = 2
+    return bid, ask
+
+
+def test_trade_buffer_init():
+    trade_buffer = TradeBuffer(capacity=4)
+
+    assert len(trade_buffer) == 0, "Test Failed: the buffer should be empty"
+    assert len(trade_buffer.prices) == 4, "Test Failed: the buffer should be preallocated"
+    pass
+
+
+def test_trade_buffer_records_trades():
+    trade_buffer = TradeBuffer(capacity=4)
+    bid, ask = make_orders()
+    trade_buffer(123, 10.5, 50, bid, ask)
+
+    assert len(trade_buffer) == 1, "Test Failed: the buffer should have a trade"
+    assert trade_buffer.times[0] == 123, "Test Failed: incorrect time"
+    assert trade_buffer.prices[0] == 10.5, "Test Failed: incorrect price"
+    assert trade_buffer.quantities[0] == 50, "Test Failed: incorrect quantity"
+    assert trade_buffer.bid_order_ids[0] == 1, "Test Failed: incorrect bid"
+    assert trade_buffer.ask_order_ids[0] == 2, "Test Failed: incorrect ask"
+    pass
+
+
+def test_trade_buffer_grows_and_clears():
+    trade_buffer = TradeBuffer(capacity=2)
+    bid, ask = make_orders()
+    for i in range(5):
+        trade_buffer(i, 10, i, bid, ask)
+
+    assert len(trade_buffer) == 5, "Test Failed: the buffer should have 5 trades"
+    assert trade_buffer.quantities[:5].tolist() == [0, 1, 2, 3, 4], "Test Failed: trades lost on growth"
+
+    capacity = len(trade_buffer.prices)
+    trade_buffer.clear()
+    assert len(trade_buffer) == 0, "Test Failed: the buffer should be empty"
+    assert len(trade_buffer.prices) == capacity, "Test Failed: memory should be kept"
+    pass
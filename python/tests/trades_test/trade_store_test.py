@@ -0,0 +1,97 @@
+from python.src.trades import TradeStore
+from python.src.trades import TradeBuffer
+from python.src.matching_engine import MatchingEngine
+from python.src.orders import LimitOrder
+from python.src.enums import OrderDirection
+import numpy as np
+
+
+def fill(trade_store, times, instrument_id="AAPL"):
+    for i, timestamp in enumerate(times):
+        trade_store.append(instrument_id, timestamp, 10 + i, 1)
+
+
+def test_trade_store_queries_across_chunks():
+    trade_store = TradeStore(chunk_size=4)
+    times = [0, 1, 2, 2, 2, 3, 5, 8, 8, 9]
+    fill(trade_store, times)
+
+    for start, end in [(0, 10), (2, 3), (2, 9), (4, 5), (-5, 1), (9, 100), (10, 20)]:
+        views = trade_store.between("AAPL", start, end)
+        found = np.concatenate(views)["timestamp"].tolist() if views else []
+        assert found == [t for t in times if start <= t < end], \
+            "Test Failed: incorrect trades between {} and {}".format(start, end)
+    assert len(trade_store.trades("AAPL").chunks) == 3, "Test Failed: trades should be split into chunks"
+    assert trade_store.between("MSFT", 0, 10) == [], "Test Failed: unknown instruments have no trades"
+    pass
+
+
+def test_trade_store_returns_views():
+    trade_store = TradeStore(chunk_size=4)
+    fill(trade_store, range(6))
+    trades = trade_store.trades("AAPL")
+
+    views = trade_store.between("AAPL", 1, 5)
+    assert [len(view) for view in views] == [3, 1], "Test Failed: one view per chunk"
+    assert all(np.shares_memory(view, chunk) for view, chunk in zip(views, trades.chunks)), \
+        "Test Failed: queries should not copy"
+    assert views[1]["price"].tolist() == [14], "Test Failed: incorrect prices"
+
+    trade_store.append("AAPL", 3, 20, 1)
+    assert trade_store.between("AAPL", 5, 6)[-1]["price"].tolist() == [15, 20], \
+        "Test Failed: a trade stamped before the last should be stored at the last trade's time"
+    assert trades.clamped == 1, "Test Failed: the clamped trade should be counted"
+    pass
+
+
+def test_trade_store_maps_history_from_disk(tmp_path):
+    directory = str(tmp_path / "trades")
+    trade_store = TradeStore(chunk_size=4, directory=directory)
+    fill(trade_store, range(10))
+    fill(trade_store, range(3), instrument_id="MSFT")
+    trades = trade_store.trades("AAPL")
+    assert all(isinstance(chunk, np.memmap) for chunk in trades.chunks[:2]), \
+        "Test Failed: full chunks should be memory mapped"
+    trade_store.close()
+
+    reopened = TradeStore(chunk_size=4, directory=directory)
+    assert sorted(reopened.instruments) == ["AAPL", "MSFT"], "Test Failed: instruments should be reloaded"
+    assert len(reopened.trades("AAPL")) == 10, "Test Failed: every trade should be reloaded"
+    reopened.append("AAPL", 10, 20, 1)
+    views = reopened.between("AAPL", 3, 11)
+    assert np.concatenate(views)["timestamp"].tolist() == list(range(3, 11)), \
+        "Test Failed: queries should span disk and memory"
+    pass
+
+
+def test_trade_store_records_engine_trades():
+    trade_buffer = TradeBuffer()
+    trade_store = TradeStore(trade_sink=trade_buffer)
+    matching_engine = MatchingEngine(trade_sink=trade_store, clock=lambda: 7)
+    bid = LimitOrder("AAPL", OrderDirection.buy, 100, 10)
+    ask = LimitOrder("AAPL", OrderDirection.sell, 40, 10)
+    matching_engine.add_order(bid)
+    matching_engine.add_order(ask)
+    matching_engine.match()
+
+    trades = np.concatenate(trade_store.between("AAPL", 0, 10))
+    assert trades.tolist() == [(7, 10, 40, bid.order_id, ask.order_id)], "Test Failed: incorrect stored trade"
+    assert len(trade_buffer) == 1, "Test Failed: trades should be passed on to the chained sink"
+    pass
+
+
+def test_trade_store_survives_the_clock_stepping_back():
+    times = iter([100, 50])
+    trade_store = TradeStore()
+    matching_engine = MatchingEngine(trade_sink=trade_store, clock=lambda: next(times))
+    bid = LimitOrder("AAPL", OrderDirection.buy, 100, 10)
+    matching_engine.add_order(bid)
+    for quantity in (30, 20):
+        matching_engine.add_order(LimitOrder("AAPL", OrderDirection.sell, quantity, 10))
+        matching_engine.match()
+
+    trades = np.concatenate(trade_store.between("AAPL", 0, 200))
+    assert trades["timestamp"].tolist() == [100, 100], "Test Failed: the late trade should take the last time"
+    assert bid.unfilled_quantity == 50 and matching_engine.order_books["AAPL"].best_ask is None, \
+        "Test Failed: the book should be consistent"
+    pass
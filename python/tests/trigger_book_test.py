@@ -0,0 +1,84 @@
+from python.src.trigger_book import TriggerBook
+from python.src.orders import StopLimitOrder
+from python.src.enums import OrderDirection
+from python.src.exceptions import InvalidOrderDirectionException
+import pytest
+
+
+def make_stops(order_direction):
+    stops = [StopLimitOrder(instrument_id="AAPL",
+                            order_direction=order_direction,
+                            quantity=100,
+                            stop_price=10 + i,
+                            price=10 + i) for i in range(5)]
+    for i, stop in enumerate(stops):
+        stop.order_id = i
+    return stops
+
+
+def test_trigger_book_init():
+    trigger_book = TriggerBook()
+
+    assert not trigger_book, "Test Failed: trigger_book should be empty"
+    assert not trigger_book.buy_stops, "Test Failed: buy_stops should be empty"
+    assert not trigger_book.sell_stops, "Test Failed: sell_stops should be empty"
+    pass
+
+
+def test_trigger_book_releases_crossed_buy_stops():
+    trigger_book = TriggerBook()
+    for stop in reversed(make_stops(OrderDirection.buy)):
+        trigger_book.add(stop)
+
+    released = trigger_book.release(low=9, high=12)
+
+    assert [o.stop_price for o in released] == [10, 11, 12], "Test Failed: wrong stops released"
+    assert len(trigger_book) == 2, "Test Failed: two stops should remain"
+    pass
+
+
+def test_trigger_book_releases_crossed_sell_stops():
+    trigger_book = TriggerBook()
+    for stop in make_stops(OrderDirection.sell):
+        trigger_book.add(stop)
+
+    released = trigger_book.release(low=13, high=15)
+
+    assert [o.stop_price for o in released] == [14, 13], "Test Failed: wrong stops released"
+    assert len(trigger_book) == 3, "Test Failed: three stops should remain"
+    pass
+
+
+def test_trigger_book_keeps_time_order_within_a_price():
+    trigger_book = TriggerBook()
+    stops = make_stops(OrderDirection.buy)
+    for stop in stops:
+        stop.stop_price = 10
+        trigger_book.add(stop)
+
+    released = trigger_book.release(low=10, high=10)
+
+    assert [o.order_id for o in released] == [0, 1, 2, 3, 4], "Test Failed: time order not kept"
+    pass
+
+
+def test_trigger_book_can_remove():
+    trigger_book = TriggerBook()
+    stops = make_stops(OrderDirection.sell)
+    for stop in stops:
+        trigger_book.add(stop)
+
+    trigger_book.remove(stops[3])
+
+    assert stops[3] not in trigger_book.sell_stops, "Test Failed: stop should be removed"
+    assert len(trigger_book) == len(stops) - 1, "Test Failed: only the removed stop should go"
+    pass
+
+
+def test_trigger_book_raises_on_invalid_direction():
+    trigger_book = TriggerBook()
+    stop = make_stops(OrderDirection.test)[0]
+
+    with pytest.raises(InvalidOrderDirectionException):
+        trigger_book.add(stop)
+    pass
@@ -0,0 +1,35 @@
+""" Packaging for the Python matching engine.
+
+The hot path, the orders, the OrderBook, the TriggerBook and the MatchingEngine,
+can optionally be compiled to C extensions with mypyc, from the type annotations
+already in the source. Compilation is off by default. Build it in place with
+
+    MATCHING_ENGINE_COMPILE=1 python setup.py build_ext --inplace
+
+The extension modules sit next to the .py files and are imported in their place.
+Without them, or after deleting them, the same modules run as pure Python.
+"""
+from setuptools import setup, find_packages
+import os
+
+COMPILED_MODULES = ["python/src/orders/base_order.py",
+                    "python/src/orders/limit_order.py",
+                    "python/src/orders/market_order.py",
+                    "python/src/orders/stop_order.py",
+                    "python/src/orders/stop_limit_order.py",
+                    "python/src/orders/cancel_order.py",
+                    "python/src/trigger_book.py",
+                    "python/src/order_book.py",
+                    "python/src/matching_engine.py"]
+
+ext_modules = []
+if os.environ.get("MATCHING_ENGINE_COMPILE"):
+    from mypyc.build import mypycify
+    # Modules outside the compiled set are imported as ordinary Python and only their types are used.
+    ext_modules = mypycify(["--ignore-missing-imports", "--follow-imports=silent"] + COMPILED_MODULES,
+                           opt_level="3")
+
+setup(name="matching-engines",
+      packages=find_packages(include=["python", "python.*"]),
+      install_requires=["numpy", "sortedcontainers", "matplotlib"],
+      ext_modules=ext_modules)